@@ -0,0 +1,68 @@
+"""Add queue lease columns to workflow_executions.
+
+Revision ID: a3f9c2d1e4b7
+Revises: 49ee0350b7d5
+Create Date: 2026-10-16 12:00:00
+
+TAG: [SPEC-011] [DATABASE] [MIGRATION] [QUEUE]
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3f9c2d1e4b7"
+down_revision: str | None = "49ee0350b7d5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema - Add worker lease columns and queue indexes."""
+    op.add_column(
+        "workflow_executions",
+        sa.Column("worker_id", sa.String(length=255), nullable=True),
+    )
+    op.add_column(
+        "workflow_executions",
+        sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "workflow_executions",
+        sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "workflow_executions",
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    # Create indexes used by queue claim scans
+    op.create_index(
+        "ix_workflow_executions_status_created_at",
+        "workflow_executions",
+        ["status", "created_at"],
+    )
+    op.create_index(
+        "ix_workflow_executions_status_lease_expires_at",
+        "workflow_executions",
+        ["status", "lease_expires_at"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema - Remove worker lease columns."""
+    op.drop_index(
+        "ix_workflow_executions_status_lease_expires_at",
+        table_name="workflow_executions",
+    )
+    op.drop_index(
+        "ix_workflow_executions_status_created_at",
+        table_name="workflow_executions",
+    )
+    op.drop_column("workflow_executions", "attempts")
+    op.drop_column("workflow_executions", "heartbeat_at")
+    op.drop_column("workflow_executions", "lease_expires_at")
+    op.drop_column("workflow_executions", "worker_id")
@@ -0,0 +1,33 @@
+"""Add cache_hit flag to node_executions.
+
+Revision ID: b7e1d4c2a9f3
+Revises: a3f9c2d1e4b7
+Create Date: 2026-10-16 13:00:00
+
+TAG: [SPEC-011] [DATABASE] [MIGRATION] [CACHING]
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e1d4c2a9f3"
+down_revision: str | None = "a3f9c2d1e4b7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema - Add node output cache hit flag."""
+    op.add_column(
+        "node_executions",
+        sa.Column("cache_hit", sa.Boolean(), nullable=False, server_default="false"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema - Remove node output cache hit flag."""
+    op.drop_column("node_executions", "cache_hit")
@@ -0,0 +1,52 @@
+"""Add partial re-execution fields to workflow_executions.
+
+Revision ID: c4d8e2f1a6b3
+Revises: b7e1d4c2a9f3
+Create Date: 2026-10-16 14:00:00
+
+TAG: [SPEC-011] [DATABASE] [MIGRATION] [RERUN]
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d8e2f1a6b3"
+down_revision: str | None = "b7e1d4c2a9f3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema - Add rerun source and dirty node IDs."""
+    op.add_column(
+        "workflow_executions",
+        sa.Column("rerun_of_id", postgresql.UUID(as_uuid=True), nullable=True),
+    )
+    op.add_column(
+        "workflow_executions",
+        sa.Column("dirty_node_ids", postgresql.JSONB, nullable=True),
+    )
+    op.create_foreign_key(
+        "fk_workflow_executions_rerun_of_id",
+        "workflow_executions",
+        "workflow_executions",
+        ["rerun_of_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema - Remove rerun source and dirty node IDs."""
+    op.drop_constraint(
+        "fk_workflow_executions_rerun_of_id",
+        "workflow_executions",
+        type_="foreignkey",
+    )
+    op.drop_column("workflow_executions", "dirty_node_ids")
+    op.drop_column("workflow_executions", "rerun_of_id")
@@ -0,0 +1,45 @@
+"""Add batch execution fields to workflow_executions.
+
+Revision ID: d9a3b6e5f2c1
+Revises: c4d8e2f1a6b3
+Create Date: 2026-10-16 15:00:00
+
+TAG: [SPEC-011] [DATABASE] [MIGRATION] [BATCH]
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d9a3b6e5f2c1"
+down_revision: str | None = "c4d8e2f1a6b3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema - Add batch ID and batch concurrency limit."""
+    op.add_column(
+        "workflow_executions",
+        sa.Column("batch_id", postgresql.UUID(as_uuid=True), nullable=True),
+    )
+    op.add_column(
+        "workflow_executions",
+        sa.Column("batch_max_concurrency", sa.Integer, nullable=True),
+    )
+    op.create_index(
+        "ix_workflow_executions_batch_id",
+        "workflow_executions",
+        ["batch_id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema - Remove batch ID and batch concurrency limit."""
+    op.drop_index("ix_workflow_executions_batch_id", "workflow_executions")
+    op.drop_column("workflow_executions", "batch_max_concurrency")
+    op.drop_column("workflow_executions", "batch_id")
@@ -0,0 +1,34 @@
+"""Add requested target nodes to workflow_executions.
+
+Revision ID: e2c7f4a8b1d6
+Revises: d9a3b6e5f2c1
+Create Date: 2026-10-16 16:00:00
+
+TAG: [SPEC-011] [DATABASE] [MIGRATION] [PRUNING]
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2c7f4a8b1d6"
+down_revision: str | None = "d9a3b6e5f2c1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema - Add target node IDs."""
+    op.add_column(
+        "workflow_executions",
+        sa.Column("target_node_ids", postgresql.JSONB, nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema - Remove target node IDs."""
+    op.drop_column("workflow_executions", "target_node_ids")
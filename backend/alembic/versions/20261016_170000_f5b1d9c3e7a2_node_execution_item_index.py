@@ -0,0 +1,33 @@
+"""Add mapped item index to node_executions.
+
+Revision ID: f5b1d9c3e7a2
+Revises: e2c7f4a8b1d6
+Create Date: 2026-10-16 17:00:00
+
+TAG: [SPEC-011] [DATABASE] [MIGRATION] [MAP]
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f5b1d9c3e7a2"
+down_revision: str | None = "e2c7f4a8b1d6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema - Add mapped item index."""
+    op.add_column(
+        "node_executions",
+        sa.Column("item_index", sa.Integer(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema - Remove mapped item index."""
+    op.drop_column("node_executions", "item_index")
@@ -3,9 +3,15 @@
 This module defines all v1 API routes.
 """
 
+from typing import Any
+
 from fastapi import APIRouter
 
 from app.api.v1 import agents, executions, tools, validation, workflows
+from app.services.executors.hedging import get_hedge_controller
+from app.services.workflow.admission import get_admission_controller
+from app.services.workflow.circuit_breaker import get_circuit_breakers
+from app.services.workflow.resources import get_resource_pools
 
 router = APIRouter()
 
@@ -21,3 +27,19 @@ router.include_router(validation.router, tags=["Validation"])
 async def api_status() -> dict[str, str]:
     """API v1 status check."""
     return {"status": "ok", "version": "v1"}
+
+
+@router.get("/status/concurrency", tags=["Status"])
+async def concurrency_status() -> dict[str, Any]:
+    """Node slot usage, adaptive limits, hedging and circuits of this process."""
+    admission = get_admission_controller()
+    return {
+        "admission": {
+            "capacity": admission.capacity,
+            "in_use": admission.in_use,
+            "waiting": admission.waiting,
+        },
+        "resource_classes": get_resource_pools().metrics(),
+        "hedging": get_hedge_controller().metrics(),
+        "circuits": get_circuit_breakers().metrics(),
+    }
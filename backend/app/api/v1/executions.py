@@ -26,11 +26,14 @@ from app.models.enums import (  # noqa: TC001 - Required at runtime for FastAPI
 )
 from app.schemas.base import PaginatedResponse
 from app.schemas.execution import (
+    ExecutionBatchResponse,
     ExecutionCancel,
     ExecutionLogPaginatedResponse,
     ExecutionLogResponse,
+    ExecutionRerun,
     ExecutionStatistics,
     NodeExecutionPaginatedResponse,
+    NodeExecutionPayload,
     NodeExecutionResponse,
     NodeExecutionWithLogs,
     WorkflowExecutionCreate,
@@ -45,6 +48,8 @@ from app.services.execution_service import (
     NodeExecutionService,
     WorkflowExecutionService,
 )
+from app.services.workflow.blob_store import resolve_payload
+from app.services.workflow.exceptions import BlobNotFoundError
 from app.services.workflow_service import WorkflowService
 
 router = APIRouter()
@@ -82,6 +87,15 @@ WorkflowIdPath = Annotated[
     ),
 ]
 
+BatchIdPath = Annotated[
+    UUID,
+    Path(
+        ...,
+        description="Unique identifier of the execution batch",
+        examples=["880e8400-e29b-41d4-a716-446655440000"],
+    ),
+]
+
 
 # =============================================================================
 # Query Parameter Dependencies
@@ -228,6 +242,7 @@ async def create_execution(
 
     Raises:
         HTTPException: 404 if workflow not found.
+        HTTPException: 400 if a target node is not in the workflow.
     """
     # Validate workflow exists
     workflow_service = WorkflowService(db)
@@ -240,16 +255,53 @@ async def create_execution(
         )
 
     # Create execution
-    execution = await WorkflowExecutionService.create(
-        db,
-        workflow_id=execution_data.workflow_id,
-        data=execution_data,
-    )
+    try:
+        execution = await WorkflowExecutionService.create(
+            db,
+            workflow_id=execution_data.workflow_id,
+            data=execution_data,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
     await db.commit()
 
     return WorkflowExecutionResponse.model_validate(execution)
 
 
+@router.get(
+    "/batches/{batch_id}",
+    response_model=ExecutionBatchResponse,
+    summary="Get batch progress",
+    description="Get the aggregated progress of an execution batch.",
+)
+async def get_execution_batch(
+    db: DBSession,
+    batch_id: BatchIdPath,
+) -> ExecutionBatchResponse:
+    """Get the aggregated progress of an execution batch.
+
+    Args:
+        db: Database session.
+        batch_id: UUID of the batch.
+
+    Returns:
+        Batch handle with execution counts by status.
+
+    Raises:
+        HTTPException: 404 if batch not found.
+    """
+    batch = await WorkflowExecutionService.get_batch(db, batch_id)
+    if batch is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Batch with ID {batch_id} not found",
+        )
+    return batch
+
+
 @router.get(
     "/{execution_id}",
     response_model=WorkflowExecutionResponse,
@@ -381,6 +433,54 @@ async def cancel_execution(
     return WorkflowExecutionResponse.model_validate(execution)
 
 
+@router.post(
+    "/{execution_id}/rerun",
+    response_model=WorkflowExecutionResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Re-run changed nodes",
+    description=(
+        "Start a new execution that reuses the stored outputs of a finished "
+        "execution and only runs the dirty nodes and their downstream nodes."
+    ),
+)
+async def rerun_execution(
+    db: DBSession,
+    execution_id: ExecutionIdPath,
+    rerun_data: ExecutionRerun,
+) -> WorkflowExecutionResponse:
+    """Partially re-execute a finished workflow execution.
+
+    Args:
+        db: Database session.
+        execution_id: UUID of the execution to re-run.
+        rerun_data: Dirty node IDs and optional input override.
+
+    Returns:
+        Created workflow execution record.
+
+    Raises:
+        HTTPException: 404 if execution not found.
+        HTTPException: 400 if execution is not finished or nodes are invalid.
+    """
+    try:
+        execution = await WorkflowExecutionService.create_rerun(
+            db, execution_id, rerun_data
+        )
+        await db.commit()
+    except ValueError as e:
+        if "not found" in str(e).lower():
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Execution with ID {execution_id} not found",
+            ) from e
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+    return WorkflowExecutionResponse.model_validate(execution)
+
+
 @router.get(
     "/{execution_id}/statistics",
     response_model=ExecutionStatistics,
@@ -523,6 +623,59 @@ async def get_node_execution(
     )
 
 
+@router.get(
+    "/{execution_id}/nodes/{node_execution_id}/payload",
+    response_model=NodeExecutionPayload,
+    summary="Get node execution payload",
+    description=(
+        "Retrieve the full input and output of a node execution, loading "
+        "large payloads from the blob store."
+    ),
+)
+async def get_node_execution_payload(
+    db: DBSession,
+    execution_id: ExecutionIdPath,
+    node_execution_id: NodeExecutionIdPath,
+) -> NodeExecutionPayload:
+    """Get the input and output of a node execution with blobs resolved.
+
+    Args:
+        db: Database session.
+        execution_id: UUID of the parent workflow execution.
+        node_execution_id: UUID of the node execution.
+
+    Returns:
+        Node execution input and output data.
+
+    Raises:
+        HTTPException: 404 if node execution or a referenced blob not found.
+    """
+    execution = await WorkflowExecutionService.get(db, execution_id)
+    if execution is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Execution with ID {execution_id} not found",
+        )
+
+    node_execution = await NodeExecutionService.get(db, node_execution_id)
+    if node_execution is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Node execution with ID {node_execution_id} not found",
+        )
+
+    try:
+        return NodeExecutionPayload(
+            input_data=await resolve_payload(node_execution.input_data) or {},
+            output_data=await resolve_payload(node_execution.output_data),
+        )
+    except BlobNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=e.message,
+        ) from e
+
+
 # =============================================================================
 # ExecutionLog Endpoints
 # =============================================================================
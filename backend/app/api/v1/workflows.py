@@ -29,6 +29,8 @@ from app.models.enums import (
 from app.models.workflow import Edge, Node
 from app.schemas.base import PaginatedResponse
 from app.schemas.execution import (
+    ExecutionBatchCreate,
+    ExecutionBatchResponse,
     WorkflowExecutionCreate,
     WorkflowExecutionResponse,
 )
@@ -48,6 +50,7 @@ from app.schemas.workflow import (
     WorkflowWithNodes,
 )
 from app.services.execution_service import WorkflowExecutionService
+from app.services.workflow.plan import get_plan_cache
 from app.services.workflow_service import (
     DAGValidationError,
     EdgeNotFoundError,
@@ -72,8 +75,8 @@ class WorkflowExecuteRequest(BaseModel):
     """Request schema for workflow execution.
 
     A simplified schema for the execute endpoint that only allows
-    optional input data, while trigger_type, context, and metadata
-    are filled in automatically.
+    optional input data and target nodes, while trigger_type, context,
+    and metadata are filled in automatically.
     """
 
     input_data: dict[str, Any] | None = Field(
@@ -81,6 +84,11 @@ class WorkflowExecuteRequest(BaseModel):
         description="Optional input data for the workflow execution (JSON)",
         examples=[{"user_id": 123, "action": "process_order"}],
     )
+    target_node_ids: list[UUID] | None = Field(
+        default=None,
+        min_length=1,
+        description="Optional nodes to run up to (with their upstream nodes)",
+    )
 
 
 # Temporary owner_id until auth is implemented
@@ -439,14 +447,16 @@ async def execute_workflow(
     Args:
         db: Database session.
         workflow_id: UUID of the workflow to execute.
-        request: Optional execution request with input_data.
+        request: Optional execution request with input_data and the
+            target nodes to run up to.
 
     Returns:
         Created workflow execution record.
 
     Raises:
         HTTPException: 404 if workflow not found.
-        HTTPException: 400 if workflow is inactive.
+        HTTPException: 400 if workflow is inactive or a target node is not
+            in the workflow.
     """
     try:
         # Get workflow to verify it exists and is active
@@ -477,6 +487,7 @@ async def execute_workflow(
             input_data=input_data,
             context=ExecutionContext(),
             metadata_=ExecutionMetadata(),
+            target_node_ids=request.target_node_ids if request else None,
         )
 
         # Create the execution
@@ -491,6 +502,11 @@ async def execute_workflow(
 
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -498,6 +514,64 @@ async def execute_workflow(
         ) from e
 
 
+@router.post(
+    "/{workflow_id}/execute/batch",
+    response_model=ExecutionBatchResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Execute workflow over many inputs",
+    description=(
+        "Queue one execution per input payload. The executions share a batch "
+        "ID and run at most max_concurrency at a time."
+    ),
+)
+async def execute_workflow_batch(
+    db: DBSession,
+    workflow_id: UUID,
+    request: ExecutionBatchCreate,
+) -> ExecutionBatchResponse:
+    """Execute a workflow once per input payload.
+
+    Args:
+        db: Database session.
+        workflow_id: UUID of the workflow to execute.
+        request: Input payloads, shared context/metadata and concurrency.
+
+    Returns:
+        Batch handle with aggregated progress.
+
+    Raises:
+        HTTPException: 404 if workflow not found.
+        HTTPException: 400 if workflow is inactive or the batch is too large.
+    """
+    workflow_service = WorkflowService(db)
+    workflow = await workflow_service.get(workflow_id)
+    if workflow is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Workflow {workflow_id} not found",
+        )
+    if not workflow.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Workflow {workflow_id} is not active. Only active workflows can be executed.",
+        )
+
+    try:
+        batch_id, _ = await WorkflowExecutionService.create_batch(
+            db, workflow_id, request, trigger_type=TriggerType.MANUAL
+        )
+        await db.commit()
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+    batch = await WorkflowExecutionService.get_batch(db, batch_id)
+    assert batch is not None  # Just inserted
+    return batch
+
+
 # =============================================================================
 # Node Endpoints
 # =============================================================================
@@ -1130,6 +1204,7 @@ async def update_workflow_graph(
 
         # Increment workflow version
         current.version += 1
+        get_plan_cache().invalidate_after_commit(db, workflow_id)
         await db.flush()
         await db.refresh(current)
 
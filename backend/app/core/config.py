@@ -66,6 +66,92 @@ class Settings(BaseSettings):
     # Scheduler
     SCHEDULER_TIMEZONE: str = "Asia/Seoul"
 
+    # Workflow Execution
+    EXECUTION_WRITE_BATCH_SIZE: int = 500  # Buffered rows before a flush
+    EXECUTION_WRITE_FLUSH_INTERVAL: float = 1.0  # Max seconds rows stay buffered
+    EXECUTION_PLAN_CACHE_SIZE: int = 256  # Compiled plans kept in process
+    EXECUTION_PRIORITY_HISTORY_SIZE: int = 20  # Recent runs per node for priorities
+    EXECUTION_CANCEL_POLL_INTERVAL: float = 1.0  # Status polls for cancellation
+
+    # Admission Control (node slots shared by all executions in a process)
+    ADMISSION_MAX_SLOTS: int = 32  # Concurrent node runs per process
+    ADMISSION_PRIORITY_SCALE: int = 25  # Priority points per doubling of share
+
+    # Resource Classes (separate node slot pools, overridable in Node.config)
+    RESOURCE_CLASS_SLOTS: dict[str, int] = {
+        "llm": 4,  # Agent/LLM calls (seconds each, rate limited upstream)
+        "http": 32,  # Tool calls waiting on the network
+        "cpu": 4,  # Transforms and aggregations
+        "light": 64,  # Triggers, conditions and other bookkeeping nodes
+    }
+    RESOURCE_CLASS_BY_NODE_TYPE: dict[str, str] = {
+        "agent": "llm",
+        "tool": "http",
+        "adapter": "cpu",
+        "aggregator": "cpu",
+    }
+    RESOURCE_CLASS_DEFAULT: str = "light"  # Class of unmapped node types
+    # Adaptive (AIMD) limits: classes listed here grow up to these slots
+    RESOURCE_CLASS_MAX_SLOTS: dict[str, int] = {"llm": 16, "http": 128}
+    RESOURCE_CLASS_LATENCY_TARGETS: dict[str, float] = {"llm": 30.0, "http": 5.0}
+    AIMD_DECREASE_FACTOR: float = 0.5  # Limit multiplier on overload
+    AIMD_DECREASE_COOLDOWN: float = 1.0  # Min seconds between decreases
+    AIMD_ERROR_RATE_TARGET: float = 0.2  # Error rate (moving average) to back off
+
+    # Circuit Breakers (per tool and LLM provider) and Retry Budget
+    CIRCUIT_FAILURE_THRESHOLD: int = 5  # Consecutive outage errors that open a circuit
+    CIRCUIT_RESET_TIMEOUT: float = 30.0  # Seconds open before half-open probing
+    CIRCUIT_HALF_OPEN_MAX_CALLS: int = 1  # Concurrent probes while half-open
+    RETRY_BUDGET_RATIO: float = 0.1  # Retry tokens earned per first attempt
+    RETRY_BUDGET_BURST: float = 10.0  # Max banked retry tokens per circuit
+    RETRY_BUDGET_REDIS: bool = False  # Share retry budgets through REDIS_URL
+
+    # Hedged Tool Requests (opt-in per tool with {"idempotent": true, "hedge": true})
+    HEDGE_LATENCY_PERCENTILE: float = 95.0  # Hedge calls slower than this percentile
+    HEDGE_MIN_SAMPLES: int = 20  # Latencies observed before a tool is hedged
+    HEDGE_LATENCY_WINDOW: int = 200  # Recent latencies kept per tool
+    HEDGE_BUDGET_RATIO: float = 0.05  # Hedge tokens earned per hedge-enabled call
+    HEDGE_BUDGET_BURST: float = 10.0  # Max banked hedge tokens
+
+    # Node Output Cache (opt-in per node with config {"cache": true})
+    NODE_OUTPUT_CACHE_SIZE: int = 1024  # In-process entries before LRU eviction
+    NODE_OUTPUT_CACHE_TTL: int = 300  # Default entry TTL in seconds
+    NODE_OUTPUT_CACHE_REDIS: bool = False  # Share entries through REDIS_URL
+
+    # Single-Flight Node Calls (opt-in per node with config {"single_flight": true})
+    SINGLE_FLIGHT_WINDOW: float = 1.0  # Seconds a completed call's result is reused
+    SINGLE_FLIGHT_MAX_ENTRIES: int = 1024  # Completed results kept in process
+
+    # Map Nodes (PARALLEL fan-out over a list in the node input)
+    MAP_DEFAULT_CONCURRENCY: int = 10  # Items of one map run at once
+    MAP_MAX_ITEMS: int = 10_000  # Larger lists fail the PARALLEL node
+
+    # Streaming Node Outputs
+    STREAM_QUEUE_SIZE: int = 8  # Chunks buffered per consumer before back-pressure
+    STREAM_CHUNK_SIZE: int = 1000  # Records per chunk when splitting payloads
+
+    # Blob Store (large node payloads kept out of node_executions rows)
+    BLOB_STORE_BACKEND: str = "filesystem"  # Only "filesystem" for now
+    BLOB_STORE_PATH: str = "data/blobs"  # Root directory of the filesystem backend
+    BLOB_OFFLOAD_THRESHOLD_BYTES: int = 262_144  # Larger JSON payloads are offloaded
+
+    # Processor Offload
+    PROCESS_POOL_ENABLED: bool = False  # Enable for execution worker processes
+    PROCESS_POOL_MAX_WORKERS: int | None = None  # Defaults to CPU count
+    PROCESS_POOL_NODE_TYPES: list[str] = ["adapter", "aggregator"]
+    PROCESS_POOL_MIN_PAYLOAD_ITEMS: int = 10_000  # Smaller payloads run inline
+
+    # Execution Workers
+    WORKER_CONCURRENCY: int = 4  # Executions run concurrently per worker
+    WORKER_POLL_INTERVAL: float = 1.0  # Seconds between queue polls when idle
+    WORKER_LEASE_SECONDS: int = 60  # Lease duration of a claimed execution
+    WORKER_HEARTBEAT_INTERVAL: float = 15.0  # Seconds between lease renewals
+    WORKER_MAX_ATTEMPTS: int = 3  # Claims before an expired execution fails
+
+    # Batch Executions (one workflow over many inputs)
+    BATCH_MAX_INPUTS: int = 1000  # Input payloads accepted per batch
+    BATCH_DEFAULT_CONCURRENCY: int = 10  # Executions of a batch running at once
+
     # Logging
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
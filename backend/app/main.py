@@ -17,6 +17,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.api import router as api_router
 from app.core.config import settings
 from app.core.logging import get_logger, setup_logging
+from app.db.session import engine
+from app.services.workflow.cancellation import CancellationListener
+from app.services.workflow.processors.offload import get_offloader, shutdown_offloader
 
 # Initialize logging system
 setup_logging(
@@ -54,6 +57,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:  # noqa: ARG001 - Requ
         },
     )
 
+    if settings.PROCESS_POOL_ENABLED:
+        await get_offloader().start()
+
+    cancel_listener = CancellationListener(engine)
+    await cancel_listener.start()
+
     # TODO: Initialize database connection pool
     # TODO: Initialize Redis connection
     # TODO: Initialize APScheduler
@@ -71,6 +80,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:  # noqa: ARG001 - Requ
         extra={"context": {"action": "application_shutdown"}},
     )
 
+    await cancel_listener.stop()
+    shutdown_offloader()
+
     # TODO: Close database connections
     # TODO: Close Redis connection
     # TODO: Shutdown scheduler
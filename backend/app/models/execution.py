@@ -23,10 +23,13 @@ from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import (
     JSON,
+    Boolean,
     DateTime,
     Enum as SQLEnum,
     ForeignKey,
+    Index,
     Integer,
+    String,
     Text,
     func,
 )
@@ -61,6 +64,16 @@ class WorkflowExecution(UUIDMixin, TimestampMixin, Base):
         error_message: Error message if execution failed (nullable)
         context: JSONB execution context (variables, secrets, environment)
         metadata_: JSONB metadata (triggered_by, priority, tags, etc.)
+        worker_id: ID of the queue worker holding the lease (nullable)
+        lease_expires_at: When the worker lease expires (nullable)
+        heartbeat_at: Last worker heartbeat (nullable)
+        attempts: Number of times the execution was claimed by a worker
+        rerun_of_id: Execution whose node outputs this partial re-run reuses
+        dirty_node_ids: Node IDs to re-execute with their descendants
+        target_node_ids: Node IDs whose outputs are requested; only they and
+            their ancestors run (nullable: the whole workflow runs)
+        batch_id: Batch of executions running the same workflow (nullable)
+        batch_max_concurrency: Maximum running executions of the batch
         created_at: Timestamp of creation (from TimestampMixin)
         updated_at: Timestamp of last update (from TimestampMixin)
         workflow: Relationship to parent Workflow
@@ -145,6 +158,59 @@ class WorkflowExecution(UUIDMixin, TimestampMixin, Base):
         server_default="{}",
     )
 
+    # Queue lease fields (claimed by workers with FOR UPDATE SKIP LOCKED)
+    worker_id: Mapped[str | None] = mapped_column(
+        String(255),
+        nullable=True,
+    )
+
+    lease_expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    heartbeat_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+
+    # Partial re-execution (reuses outputs of unaffected upstream nodes)
+    rerun_of_id: Mapped[uuid.UUID | None] = mapped_column(
+        GUID(),
+        ForeignKey("workflow_executions.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+
+    dirty_node_ids: Mapped[list[str] | None] = mapped_column(
+        JSONType,
+        nullable=True,
+    )
+
+    # Demand-driven pruning (only ancestors of the targets run)
+    target_node_ids: Mapped[list[str] | None] = mapped_column(
+        JSONType,
+        nullable=True,
+    )
+
+    # Batch execution (one workflow over many inputs)
+    batch_id: Mapped[uuid.UUID | None] = mapped_column(
+        GUID(),
+        nullable=True,
+        index=True,
+    )
+
+    batch_max_concurrency: Mapped[int | None] = mapped_column(
+        Integer,
+        nullable=True,
+    )
+
     # Relationships
     workflow: Mapped[Workflow] = relationship(
         "Workflow",
@@ -166,6 +232,17 @@ class WorkflowExecution(UUIDMixin, TimestampMixin, Base):
         foreign_keys="ExecutionLog.workflow_execution_id",
     )
 
+    # Table constraints
+    __table_args__ = (
+        # Queue scans: pending rows by age, running rows by lease expiry
+        Index("ix_workflow_executions_status_created_at", "status", "created_at"),
+        Index(
+            "ix_workflow_executions_status_lease_expires_at",
+            "status",
+            "lease_expires_at",
+        ),
+    )
+
     @property
     def duration_seconds(self) -> float | None:
         """Calculate execution duration in seconds.
@@ -283,6 +360,10 @@ class NodeExecution(UUIDMixin, TimestampMixin, Base):
         error_traceback: Full traceback if node failed (nullable)
         retry_count: Number of times this node has been retried
         execution_order: Order in which this node was executed
+        cache_hit: Whether the output was served from the node output cache
+            or reused from the source execution of a partial re-run
+        item_index: Position of the mapped item for the per-item runs of a
+            map body node (nullable; None for the node's own record)
         created_at: Timestamp of creation (from TimestampMixin)
         updated_at: Timestamp of last update (from TimestampMixin)
         workflow_execution: Relationship to parent WorkflowExecution
@@ -368,6 +449,20 @@ class NodeExecution(UUIDMixin, TimestampMixin, Base):
         nullable=False,
     )
 
+    # Output memoization
+    cache_hit: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=False,
+        server_default="false",
+    )
+
+    # Per-item runs of map body nodes (fan-out over a PARALLEL node)
+    item_index: Mapped[int | None] = mapped_column(
+        Integer,
+        nullable=True,
+    )
+
     # Relationships
     workflow_execution: Mapped[WorkflowExecution] = relationship(
         "WorkflowExecution",
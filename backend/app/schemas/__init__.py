@@ -37,6 +37,8 @@ from app.schemas.base import (
 
 # Execution schemas
 from app.schemas.execution import (
+    ExecutionBatchCreate,
+    ExecutionBatchResponse,
     ExecutionCancel,
     ExecutionContext,
     ExecutionLogBase,
@@ -44,12 +46,14 @@ from app.schemas.execution import (
     ExecutionLogPaginatedResponse,
     ExecutionLogResponse,
     ExecutionMetadata,
+    ExecutionRerun,
     ExecutionResume,
     ExecutionRetry,
     ExecutionStatistics,
     NodeExecutionBase,
     NodeExecutionCreate,
     NodeExecutionPaginatedResponse,
+    NodeExecutionPayload,
     NodeExecutionResponse,
     NodeExecutionUpdate,
     NodeExecutionWithLogs,
@@ -125,6 +129,8 @@ __all__ = [
     "SuccessResponse",
     "VersionField",
     # Execution schemas
+    "ExecutionBatchCreate",
+    "ExecutionBatchResponse",
     "ExecutionCancel",
     "ExecutionContext",
     "ExecutionLogBase",
@@ -132,12 +138,14 @@ __all__ = [
     "ExecutionLogPaginatedResponse",
     "ExecutionLogResponse",
     "ExecutionMetadata",
+    "ExecutionRerun",
     "ExecutionResume",
     "ExecutionRetry",
     "ExecutionStatistics",
     "NodeExecutionBase",
     "NodeExecutionCreate",
     "NodeExecutionPaginatedResponse",
+    "NodeExecutionPayload",
     "NodeExecutionResponse",
     "NodeExecutionUpdate",
     "NodeExecutionWithLogs",
@@ -187,11 +187,17 @@ class NodeExecutionResponse(BaseResponse):
     )
     input_data: dict[str, Any] = Field(
         ...,
-        description="Input data for the node execution",
+        description=(
+            "Input data for the node execution, or a blob reference "
+            '({"$blob": ..., "size_bytes": ...}) for large payloads'
+        ),
     )
     output_data: dict[str, Any] | None = Field(
         default=None,
-        description="Output data from the node execution",
+        description=(
+            "Output data from the node execution, or a blob reference "
+            "for large payloads"
+        ),
     )
     error_message: str | None = Field(
         default=None,
@@ -212,6 +218,15 @@ class NodeExecutionResponse(BaseResponse):
         ge=0,
         description="Order in which this node was executed",
     )
+    cache_hit: bool = Field(
+        default=False,
+        description="Whether the output was served from cache or a previous run",
+    )
+    item_index: int | None = Field(
+        default=None,
+        ge=0,
+        description="Mapped item position for per-item runs of a map body node",
+    )
 
     @computed_field
     def duration_seconds(self) -> float | None:
@@ -230,6 +245,22 @@ class NodeExecutionWithLogs(NodeExecutionResponse):
     )
 
 
+class NodeExecutionPayload(BaseSchema):
+    """Schema for the full input and output of a node execution.
+
+    Blob references stored for large payloads are resolved.
+    """
+
+    input_data: dict[str, Any] = Field(
+        ...,
+        description="Input data for the node execution",
+    )
+    output_data: dict[str, Any] | None = Field(
+        default=None,
+        description="Output data from the node execution",
+    )
+
+
 # =============================================================================
 # WorkflowExecution Schemas
 # =============================================================================
@@ -283,6 +314,16 @@ class ExecutionMetadata(BaseSchema):
         description="External correlation ID for tracing across systems",
         examples=["req-abc123", "trace-xyz789"],
     )
+    deadline_seconds: float | None = Field(
+        default=None,
+        gt=0,
+        le=86400,
+        description=(
+            "Time budget of the execution in seconds, counted from its start "
+            "(overrides the workflow config deadline_seconds)"
+        ),
+        examples=[30.0, 300.0],
+    )
 
     @field_validator("tags")
     @classmethod
@@ -320,6 +361,14 @@ class WorkflowExecutionBase(BaseSchema):
         alias="metadata",
         description="Execution metadata (triggered_by, priority, tags)",
     )
+    target_node_ids: list[UUID] | None = Field(
+        default=None,
+        min_length=1,
+        description=(
+            "Nodes whose outputs are needed; only they and their upstream "
+            "nodes run, the rest is skipped (default: the whole workflow)"
+        ),
+    )
 
 
 class WorkflowExecutionCreate(WorkflowExecutionBase):
@@ -370,6 +419,22 @@ class WorkflowExecutionResponse(BaseResponse):
         default_factory=dict,
         description="Execution metadata (triggered_by, priority, tags)",
     )
+    rerun_of_id: UUID | None = Field(
+        default=None,
+        description="Execution whose node outputs this partial re-run reuses",
+    )
+    dirty_node_ids: list[UUID] | None = Field(
+        default=None,
+        description="Nodes re-executed together with their downstream nodes",
+    )
+    target_node_ids: list[UUID] | None = Field(
+        default=None,
+        description="Requested nodes; only they and their upstream nodes run",
+    )
+    batch_id: UUID | None = Field(
+        default=None,
+        description="Batch this execution belongs to",
+    )
 
     @computed_field
     def duration_seconds(self) -> float | None:
@@ -483,6 +548,90 @@ class ExecutionRetry(BaseSchema):
     )
 
 
+class ExecutionRerun(BaseSchema):
+    """Schema for partially re-executing a finished execution."""
+
+    dirty_node_ids: list[UUID] = Field(
+        ...,
+        min_length=1,
+        description="Changed or failed nodes to re-execute with their downstream nodes",
+    )
+    input_override: dict[str, Any] | None = Field(
+        default=None,
+        description="Optional input data override (defaults to the original input)",
+    )
+
+
+class ExecutionBatchCreate(BaseSchema):
+    """Schema for executing one workflow over many input payloads."""
+
+    inputs: list[dict[str, Any]] = Field(
+        ...,
+        min_length=1,
+        description="Input data of each execution in the batch (JSON)",
+        examples=[[{"symbol": "AAPL"}, {"symbol": "MSFT"}]],
+    )
+    max_concurrency: int | None = Field(
+        default=None,
+        ge=1,
+        le=1000,
+        description="Maximum executions of the batch running at the same time",
+        examples=[10],
+    )
+    context: ExecutionContext = Field(
+        default_factory=ExecutionContext,
+        description="Execution context shared by every execution of the batch",
+    )
+    metadata_: ExecutionMetadata = Field(
+        default_factory=ExecutionMetadata,
+        alias="metadata",
+        description="Execution metadata shared by every execution of the batch",
+    )
+    target_node_ids: list[UUID] | None = Field(
+        default=None,
+        min_length=1,
+        description=(
+            "Nodes whose outputs are needed; only they and their upstream "
+            "nodes run, the rest is skipped (default: the whole workflow)"
+        ),
+    )
+
+
+class ExecutionBatchResponse(BaseSchema):
+    """Schema for the aggregated progress of an execution batch."""
+
+    batch_id: UUID = Field(
+        ...,
+        description="UUID of the batch",
+    )
+    workflow_id: UUID = Field(
+        ...,
+        description="UUID of the workflow executed by the batch",
+    )
+    total: int = Field(
+        ...,
+        ge=0,
+        description="Number of executions in the batch",
+    )
+    pending: int = Field(default=0, ge=0, description="Pending executions")
+    running: int = Field(default=0, ge=0, description="Running executions")
+    completed: int = Field(default=0, ge=0, description="Completed executions")
+    failed: int = Field(default=0, ge=0, description="Failed executions")
+    cancelled: int = Field(default=0, ge=0, description="Cancelled executions")
+
+    @computed_field
+    def progress(self) -> float:
+        """Fraction of executions that finished (0.0 to 1.0)."""
+        if self.total == 0:
+            return 1.0
+        return (self.total - self.pending - self.running) / self.total
+
+    @computed_field
+    def is_terminal(self) -> bool:
+        """Check if every execution of the batch finished."""
+        return self.pending == 0 and self.running == 0
+
+
 class ExecutionResume(BaseSchema):
     """Schema for resuming a paused or failed execution."""
 
@@ -575,6 +724,9 @@ ExecutionLogPaginatedResponse = PaginatedResponse[ExecutionLogResponse]
 
 
 __all__ = [
+    # Batch schemas
+    "ExecutionBatchCreate",
+    "ExecutionBatchResponse",
     # Control schemas
     "ExecutionCancel",
     # WorkflowExecution schemas
@@ -593,6 +745,7 @@ __all__ = [
     "NodeExecutionBase",
     "NodeExecutionCreate",
     "NodeExecutionPaginatedResponse",
+    "NodeExecutionPayload",
     "NodeExecutionResponse",
     "NodeExecutionUpdate",
     "NodeExecutionWithLogs",
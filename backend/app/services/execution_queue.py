@@ -0,0 +1,287 @@
+"""Database-backed execution queue for distributed workers.
+
+TAG: [SPEC-011] [SERVICES] [EXECUTION] [QUEUE]
+
+The workflow_executions table doubles as the job queue. Workers claim
+PENDING executions (and RUNNING executions whose lease has expired) with
+SELECT ... FOR UPDATE SKIP LOCKED, so any number of workers on any number of
+hosts can poll concurrently without blocking or double-claiming rows.
+
+A claim grants a time-limited lease that the worker renews with heartbeats.
+If a worker dies, its lease expires and another worker reclaims the
+execution, up to WORKER_MAX_ATTEMPTS claims. On SQLite (tests) FOR UPDATE
+is ignored, which is safe for a single process.
+
+Executions of a batch carry the batch's concurrency limit; rows of a batch
+that already has that many executions under a live lease are not claimed.
+Workers claiming at the same moment may briefly exceed the limit.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any, cast
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.orm import aliased
+
+from app.core.config import settings
+from app.models.enums import ExecutionStatus
+from app.models.execution import WorkflowExecution
+
+if TYPE_CHECKING:
+    import uuid
+
+    from sqlalchemy import CursorResult, ScalarSelect
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class ExecutionQueueService:
+    """Service for claiming and leasing queued workflow executions.
+
+    TAG: [SPEC-011] [SERVICES] [EXECUTION] [QUEUE]
+
+    All methods commit their own transaction so row locks are held only for
+    the duration of the claim, never while an execution runs.
+    """
+
+    @staticmethod
+    async def claim(
+        db: AsyncSession,
+        worker_id: str,
+        limit: int = 1,
+        lease_seconds: int | None = None,
+        max_attempts: int | None = None,
+    ) -> list[WorkflowExecution]:
+        """Claim up to ``limit`` runnable executions for a worker.
+
+        Runnable executions are PENDING ones and RUNNING ones whose lease has
+        expired, oldest first. Claimed rows are moved to RUNNING with a fresh
+        lease and their attempt counter is incremented.
+
+        Args:
+            db: Database session.
+            worker_id: ID of the claiming worker.
+            limit: Maximum number of executions to claim.
+            lease_seconds: Lease duration (default from settings).
+            max_attempts: Maximum claims per execution (default from settings).
+
+        Returns:
+            List of claimed WorkflowExecution records.
+        """
+        if limit <= 0:
+            return []
+
+        lease_seconds = lease_seconds or settings.WORKER_LEASE_SECONDS
+        max_attempts = max_attempts or settings.WORKER_MAX_ATTEMPTS
+        now = datetime.now(UTC)
+
+        query = (
+            select(WorkflowExecution)
+            .where(
+                or_(
+                    WorkflowExecution.status == ExecutionStatus.PENDING,
+                    and_(
+                        WorkflowExecution.status == ExecutionStatus.RUNNING,
+                        WorkflowExecution.lease_expires_at < now,
+                    ),
+                ),
+                WorkflowExecution.attempts < max_attempts,
+                or_(
+                    WorkflowExecution.batch_max_concurrency.is_(None),
+                    ExecutionQueueService._batch_running(now)
+                    < WorkflowExecution.batch_max_concurrency,
+                ),
+            )
+            .order_by(WorkflowExecution.created_at.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await db.execute(query)
+        executions = await ExecutionQueueService._within_batch_limits(
+            db, list(result.scalars().all()), now
+        )
+
+        for execution in executions:
+            execution.status = ExecutionStatus.RUNNING
+            execution.worker_id = worker_id
+            execution.lease_expires_at = now + timedelta(seconds=lease_seconds)
+            execution.heartbeat_at = now
+            execution.attempts += 1
+            if execution.started_at is None:
+                execution.started_at = now
+
+        await db.commit()
+        return executions
+
+    @staticmethod
+    def _batch_running(now: datetime) -> ScalarSelect[int]:
+        """Count live-leased executions in the batch of the outer row."""
+        running = aliased(WorkflowExecution)
+        return (
+            select(func.count(running.id))
+            .where(
+                running.batch_id == WorkflowExecution.batch_id,
+                running.status == ExecutionStatus.RUNNING,
+                running.lease_expires_at >= now,
+            )
+            .correlate(WorkflowExecution)
+            .scalar_subquery()
+        )
+
+    @staticmethod
+    async def _within_batch_limits(
+        db: AsyncSession,
+        executions: list[WorkflowExecution],
+        now: datetime,
+    ) -> list[WorkflowExecution]:
+        """Drop candidates that would push their batch over its limit.
+
+        The claim query only excludes batches that are already full; this
+        caps how many rows of one batch a single claim takes.
+        """
+        batch_ids = {e.batch_id for e in executions if e.batch_id is not None}
+        if not batch_ids:
+            return executions
+
+        result = await db.execute(
+            select(WorkflowExecution.batch_id, func.count(WorkflowExecution.id))
+            .where(
+                WorkflowExecution.batch_id.in_(batch_ids),
+                WorkflowExecution.status == ExecutionStatus.RUNNING,
+                WorkflowExecution.lease_expires_at >= now,
+            )
+            .group_by(WorkflowExecution.batch_id)
+        )
+        running = Counter(dict(result.tuples().all()))
+
+        claimable = []
+        for execution in executions:
+            limit = execution.batch_max_concurrency
+            if execution.batch_id is not None and limit is not None:
+                if running[execution.batch_id] >= limit:
+                    continue
+                running[execution.batch_id] += 1
+            claimable.append(execution)
+        return claimable
+
+    @staticmethod
+    async def heartbeat(
+        db: AsyncSession,
+        execution_id: uuid.UUID,
+        worker_id: str,
+        lease_seconds: int | None = None,
+    ) -> bool:
+        """Renew the lease of an execution held by a worker.
+
+        Args:
+            db: Database session.
+            execution_id: UUID of the leased execution.
+            worker_id: ID of the worker holding the lease.
+            lease_seconds: Lease duration (default from settings).
+
+        Returns:
+            True if the lease was renewed, False if the execution is no longer
+            RUNNING under this worker (cancelled, finished or reclaimed).
+        """
+        lease_seconds = lease_seconds or settings.WORKER_LEASE_SECONDS
+        now = datetime.now(UTC)
+
+        result = cast(
+            "CursorResult[Any]",
+            await db.execute(
+                update(WorkflowExecution)
+                .where(
+                    WorkflowExecution.id == execution_id,
+                    WorkflowExecution.worker_id == worker_id,
+                    WorkflowExecution.status == ExecutionStatus.RUNNING,
+                )
+                .values(
+                    heartbeat_at=now,
+                    lease_expires_at=now + timedelta(seconds=lease_seconds),
+                )
+            ),
+        )
+        await db.commit()
+        return result.rowcount > 0
+
+    @staticmethod
+    async def release(
+        db: AsyncSession,
+        execution_id: uuid.UUID,
+        worker_id: str,
+        error_message: str | None = None,
+    ) -> None:
+        """Release a worker's lease once it stops running an execution.
+
+        If the execution is still RUNNING (the run ended without reaching a
+        terminal state), it is marked FAILED with ``error_message``.
+
+        Args:
+            db: Database session.
+            execution_id: UUID of the leased execution.
+            worker_id: ID of the worker holding the lease.
+            error_message: Failure reason for executions left RUNNING.
+        """
+        now = datetime.now(UTC)
+        owned = and_(
+            WorkflowExecution.id == execution_id,
+            WorkflowExecution.worker_id == worker_id,
+        )
+
+        await db.execute(
+            update(WorkflowExecution)
+            .where(owned, WorkflowExecution.status == ExecutionStatus.RUNNING)
+            .values(
+                status=ExecutionStatus.FAILED,
+                ended_at=now,
+                error_message=error_message or "Execution ended without a result",
+            )
+        )
+        await db.execute(
+            update(WorkflowExecution).where(owned).values(lease_expires_at=None)
+        )
+        await db.commit()
+
+    @staticmethod
+    async def fail_exhausted(
+        db: AsyncSession,
+        max_attempts: int | None = None,
+    ) -> int:
+        """Fail RUNNING executions whose lease expired too many times.
+
+        Args:
+            db: Database session.
+            max_attempts: Maximum claims per execution (default from settings).
+
+        Returns:
+            Number of executions marked FAILED.
+        """
+        max_attempts = max_attempts or settings.WORKER_MAX_ATTEMPTS
+        now = datetime.now(UTC)
+
+        result = cast(
+            "CursorResult[Any]",
+            await db.execute(
+                update(WorkflowExecution)
+                .where(
+                    WorkflowExecution.status == ExecutionStatus.RUNNING,
+                    WorkflowExecution.lease_expires_at < now,
+                    WorkflowExecution.attempts >= max_attempts,
+                )
+                .values(
+                    status=ExecutionStatus.FAILED,
+                    ended_at=now,
+                    lease_expires_at=None,
+                    error_message=(
+                        f"Worker lease expired after {max_attempts} attempt(s)"
+                    ),
+                )
+            ),
+        )
+        await db.commit()
+        return result.rowcount
+
+
+__all__ = ["ExecutionQueueService"]
@@ -11,22 +11,27 @@ node executions, and execution logs with proper state transitions.
 
 from __future__ import annotations
 
+import uuid
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select
 from sqlalchemy.orm import selectinload
 
-from app.models.enums import ExecutionStatus, LogLevel
+from app.core.config import settings
+from app.models.enums import ExecutionStatus, LogLevel, TriggerType
 from app.models.execution import ExecutionLog, NodeExecution, WorkflowExecution
+from app.models.workflow import Node
 from app.schemas.execution import (
+    ExecutionBatchCreate,
+    ExecutionBatchResponse,
+    ExecutionRerun,
     ExecutionStatistics,
     WorkflowExecutionCreate,
 )
+from app.services.workflow.cancellation import notify_cancellation
 
 if TYPE_CHECKING:
-    import uuid
-
     from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -51,7 +56,13 @@ class WorkflowExecutionService:
 
         Returns:
             The created WorkflowExecution instance.
+
+        Raises:
+            ValueError: If a target node does not belong to the workflow.
         """
+        target_node_ids = await WorkflowExecutionService._check_node_ids(
+            db, workflow_id, data.target_node_ids, "Target"
+        )
         execution = WorkflowExecution(
             workflow_id=workflow_id,
             trigger_type=data.trigger_type,
@@ -59,12 +70,204 @@ class WorkflowExecutionService:
             input_data=data.input_data,
             context=data.context.model_dump() if data.context else {},
             metadata_=data.metadata_.model_dump() if data.metadata_ else {},
+            target_node_ids=target_node_ids,
+        )
+        db.add(execution)
+        await db.flush()
+        await db.refresh(execution)
+        return execution
+
+    @staticmethod
+    async def _check_node_ids(
+        db: AsyncSession,
+        workflow_id: uuid.UUID,
+        node_ids: list[uuid.UUID] | None,
+        label: str,
+    ) -> list[str] | None:
+        """Check that nodes belong to a workflow and serialize their IDs.
+
+        Args:
+            db: Database session.
+            workflow_id: UUID of the workflow.
+            node_ids: Node IDs to check (None passes through).
+            label: Role of the nodes, used in the error message.
+
+        Returns:
+            String node IDs for JSON storage, or None.
+
+        Raises:
+            ValueError: If a node does not belong to the workflow.
+        """
+        if node_ids is None:
+            return None
+
+        result = await db.execute(
+            select(Node.id).where(Node.workflow_id == workflow_id)
+        )
+        unknown = set(node_ids) - set(result.scalars().all())
+        if unknown:
+            raise ValueError(
+                f"{label} nodes not in workflow: "
+                + ", ".join(sorted(str(node_id) for node_id in unknown))
+            )
+        return [str(node_id) for node_id in node_ids]
+
+    @staticmethod
+    async def create_rerun(
+        db: AsyncSession,
+        source_execution_id: uuid.UUID,
+        data: ExecutionRerun,
+    ) -> WorkflowExecution:
+        """Create a partial re-execution of a finished execution.
+
+        The new execution reuses the stored outputs of every node that is
+        not downstream of a dirty node; only the affected sub-DAG runs.
+
+        Args:
+            db: Database session.
+            source_execution_id: UUID of the execution to re-run.
+            data: Dirty node IDs and optional input override.
+
+        Returns:
+            The created (PENDING) WorkflowExecution instance.
+
+        Raises:
+            ValueError: If the source execution is not found or not finished,
+                or a dirty node does not belong to its workflow.
+        """
+        source = await WorkflowExecutionService.get(db, source_execution_id)
+        if source is None:
+            raise ValueError(f"Execution {source_execution_id} not found")
+        if not source.is_terminal:
+            raise ValueError(f"Cannot re-run execution in {source.status.value} status")
+
+        dirty_node_ids = await WorkflowExecutionService._check_node_ids(
+            db, source.workflow_id, data.dirty_node_ids, "Dirty"
+        )
+
+        execution = WorkflowExecution(
+            workflow_id=source.workflow_id,
+            trigger_type=source.trigger_type,
+            status=ExecutionStatus.PENDING,
+            input_data=(
+                data.input_override
+                if data.input_override is not None
+                else source.input_data
+            ),
+            context=source.context,
+            metadata_=source.metadata_,
+            rerun_of_id=source.id,
+            dirty_node_ids=dirty_node_ids,
+            target_node_ids=source.target_node_ids,
         )
         db.add(execution)
         await db.flush()
         await db.refresh(execution)
         return execution
 
+    @staticmethod
+    async def create_batch(
+        db: AsyncSession,
+        workflow_id: uuid.UUID,
+        data: ExecutionBatchCreate,
+        trigger_type: TriggerType = TriggerType.MANUAL,
+    ) -> tuple[uuid.UUID, list[uuid.UUID]]:
+        """Create one PENDING execution per input payload of a batch.
+
+        The rows are inserted with a single multi-row INSERT and share a
+        batch ID and concurrency limit, which queue workers honour when
+        claiming them.
+
+        Args:
+            db: Database session.
+            workflow_id: UUID of the workflow to execute.
+            data: Input payloads, shared context/metadata and concurrency.
+            trigger_type: How the executions were triggered.
+
+        Returns:
+            Tuple of (batch ID, execution IDs in input order).
+
+        Raises:
+            ValueError: If the batch has more inputs than BATCH_MAX_INPUTS or
+                a target node does not belong to the workflow.
+        """
+        if len(data.inputs) > settings.BATCH_MAX_INPUTS:
+            raise ValueError(
+                f"Batch of {len(data.inputs)} inputs exceeds the limit of "
+                f"{settings.BATCH_MAX_INPUTS}"
+            )
+
+        target_node_ids = await WorkflowExecutionService._check_node_ids(
+            db, workflow_id, data.target_node_ids, "Target"
+        )
+        batch_id = uuid.uuid4()
+        execution_ids = [uuid.uuid4() for _ in data.inputs]
+        context = data.context.model_dump()
+        metadata = data.metadata_.model_dump()
+        max_concurrency = data.max_concurrency or settings.BATCH_DEFAULT_CONCURRENCY
+
+        await db.execute(
+            insert(WorkflowExecution),
+            [
+                {
+                    "id": execution_id,
+                    "workflow_id": workflow_id,
+                    "trigger_type": trigger_type,
+                    "status": ExecutionStatus.PENDING,
+                    "input_data": input_data,
+                    "context": context,
+                    "metadata_": metadata,
+                    "target_node_ids": target_node_ids,
+                    "batch_id": batch_id,
+                    "batch_max_concurrency": max_concurrency,
+                }
+                for execution_id, input_data in zip(
+                    execution_ids, data.inputs, strict=True
+                )
+            ],
+        )
+        return batch_id, execution_ids
+
+    @staticmethod
+    async def get_batch(
+        db: AsyncSession,
+        batch_id: uuid.UUID,
+    ) -> ExecutionBatchResponse | None:
+        """Get the aggregated progress of an execution batch.
+
+        Args:
+            db: Database session.
+            batch_id: UUID of the batch.
+
+        Returns:
+            ExecutionBatchResponse with counts by status, or None if no
+            execution belongs to the batch.
+        """
+        result = await db.execute(
+            select(
+                WorkflowExecution.workflow_id,
+                WorkflowExecution.status,
+                func.count(WorkflowExecution.id),
+            )
+            .where(WorkflowExecution.batch_id == batch_id)
+            .group_by(WorkflowExecution.workflow_id, WorkflowExecution.status)
+        )
+        rows = result.all()
+        if not rows:
+            return None
+
+        counts = {status.value: count for _, status, count in rows}
+        return ExecutionBatchResponse(
+            batch_id=batch_id,
+            workflow_id=rows[0][0],
+            total=sum(counts.values()),
+            pending=counts.get(ExecutionStatus.PENDING.value, 0),
+            running=counts.get(ExecutionStatus.RUNNING.value, 0),
+            completed=counts.get(ExecutionStatus.COMPLETED.value, 0),
+            failed=counts.get(ExecutionStatus.FAILED.value, 0),
+            cancelled=counts.get(ExecutionStatus.CANCELLED.value, 0),
+        )
+
     @staticmethod
     async def get(
         db: AsyncSession,
@@ -254,6 +457,9 @@ class WorkflowExecutionService:
     ) -> WorkflowExecution:
         """Cancel a workflow execution (transition to CANCELLED).
 
+        A running execution is interrupted by its executor, in whichever
+        process it runs, once the transaction commits.
+
         Args:
             db: Database session.
             execution_id: UUID of the execution to cancel.
@@ -271,6 +477,7 @@ class WorkflowExecutionService:
         execution.cancel()
         await db.flush()
         await db.refresh(execution)
+        await notify_cancellation(db, execution_id)
         return execution
 
     @staticmethod
@@ -5,6 +5,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from app.services.executors.base import ToolExecutor, ToolExecutorFactory
+from app.services.executors.hedging import (
+    HedgeController,
+    HedgingToolExecutor,
+    get_hedge_controller,
+)
 from app.services.executors.http_executor import HttpToolExecutor
 
 if TYPE_CHECKING:
@@ -14,6 +19,9 @@ if TYPE_CHECKING:
 ToolExecutorFactory.register("http", HttpToolExecutor)
 
 __all__ = [
+    "HedgeController",
+    "HedgingToolExecutor",
     "ToolExecutor",
     "ToolExecutorFactory",
+    "get_hedge_controller",
 ]
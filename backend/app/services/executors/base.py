@@ -71,7 +71,12 @@ class ToolExecutorFactory:
 
     @classmethod
     def create(cls, tool_type: ToolType | str) -> ToolExecutor:
-        """Create an executor instance for the given tool type."""
+        """Create an executor instance for the given tool type.
+
+        The executor is wrapped to hedge calls of idempotent tools.
+        """
+        from app.services.executors.hedging import HedgingToolExecutor
+
         type_str = tool_type.value if isinstance(tool_type, ToolType) else tool_type
 
         if type_str not in cls._executors:
@@ -81,7 +86,7 @@ class ToolExecutorFactory:
             )
 
         executor_class = cls._executors[type_str]
-        return executor_class()
+        return HedgingToolExecutor(executor_class())
 
     @classmethod
     def supported_types(cls) -> list[str]:
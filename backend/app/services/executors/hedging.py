@@ -0,0 +1,295 @@
+"""Hedged requests for idempotent tools.
+
+TAG: [SPEC-011] [EXECUTION] [HEDGING]
+
+A few slow responses of an upstream API dominate the tail latency of the
+workflows calling it. For tools that opt in, a second identical request is
+issued when the first has not returned by the tool's observed latency
+percentile, and the first successful response wins:
+
+    {"url": "...", "method": "GET", "idempotent": true, "hedge": true}
+    {"url": "...", "idempotent": true, "hedge": {"percentile": 90}}
+
+Only tools marked idempotent are hedged, since both requests may reach the
+upstream. Hedges are paid from a budget that earns HEDGE_BUDGET_RATIO
+tokens per hedge-enabled call (up to HEDGE_BUDGET_BURST), so hedging adds
+at most about that fraction of extra load, even while an upstream is slow
+for every call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections import defaultdict, deque
+from typing import Any
+
+from app.core.config import settings
+from app.services.executors.base import ToolExecutionResult, ToolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Tool config keys enabling hedging
+IDEMPOTENT_CONFIG_KEY = "idempotent"
+HEDGE_CONFIG_KEY = "hedge"
+
+
+def hedge_percentile(config: dict[str, Any]) -> float | None:
+    """Get the latency percentile after which a tool call is hedged.
+
+    Args:
+        config: Tool configuration
+
+    Returns:
+        Percentile (0-100), or None if the tool is not hedged
+    """
+    hedge = config.get(HEDGE_CONFIG_KEY)
+    if config.get(IDEMPOTENT_CONFIG_KEY) is not True or not hedge:
+        return None
+    percentile = settings.HEDGE_LATENCY_PERCENTILE
+    if isinstance(hedge, dict):
+        percentile = hedge.get("percentile", percentile)
+    if not isinstance(percentile, int | float) or not 0 < percentile < 100:
+        logger.warning(f"Invalid hedge percentile {percentile!r}, not hedging")
+        return None
+    return float(percentile)
+
+
+class HedgeController:
+    """Latency history, hedge budget and metrics of hedged tools.
+
+    TAG: [SPEC-011] [EXECUTION] [HEDGING]
+    """
+
+    def __init__(
+        self,
+        budget_ratio: float | None = None,
+        budget_burst: float | None = None,
+        min_samples: int | None = None,
+        window: int | None = None,
+    ) -> None:
+        """Initialize with an empty history and a full budget.
+
+        Args:
+            budget_ratio: Hedge tokens earned per hedge-enabled call (default
+                from settings)
+            budget_burst: Maximum banked hedge tokens (default from settings)
+            min_samples: Latencies observed before a tool is hedged (default
+                from settings)
+            window: Latencies kept per tool (default from settings)
+        """
+        self.budget_ratio = (
+            budget_ratio if budget_ratio is not None else settings.HEDGE_BUDGET_RATIO
+        )
+        self.budget_burst = (
+            budget_burst if budget_burst is not None else settings.HEDGE_BUDGET_BURST
+        )
+        self.min_samples = (
+            min_samples if min_samples is not None else settings.HEDGE_MIN_SAMPLES
+        )
+        window = window if window is not None else settings.HEDGE_LATENCY_WINDOW
+        self._latencies: defaultdict[str, deque[float]] = defaultdict(
+            lambda: deque(maxlen=window)
+        )
+        self._tokens = self.budget_burst
+        self._metrics: defaultdict[str, dict[str, int]] = defaultdict(
+            lambda: {"calls": 0, "hedged": 0, "hedge_wins": 0, "budget_exhausted": 0}
+        )
+
+    def hedge_delay(self, key: str, percentile: float) -> float | None:
+        """Get the time after which a call is hedged.
+
+        Args:
+            key: Tool key
+            percentile: Latency percentile (0-100)
+
+        Returns:
+            Delay in seconds, or None until enough latencies are known
+        """
+        latencies = self._latencies.get(key)
+        if not latencies or len(latencies) < self.min_samples:
+            return None
+        ordered = sorted(latencies)
+        index = min(len(ordered) - 1, math.ceil(percentile / 100 * len(ordered)) - 1)
+        return ordered[max(0, index)]
+
+    def record_latency(self, key: str, latency: float) -> None:
+        """Record the latency of a successful attempt.
+
+        Args:
+            key: Tool key
+            latency: Attempt duration in seconds
+        """
+        self._latencies[key].append(latency)
+
+    def start_call(self, key: str) -> None:
+        """Count a hedge-enabled call and earn its share of hedge budget.
+
+        Args:
+            key: Tool key
+        """
+        self._metrics[key]["calls"] += 1
+        self._tokens = min(self.budget_burst, self._tokens + self.budget_ratio)
+
+    def try_hedge(self, key: str) -> bool:
+        """Spend one hedge token if the budget allows.
+
+        Args:
+            key: Tool key
+
+        Returns:
+            True if the hedge may be issued
+        """
+        if self._tokens < 1.0:
+            self._metrics[key]["budget_exhausted"] += 1
+            return False
+        self._tokens -= 1.0
+        self._metrics[key]["hedged"] += 1
+        return True
+
+    def record_hedge_win(self, key: str) -> None:
+        """Count a call answered by its hedge.
+
+        Args:
+            key: Tool key
+        """
+        self._metrics[key]["hedge_wins"] += 1
+
+    def metrics(self) -> dict[str, Any]:
+        """Snapshot of the hedge budget and per-tool counters.
+
+        Returns:
+            Dictionary with the available budget and counters per tool key
+        """
+        return {
+            "budget_tokens": round(self._tokens, 4),
+            "tools": {key: dict(counters) for key, counters in self._metrics.items()},
+        }
+
+
+class HedgingToolExecutor(ToolExecutor):
+    """Tool executor issuing hedged requests for idempotent tools.
+
+    TAG: [SPEC-011] [EXECUTION] [HEDGING]
+
+    Wraps the executor of a tool type; calls of tools without a hedge
+    policy go straight to it.
+    """
+
+    def __init__(
+        self, executor: ToolExecutor, controller: HedgeController | None = None
+    ) -> None:
+        """Initialize the wrapper.
+
+        Args:
+            executor: Executor of the tool type
+            controller: Hedge state (default: global controller)
+        """
+        self.executor = executor
+        self.controller = controller or get_hedge_controller()
+
+    @staticmethod
+    def _tool_key(config: dict[str, Any]) -> str:
+        """Key latencies by endpoint, the unit whose tail is measured."""
+        method = str(config.get("method", "POST")).upper()
+        return f"{method} {config.get('url') or config.get('server_url', '')}"
+
+    async def _attempt(
+        self,
+        config: dict[str, Any],
+        input_data: dict[str, Any],
+        auth_config: dict[str, Any] | None,
+    ) -> tuple[ToolExecutionResult, float]:
+        started = time.monotonic()
+        result = await self.executor.execute(config, input_data, auth_config)
+        return result, time.monotonic() - started
+
+    async def execute(
+        self,
+        config: dict[str, Any],
+        input_data: dict[str, Any],
+        auth_config: dict[str, Any] | None = None,
+    ) -> ToolExecutionResult:
+        """Execute the tool, hedging slow calls of idempotent tools."""
+        percentile = hedge_percentile(config)
+        if percentile is None:
+            return await self.executor.execute(config, input_data, auth_config)
+
+        key = self._tool_key(config)
+        self.controller.start_call(key)
+        delay = self.controller.hedge_delay(key, percentile)
+
+        primary = asyncio.create_task(self._attempt(config, input_data, auth_config))
+        attempts = [primary]
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(attempts, timeout=delay)
+                if not done and self.controller.try_hedge(key):
+                    attempts.append(
+                        asyncio.create_task(
+                            self._attempt(config, input_data, auth_config)
+                        )
+                    )
+
+            # The first successful response wins; a failure waits for the rest
+            pending = set(attempts)
+            failure: ToolExecutionResult | BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in sorted(done, key=attempts.index):
+                    error = task.exception()
+                    if error is not None:
+                        failure = error
+                        continue
+                    result, latency = task.result()
+                    if not result.success:
+                        failure = result
+                        continue
+                    self.controller.record_latency(key, latency)
+                    if task is not primary:
+                        self.controller.record_hedge_win(key)
+                        result.metadata["hedged"] = True
+                    return result
+
+            assert failure is not None  # Every attempt finished without a winner
+            if isinstance(failure, BaseException):
+                raise failure
+            return failure
+        finally:
+            for task in attempts:
+                task.cancel()
+            await asyncio.gather(*attempts, return_exceptions=True)
+
+    def validate_config(self, config: dict[str, Any]) -> bool:
+        """Validate tool configuration with the wrapped executor."""
+        return self.executor.validate_config(config)
+
+
+# Module-level singleton shared by all tool executors of the process
+_controller: HedgeController | None = None
+
+
+def get_hedge_controller() -> HedgeController:
+    """Get the global hedge controller singleton.
+
+    TAG: [SPEC-011] [EXECUTION] [HEDGING]
+
+    Returns:
+        The global HedgeController instance (creates on first call)
+    """
+    global _controller
+    if _controller is None:
+        _controller = HedgeController()
+    return _controller
+
+
+__all__ = [
+    "HedgeController",
+    "HedgingToolExecutor",
+    "get_hedge_controller",
+    "hedge_percentile",
+]
@@ -16,6 +16,7 @@ Validation (SPEC-010):
 
 Execution (SPEC-011):
 - WorkflowExecutor: DAG-based workflow execution engine
+- BatchExecutor: One workflow over many inputs with bounded concurrency
 - ExecutionContext: Thread-safe context for node data passing
 - Execution Exceptions: Custom exception hierarchy for execution
 
@@ -46,15 +47,60 @@ from app.services.workflow.validator import DAGValidator
 # SPEC-011: Workflow Execution Components
 # ============================================================================
 
+from app.services.workflow.cancellation import (
+    CancellationListener,
+    CancellationRegistry,
+    get_cancellation_registry,
+    notify_cancellation,
+)
+from app.services.workflow.admission import (
+    AdmissionController,
+    get_admission_controller,
+)
+from app.services.workflow.batch import BatchExecutor, BatchResult
+from app.services.workflow.blob_store import (
+    BlobStore,
+    FileSystemBlobStore,
+    get_blob_store,
+)
+from app.services.workflow.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakers,
+    RetryBudget,
+    get_circuit_breakers,
+)
 from app.services.workflow.context import ExecutionContext
 from app.services.workflow.exceptions import (
+    BlobNotFoundError,
+    CircuitOpenError,
     ConditionEvaluationError,
+    DeadlineExceededError,
     ExecutionCancelledError,
     ExecutionError,
     NodeExecutionError,
     NodeTimeoutError,
+    StreamError,
+)
+from app.services.workflow.executor import (
+    ExecutionResult,
+    SchedulingMode,
+    WorkflowExecutor,
+)
+from app.services.workflow.output_cache import (
+    NodeOutputCache,
+    get_node_output_cache,
+)
+from app.services.workflow.persistence import ExecutionWriteBuffer
+from app.services.workflow.plan import (
+    ExecutionPlan,
+    ExecutionPlanCache,
+    PlanEdge,
+    PlanNode,
+    get_plan_cache,
 )
-from app.services.workflow.executor import ExecutionResult, WorkflowExecutor
+from app.services.workflow.resources import ResourcePools, get_resource_pools
+from app.services.workflow.single_flight import SingleFlight, get_single_flight
+from app.services.workflow.streaming import RecordStream
 
 __all__ = [
     # ============================================================================
@@ -78,12 +124,56 @@ __all__ = [
     # Executor
     "WorkflowExecutor",
     "ExecutionResult",
+    "SchedulingMode",
+    # Batch execution
+    "BatchExecutor",
+    "BatchResult",
     # Context
     "ExecutionContext",
+    # Compiled plans
+    "ExecutionPlan",
+    "ExecutionPlanCache",
+    "PlanEdge",
+    "PlanNode",
+    "get_plan_cache",
+    # Output memoization
+    "NodeOutputCache",
+    "get_node_output_cache",
+    # Persistence
+    "ExecutionWriteBuffer",
+    # Blob store
+    "BlobStore",
+    "FileSystemBlobStore",
+    "get_blob_store",
+    # Streaming
+    "RecordStream",
+    # Admission control
+    "AdmissionController",
+    "get_admission_controller",
+    # Resource classes
+    "ResourcePools",
+    "get_resource_pools",
+    # Circuit breakers
+    "CircuitBreaker",
+    "CircuitBreakers",
+    "RetryBudget",
+    "get_circuit_breakers",
+    # Single-flight
+    "SingleFlight",
+    "get_single_flight",
+    # Cancellation
+    "CancellationListener",
+    "CancellationRegistry",
+    "get_cancellation_registry",
+    "notify_cancellation",
     # Execution Exceptions
+    "BlobNotFoundError",
+    "CircuitOpenError",
     "ConditionEvaluationError",
+    "DeadlineExceededError",
     "ExecutionCancelledError",
     "ExecutionError",
     "NodeExecutionError",
     "NodeTimeoutError",
+    "StreamError",
 ]
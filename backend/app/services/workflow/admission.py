@@ -0,0 +1,172 @@
+"""Process-wide admission control of node runs.
+
+TAG: [SPEC-011] [EXECUTION] [ADMISSION]
+
+Every WorkflowExecutor limits its own parallelism with max_parallel_nodes,
+but executions in the same process also share one pool of node slots
+(ADMISSION_MAX_SLOTS). When the pool is full, waiting node runs are admitted
+by start-time fair queuing (SFQ) over flows:
+
+- A flow is one (owner, priority) pair, so a single owner's large backtest
+  is one flow however many nodes or executions it has queued.
+- Each flow is weighted by its execution priority (metadata_.priority,
+  -100..100): the weight doubles every ADMISSION_PRIORITY_SCALE points.
+- A waiter's start tag is max(virtual time, the flow's previous finish tag);
+  the finish tag adds 1/weight. The waiter with the lowest start tag is
+  admitted next, so busy flows share slots in proportion to their weights
+  and an idle flow does not bank credit.
+
+A cluster-wide bound follows from running one controller per worker process:
+ADMISSION_MAX_SLOTS times the number of workers.
+"""
+
+import asyncio
+import heapq
+import itertools
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from uuid import UUID
+
+from app.core.config import settings
+
+# Flow key: (owner ID, execution priority)
+FlowKey = tuple[UUID | None, int]
+
+# Finished-tag entries kept before idle flows are pruned
+_MAX_IDLE_FLOWS = 1024
+
+
+def priority_weight(priority: int) -> float:
+    """Convert an execution priority into a fair-queuing weight.
+
+    Args:
+        priority: Execution priority (-100..100, higher = more priority)
+
+    Returns:
+        Relative share of node slots (1.0 for priority 0)
+    """
+    return float(2.0 ** (priority / settings.ADMISSION_PRIORITY_SCALE))
+
+
+class AdmissionController:
+    """Weighted fair pool of node slots shared by all executions.
+
+    TAG: [SPEC-011] [EXECUTION] [ADMISSION]
+
+    Attributes:
+        capacity: Number of node slots
+    """
+
+    def __init__(self, capacity: int | None = None) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            capacity: Number of node slots (default from settings)
+        """
+        self.capacity = capacity or settings.ADMISSION_MAX_SLOTS
+        self._in_use = 0
+        self._virtual_time = 0.0
+        self._finish_tags: dict[FlowKey, float] = {}
+        self._waiters: list[tuple[float, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+
+    @property
+    def in_use(self) -> int:
+        """Number of slots currently held."""
+        return self._in_use
+
+    @property
+    def waiting(self) -> int:
+        """Number of node runs waiting for a slot."""
+        return sum(not future.done() for _, _, future in self._waiters)
+
+    def _start_tag(self, owner_id: UUID | None, priority: int) -> float:
+        """Assign the SFQ start tag of a request and advance its flow."""
+        key = (owner_id, priority)
+        start = max(self._virtual_time, self._finish_tags.get(key, 0.0))
+        self._finish_tags[key] = start + 1.0 / priority_weight(priority)
+        return start
+
+    async def acquire(self, owner_id: UUID | None, priority: int = 0) -> None:
+        """Wait for a node slot.
+
+        Args:
+            owner_id: Owner of the workflow being executed
+            priority: Execution priority (-100..100)
+        """
+        start = self._start_tag(owner_id, priority)
+        # Waiters only remain queued while every slot is held
+        if self._in_use < self.capacity:
+            self._in_use += 1
+            self._virtual_time = max(self._virtual_time, start)
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (start, next(self._sequence), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Admitted just before the cancellation landed
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Return a slot and admit the next waiter by start tag."""
+        self._in_use -= 1
+        while self._waiters and self._in_use < self.capacity:
+            start, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            self._in_use += 1
+            self._virtual_time = max(self._virtual_time, start)
+            future.set_result(None)
+
+        if len(self._finish_tags) > _MAX_IDLE_FLOWS:
+            # Flows finished before the virtual time restart from it anyway
+            self._finish_tags = {
+                key: tag
+                for key, tag in self._finish_tags.items()
+                if tag > self._virtual_time
+            }
+
+    @asynccontextmanager
+    async def slot(
+        self, owner_id: UUID | None, priority: int = 0
+    ) -> AsyncIterator[None]:
+        """Hold a node slot for the duration of the block.
+
+        Args:
+            owner_id: Owner of the workflow being executed
+            priority: Execution priority (-100..100)
+        """
+        await self.acquire(owner_id, priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+
+# Module-level singleton shared by all executors of the process
+_controller: AdmissionController | None = None
+
+
+def get_admission_controller() -> AdmissionController:
+    """Get the global admission controller singleton.
+
+    TAG: [SPEC-011] [EXECUTION] [ADMISSION]
+
+    Returns:
+        The global AdmissionController instance (creates on first call)
+    """
+    global _controller
+    if _controller is None:
+        _controller = AdmissionController()
+    return _controller
+
+
+__all__ = [
+    "AdmissionController",
+    "get_admission_controller",
+    "priority_weight",
+]
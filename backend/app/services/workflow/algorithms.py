@@ -240,21 +240,20 @@ class GraphAlgorithms(Generic[NodeId]):
         return levels
 
     @staticmethod
-    def find_unreachable_from(
+    def find_reachable_from(
         graph: Graph[NodeId],
         start_nodes: set[NodeId],
     ) -> set[NodeId]:
-        """Find nodes not reachable from any start node using BFS.
+        """Find start nodes and every node downstream of them using BFS.
 
-        TAG: [SPEC-010] [DAG] [ALGORITHM]
-        REQ: REQ-010-007
+        TAG: [SPEC-011] [DAG] [ALGORITHM] [RERUN]
 
         Args:
             graph: The graph to analyze.
-            start_nodes: Set of starting nodes (typically trigger nodes).
+            start_nodes: Set of starting nodes.
 
         Returns:
-            Set of node IDs not reachable from any start node.
+            Set of node IDs reachable from any start node, including them.
 
         Time Complexity: O(V + E)
         Space Complexity: O(V)
@@ -262,14 +261,10 @@ class GraphAlgorithms(Generic[NodeId]):
         Example:
             >>> graph = Graph[UUID]()
             >>> graph.add_edge(a, b)
-            >>> graph.add_edge(c, d)  # c is disconnected
-            >>> unreachable = GraphAlgorithms.find_unreachable_from(graph, {a})
-            >>> # Returns {c, d} (not reachable from a)
+            >>> graph.add_edge(c, d)
+            >>> GraphAlgorithms.find_reachable_from(graph, {a})
+            >>> # Returns {a, b}
         """
-        if not start_nodes:
-            # If no start nodes, all nodes are unreachable
-            return graph._nodes.copy()
-
         reachable: set[NodeId] = set()
         queue: deque[NodeId] = deque(start_nodes)
 
@@ -284,8 +279,86 @@ class GraphAlgorithms(Generic[NodeId]):
                 if successor not in reachable:
                     queue.append(successor)
 
+        return reachable
+
+    @staticmethod
+    def find_ancestors_of(
+        graph: Graph[NodeId],
+        target_nodes: set[NodeId],
+    ) -> set[NodeId]:
+        """Find target nodes and every node upstream of them using BFS.
+
+        TAG: [SPEC-011] [DAG] [ALGORITHM] [PRUNING]
+
+        Walks the reverse adjacency, so the result is exactly the nodes
+        that must run for the targets to produce their outputs.
+
+        Args:
+            graph: The graph to analyze.
+            target_nodes: Set of target nodes.
+
+        Returns:
+            Set of node IDs any target depends on, including the targets.
+
+        Time Complexity: O(V + E)
+        Space Complexity: O(V)
+
+        Example:
+            >>> graph = Graph[UUID]()
+            >>> graph.add_edge(a, b)
+            >>> graph.add_edge(a, c)
+            >>> GraphAlgorithms.find_ancestors_of(graph, {b})
+            >>> # Returns {a, b}
+        """
+        ancestors: set[NodeId] = set()
+        queue: deque[NodeId] = deque(target_nodes)
+
+        while queue:
+            current = queue.popleft()
+            if current in ancestors:
+                continue
+
+            ancestors.add(current)
+
+            for predecessor in graph.get_predecessors(current):
+                if predecessor not in ancestors:
+                    queue.append(predecessor)
+
+        return ancestors
+
+    @staticmethod
+    def find_unreachable_from(
+        graph: Graph[NodeId],
+        start_nodes: set[NodeId],
+    ) -> set[NodeId]:
+        """Find nodes not reachable from any start node using BFS.
+
+        TAG: [SPEC-010] [DAG] [ALGORITHM]
+        REQ: REQ-010-007
+
+        Args:
+            graph: The graph to analyze.
+            start_nodes: Set of starting nodes (typically trigger nodes).
+
+        Returns:
+            Set of node IDs not reachable from any start node.
+
+        Time Complexity: O(V + E)
+        Space Complexity: O(V)
+
+        Example:
+            >>> graph = Graph[UUID]()
+            >>> graph.add_edge(a, b)
+            >>> graph.add_edge(c, d)  # c is disconnected
+            >>> unreachable = GraphAlgorithms.find_unreachable_from(graph, {a})
+            >>> # Returns {c, d} (not reachable from a)
+        """
+        if not start_nodes:
+            # If no start nodes, all nodes are unreachable
+            return graph._nodes.copy()
+
         # Find nodes that were never reached
-        return graph._nodes - reachable
+        return graph._nodes - GraphAlgorithms.find_reachable_from(graph, start_nodes)
 
     @staticmethod
     def find_dangling_nodes(graph: Graph[NodeId]) -> set[NodeId]:
@@ -0,0 +1,249 @@
+"""Batch execution of one workflow over many inputs.
+
+TAG: [SPEC-011] [EXECUTION] [BATCH]
+
+Running the same workflow for hundreds of input payloads through separate
+execute calls pays a round trip per execution record and lets one caller
+take every execution slot. BatchExecutor instead:
+
+- compiles the execution plan once and hands it to every execution,
+- inserts all execution rows with one multi-row INSERT,
+- runs at most ``max_concurrency`` executions of the batch at a time, each
+  in its own session from the shared engine pool and with the process-wide
+  output cache, admission controller, resource pools and circuit breakers,
+- reports progress aggregated over the batch.
+
+Batches submitted through the API are run by queue workers instead, which
+honour the same per-batch concurrency limit (see app.services.execution_queue).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, cast
+
+from sqlalchemy import update
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.models.enums import ExecutionStatus, TriggerType
+from app.models.execution import WorkflowExecution
+from app.services.execution_queue import ExecutionQueueService
+from app.services.workflow.executor import (
+    ExecutionResult,
+    SchedulingMode,
+    WorkflowExecutor,
+)
+from app.services.workflow.plan import ExecutionPlanCache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from uuid import UUID
+
+    from sqlalchemy import CursorResult
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class BatchResult:
+    """Result of a batch execution.
+
+    Attributes:
+        batch_id: UUID of the batch.
+        workflow_id: UUID of the executed workflow.
+        results: Execution results in input order.
+
+    """
+
+    batch_id: UUID
+    workflow_id: UUID
+    results: list[ExecutionResult] = field(default_factory=list)
+
+    @property
+    def counts(self) -> dict[str, int]:
+        """Number of executions per final status."""
+        counts: dict[str, int] = {}
+        for result in self.results:
+            counts[result.status.value] = counts.get(result.status.value, 0) + 1
+        return counts
+
+
+class BatchExecutor:
+    """Runs one workflow over a list of input payloads.
+
+    TAG: [SPEC-011] [EXECUTION] [BATCH]
+
+    Attributes:
+        max_concurrency: Maximum executions of a batch running at once.
+        scheduling_mode: Node scheduling strategy of every execution.
+        max_parallel_nodes: Parallel node limit of every execution.
+
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        max_concurrency: int | None = None,
+        scheduling_mode: SchedulingMode = SchedulingMode.LEVELS,
+        max_parallel_nodes: int = 10,
+    ) -> None:
+        """Initialize the batch executor.
+
+        Args:
+            session_factory: Factory returning new AsyncSession instances.
+            max_concurrency: Executions run at once (default from settings).
+            scheduling_mode: Node scheduling strategy (default: LEVELS).
+            max_parallel_nodes: Parallel nodes per execution (default: 10).
+
+        """
+        self._session_factory = session_factory
+        self.max_concurrency = max_concurrency or settings.BATCH_DEFAULT_CONCURRENCY
+        self.scheduling_mode = scheduling_mode
+        self.max_parallel_nodes = max_parallel_nodes
+
+    async def execute(
+        self,
+        workflow_id: UUID,
+        inputs: list[dict[str, Any]],
+        trigger_type: TriggerType = TriggerType.MANUAL,
+        context: dict[str, Any] | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> BatchResult:
+        """Execute a workflow once per input payload.
+
+        TAG: [SPEC-011] [EXECUTION] [BATCH]
+
+        Args:
+            workflow_id: UUID of the workflow to execute.
+            inputs: Input data of each execution.
+            trigger_type: How the executions were triggered.
+            context: Execution context shared by all executions.
+            metadata: Execution metadata shared by all executions.
+
+        Returns:
+            BatchResult with one ExecutionResult per input, in input order.
+
+        Raises:
+            ExecutionError: If the workflow does not exist.
+            ValueError: If the batch has more inputs than BATCH_MAX_INPUTS.
+
+        """
+        # Imported here: the execution service imports this package
+        from app.schemas.execution import ExecutionBatchCreate
+        from app.services.execution_service import WorkflowExecutionService
+
+        data = ExecutionBatchCreate.model_validate(
+            {
+                "inputs": inputs,
+                "max_concurrency": self.max_concurrency,
+                "context": context or {},
+                "metadata": metadata or {},
+            }
+        )
+
+        # Compile once; every execution of the batch reads the same plan
+        plan_cache = ExecutionPlanCache(max_size=1)
+        async with self._session_factory() as db:
+            await WorkflowExecutor(db, plan_cache=plan_cache).prepare(workflow_id)
+            batch_id, execution_ids = await WorkflowExecutionService.create_batch(
+                db, workflow_id, data, trigger_type=trigger_type
+            )
+            await db.commit()
+
+        logger.info(
+            f"Batch {batch_id} started: {len(execution_ids)} execution(s) of "
+            f"workflow {workflow_id} (concurrency={self.max_concurrency})"
+        )
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        worker_id = f"batch:{batch_id}"
+
+        async def run(execution_id: UUID) -> ExecutionResult:
+            async with semaphore:
+                return await self._run_one(execution_id, worker_id, plan_cache)
+
+        results = await asyncio.gather(*(run(eid) for eid in execution_ids))
+        batch = BatchResult(
+            batch_id=batch_id, workflow_id=workflow_id, results=list(results)
+        )
+        logger.info(f"Batch {batch_id} finished: {batch.counts}")
+        return batch
+
+    async def _run_one(
+        self,
+        execution_id: UUID,
+        worker_id: str,
+        plan_cache: ExecutionPlanCache,
+    ) -> ExecutionResult:
+        """Run one execution of the batch in its own session."""
+        error_message: str | None = None
+        result: ExecutionResult | None = None
+
+        async with self._session_factory() as db:
+            # Take the row unless a queue worker or a canceller got it first;
+            # without a lease it is never reclaimed by workers
+            taken = cast(
+                "CursorResult[Any]",
+                await db.execute(
+                    update(WorkflowExecution)
+                    .where(
+                        WorkflowExecution.id == execution_id,
+                        WorkflowExecution.status == ExecutionStatus.PENDING,
+                    )
+                    .values(
+                        status=ExecutionStatus.RUNNING,
+                        worker_id=worker_id,
+                        started_at=datetime.now(UTC),
+                        attempts=WorkflowExecution.attempts + 1,
+                    )
+                ),
+            )
+            await db.commit()
+            if taken.rowcount == 0:
+                execution = await db.get(WorkflowExecution, execution_id)
+                return ExecutionResult(
+                    execution_id=execution_id,
+                    status=(
+                        execution.status
+                        if execution is not None
+                        else ExecutionStatus.CANCELLED
+                    ),
+                )
+
+            executor = WorkflowExecutor(
+                db,
+                max_parallel_nodes=self.max_parallel_nodes,
+                scheduling_mode=self.scheduling_mode,
+                plan_cache=plan_cache,
+            )
+            try:
+                result = await executor.run_execution(execution_id)
+                error_message = result.error_message
+            except Exception as e:
+                logger.exception(f"Batch execution {execution_id} crashed")
+                error_message = str(e)
+                await db.rollback()
+
+        # Fail executions the run left RUNNING, like a queue worker would
+        async with self._session_factory() as db:
+            await ExecutionQueueService.release(
+                db,
+                execution_id=execution_id,
+                worker_id=worker_id,
+                error_message=error_message,
+            )
+
+        if result is None:
+            return ExecutionResult(
+                execution_id=execution_id,
+                status=ExecutionStatus.FAILED,
+                error_message=error_message,
+            )
+        return result
+
+
+__all__ = ["BatchExecutor", "BatchResult"]
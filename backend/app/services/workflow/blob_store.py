@@ -0,0 +1,273 @@
+"""Content-addressed blob store for large node payloads.
+
+TAG: [SPEC-011] [EXECUTION] [BLOB-STORE]
+
+Node inputs and outputs larger than BLOB_OFFLOAD_THRESHOLD_BYTES (as JSON)
+are written to the blob store, and only a reference is kept in the
+node_executions JSON columns:
+
+    {"$blob": "sha256:<hex>", "size_bytes": 12345}
+
+Blobs are addressed by the SHA-256 of their content, so identical payloads
+are stored once and a blob never changes after it is written. References
+are resolved lazily: list endpoints return them as is, and the payload
+endpoint loads the blob when a client asks for it.
+
+Backends:
+- "filesystem": one file per blob under BLOB_STORE_PATH.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, TypeGuard
+
+from app.core.config import settings
+from app.services.workflow.exceptions import BlobNotFoundError
+from app.services.workflow.output_cache import to_plain
+from app.services.workflow.processors.offload import estimate_payload_items
+
+logger = logging.getLogger(__name__)
+
+# Reference keys stored in place of an offloaded payload
+BLOB_REF_KEY = "$blob"
+BLOB_SIZE_KEY = "size_bytes"
+
+# Digest prefix naming the hash algorithm
+DIGEST_PREFIX = "sha256:"
+
+# Payloads with more container items are encoded in a worker thread
+INLINE_ENCODE_MAX_ITEMS = 1_000
+
+
+class BlobStore(ABC):
+    """Content-addressed storage backend.
+
+    TAG: [SPEC-011] [EXECUTION] [BLOB-STORE]
+    """
+
+    @abstractmethod
+    async def put(self, data: bytes) -> str:
+        """Store a blob.
+
+        Args:
+            data: Blob content
+
+        Returns:
+            Digest addressing the blob ("sha256:<hex>")
+        """
+
+    @abstractmethod
+    async def get(self, digest: str) -> bytes:
+        """Load a blob.
+
+        Args:
+            digest: Digest returned by put
+
+        Returns:
+            Blob content
+
+        Raises:
+            BlobNotFoundError: If no blob has this digest
+        """
+
+    @staticmethod
+    def digest_of(data: bytes) -> str:
+        """Compute the digest addressing a blob.
+
+        Args:
+            data: Blob content
+
+        Returns:
+            Digest string
+        """
+        return DIGEST_PREFIX + hashlib.sha256(data).hexdigest()
+
+
+class FileSystemBlobStore(BlobStore):
+    """Blob store keeping one file per blob under a root directory.
+
+    TAG: [SPEC-011] [EXECUTION] [BLOB-STORE]
+
+    Files are sharded by the first two hex characters of the digest and
+    written through a temporary file, so readers never see partial blobs.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        """Initialize the store.
+
+        Args:
+            root: Directory holding the blobs (created on first write)
+        """
+        self.root = Path(root)
+
+    def _path(self, digest: str) -> Path:
+        if not digest.startswith(DIGEST_PREFIX):
+            raise BlobNotFoundError(digest)
+        hex_digest = digest.removeprefix(DIGEST_PREFIX)
+        if len(hex_digest) != 64 or not all(
+            c in "0123456789abcdef" for c in hex_digest
+        ):
+            raise BlobNotFoundError(digest)
+        return self.root / hex_digest[:2] / hex_digest
+
+    def _write(self, path: Path, data: bytes) -> None:
+        if path.exists():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(data)
+            Path(tmp_name).replace(path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    async def put(self, data: bytes) -> str:
+        """Store a blob unless an identical one exists."""
+        digest = self.digest_of(data)
+        await asyncio.to_thread(self._write, self._path(digest), data)
+        return digest
+
+    async def get(self, digest: str) -> bytes:
+        """Load a blob by digest."""
+        path = self._path(digest)
+        try:
+            return await asyncio.to_thread(path.read_bytes)
+        except FileNotFoundError:
+            raise BlobNotFoundError(digest) from None
+
+
+def is_blob_ref(value: Any) -> TypeGuard[Mapping[str, Any]]:
+    """Check whether a stored payload is a blob reference.
+
+    Args:
+        value: Value of a JSON payload column
+
+    Returns:
+        True if value references an offloaded blob
+    """
+    return isinstance(value, Mapping) and isinstance(value.get(BLOB_REF_KEY), str)
+
+
+def _encode(payload: Mapping[str, Any]) -> tuple[dict[str, Any], bytes]:
+    """Convert a payload to a plain dict and its compact JSON encoding."""
+    # Node input is a read-only view over predecessor outputs
+    plain: dict[str, Any] = to_plain(payload)
+    return plain, json.dumps(plain, default=str, separators=(",", ":")).encode()
+
+
+async def offload_payload(
+    payload: Mapping[str, Any] | None,
+    store: BlobStore | None = None,
+    threshold: int | None = None,
+) -> dict[str, Any] | None:
+    """Replace a payload larger than the threshold by a blob reference.
+
+    TAG: [SPEC-011] [EXECUTION] [BLOB-STORE]
+
+    The payload is encoded once; payloads with many items are encoded in a
+    worker thread so the event loop keeps serving other nodes, and the
+    encoded bytes are what the blob store writes.
+
+    Args:
+        payload: Node input or output
+        store: Blob store (default: global store)
+        threshold: Size in bytes of the JSON encoding above which the payload
+            is offloaded (default from settings)
+
+    Returns:
+        The payload as a dict, or a blob reference
+    """
+    if payload is None:
+        return None
+    if is_blob_ref(payload):
+        return dict(payload)
+
+    threshold = (
+        threshold if threshold is not None else settings.BLOB_OFFLOAD_THRESHOLD_BYTES
+    )
+    if (
+        estimate_payload_items(payload, INLINE_ENCODE_MAX_ITEMS)
+        < INLINE_ENCODE_MAX_ITEMS
+    ):
+        plain, data = _encode(payload)
+    else:
+        plain, data = await asyncio.to_thread(_encode, payload)
+    if len(data) <= threshold:
+        return plain
+
+    store = store or get_blob_store()
+    digest = await store.put(data)
+    logger.debug(f"Offloaded {len(data)} byte payload to blob {digest}")
+    return {BLOB_REF_KEY: digest, BLOB_SIZE_KEY: len(data)}
+
+
+async def resolve_payload(
+    payload: Mapping[str, Any] | None,
+    store: BlobStore | None = None,
+) -> dict[str, Any] | None:
+    """Load the payload behind a blob reference.
+
+    TAG: [SPEC-011] [EXECUTION] [BLOB-STORE]
+
+    Args:
+        payload: Value of a JSON payload column
+        store: Blob store (default: global store)
+
+    Returns:
+        The payload itself, or the payload loaded from the blob store
+
+    Raises:
+        BlobNotFoundError: If the referenced blob is missing
+    """
+    if not is_blob_ref(payload):
+        return dict(payload) if payload is not None else None
+    store = store or get_blob_store()
+    loaded: dict[str, Any] = json.loads(await store.get(payload[BLOB_REF_KEY]))
+    return loaded
+
+
+# Global store instance (initialized from settings)
+_global_store: BlobStore | None = None
+
+
+def get_blob_store() -> BlobStore:
+    """Get or create the global blob store instance.
+
+    TAG: [SPEC-011] [EXECUTION] [BLOB-STORE]
+
+    Returns:
+        BlobStore for the configured backend
+
+    Raises:
+        ValueError: If BLOB_STORE_BACKEND names an unknown backend
+    """
+    global _global_store
+
+    if _global_store is None:
+        if settings.BLOB_STORE_BACKEND != "filesystem":
+            raise ValueError(
+                f"Unsupported blob store backend: {settings.BLOB_STORE_BACKEND}"
+            )
+        _global_store = FileSystemBlobStore(settings.BLOB_STORE_PATH)
+
+    return _global_store
+
+
+__all__ = [
+    "BLOB_REF_KEY",
+    "BlobStore",
+    "FileSystemBlobStore",
+    "get_blob_store",
+    "is_blob_ref",
+    "offload_payload",
+    "resolve_payload",
+]
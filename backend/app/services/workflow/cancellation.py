@@ -0,0 +1,182 @@
+"""Cross-process cancellation of running workflow executions.
+
+TAG: [SPEC-011] [EXECUTION] [CANCELLATION]
+REQ: REQ-011-009 - Workflow cancellation support
+
+A running WorkflowExecutor registers an asyncio.Event per execution in the
+process-local CancellationRegistry. Cancellation reaches it through:
+
+1. The registry directly, when the execution is cancelled in the same process.
+2. Postgres NOTIFY on CANCEL_CHANNEL, relayed into the registry by a
+   CancellationListener running in every API and worker process.
+3. A polling fallback in the executor against the execution status column,
+   for databases without LISTEN/NOTIFY or when a notification is missed.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from sqlalchemy import func, select
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+logger = logging.getLogger(__name__)
+
+# Postgres NOTIFY channel carrying cancelled execution IDs
+CANCEL_CHANNEL = "workflow_execution_cancel"
+
+
+class CancellationRegistry:
+    """Process-local map of running executions to their cancel events.
+
+    TAG: [SPEC-011] [EXECUTION] [CANCELLATION]
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._events: dict[UUID, asyncio.Event] = {}
+
+    def register(self, execution_id: UUID, event: asyncio.Event) -> None:
+        """Register the cancel event of a running execution.
+
+        Args:
+            execution_id: UUID of the running execution.
+            event: Event set when the execution is cancelled.
+
+        """
+        self._events[execution_id] = event
+
+    def unregister(self, execution_id: UUID) -> None:
+        """Remove a finished execution.
+
+        Args:
+            execution_id: UUID of the finished execution.
+
+        """
+        self._events.pop(execution_id, None)
+
+    def signal(self, execution_id: UUID) -> bool:
+        """Signal cancellation to an execution running in this process.
+
+        Args:
+            execution_id: UUID of the cancelled execution.
+
+        Returns:
+            True if the execution is running in this process.
+
+        """
+        event = self._events.get(execution_id)
+        if event is None:
+            return False
+        event.set()
+        return True
+
+
+# Module-level singleton for convenience
+_registry: CancellationRegistry | None = None
+
+
+def get_cancellation_registry() -> CancellationRegistry:
+    """Get the global cancellation registry singleton.
+
+    Returns:
+        The global CancellationRegistry instance (creates on first call).
+
+    """
+    global _registry
+    if _registry is None:
+        _registry = CancellationRegistry()
+    return _registry
+
+
+async def notify_cancellation(db: AsyncSession, execution_id: UUID) -> None:
+    """Signal cancellation of an execution to every process running it.
+
+    The in-process signal is immediate. On Postgres the notification is
+    queued in the current transaction and delivered when it commits, so it
+    never races ahead of the CANCELLED status update. Call it after the
+    status update has been flushed.
+
+    Args:
+        db: Database session holding the status update.
+        execution_id: UUID of the cancelled execution.
+
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        await db.execute(select(func.pg_notify(CANCEL_CHANNEL, str(execution_id))))
+
+    get_cancellation_registry().signal(execution_id)
+
+
+class CancellationListener:
+    """Relays Postgres cancel notifications into the local registry.
+
+    TAG: [SPEC-011] [EXECUTION] [CANCELLATION]
+
+    Holds one dedicated connection for LISTEN. Does nothing on databases
+    other than Postgres with asyncpg; executors then rely on polling.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        registry: CancellationRegistry | None = None,
+    ) -> None:
+        """Initialize the listener.
+
+        Args:
+            engine: Async engine to take the LISTEN connection from.
+            registry: Registry to signal (default: global registry).
+
+        """
+        self._engine = engine
+        self._registry = registry or get_cancellation_registry()
+        self._conn: AsyncConnection | None = None
+        self._driver_conn: Any = None
+
+    async def start(self) -> None:
+        """Open the LISTEN connection (no-op without Postgres/asyncpg)."""
+        if (
+            self._engine.dialect.name != "postgresql"
+            or self._engine.dialect.driver != "asyncpg"
+        ):
+            logger.info("Cancel notifications unavailable; executors will poll")
+            return
+
+        self._conn = await self._engine.connect()
+        raw_conn = await self._conn.get_raw_connection()
+        self._driver_conn = raw_conn.driver_connection
+        await self._driver_conn.add_listener(CANCEL_CHANNEL, self._on_notify)
+
+    async def stop(self) -> None:
+        """Stop listening and release the connection."""
+        if self._driver_conn is not None:
+            await self._driver_conn.remove_listener(CANCEL_CHANNEL, self._on_notify)
+            self._driver_conn = None
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+
+    def _on_notify(self, _conn: Any, _pid: int, _channel: str, payload: str) -> None:
+        """Handle a notification carrying a cancelled execution ID."""
+        try:
+            execution_id = UUID(payload)
+        except ValueError:
+            logger.warning(f"Ignoring malformed cancel notification: {payload!r}")
+            return
+        self._registry.signal(execution_id)
+
+
+__all__ = [
+    "CANCEL_CHANNEL",
+    "CancellationListener",
+    "CancellationRegistry",
+    "get_cancellation_registry",
+    "notify_cancellation",
+]
@@ -0,0 +1,414 @@
+"""Circuit breakers and retry budget for external dependencies.
+
+TAG: [SPEC-011] [EXECUTION] [CIRCUIT-BREAKER]
+
+Node retries back off per execution, but when an upstream API goes down
+every concurrent execution keeps retrying it. Nodes calling an external
+dependency share process-wide state per dependency instead:
+
+- Circuit: one per tool (tool:<tool_id>) and per LLM provider
+  (llm:<provider>, from the node config "provider" or
+  "llm_config.provider"; agent:<agent_id> without one). Node config
+  {"circuit": "<name>"} names the circuit explicitly; other nodes have none.
+- A circuit opens after CIRCUIT_FAILURE_THRESHOLD consecutive outage errors
+  (timeouts, connection failures, HTTP 429/5xx). While open, nodes fail
+  fast with CircuitOpenError. After CIRCUIT_RESET_TIMEOUT seconds it lets
+  CIRCUIT_HALF_OPEN_MAX_CALLS probe attempts through: a success closes it,
+  an outage error opens it again.
+- Retry budget: each first attempt earns RETRY_BUDGET_RATIO tokens for its
+  circuit (up to RETRY_BUDGET_BURST) and each retry spends one, so retries
+  add at most about that fraction of load. With RETRY_BUDGET_REDIS the
+  buckets live in Redis and are shared by all processes.
+"""
+
+import logging
+import time
+from collections.abc import Mapping
+from enum import StrEnum
+from typing import Any, Protocol
+
+from redis.asyncio import ConnectionPool, Redis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.models.enums import NodeType
+from app.services.workflow.resources import is_overload_error
+
+logger = logging.getLogger(__name__)
+
+# Node config key naming the circuit of a node
+CIRCUIT_CONFIG_KEY = "circuit"
+
+# Redis key prefix of shared retry budgets
+RETRY_BUDGET_KEY_PREFIX = "retry_budget:"
+
+# Atomically earn ARGV[1] tokens (capped at ARGV[2]) and, if ARGV[3] is 1,
+# spend one; returns 1 unless the spend was refused
+_BUDGET_SCRIPT = """
+local tokens = tonumber(redis.call('GET', KEYS[1]) or ARGV[2])
+tokens = math.min(tonumber(ARGV[2]), tokens + tonumber(ARGV[1]))
+local allowed = 1
+if ARGV[3] == '1' then
+    if tokens < 1 then allowed = 0 else tokens = tokens - 1 end
+end
+redis.call('SET', KEYS[1], tostring(tokens), 'EX', tonumber(ARGV[4]))
+return allowed
+"""
+
+# Seconds an idle shared budget is kept in Redis
+_BUDGET_TTL = 3600
+
+
+class CircuitState(StrEnum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class _CircuitNode(Protocol):
+    @property
+    def node_type(self) -> Any: ...
+    @property
+    def config(self) -> Mapping[str, Any] | None: ...
+    @property
+    def tool_id(self) -> Any: ...
+    @property
+    def agent_id(self) -> Any: ...
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with half-open probing.
+
+    TAG: [SPEC-011] [EXECUTION] [CIRCUIT-BREAKER]
+
+    Only outage errors count as failures; any other error shows the
+    dependency is reachable and counts as a success.
+
+    Attributes:
+        name: Circuit name
+        failure_threshold: Consecutive outage errors that open the circuit
+        reset_timeout: Seconds the circuit stays open before probing
+        half_open_max_calls: Concurrent probe attempts while half-open
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int | None = None,
+        reset_timeout: float | None = None,
+        half_open_max_calls: int | None = None,
+    ) -> None:
+        """Initialize a closed circuit.
+
+        Args:
+            name: Circuit name
+            failure_threshold: Outage errors before opening (default from
+                settings)
+            reset_timeout: Open duration in seconds (default from settings)
+            half_open_max_calls: Probes while half-open (default from
+                settings)
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold or settings.CIRCUIT_FAILURE_THRESHOLD
+        self.reset_timeout = (
+            reset_timeout
+            if reset_timeout is not None
+            else settings.CIRCUIT_RESET_TIMEOUT
+        )
+        self.half_open_max_calls = (
+            half_open_max_calls or settings.CIRCUIT_HALF_OPEN_MAX_CALLS
+        )
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state (an open circuit turns half-open after the timeout)."""
+        if (
+            self._state == CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._probes = 0
+        return self._state
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until an open circuit lets a probe through."""
+        if self.state != CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def allow(self) -> bool:
+        """Check whether an attempt may call the dependency.
+
+        A half-open circuit counts the allowed attempt as a probe, which
+        must end with record_success, record_failure or abandon.
+
+        Returns:
+            True if the attempt may proceed
+        """
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN and self._probes < self.half_open_max_calls:
+            self._probes += 1
+            return True
+        self._rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        """Record an attempt that reached the dependency."""
+        if self._state == CircuitState.HALF_OPEN:
+            logger.info(f"Circuit {self.name!r} closed")
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._probes = 0
+
+    def record_failure(self, error: BaseException) -> None:
+        """Record a failed attempt.
+
+        Args:
+            error: Exception raised by the attempt
+        """
+        if not is_overload_error(error):
+            self.record_success()
+            return
+
+        self._failures += 1
+        if self._state == CircuitState.HALF_OPEN or (
+            self._failures >= self.failure_threshold
+        ):
+            if self._state != CircuitState.OPEN:
+                logger.warning(
+                    f"Circuit {self.name!r} opened after {self._failures} failures"
+                )
+            self._state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+            self._probes = 0
+
+    def abandon(self) -> None:
+        """Return the probe of an attempt that was cancelled."""
+        if self._state == CircuitState.HALF_OPEN and self._probes > 0:
+            self._probes -= 1
+
+    def metrics(self) -> dict[str, Any]:
+        """Snapshot of the circuit state.
+
+        Returns:
+            Dictionary with state, consecutive failures and rejected attempts
+        """
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self._failures,
+            "rejected": self._rejected,
+        }
+
+
+class RetryBudget:
+    """Token buckets limiting retries per circuit.
+
+    TAG: [SPEC-011] [EXECUTION] [CIRCUIT-BREAKER]
+
+    Buckets are kept in-process, or in Redis when a URL is given; if Redis
+    is unavailable the in-process buckets are used.
+
+    Attributes:
+        ratio: Tokens earned per first attempt
+        burst: Maximum tokens per bucket
+    """
+
+    def __init__(
+        self,
+        ratio: float | None = None,
+        burst: float | None = None,
+        redis_url: str | None = None,
+    ) -> None:
+        """Initialize full buckets.
+
+        Args:
+            ratio: Tokens earned per first attempt (default from settings)
+            burst: Bucket size (default from settings)
+            redis_url: Redis URL sharing the buckets (in-process if None)
+        """
+        self.ratio = ratio if ratio is not None else settings.RETRY_BUDGET_RATIO
+        self.burst = burst if burst is not None else settings.RETRY_BUDGET_BURST
+        self._tokens: dict[str, float] = {}
+        self._pool: ConnectionPool | None = None
+        self._redis: Redis | None = None
+        if redis_url:
+            try:
+                self._pool = ConnectionPool.from_url(redis_url, decode_responses=True)
+                self._redis = Redis(connection_pool=self._pool)
+            except Exception as e:
+                logger.warning(f"Failed to initialize Redis retry budget: {e}")
+                self._pool = None
+                self._redis = None
+
+    async def _update(self, key: str, earn: float, spend: bool) -> bool:
+        if self._redis is not None:
+            try:
+                allowed = await self._redis.eval(
+                    _BUDGET_SCRIPT,
+                    1,
+                    RETRY_BUDGET_KEY_PREFIX + key,
+                    earn,
+                    self.burst,
+                    int(spend),
+                    _BUDGET_TTL,
+                )
+                return bool(allowed)
+            except RedisError as e:
+                logger.warning(f"Redis retry budget failed: {e}")
+
+        tokens = min(self.burst, self._tokens.get(key, self.burst) + earn)
+        granted = not spend or tokens >= 1.0
+        if spend and granted:
+            tokens -= 1.0
+        self._tokens[key] = tokens
+        return granted
+
+    async def deposit(self, key: str) -> None:
+        """Earn the tokens of one first attempt.
+
+        Args:
+            key: Circuit name
+        """
+        await self._update(key, self.ratio, spend=False)
+
+    async def try_withdraw(self, key: str) -> bool:
+        """Spend one token for a retry if the bucket allows.
+
+        Args:
+            key: Circuit name
+
+        Returns:
+            True if the retry may proceed
+        """
+        return await self._update(key, 0.0, spend=True)
+
+    async def close(self) -> None:
+        """Close the Redis connection pool."""
+        if self._pool:
+            await self._pool.aclose()
+
+
+class CircuitBreakers:
+    """Process-wide circuit breakers and retry budget.
+
+    TAG: [SPEC-011] [EXECUTION] [CIRCUIT-BREAKER]
+
+    Attributes:
+        retry_budget: Retry token buckets per circuit
+    """
+
+    def __init__(self, retry_budget: RetryBudget | None = None) -> None:
+        """Initialize without circuits (created on first use).
+
+        Args:
+            retry_budget: Retry budget (default from settings)
+        """
+        if retry_budget is None:
+            redis_url = (
+                str(settings.REDIS_URL)
+                if settings.RETRY_BUDGET_REDIS and settings.REDIS_URL
+                else None
+            )
+            retry_budget = RetryBudget(redis_url=redis_url)
+        self.retry_budget = retry_budget
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def breaker(self, name: str) -> CircuitBreaker:
+        """Get the breaker of a circuit.
+
+        Args:
+            name: Circuit name
+
+        Returns:
+            CircuitBreaker (created closed on first use)
+        """
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = self._breakers[name] = CircuitBreaker(name)
+        return breaker
+
+    @staticmethod
+    def circuit_name(node: _CircuitNode) -> str | None:
+        """Resolve the circuit of a node.
+
+        Args:
+            node: Node or PlanNode
+
+        Returns:
+            Circuit name, or None for nodes without an external dependency
+        """
+        config = getattr(node, "config", None) or {}
+        name = config.get(CIRCUIT_CONFIG_KEY)
+        if isinstance(name, str) and name:
+            return name
+
+        node_type = getattr(node, "node_type", None)
+        if node_type == NodeType.TOOL and getattr(node, "tool_id", None):
+            return f"tool:{node.tool_id}"
+        if node_type == NodeType.AGENT:
+            llm_config = config.get("llm_config")
+            provider = config.get("provider") or (
+                llm_config.get("provider") if isinstance(llm_config, Mapping) else None
+            )
+            if isinstance(provider, str) and provider:
+                return f"llm:{provider}"
+            if getattr(node, "agent_id", None):
+                return f"agent:{node.agent_id}"
+        return None
+
+    def for_node(self, node: _CircuitNode) -> CircuitBreaker | None:
+        """Get the breaker guarding a node's dependency.
+
+        Args:
+            node: Node or PlanNode
+
+        Returns:
+            CircuitBreaker, or None if the node has no circuit
+        """
+        name = self.circuit_name(node)
+        return self.breaker(name) if name is not None else None
+
+    def metrics(self) -> dict[str, dict[str, Any]]:
+        """Snapshot of every circuit, keyed by name.
+
+        Returns:
+            Dictionary of circuit metrics
+        """
+        return {name: breaker.metrics() for name, breaker in self._breakers.items()}
+
+
+# Module-level singleton shared by all executors of the process
+_breakers: CircuitBreakers | None = None
+
+
+def get_circuit_breakers() -> CircuitBreakers:
+    """Get the global circuit breakers singleton.
+
+    TAG: [SPEC-011] [EXECUTION] [CIRCUIT-BREAKER]
+
+    Returns:
+        The global CircuitBreakers instance (creates on first call)
+    """
+    global _breakers
+    if _breakers is None:
+        _breakers = CircuitBreakers()
+    return _breakers
+
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitBreakers",
+    "CircuitState",
+    "RetryBudget",
+    "get_circuit_breakers",
+]
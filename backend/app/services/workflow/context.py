@@ -9,29 +9,47 @@ between workflow nodes during execution.
 
 from __future__ import annotations
 
+from collections import ChainMap
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable, Mapping, Sequence
     from uuid import UUID
 
     from app.models.workflow import Edge, Node
+    from app.services.workflow.plan import PlanEdge, PlanNode
+    from app.services.workflow.streaming import RecordStream
 
 
 class ExecutionContext:
-    """Thread-safe context for passing data between nodes.
+    """Copy-on-write context for passing data between nodes.
 
     TAG: [SPEC-011] [EXECUTION] [CONTEXT]
     REQ: REQ-011-003
 
     Manages workflow variables, node outputs, and error recording
-    during workflow execution. Uses asyncio.Lock for thread safety.
+    during workflow execution. No method awaits while touching shared
+    state, so concurrent node tasks on the event loop never interleave
+    inside one and no lock is needed.
+
+    Node outputs are immutable once published with set_output: nodes get
+    read-only views of them and must not mutate a dict after publishing it.
+    Node input is a layered view over predecessor outputs, so fan-in reads
+    cost O(predecessors) instead of copying every predecessor's data.
+
+    With consumer tracking enabled (track_consumers), an output is released
+    once every consuming edge has read it, so memory scales with the DAG
+    frontier. Outputs without consumers (sink nodes) and retained outputs
+    stay until the run ends.
 
     Attributes:
         workflow_execution_id: UUID of the workflow execution.
         _variables: Workflow variables dictionary.
         _node_outputs: Dictionary mapping node IDs to their output data.
+        _streams: Dictionary mapping streaming node IDs to their chunk streams.
+        _consumers: Unread consuming edges per releasable node output.
         _errors: List of error dictionaries.
-        _lock: Async lock for thread-safe operations.
 
     """
 
@@ -43,39 +61,108 @@ class ExecutionContext:
             input_data: Initial input data for the workflow.
 
         """
-        from asyncio import Lock
-
         self.workflow_execution_id = workflow_execution_id
         self._variables: dict[str, Any] = dict(input_data)
         self._node_outputs: dict[UUID, dict[str, Any]] = {}
+        self._streams: dict[UUID, RecordStream] = {}
+        self._consumers: dict[UUID, int] = {}
         self._errors: list[dict[str, Any]] = []
-        self._lock = Lock()
 
-    async def get_input(self, node: Node, incoming_edges: list[Edge]) -> dict[str, Any]:  # noqa: ARG002
+    async def get_input(
+        self,
+        node: Node | PlanNode,  # noqa: ARG002
+        incoming_edges: Sequence[Edge | PlanEdge],
+    ) -> Mapping[str, Any]:
         """Get input data for a node from predecessor outputs.
 
         TAG: [SPEC-011] [EXECUTION] [CONTEXT]
         REQ: REQ-011-003
 
-        Merges outputs from all predecessor nodes into a single input dict.
-        If multiple predecessors produce the same key, the last one wins.
+        Layers the outputs of all predecessor nodes into one read-only view
+        without copying them. If multiple predecessors produce the same key,
+        the last one wins. Each edge read counts as one consumer of the
+        predecessor output.
 
         Args:
             node: The target node to get input for.
-            incoming_edges: List of edges coming into this node.
+            incoming_edges: Edges coming into this node.
 
         Returns:
-            Merged input data dictionary from all predecessor outputs.
+            Read-only mapping over all predecessor outputs; use dict() on it
+            for a mutable copy.
+
+        """
+        layers: list[dict[str, Any]] = []
+        for edge in incoming_edges:
+            predecessor_output = self._node_outputs.get(edge.source_node_id)
+            if predecessor_output is not None:
+                layers.append(predecessor_output)
+            self._release(edge.source_node_id)
+
+        # ChainMap looks keys up front to back; reverse so later edges win
+        layers.reverse()
+        return MappingProxyType(ChainMap(*layers))
+
+    def track_consumers(
+        self,
+        consumer_counts: Mapping[UUID, int],
+        retain: Collection[UUID] = (),
+    ) -> None:
+        """Enable release of node outputs once all consumers have read them.
+
+        TAG: [SPEC-011] [EXECUTION] [CONTEXT] [MEMORY]
+
+        Args:
+            consumer_counts: Number of consuming (outgoing) edges per node.
+            retain: Node IDs whose outputs are kept regardless.
 
         """
-        input_data: dict[str, Any] = {}
+        self._consumers = {
+            node_id: count
+            for node_id, count in consumer_counts.items()
+            if count > 0 and node_id not in retain
+        }
+
+    async def release_inputs(self, incoming_edges: Iterable[Edge | PlanEdge]) -> None:
+        """Count edges of a node that will never read its inputs as consumed.
+
+        TAG: [SPEC-011] [EXECUTION] [CONTEXT] [MEMORY]
+
+        Used for skipped nodes, so their predecessors' outputs are not held
+        for a read that never happens.
+
+        Args:
+            incoming_edges: Edges coming into the node that will not run.
+
+        """
+        for edge in incoming_edges:
+            self._release(edge.source_node_id)
+
+    def _release(self, node_id: UUID) -> None:
+        """Consume one read of a node output, dropping it after the last."""
+        remaining = self._consumers.get(node_id)
+        if remaining is None:
+            return
+        if remaining > 1:
+            self._consumers[node_id] = remaining - 1
+            return
+        del self._consumers[node_id]
+        self._node_outputs.pop(node_id, None)
 
-        async with self._lock:
-            for edge in incoming_edges:
-                predecessor_output = self._node_outputs.get(edge.source_node_id, {})
-                input_data.update(predecessor_output)
+    async def discard_output(self, node_id: UUID) -> None:
+        """Drop the output of a node whose run was discarded.
 
-        return input_data
+        TAG: [SPEC-011] [EXECUTION] [CONTEXT] [MEMORY]
+
+        Used for speculative branches excluded by their condition node; the
+        output is removed even if it is a sink or retained output.
+
+        Args:
+            node_id: UUID of the node whose run was discarded.
+
+        """
+        self._consumers.pop(node_id, None)
+        self._node_outputs.pop(node_id, None)
 
     async def set_output(self, node_id: UUID, data: dict[str, Any]) -> None:
         """Store output data from a node.
@@ -83,13 +170,37 @@ class ExecutionContext:
         TAG: [SPEC-011] [EXECUTION] [CONTEXT]
         REQ: REQ-011-003
 
+        The context takes ownership of data: it is shared with consumers
+        as is, so the producer must not mutate it afterwards.
+
         Args:
             node_id: UUID of the node that produced the output.
             data: Output data dictionary to store.
 
         """
-        async with self._lock:
-            self._node_outputs[node_id] = data
+        self._node_outputs[node_id] = data
+
+    async def get_stream(self, node_id: UUID) -> RecordStream:
+        """Get the output stream of a streaming node, creating it if needed.
+
+        TAG: [SPEC-011] [EXECUTION] [CONTEXT] [STREAMING]
+
+        Producers and consumers share the same stream; consumers must
+        subscribe before the producer sends its first chunk.
+
+        Args:
+            node_id: UUID of the streaming node.
+
+        Returns:
+            RecordStream carrying the node's record chunks.
+
+        """
+        from app.services.workflow.streaming import RecordStream
+
+        stream = self._streams.get(node_id)
+        if stream is None:
+            stream = self._streams[node_id] = RecordStream()
+        return stream
 
     async def get_variable(self, name: str) -> Any:
         """Get a workflow variable.
@@ -104,8 +215,7 @@ class ExecutionContext:
             Variable value, or None if not found.
 
         """
-        async with self._lock:
-            return self._variables.get(name)
+        return self._variables.get(name)
 
     async def set_variable(self, name: str, value: Any) -> None:
         """Set a workflow variable.
@@ -118,8 +228,7 @@ class ExecutionContext:
             value: Value to set.
 
         """
-        async with self._lock:
-            self._variables[name] = value
+        self._variables[name] = value
 
     async def add_error(
         self, node_id: UUID, error_type: str, message: str,
@@ -135,10 +244,9 @@ class ExecutionContext:
             message: Error message.
 
         """
-        async with self._lock:
-            self._errors.append(
-                {"node_id": str(node_id), "error_type": error_type, "message": message},
-            )
+        self._errors.append(
+            {"node_id": str(node_id), "error_type": error_type, "message": message},
+        )
 
     def has_errors(self) -> bool:
         """Check if any errors occurred.
@@ -150,18 +258,19 @@ class ExecutionContext:
             True if errors have been recorded, False otherwise.
 
         """
-        # Synchronous method - lock not needed for simple len check
         return len(self._errors) > 0
 
     async def get_all_outputs(self) -> dict[UUID, dict[str, Any]]:
-        """Get all node outputs.
+        """Get all node outputs still held by the context.
 
         TAG: [SPEC-011] [EXECUTION] [CONTEXT]
         REQ: REQ-011-003
 
+        With consumer tracking enabled, released intermediate outputs are
+        not included; they remain available on their NodeExecution rows.
+
         Returns:
             Dictionary mapping node IDs to their output data.
 
         """
-        async with self._lock:
-            return dict(self._node_outputs)
+        return dict(self._node_outputs)
@@ -209,3 +209,67 @@ class ConditionEvaluationError(ExecutionError):
         super().__init__(message)
         self.node_id = node_id
         self.reason = reason
+
+
+class StreamError(ExecutionError):
+    """Raised when a node output stream is used incorrectly.
+
+    TAG: [SPEC-011] [EXECUTION] [EXCEPTIONS] [STREAMING]
+
+    Attributes:
+        message: Error message.
+
+    """
+
+
+class BlobNotFoundError(ExecutionError):
+    """Raised when an offloaded payload is missing from the blob store.
+
+    TAG: [SPEC-011] [EXECUTION] [EXCEPTIONS] [BLOB-STORE]
+
+    Attributes:
+        digest: Digest of the missing blob.
+
+    """
+
+    def __init__(self, digest: str) -> None:
+        super().__init__(f"Blob {digest} not found")
+        self.digest = digest
+
+
+class CircuitOpenError(ExecutionError):
+    """Raised when a node's dependency circuit is open.
+
+    TAG: [SPEC-011] [EXECUTION] [EXCEPTIONS] [CIRCUIT-BREAKER]
+
+    Attributes:
+        circuit: Name of the open circuit.
+        retry_after: Seconds until the circuit lets a probe through.
+
+    """
+
+    def __init__(self, circuit: str, retry_after: float) -> None:
+        super().__init__(f"Circuit {circuit} is open, retry after {retry_after:.1f}s")
+        self.circuit = circuit
+        self.retry_after = retry_after
+
+
+class DeadlineExceededError(ExecutionError):
+    """Raised when an execution cannot finish within its deadline.
+
+    TAG: [SPEC-011] [EXECUTION] [EXCEPTIONS] [DEADLINE]
+
+    Attributes:
+        execution_id: ID of the aborted execution.
+        deadline_seconds: Time budget of the execution in seconds.
+
+    """
+
+    def __init__(self, execution_id: UUID, deadline_seconds: float) -> None:
+        message = (
+            f"Execution {str(execution_id)[:8]} cannot finish within its "
+            f"{deadline_seconds:g}s deadline"
+        )
+        super().__init__(message)
+        self.execution_id = execution_id
+        self.deadline_seconds = deadline_seconds
@@ -7,34 +7,107 @@ REQ: REQ-011-003 - ExecutionContext for node data passing
 REQ: REQ-011-004 - Exponential backoff retry
 REQ: REQ-011-005 - Failure isolation policy
 REQ: REQ-011-009 - Workflow cancellation support
+REQ: REQ-011-012 - Concurrency control
 """
 
 from __future__ import annotations
 
 import contextlib
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from enum import StrEnum
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, select
 
+from app.core.config import settings
 from app.models.enums import ExecutionStatus, LogLevel, TriggerType
 from app.models.execution import ExecutionLog, NodeExecution, WorkflowExecution
 from app.models.workflow import Edge, Node, Workflow
+from app.services.workflow.admission import (
+    AdmissionController,
+    get_admission_controller,
+)
+from app.services.workflow.algorithms import GraphAlgorithms
+from app.services.workflow.blob_store import resolve_payload
+from app.services.workflow.cancellation import (
+    get_cancellation_registry,
+    notify_cancellation,
+)
+from app.services.workflow.circuit_breaker import (
+    CircuitBreakers,
+    get_circuit_breakers,
+)
 from app.services.workflow.context import ExecutionContext
 from app.services.workflow.exceptions import (
+    CircuitOpenError,
+    DeadlineExceededError,
     ExecutionCancelledError,
     ExecutionError,
+    NodeExecutionError,
     NodeTimeoutError,
 )
 from app.services.workflow.graph import Graph
+from app.services.workflow.output_cache import (
+    NodeOutputCache,
+    get_cache_ttl,
+    get_node_output_cache,
+    make_cache_key,
+)
+from app.services.workflow.persistence import ExecutionWriteBuffer
+from app.services.workflow.plan import (
+    ExecutionPlan,
+    ExecutionPlanCache,
+    PlanEdge,
+    PlanNode,
+    get_plan_cache,
+)
+from app.services.workflow.resources import ResourcePools, get_resource_pools
+from app.services.workflow.single_flight import (
+    SingleFlight,
+    get_single_flight,
+    get_single_flight_window,
+)
 from app.services.workflow.validator import DAGValidator
 
 if TYPE_CHECKING:
+    import asyncio
+    from collections.abc import Collection, Mapping, Sequence
+
     from sqlalchemy.ext.asyncio import AsyncSession
 
 type _Graph = Graph[UUID]
+type _ExecNode = Node | PlanNode
+type _ExecEdge = Edge | PlanEdge
+
+# Node config key keeping an intermediate output in the execution result
+RETAIN_OUTPUT_CONFIG_KEY = "retain_output"
+
+# Execution metadata and workflow config key of the execution time budget
+DEADLINE_CONFIG_KEY = "deadline_seconds"
+
+# PARALLEL node config keys: input key of the list to fan out, items per map
+# body run, key of the item in the body input and body runs at once
+MAP_ITEMS_CONFIG_KEY = "items_key"
+MAP_CHUNK_SIZE_CONFIG_KEY = "chunk_size"
+MAP_ITEM_CONFIG_KEY = "item_key"
+MAP_CONCURRENCY_CONFIG_KEY = "max_concurrency"
+
+
+class SchedulingMode(StrEnum):
+    """Node scheduling strategy used by WorkflowExecutor.
+
+    TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [SCHEDULER]
+
+    LEVELS: Run topological levels one at a time (a level waits for the
+        slowest node of the previous level).
+    DEPENDENCY: Track remaining in-degree per node and start each node as
+        soon as its own predecessors have finished.
+    """
+
+    LEVELS = "levels"
+    DEPENDENCY = "dependency"
 
 
 @dataclass
@@ -48,7 +121,8 @@ class ExecutionResult:
         status: Final execution status.
         output_data: Output data from the workflow (if successful).
         error_message: Error message (if failed).
-        node_results: Dictionary of node ID to execution result.
+        node_results: Outputs of sink nodes and nodes configured with
+            retain_output, keyed by node ID.
 
     """
 
@@ -59,6 +133,82 @@ class ExecutionResult:
     node_results: dict[UUID, dict[str, Any]] | None = None
 
 
+@dataclass
+class _NodeOutcome:
+    """Outcome of a single node run, before it is persisted.
+
+    Node tasks only compute outcomes; the coordinating coroutine turns them
+    into NodeExecution rows so the session is never used concurrently.
+
+    Attributes:
+        node_id: ID of the executed node.
+        input_data: Input data the node was executed with.
+        execution_order: Execution order counter.
+        started_at: When the node started executing.
+        ended_at: When the node finished executing.
+        output_data: Output data (if successful).
+        retry_count: Number of retries needed (if successful).
+        error: Exception raised by the node (if failed).
+        cancelled: Whether the node was cancelled while running.
+        cache_hit: Whether the output came from the node output cache.
+        reused: Whether the output was reused from the re-run source execution.
+        resumed: Whether the record of the node was kept from an earlier
+            attempt of the same execution (not persisted again).
+        deduplicated_from: Structurally identical node whose run this node
+            shared (if deduplicated).
+        shared_flight: Whether the output came from an identical call made
+            by another execution (single-flight).
+        item_index: Position of the mapped item (per-item runs of a map body).
+        item_outcomes: Per-item runs of a map body node, in item order.
+
+    """
+
+    node_id: UUID
+    input_data: Mapping[str, Any]
+    execution_order: int
+    started_at: datetime
+    ended_at: datetime
+    output_data: dict[str, Any] | None = None
+    retry_count: int = 0
+    error: Exception | None = None
+    cancelled: bool = False
+    cache_hit: bool = False
+    reused: bool = False
+    resumed: bool = False
+    deduplicated_from: UUID | None = None
+    shared_flight: bool = False
+    item_index: int | None = None
+    item_outcomes: list[_NodeOutcome] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> bool:
+        """Check if the node completed without error."""
+        return self.error is None and not self.cancelled
+
+
+def _execution_priority(execution: WorkflowExecution) -> int:
+    """Read the admission priority (-100..100) from execution metadata."""
+    try:
+        priority = int((execution.metadata_ or {}).get("priority", 0))
+    except (TypeError, ValueError):
+        return 0
+    return max(-100, min(100, priority))
+
+
+def _execution_deadline(
+    execution: WorkflowExecution, workflow: Workflow
+) -> float | None:
+    """Read the time budget in seconds (request metadata before workflow)."""
+    for source in (execution.metadata_, workflow.config):
+        try:
+            seconds = float((source or {}).get(DEADLINE_CONFIG_KEY) or 0)
+        except (TypeError, ValueError):
+            continue
+        if seconds > 0:
+            return seconds
+    return None
+
+
 class WorkflowExecutor:
     """DAG-based workflow execution engine.
 
@@ -70,32 +220,113 @@ class WorkflowExecutor:
     Attributes:
         db: Async database session.
         max_parallel_nodes: Maximum number of nodes to execute in parallel.
+            Node runs additionally take slots from the pool of their
+            resource class and from the process-wide admission controller,
+            shared fairly by owner and priority.
+        scheduling_mode: Strategy used to decide when nodes start.
         _validator: DAGValidator instance for validation.
+        _writes: Write-behind buffer for node execution and log records.
+        _plan_cache: Cache of compiled execution plans.
+        _output_cache: Content-addressed cache of node outputs.
+        _plan: Execution plan of the workflow currently being executed.
+        _priorities: Critical-path priority per node of the current plan.
         _cancelled: Flag indicating if execution was cancelled.
+        _cancel_event: Event set to interrupt running nodes immediately.
+        _cancelled_outcomes: Outcomes of nodes interrupted by cancellation.
+        _reused_outputs: Stored (input, output) per node reused by a re-run.
+        _carried_skips: Nodes skipped before scheduling starts: kept SKIPPED
+            from a re-run's source execution or pruned as not needed for the
+            requested target nodes.
+        _resumed_nodes: Nodes whose records an earlier attempt of a
+            reclaimed execution left in place.
+        _shared_runs: Run of each group of structurally identical nodes,
+            keyed by the group's canonical node ID.
+        _unread_outputs: Nodes whose outputs no node reads although they
+            have successors (condition nodes followed only by speculative
+            branches); their outputs are only persisted.
+        _admission: Process-wide node slot pool shared by all executions.
+        _resources: Process-wide slot pools per node resource class.
+        _flow: (owner ID, priority) admission flow of the current execution.
+        _circuits: Process-wide circuit breakers and retry budget.
+        _single_flight: Process-wide registry of in-flight node calls.
+        _deadline: Monotonic time by which the current execution must end.
+        _deadline_seconds: Time budget of the current execution.
+        _deadline_missed: Set when a node found the deadline unreachable.
+        _reserves: Expected critical-path duration after each node (seconds).
+        _execution_id: ID of the execution currently being run.
 
     """
 
-    def __init__(self, db: AsyncSession, max_parallel_nodes: int = 10) -> None:
+    def __init__(
+        self,
+        db: AsyncSession,
+        max_parallel_nodes: int = 10,
+        scheduling_mode: SchedulingMode = SchedulingMode.LEVELS,
+        plan_cache: ExecutionPlanCache | None = None,
+        output_cache: NodeOutputCache | None = None,
+        admission: AdmissionController | None = None,
+        resources: ResourcePools | None = None,
+        circuits: CircuitBreakers | None = None,
+        single_flight: SingleFlight | None = None,
+    ) -> None:
         """Initialize the executor.
 
         Args:
             db: Async database session.
             max_parallel_nodes: Maximum parallel node executions (default: 10).
+            scheduling_mode: Node scheduling strategy (default: LEVELS).
+            plan_cache: Compiled plan cache (default: global plan cache).
+            output_cache: Node output cache (default: global output cache).
+            admission: Node slot pool (default: global admission controller).
+            resources: Resource class pools (default: global resource pools).
+            circuits: Circuit breakers (default: global circuit breakers).
+            single_flight: Single-flight registry (default: global registry).
 
         """
         import asyncio
 
         self.db = db
         self.max_parallel_nodes = max_parallel_nodes
+        self.scheduling_mode = SchedulingMode(scheduling_mode)
         self._semaphore = asyncio.Semaphore(max_parallel_nodes)
         self._cancelled = False
+        self._cancel_event = asyncio.Event()
+        self._cancelled_outcomes: list[_NodeOutcome] = []
+        self._last_cancel_poll = 0.0
         self._validator = DAGValidator(db)
+        self._writes = ExecutionWriteBuffer(db)
+        self._plan_cache = plan_cache if plan_cache is not None else get_plan_cache()
+        self._output_cache = (
+            output_cache if output_cache is not None else get_node_output_cache()
+        )
+        self._plan: ExecutionPlan | None = None
+        self._priorities: dict[UUID, float] = {}
+        self._reused_outputs: dict[UUID, tuple[Mapping[str, Any], dict[str, Any]]] = {}
+        self._carried_skips: set[UUID] = set()
+        self._resumed_nodes: set[UUID] = set()
+        self._shared_runs: dict[UUID, asyncio.Future[_NodeOutcome]] = {}
+        self._unread_outputs: set[UUID] = set()
+        self._admission = (
+            admission if admission is not None else get_admission_controller()
+        )
+        self._flow: tuple[UUID | None, int] = (None, 0)
+        self._resources = resources if resources is not None else get_resource_pools()
+        self._circuits = circuits if circuits is not None else get_circuit_breakers()
+        self._single_flight = (
+            single_flight if single_flight is not None else get_single_flight()
+        )
+        self._deadline: float | None = None
+        self._deadline_seconds = 0.0
+        self._deadline_missed = False
+        self._reserves: dict[UUID, float] = {}
+        self._execution_id: UUID | None = None
 
     async def execute(
         self,
         workflow_id: UUID,
         input_data: dict[str, Any],
         trigger_type: TriggerType = TriggerType.MANUAL,
+        target_node_ids: Collection[UUID] | None = None,
     ) -> ExecutionResult:
         """Execute a workflow.
 
@@ -107,6 +338,8 @@ class WorkflowExecutor:
             workflow_id: UUID of the workflow to execute.
             input_data: Input data for the workflow.
             trigger_type: How the execution was triggered.
+            target_node_ids: Nodes whose outputs are needed; only they and
+                their ancestors run (default: the whole workflow).
 
         Returns:
             ExecutionResult with execution details.
@@ -129,12 +362,164 @@ class WorkflowExecutor:
             status=ExecutionStatus.PENDING,
             input_data=input_data,
             started_at=datetime.now(UTC),
+            target_node_ids=(
+                [str(node_id) for node_id in target_node_ids]
+                if target_node_ids
+                else None
+            ),
+        )
+        self.db.add(execution)
+        await self.db.flush()
+
+        return await self._run_workflow(execution, workflow)
+
+    async def run_execution(self, execution_id: UUID) -> ExecutionResult:
+        """Run an existing workflow execution record.
+
+        TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [QUEUE]
+
+        Used by queue workers, which claim PENDING executions created by the
+        API instead of creating their own records. An execution reclaimed
+        after its worker died continues from the nodes that attempt
+        finished.
+
+        Args:
+            execution_id: UUID of the execution to run.
+
+        Returns:
+            ExecutionResult with execution details.
+
+        Raises:
+            ExecutionCancelledError: If executor was cancelled.
+            ExecutionError: If the execution or its workflow does not exist.
+
+        """
+        if self._cancelled:
+            raise ExecutionCancelledError(execution_id=execution_id)
+
+        execution = await self.db.get(WorkflowExecution, execution_id)
+        if execution is None:
+            raise ExecutionError(f"Execution {execution_id} not found")
+
+        workflow = await self._get_workflow(execution.workflow_id)
+        # Claimed before: a worker died while running it
+        return await self._run_workflow(
+            execution, workflow, resume=execution.attempts > 1
+        )
+
+    async def rerun(
+        self,
+        source_execution_id: UUID,
+        dirty_node_ids: Collection[UUID],
+        input_data: dict[str, Any] | None = None,
+    ) -> ExecutionResult:
+        """Re-execute only the nodes affected by a change.
+
+        TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [RERUN]
+
+        Creates a new execution that restores the stored outputs of every
+        node not downstream of a dirty node and runs the rest.
+
+        Args:
+            source_execution_id: UUID of the finished execution to re-run.
+            dirty_node_ids: Changed or failed nodes to re-execute.
+            input_data: Input override (default: the source execution input).
+
+        Returns:
+            ExecutionResult with execution details.
+
+        Raises:
+            ExecutionCancelledError: If executor was cancelled.
+            ExecutionError: If the source execution does not exist.
+
+        """
+        if self._cancelled:
+            raise ExecutionCancelledError(execution_id=source_execution_id)
+
+        source = await self.db.get(WorkflowExecution, source_execution_id)
+        if source is None:
+            raise ExecutionError(f"Execution {source_execution_id} not found")
+
+        workflow = await self._get_workflow(source.workflow_id)
+
+        execution = WorkflowExecution(
+            workflow_id=source.workflow_id,
+            trigger_type=source.trigger_type,
+            status=ExecutionStatus.PENDING,
+            input_data=input_data if input_data is not None else source.input_data,
+            started_at=datetime.now(UTC),
+            rerun_of_id=source.id,
+            dirty_node_ids=[str(node_id) for node_id in dirty_node_ids],
         )
         self.db.add(execution)
         await self.db.flush()
 
+        return await self._run_workflow(execution, workflow)
+
+    async def prepare(self, workflow_id: UUID) -> tuple[Workflow, ExecutionPlan]:
+        """Fetch a workflow and compile its execution plan ahead of runs.
+
+        TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [PLAN]
+
+        The plan is stored in this executor's plan cache, so executors
+        sharing that cache reuse it instead of compiling it again.
+
+        Args:
+            workflow_id: UUID of the workflow.
+
+        Returns:
+            The workflow and the plan of its current version.
+
+        Raises:
+            ExecutionError: If the workflow does not exist.
+
+        """
+        workflow = await self._get_workflow(workflow_id)
+        return workflow, await self._get_execution_plan(workflow)
+
+    def stop(self) -> None:
+        """Stop scheduling further nodes without updating the database.
+
+        TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [QUEUE]
+
+        Used when the execution record was cancelled or reclaimed elsewhere,
+        e.g. when a queue worker loses its lease. Running nodes are cancelled
+        immediately.
+        """
+        self._cancelled = True
+        self._cancel_event.set()
+
+    async def _run_workflow(
+        self,
+        execution: WorkflowExecution,
+        workflow: Workflow,
+        *,
+        resume: bool = False,
+    ) -> ExecutionResult:
+        """Run a workflow for an execution record.
+
+        TAG: [SPEC-011] [EXECUTION] [EXECUTOR]
+        REQ: REQ-011-001 - DAG topological sort based execution
+        REQ: REQ-011-002 - asyncio.TaskGroup parallel execution
+
+        Args:
+            execution: WorkflowExecution record to run.
+            workflow: Workflow being executed.
+            resume: Whether an earlier attempt already ran part of it.
+
+        Returns:
+            ExecutionResult with execution details.
+
+        """
         # Store execution_id early to avoid accessing session objects later
         execution_id = execution.id
+        input_data = execution.input_data
+        rerun_of_id = execution.rerun_of_id
+        dirty_node_ids = execution.dirty_node_ids or []
+        target_node_ids = execution.target_node_ids or []
+        self._flow = (workflow.owner_id, _execution_priority(execution))
+        self._execution_id = execution_id
+        self._start_deadline(execution, workflow)
 
         # Log workflow start
         await self._log_execution_event(
@@ -149,22 +534,80 @@ class WorkflowExecutor:
             input_data=input_data,
         )
 
+        # Make the run reachable by cancel requests from any process
+        registry = get_cancellation_registry()
+        registry.register(execution_id, self._cancel_event)
+
         try:
-            # Validate workflow topology
-            topology = await self._validator.get_topology(workflow_id)
+            # Validate workflow topology (compiled once per workflow version)
+            plan = await self._get_execution_plan(workflow)
+            self._plan = plan
+            needed = self._needed_nodes(plan, target_node_ids)
+            medians = await self._get_node_duration_medians(plan)
+            self._priorities = plan.priorities(medians, nodes=needed)
+            # Expected time still needed after each node, in seconds (only
+            # known from duration history)
+            default_median = sum(medians.values()) / len(medians) if medians else 0.0
+            self._reserves = (
+                {
+                    nid: rank - medians.get(nid, default_median)
+                    for nid, rank in self._priorities.items()
+                }
+                if medians
+                else {}
+            )
+            # Release intermediate outputs once all readers have read them
+            # (nodes pruned from the run never read; targets are kept)
+            reads: dict[UUID, int] = {}
+            for nid, edges in plan.incoming_edges.items():
+                if needed is None or nid in needed:
+                    for edge in edges:
+                        reads[edge.source_node_id] = (
+                            reads.get(edge.source_node_id, 0) + 1
+                        )
+            retain = {
+                nid
+                for nid, node in plan.nodes.items()
+                if (node.config or {}).get(RETAIN_OUTPUT_CONFIG_KEY)
+            } | {UUID(str(nid)) for nid in target_node_ids}
+            context.track_consumers(reads, retain=retain)
+            # Speculative branches read their condition node's inputs, so a
+            # condition node followed only by them has no reader
+            self._unread_outputs = {
+                nid
+                for nid in plan.speculative_branches
+                if not reads.get(nid) and nid not in retain
+            }
+            self._reused_outputs = {}
+            self._carried_skips = set()
+            self._resumed_nodes = set()
+            self._shared_runs = {}
+            if rerun_of_id is not None:
+                await self._prepare_rerun(
+                    execution_id, rerun_of_id, dirty_node_ids, plan
+                )
+            elif resume:
+                await self._prepare_resume(execution_id, plan)
+            if needed is not None:
+                await self._prune_to_targets(execution_id, needed, plan)
 
             # Update execution status to RUNNING
             execution.status = ExecutionStatus.RUNNING
             await self.db.commit()
 
-            # Execute nodes by topological levels
-            await self._execute_by_levels(execution, workflow, topology, context)
+            # Execute nodes using the configured scheduling strategy
+            if self.scheduling_mode == SchedulingMode.DEPENDENCY:
+                await self._execute_by_dependencies(execution, plan, context)
+            else:
+                await self._execute_by_levels(execution, plan, context)
 
             # Mark as completed
             execution.status = ExecutionStatus.COMPLETED
             execution.ended_at = datetime.now(UTC)
-            # Convert UUID keys to strings for JSON storage
+            # Sink and retained node outputs; intermediate outputs were
+            # released and live on their NodeExecution rows
             outputs = await context.get_all_outputs()
+            # Convert UUID keys to strings for JSON storage
             execution.output_data = {str(k): v for k, v in outputs.items()}
 
             # Log workflow completion
@@ -174,13 +617,42 @@ class WorkflowExecutor:
                 message="Workflow execution completed successfully",
             )
 
+            await self._writes.flush()
             await self.db.commit()
 
             return ExecutionResult(
                 execution_id=execution_id,
                 status=ExecutionStatus.COMPLETED,
                 output_data=execution.output_data,
-                node_results=await context.get_all_outputs(),
+                node_results=outputs,
+            )
+
+        except ExecutionCancelledError as e:
+            await self._record_cancellation(execution_id)
+            return ExecutionResult(
+                execution_id=execution_id,
+                status=ExecutionStatus.CANCELLED,
+                error_message=str(e),
+            )
+
+        except DeadlineExceededError as e:
+            # Nodes still running were interrupted; record them and fail
+            node_map = self._plan.nodes if self._plan is not None else {}
+            await self._record_node_outcomes(
+                execution_id, self._cancelled_outcomes, node_map
+            )
+            self._cancelled_outcomes.clear()
+            await self._log_execution_event(
+                execution_id=execution_id,
+                level=LogLevel.WARNING,
+                message=f"Workflow execution aborted: {e}",
+            )
+            await self._flush_writes_after_failure()
+
+            return ExecutionResult(
+                execution_id=execution_id,
+                status=ExecutionStatus.FAILED,
+                error_message=str(e),
             )
 
         except Exception as e:
@@ -188,29 +660,41 @@ class WorkflowExecutor:
             # to avoid accessing stale session objects
             execution_id = execution.id
 
+            # Persist records buffered before the failure (best effort)
+            await self._flush_writes_after_failure()
+
             return ExecutionResult(
                 execution_id=execution_id,
                 status=ExecutionStatus.FAILED,
                 error_message=str(e),
             )
 
+        finally:
+            registry.unregister(execution_id)
+
     async def cancel(self, execution_id: UUID) -> None:
         """Cancel a running workflow execution.
 
         TAG: [SPEC-011] [EXECUTION] [EXECUTOR]
         REQ: REQ-011-009 - Workflow cancellation support
 
+        The run is interrupted wherever it executes: in this process through
+        the cancellation registry, in other processes through a Postgres
+        notification or, failing that, their status polling.
+
         Args:
             execution_id: UUID of the execution to cancel.
 
         """
         self._cancelled = True
+        self._cancel_event.set()
 
         # Update execution record
         execution = await self.db.get(WorkflowExecution, execution_id)
         if execution and execution.status == ExecutionStatus.RUNNING:
             execution.status = ExecutionStatus.CANCELLED
             execution.ended_at = datetime.now(UTC)
+            await notify_cancellation(self.db, execution_id)
             await self.db.commit()
 
     # ==========================================================================
@@ -235,427 +719,1791 @@ class WorkflowExecutor:
             message: Log message.
             node_execution_id: Optional node execution ID for node-level logs.
 
+        Logs are buffered and written in batches by ExecutionWriteBuffer.
+
         """
         from sqlalchemy import exc
 
-        log = ExecutionLog(
-            workflow_execution_id=execution_id,
-            node_execution_id=node_execution_id,
-            level=level,
-            message=message,
-        )
-        self.db.add(log)
         with contextlib.suppress(exc.PendingRollbackError):
             # Session is in rollback state - skip logging
             # This happens when there's been a previous error
-            await self.db.flush()
+            await self._writes.add_log(
+                workflow_execution_id=execution_id,
+                node_execution_id=node_execution_id,
+                level=level,
+                message=message,
+            )
+
+    async def _flush_writes_after_failure(self) -> None:
+        """Flush buffered records after a failed run, ignoring DB errors.
+
+        TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [PERSISTENCE]
+
+        If the session itself is broken the buffered rows are discarded,
+        matching the previous behavior of skipping logs in that state.
+        """
+        from sqlalchemy import exc
+
+        try:
+            await self._writes.flush()
+        except exc.SQLAlchemyError:
+            self._writes.clear()
+
+    async def _record_cancellation(self, execution_id: UUID) -> None:
+        """Persist the nodes interrupted by a cancellation.
+
+        TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [CANCELLATION]
+        REQ: REQ-011-009 - Workflow cancellation support
+
+        The execution status is left to the canceller, which already set it
+        to CANCELLED; a run stopped because its lease was reclaimed must not
+        overwrite the new owner's status.
+
+        Args:
+            execution_id: UUID of the cancelled execution.
+
+        """
+        from sqlalchemy import exc
+
+        node_map = self._plan.nodes if self._plan is not None else {}
+        try:
+            await self._record_node_outcomes(
+                execution_id, self._cancelled_outcomes, node_map
+            )
+            await self._log_execution_event(
+                execution_id=execution_id,
+                level=LogLevel.WARNING,
+                message="Workflow execution cancelled",
+            )
+            await self._writes.flush()
+            await self.db.commit()
+        except exc.SQLAlchemyError:
+            self._writes.clear()
+        finally:
+            self._cancelled_outcomes.clear()
+
+    async def _is_cancel_requested(self, execution_id: UUID) -> bool:
+        """Check for cancellation, polling the status column when due.
+
+        TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [CANCELLATION]
+
+        The status column is read at most every EXECUTION_CANCEL_POLL_INTERVAL
+        seconds. It is the fallback for missed or unsupported notifications.
+
+        Args:
+            execution_id: UUID of the running execution.
+
+        Returns:
+            True if the execution has been cancelled.
+
+        """
+        import time
+
+        if self._cancelled or self._cancel_event.is_set():
+            return True
+
+        now = time.monotonic()
+        if now - self._last_cancel_poll < settings.EXECUTION_CANCEL_POLL_INTERVAL:
+            return False
+        self._last_cancel_poll = now
 
-    async def _get_workflow(self, workflow_id: UUID) -> Workflow:
-        """Fetch workflow by ID."""
         result = await self.db.execute(
-            select(Workflow).where(Workflow.id == workflow_id),
+            select(WorkflowExecution.status).where(WorkflowExecution.id == execution_id)
         )
-        workflow = result.scalars().first()
-        if workflow is None:
-            raise ExecutionError(f"Workflow {workflow_id} not found")
-        return workflow
+        if result.scalar_one_or_none() == ExecutionStatus.CANCELLED:
+            self._cancelled = True
+        return self._cancelled
 
-    async def _execute_node_with_timeout(
+    async def _wait_for_nodes(
         self,
-        node: Node,
-        input_data: dict[str, Any],
-        execution_order: int,  # noqa: ARG002
-    ) -> dict[str, Any]:
-        """Execute a single node with timeout handling.
+        execution_id: UUID,
+        tasks: Collection[asyncio.Task[Any]],
+    ) -> set[asyncio.Task[Any]]:
+        """Wait until a node task finishes, watching for cancellation.
+
+        TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [CANCELLATION]
+        REQ: REQ-011-009 - Workflow cancellation support
+
+        Wakes up immediately on the cancel event, and at least every
+        EXECUTION_CANCEL_POLL_INTERVAL seconds to poll the status column.
+        Only called from coordinating coroutines, so the poll never shares
+        the session with node tasks.
+
+        Args:
+            execution_id: UUID of the running execution.
+            tasks: Running node tasks.
+
+        Returns:
+            Set of finished node tasks (never empty).
+
+        Raises:
+            ExecutionCancelledError: If cancellation was requested; the
+                caller is responsible for cancelling the running tasks.
+            DeadlineExceededError: If the execution deadline passed or a node
+                found it unreachable; the caller cancels the running tasks.
+
+        """
+        import asyncio
+        import time
+
+        cancel_waiter = asyncio.ensure_future(self._cancel_event.wait())
+        try:
+            while True:
+                timeout = settings.EXECUTION_CANCEL_POLL_INTERVAL
+                if self._deadline is not None:
+                    remaining = self._deadline - time.monotonic()
+                    if self._deadline_missed or remaining <= 0:
+                        raise DeadlineExceededError(
+                            execution_id, self._deadline_seconds
+                        )
+                    timeout = min(timeout, remaining)
+                done, _ = await asyncio.wait(
+                    {*tasks, cancel_waiter},
+                    timeout=timeout,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if await self._is_cancel_requested(execution_id):
+                    raise ExecutionCancelledError(execution_id=execution_id)
+                if done:
+                    return done
+        finally:
+            cancel_waiter.cancel()
+
+    async def _get_execution_plan(self, workflow: Workflow) -> ExecutionPlan:
+        """Get the compiled execution plan for a workflow version.
+
+        TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [PLAN]
+        REQ: REQ-011-001 - DAG topological sort based execution
+
+        Compiles and caches the plan on a cache miss.
+
+        Args:
+            workflow: Workflow to execute.
+
+        Returns:
+            ExecutionPlan for the workflow's current version.
+
+        """
+        plan = self._plan_cache.get(workflow.id, workflow.version)
+        if plan is not None:
+            return plan
+
+        topology = await self._validator.get_topology(workflow.id)
+        nodes, edges = await self._get_workflow_graph_data(workflow.id)
+        plan = ExecutionPlan.compile(
+            workflow_id=workflow.id,
+            version=workflow.version,
+            topology=topology,
+            nodes=nodes,
+            edges=edges,
+        )
+        self._plan_cache.set(plan)
+        return plan
+
+    async def _get_node_duration_medians(
+        self, plan: ExecutionPlan
+    ) -> dict[UUID, float]:
+        """Get the median duration of recent completed runs of each node.
+
+        TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [SCHEDULER]
+
+        Only the EXECUTION_PRIORITY_HISTORY_SIZE most recent runs per node
+        are considered. Nodes that never completed are absent.
+
+        Args:
+            plan: Compiled ExecutionPlan of the workflow.
+
+        Returns:
+            Median duration in seconds per node ID.
+
+        """
+        import statistics
+
+        history_size = settings.EXECUTION_PRIORITY_HISTORY_SIZE
+        if history_size <= 0 or not plan.nodes:
+            return {}
+
+        recent = (
+            select(
+                NodeExecution.node_id,
+                NodeExecution.started_at,
+                NodeExecution.ended_at,
+                func.row_number()
+                .over(
+                    partition_by=NodeExecution.node_id,
+                    order_by=NodeExecution.ended_at.desc(),
+                )
+                .label("recency"),
+            )
+            .where(
+                NodeExecution.node_id.in_(list(plan.nodes)),
+                NodeExecution.status == ExecutionStatus.COMPLETED,
+                NodeExecution.cache_hit.is_(False),
+                NodeExecution.item_index.is_(None),
+                NodeExecution.started_at.is_not(None),
+                NodeExecution.ended_at.is_not(None),
+            )
+            .subquery()
+        )
+        result = await self.db.execute(
+            select(recent.c.node_id, recent.c.started_at, recent.c.ended_at).where(
+                recent.c.recency <= history_size
+            )
+        )
+
+        durations: dict[UUID, list[float]] = {}
+        for node_id, started_at, ended_at in result.all():
+            durations.setdefault(node_id, []).append(
+                (ended_at - started_at).total_seconds()
+            )
+        return {
+            node_id: statistics.median(values) for node_id, values in durations.items()
+        }
+
+    async def _prepare_rerun(
+        self,
+        execution_id: UUID,
+        source_execution_id: UUID,
+        dirty_node_ids: Collection[str],
+        plan: ExecutionPlan,
+    ) -> None:
+        """Select the node results a partial re-run restores.
+
+        TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [RERUN]
+
+        Dirty nodes, nodes without a finished record in the source execution
+        (failed, cancelled, new) and everything downstream of them are
+        re-executed. Completed upstream nodes have their stored output
+        restored into the context instead of running. Source SKIPPED nodes
+        and their descendants stay skipped, since the routing that skipped
+        them is unaffected.
+
+        Args:
+            execution_id: UUID of the re-run execution.
+            source_execution_id: UUID of the execution whose results are reused.
+            dirty_node_ids: String IDs of the changed nodes.
+            plan: Compiled plan of the workflow being executed.
+
+        """
+        affected = await self._restore_finished_nodes(
+            source_execution_id, dirty_node_ids, plan
+        )
+
+        await self._create_skipped_executions(
+            skipped_nodes=self._carried_skips,
+            node_map=plan.nodes,
+            execution_id=execution_id,
+            reason=f"Skipped in execution {source_execution_id}",
+        )
+        await self._log_execution_event(
+            execution_id=execution_id,
+            level=LogLevel.INFO,
+            message=(
+                f"Re-running {len(affected)} of {len(plan.nodes)} node(s) "
+                f"from execution {source_execution_id}"
+            ),
+        )
+
+    async def _prepare_resume(self, execution_id: UUID, plan: ExecutionPlan) -> None:
+        """Continue an execution reclaimed from a worker that died.
+
+        TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [QUEUE]
+
+        Nodes the earlier attempt finished keep their records and have their
+        stored output restored instead of running again, as in a partial
+        re-run. Records of every other node (running, failed or cancelled
+        when the attempt stopped) and of their descendants are deleted, so
+        each node ends up with one record.
+
+        Args:
+            execution_id: UUID of the reclaimed execution.
+            plan: Compiled plan of the workflow being executed.
+
+        """
+        affected = await self._restore_finished_nodes(execution_id, (), plan)
+        self._resumed_nodes = set(self._reused_outputs) | self._carried_skips
+
+        stale_records = select(NodeExecution.id).where(
+            NodeExecution.workflow_execution_id == execution_id,
+            NodeExecution.node_id.not_in(self._resumed_nodes),
+        )
+        await self.db.execute(
+            delete(ExecutionLog).where(
+                ExecutionLog.node_execution_id.in_(stale_records)
+            )
+        )
+        await self.db.execute(
+            delete(NodeExecution).where(
+                NodeExecution.workflow_execution_id == execution_id,
+                NodeExecution.node_id.not_in(self._resumed_nodes),
+            )
+        )
+        await self._log_execution_event(
+            execution_id=execution_id,
+            level=LogLevel.WARNING,
+            message=(
+                f"Resuming reclaimed execution: {len(affected)} of "
+                f"{len(plan.nodes)} node(s) left to run"
+            ),
+        )
+
+    async def _restore_finished_nodes(
+        self,
+        source_execution_id: UUID,
+        dirty_node_ids: Collection[str],
+        plan: ExecutionPlan,
+    ) -> set[UUID]:
+        """Load the results of a finished or interrupted execution.
+
+        TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [RERUN]
+
+        Sets _reused_outputs to the completed nodes not downstream of a dirty
+        or unfinished node, and _carried_skips to the SKIPPED nodes and
+        their descendants.
+
+        Args:
+            source_execution_id: UUID of the execution whose results are reused.
+            dirty_node_ids: String IDs of nodes to run again.
+            plan: Compiled plan of the workflow being executed.
+
+        Returns:
+            The nodes that must run.
+
+        """
+        result = await self.db.execute(
+            select(
+                NodeExecution.node_id,
+                NodeExecution.status,
+                NodeExecution.input_data,
+                NodeExecution.output_data,
+            )
+            .where(
+                NodeExecution.workflow_execution_id == source_execution_id,
+                NodeExecution.item_index.is_(None),
+            )
+            .order_by(NodeExecution.execution_order)
+        )
+        previous = {row.node_id: row for row in result.all()}
+
+        stale = {UUID(str(node_id)) for node_id in dirty_node_ids}
+        stale |= {
+            node_id
+            for node_id in plan.nodes
+            if node_id not in previous
+            or previous[node_id].status
+            not in (ExecutionStatus.COMPLETED, ExecutionStatus.SKIPPED)
+        }
+        affected = GraphAlgorithms.find_reachable_from(
+            plan.graph, stale & plan.nodes.keys()
+        )
+
+        self._carried_skips = GraphAlgorithms.find_reachable_from(
+            plan.graph,
+            {
+                node_id
+                for node_id, row in previous.items()
+                if node_id in plan.nodes
+                and node_id not in affected
+                and row.status == ExecutionStatus.SKIPPED
+            },
+        )
+        affected -= self._carried_skips
+        # Inputs are only persisted again, so blob references are kept as is;
+        # outputs feed successors and are loaded from the blob store
+        self._reused_outputs = {
+            node_id: (
+                row.input_data or {},
+                await resolve_payload(row.output_data) or {},
+            )
+            for node_id, row in previous.items()
+            if node_id in plan.nodes
+            and node_id not in affected
+            and node_id not in self._carried_skips
+        }
+        return affected
+
+    @staticmethod
+    def _needed_nodes(
+        plan: ExecutionPlan, target_node_ids: Collection[str]
+    ) -> set[UUID] | None:
+        """Get the nodes an execution must run to produce its targets.
+
+        TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [PRUNING]
+
+        Args:
+            plan: Compiled plan of the workflow being executed.
+            target_node_ids: String IDs of the requested nodes.
+
+        Returns:
+            The targets and all their ancestors, or None to run every node.
+
+        Raises:
+            ExecutionError: If a target node is not part of the workflow.
+
+        """
+        if not target_node_ids:
+            return None
+
+        targets = {UUID(str(node_id)) for node_id in target_node_ids}
+        unknown = targets - plan.nodes.keys()
+        if unknown:
+            raise ExecutionError(
+                "Target nodes not in workflow: "
+                + ", ".join(sorted(str(node_id) for node_id in unknown))
+            )
+        return GraphAlgorithms.find_ancestors_of(plan.graph, targets)
+
+    async def _prune_to_targets(
+        self,
+        execution_id: UUID,
+        needed: set[UUID],
+        plan: ExecutionPlan,
+    ) -> None:
+        """Skip every node the requested targets do not depend on.
+
+        TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [PRUNING]
+
+        Pruned nodes are recorded as SKIPPED in the next buffered bulk
+        write, with one log entry for the whole execution rather than one
+        per node. Since only ancestors of targets are kept, everything
+        downstream of a pruned node is pruned as well.
+
+        Args:
+            execution_id: UUID of the execution being run.
+            needed: Targets and their ancestors.
+            plan: Compiled plan of the workflow being executed.
+
+        """
+        pruned = plan.nodes.keys() - needed
+        for node_id in pruned:
+            self._reused_outputs.pop(node_id, None)
+        newly_skipped = pruned - self._carried_skips
+        self._carried_skips |= pruned
+
+        now = datetime.now(UTC)
+        for node_id in plan.ordered_node_ids:
+            if node_id in newly_skipped:
+                await self._writes.add_node_execution(
+                    workflow_execution_id=execution_id,
+                    node_id=node_id,
+                    status=ExecutionStatus.SKIPPED,
+                    started_at=now,
+                    ended_at=now,
+                    input_data={},
+                    execution_order=9999,  # High number to indicate skipped
+                    error_message="Not needed for the requested target nodes",
+                )
+        await self._log_execution_event(
+            execution_id=execution_id,
+            level=LogLevel.INFO,
+            message=(
+                f"Running {len(needed)} of {len(plan.nodes)} node(s) needed "
+                f"for the requested target nodes"
+            ),
+        )
+
+    async def _get_workflow(self, workflow_id: UUID) -> Workflow:
+        """Fetch workflow by ID."""
+        result = await self.db.execute(
+            select(Workflow).where(Workflow.id == workflow_id),
+        )
+        workflow = result.scalars().first()
+        if workflow is None:
+            raise ExecutionError(f"Workflow {workflow_id} not found")
+        return workflow
+
+    def _start_deadline(self, execution: WorkflowExecution, workflow: Workflow) -> None:
+        """Start the deadline clock of an execution.
+
+        TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [DEADLINE]
+
+        The time budget comes from the execution metadata (deadline_seconds)
+        or the workflow config and counts from the execution start, so a run
+        resumed by another worker keeps the original deadline.
+
+        Args:
+            execution: WorkflowExecution record being run.
+            workflow: Workflow being executed.
+
+        """
+        import time
+
+        self._deadline_missed = False
+        self._reserves = {}
+        seconds = _execution_deadline(execution, workflow)
+        if seconds is None:
+            self._deadline = None
+            return
+
+        elapsed = 0.0
+        started_at = execution.started_at
+        if started_at is not None:
+            if started_at.tzinfo is None:
+                started_at = started_at.replace(tzinfo=UTC)
+            elapsed = max(0.0, (datetime.now(UTC) - started_at).total_seconds())
+        self._deadline_seconds = seconds
+        self._deadline = time.monotonic() + seconds - elapsed
+
+    def _node_budget(self, node: _ExecNode) -> float | None:
+        """Get the time a node may take without missing the deadline.
+
+        TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [DEADLINE]
+
+        The remaining execution budget minus the expected duration of the
+        critical path after the node.
+
+        Args:
+            node: Node about to run.
+
+        Returns:
+            Seconds available to the node, or None without a deadline.
+
+        """
+        import time
+
+        if self._deadline is None:
+            return None
+        return self._deadline - time.monotonic() - self._reserves.get(node.id, 0.0)
+
+    async def _execute_node_with_timeout(
+        self,
+        node: _ExecNode,
+        input_data: Mapping[str, Any],
+        execution_order: int,  # noqa: ARG002
+    ) -> dict[str, Any]:
+        """Execute a single node with timeout handling.
+
+        TAG: [SPEC-011] [EXECUTION] [EXECUTOR]
+        REQ: REQ-011-008 - Node timeout handling with asyncio.timeout()
+
+        Args:
+            node: Node to execute.
+            input_data: Input data for the node.
+            execution_order: Execution order counter.
+
+        Returns:
+            Output data from node execution.
+
+        Raises:
+            NodeTimeoutError: If node execution exceeds timeout.
+
+        """
+        import asyncio
+
+        # Get timeout from node config (default to 30 seconds), shortened
+        # to what the execution deadline leaves for this node
+        timeout_seconds = node.config.get("timeout_seconds", 30) if node.config else 30
+        budget = self._node_budget(node)
+        if budget is not None:
+            timeout_seconds = max(0.0, min(timeout_seconds, budget))
+
+        # Get simulated execution time from node config (for testing, default 0.01s)
+        sleep_seconds = node.config.get("sleep_seconds", 0.01) if node.config else 0.01
+
+        async def execute_node_logic() -> dict[str, Any]:
+            """Execute the actual node logic."""
+            # Placeholder implementation - in real scenario, this would execute
+            # the node's configured operation (API call, transformation, etc.)
+            await asyncio.sleep(sleep_seconds)  # Simulate work
+            return {"executed": True, "input": dict(input_data)}
+
+        try:
+            async with asyncio.timeout(timeout_seconds):
+                return await execute_node_logic()
+        except TimeoutError:
+            raise NodeTimeoutError(node_id=node.id, timeout_seconds=timeout_seconds)
+
+    async def _execute_node_with_retry(
+        self,
+        node: _ExecNode,
+        input_data: Mapping[str, Any],
+        execution_order: int,
+    ) -> tuple[dict[str, Any], int]:
+        """Execute a node with exponential backoff retry.
+
+        TAG: [SPEC-011] [EXECUTION] [EXECUTOR]
+        REQ: REQ-011-004 - Exponential backoff retry
+
+        Args:
+            node: Node to execute.
+            input_data: Input data for the node.
+            execution_order: Execution order counter.
+
+        Returns:
+            Tuple of (output_data, retry_count).
+
+        Raises:
+            CircuitOpenError: If the circuit of the node's dependency is open.
+            DeadlineExceededError: If the execution deadline leaves no time
+                for the node and its critical path.
+            ExecutionError: If all retries are exhausted.
+
+        """
+        import asyncio
+        import time
+
+        # Get retry config from node
+        retry_config = node.config.get("retry_config", {}) if node.config else {}
+        max_retries = retry_config.get("max_retries", 0)
+        delay = retry_config.get("delay", 1)
+
+        last_error: Exception | None = None
+        # Every attempt's latency and error adapt the resource class limit
+        pool, _ = self._resources.for_node(node)
+        # Nodes calling a tool or LLM provider share its circuit and budget
+        breaker = self._circuits.for_node(node)
+        retry_budget = self._circuits.retry_budget
+        if breaker is not None:
+            await retry_budget.deposit(breaker.name)
+
+        for attempt in range(max_retries + 1):  # +1 for initial attempt
+            budget = self._node_budget(node)
+            if budget is not None and budget <= 0:
+                self._deadline_missed = True
+                raise DeadlineExceededError(
+                    self._execution_id or UUID(int=0), self._deadline_seconds
+                ) from last_error
+            if breaker is not None and not breaker.allow():
+                raise CircuitOpenError(
+                    breaker.name, breaker.retry_after
+                ) from last_error
+            attempt_started = time.monotonic()
+            try:
+                # Execute with timeout
+                output_data = await self._execute_node_with_timeout(
+                    node,
+                    input_data,
+                    execution_order,
+                )
+                pool.record(time.monotonic() - attempt_started)
+                if breaker is not None:
+                    breaker.record_success()
+                # Success - return output and retry count
+                return output_data, attempt
+
+            except asyncio.CancelledError:
+                if breaker is not None:
+                    breaker.abandon()
+                raise
+
+            except Exception as e:
+                pool.record(time.monotonic() - attempt_started, e)
+                if breaker is not None:
+                    breaker.record_failure(e)
+                last_error = e
+
+                # If this was not the last attempt, wait before retry
+                if attempt < max_retries:
+                    if breaker is not None and not await retry_budget.try_withdraw(
+                        breaker.name
+                    ):
+                        raise ExecutionError(
+                            f"Node {str(node.id)[:8]} failed, retry budget of "
+                            f"{breaker.name} exhausted: {e}",
+                        ) from e
+                    # Exponential backoff: delay * (2 ** attempt)
+                    backoff_delay = delay * (2**attempt)
+                    budget = self._node_budget(node)
+                    if budget is not None and backoff_delay >= budget:
+                        # The retry could not finish before the deadline
+                        self._deadline_missed = True
+                        raise DeadlineExceededError(
+                            self._execution_id or UUID(int=0),
+                            self._deadline_seconds,
+                        ) from e
+                    await asyncio.sleep(backoff_delay)
+
+        # All retries exhausted
+        raise ExecutionError(
+            f"Node {str(node.id)[:8]} failed after {max_retries} retries: {last_error}",
+        ) from last_error
+
+    async def _execute_by_levels(
+        self,
+        execution: WorkflowExecution,
+        plan: ExecutionPlan,
+        context: ExecutionContext,
+    ) -> None:
+        """Execute nodes by topological levels.
+
+        TAG: [SPEC-011] [EXECUTION] [EXECUTOR]
+        REQ: REQ-011-002 - asyncio.TaskGroup parallel execution
+        REQ: REQ-011-005 - Failure isolation policy
+        REQ: REQ-011-006 - Condition node branching
+
+        Executes all nodes in each level in parallel using asyncio.TaskGroup.
+        Tracks failed nodes and marks downstream nodes as SKIPPED.
+        Processes condition nodes and excludes non-matching paths from execution.
+
+        Speculative branches of a condition node (see ExecutionPlan) start
+        before the condition is evaluated and run alongside its level; the
+        runs of excluded branches are cancelled and discarded, the others
+        are joined into their own level.
+
+        Args:
+            execution: WorkflowExecution record.
+            plan: Compiled ExecutionPlan with execution levels.
+            context: ExecutionContext for data passing.
+
+        """
+        import asyncio
+
+        from app.models.workflow import NodeType
+
+        node_map = plan.nodes
+        graph = plan.graph
+
+        # Track failed and skipped node IDs
+        failed_node_ids: set[UUID] = set()
+        skipped_node_ids: set[UUID] = set(self._carried_skips)
+        # Speculative branch runs not yet joined into their level
+        speculative: dict[UUID, asyncio.Task[_NodeOutcome]] = {}
+
+        try:
+            # Execute each level
+            for level_data in plan.topology.execution_order:
+                if self._cancelled:
+                    raise ExecutionCancelledError(execution_id=execution.id)
+
+                # Check for CONDITION nodes in this level (routing of reused
+                # condition nodes is carried over from the re-run source)
+                condition_nodes_in_level = [
+                    node_map[nid]
+                    for nid in level_data.node_ids
+                    if nid in node_map
+                    and node_map[nid].node_type == NodeType.CONDITION
+                    and nid not in skipped_node_ids
+                    and nid not in self._reused_outputs
+                ]
+
+                # Start speculative branches before their conditions decide
+                branch_ids = [
+                    nid
+                    for condition_node in condition_nodes_in_level
+                    for nid in plan.speculative_branches.get(condition_node.id, ())
+                    if nid not in skipped_node_ids and nid not in self._reused_outputs
+                ]
+                for execution_order, nid in enumerate(
+                    branch_ids, start=len(level_data.node_ids) + 1
+                ):
+                    # Read now, so a discarded run never reads afterwards
+                    input_data = await context.get_input(
+                        node_map[nid], plan.incoming_edges.get(nid, ())
+                    )
+                    speculative[nid] = asyncio.create_task(
+                        self._run_node_in_slots(
+                            node_map[nid],
+                            (),
+                            context,
+                            execution_order,
+                            input_data=input_data,
+                        )
+                    )
+
+                # Process condition nodes and apply routing
+                for condition_node in condition_nodes_in_level:
+                    # Evaluate condition (placeholder - SPEC-012 will implement)
+                    evaluation_result = await self._evaluate_condition_node(
+                        node=condition_node,
+                        context=context,
+                    )
+
+                    # Apply condition routing to get skipped nodes
+                    matched_edges = evaluation_result.get("matched_edges", [])
+                    condition_skipped = await self._apply_condition_routing(
+                        condition_node_id=condition_node.id,
+                        matched_edges=matched_edges,
+                        graph=graph,
+                        node_map=node_map,
+                        edge_map=plan.edge_endpoints,
+                    )
+
+                    # Add to global skipped set; skipped nodes never read
+                    # inputs (discarded speculative runs already did)
+                    condition_skipped -= skipped_node_ids
+                    skipped_node_ids.update(condition_skipped)
+                    discarded = await self._discard_speculative_runs(
+                        speculative, condition_skipped, context, execution.id, node_map
+                    )
+                    for nid in condition_skipped - discarded:
+                        await context.release_inputs(plan.incoming_edges.get(nid, ()))
+
+                    # Create SKIPPED NodeExecution records for skipped nodes
+                    await self._create_skipped_executions(
+                        skipped_nodes=condition_skipped,
+                        node_map=node_map,
+                        execution_id=execution.id,
+                        reason="Condition node excluded this path",
+                    )
+
+                # Filter out skipped and already running nodes from this
+                # level; critical-path nodes first so they win the semaphore
+                # when the level exceeds it
+                started = {
+                    nid: speculative.pop(nid)
+                    for nid in level_data.node_ids
+                    if nid in speculative
+                }
+                nodes_to_execute = sorted(
+                    (
+                        nid
+                        for nid in level_data.node_ids
+                        if nid not in skipped_node_ids and nid not in started
+                    ),
+                    key=lambda nid: -self._priorities.get(nid, 0.0),
+                )
+
+                # Execute non-skipped nodes in this level in parallel
+                level_failed_nodes = await self._execute_level(
+                    execution,
+                    nodes_to_execute,
+                    node_map,
+                    plan.incoming_edges,
+                    context,
+                    started=started,
+                )
+
+                # Add failed nodes to tracking set
+                failed_node_ids.update(level_failed_nodes)
+        finally:
+            # Only reached with speculative runs on cancellation or error;
+            # interrupted nodes are recorded by the cancellation handler
+            for task in speculative.values():
+                task.cancel()
+            if speculative:
+                await asyncio.gather(*speculative.values(), return_exceptions=True)
+
+        # Mark all downstream nodes of failed nodes as SKIPPED
+        if failed_node_ids:
+            await self._mark_downstream_blocked(
+                failed_node_ids=failed_node_ids,
+                graph=graph,
+                node_map=node_map,
+                execution_id=execution.id,
+                exclude_node_ids=skipped_node_ids,
+            )
+
+            if self._deadline_missed:
+                raise DeadlineExceededError(execution.id, self._deadline_seconds)
+
+            # Raise exception to mark workflow as failed
+            failed_node_names = [
+                node_map[nid].name for nid in failed_node_ids if nid in node_map
+            ]
+            raise ExecutionError(
+                f"Workflow execution failed: {len(failed_node_ids)} node(s) failed: "
+                f"{', '.join(failed_node_names)}"
+            )
+
+    async def _discard_speculative_runs(
+        self,
+        runs: dict[UUID, asyncio.Task[_NodeOutcome]],
+        node_ids: set[UUID],
+        context: ExecutionContext,
+        execution_id: UUID,
+        node_map: Mapping[UUID, _ExecNode],
+    ) -> set[UUID]:
+        """Cancel and discard the speculative runs of excluded branches.
+
+        TAG: [SPEC-011] [EXECUTION] [EXECUTOR]
+        REQ: REQ-011-006 - Path exclusion based on condition result
+
+        Args:
+            runs: Speculative runs by node ID (discarded runs are removed).
+            node_ids: Node IDs excluded by a condition node.
+            context: ExecutionContext for data passing.
+            execution_id: Workflow execution ID.
+            node_map: Map of node ID to node.
+
+        Returns:
+            IDs of the nodes whose runs were discarded.
+
+        """
+        import asyncio
+
+        discarded = {nid for nid in node_ids if nid in runs}
+        if not discarded:
+            return discarded
+
+        tasks = [runs.pop(nid) for nid in discarded]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # Discarded runs were not interrupted by a cancellation
+        self._cancelled_outcomes[:] = [
+            o for o in self._cancelled_outcomes if o.node_id not in discarded
+        ]
+
+        for nid in discarded:
+            await context.discard_output(nid)
+            node = node_map.get(nid)
+            await self._log_execution_event(
+                execution_id=execution_id,
+                level=LogLevel.INFO,
+                message=(
+                    f"Speculative run of node '{node.name if node else nid}' discarded"
+                ),
+            )
+        return discarded
+
+    async def _execute_level(
+        self,
+        execution: WorkflowExecution,
+        node_ids: list[UUID],
+        node_map: Mapping[UUID, PlanNode],
+        incoming_edges: Mapping[UUID, tuple[PlanEdge, ...]],
+        context: ExecutionContext,
+        started: Mapping[UUID, asyncio.Task[_NodeOutcome]] | None = None,
+    ) -> list[UUID]:
+        """Execute all nodes in a level in parallel.
+
+        TAG: [SPEC-011] [EXECUTION] [EXECUTOR]
+        REQ: REQ-011-005 - Failure isolation policy
+
+        Uses asyncio.TaskGroup to execute nodes in parallel, bounded by the
+        executor semaphore. Returns list of failed node IDs for downstream
+        blocking.
+
+        Args:
+            execution: WorkflowExecution record.
+            node_ids: List of node IDs to execute.
+            node_map: Map of node ID to PlanNode.
+            incoming_edges: Map of node ID to the edges ending at it.
+            context: ExecutionContext for data passing.
+            started: Runs of nodes of the level that were started earlier
+                (speculative branches), joined into the level.
+
+        Returns:
+            List of node IDs that failed during execution.
+
+        """
+        import asyncio
+
+        outcomes: list[_NodeOutcome] = []
+
+        async def execute_and_collect(node_id: UUID, execution_order: int) -> None:
+            """Execute node and collect its outcome."""
+            outcome = await self._run_node(
+                node_map[node_id],
+                incoming_edges.get(node_id, ()),
+                context,
+                execution_order,
+            )
+            outcomes.append(outcome)
+
+        async def collect_started(task: asyncio.Task[_NodeOutcome]) -> None:
+            """Wait for a node started earlier and collect its outcome."""
+            outcomes.append(await task)
+
+        # Execute all nodes in parallel using TaskGroup; node tasks never touch
+        # the session, outcomes are recorded once the level has finished
+        interrupted: ExecutionError | None = None
+        async with asyncio.TaskGroup() as tg:
+            pending = {
+                tg.create_task(execute_and_collect(node_id, execution_order))
+                for execution_order, node_id in enumerate(node_ids, start=1)
+            } | {
+                tg.create_task(collect_started(task))
+                for task in (started or {}).values()
+            }
+            try:
+                while pending:
+                    pending -= await self._wait_for_nodes(execution.id, pending)
+            except (ExecutionCancelledError, DeadlineExceededError) as e:
+                # Interrupt the live tasks; the TaskGroup waits for them
+                interrupted = e
+                for task in pending:
+                    task.cancel()
+
+        await self._record_node_outcomes(execution.id, outcomes, node_map)
+
+        if interrupted is not None:
+            raise interrupted
+
+        return [o.node_id for o in outcomes if not o.succeeded]
+
+    async def _execute_by_dependencies(
+        self,
+        execution: WorkflowExecution,
+        plan: ExecutionPlan,
+        context: ExecutionContext,
+    ) -> None:
+        """Execute nodes as soon as their own predecessors have finished.
+
+        TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [SCHEDULER]
+        REQ: REQ-011-005 - Failure isolation policy
+        REQ: REQ-011-006 - Condition node branching
+        REQ: REQ-011-012 - Concurrency control
+
+        Tracks the remaining in-degree of every node. When a node finishes,
+        the in-degree of each successor is decremented and successors that
+        reach zero become ready, so a slow node only delays its own
+        descendants instead of the whole next level.
+
+        At most max_parallel_nodes nodes run at once. When more nodes are
+        ready than slots are free, the nodes with the longest remaining path
+        (weighted by historical durations, see ExecutionPlan.priorities) are
+        started first, ties broken by topological order. A ready node whose
+        resource class already has its capacity in use by this execution
+        waits in the heap, so the free slots go to nodes of other classes.
+        Condition nodes are evaluated when they become ready and their
+        excluded paths are skipped. A failed node never releases its
+        successors, which are marked SKIPPED once the run drains.
+
+        All database writes happen in this coroutine; node tasks only compute
+        outcomes, so the session is never used concurrently.
+
+        Args:
+            execution: WorkflowExecution record.
+            plan: Compiled ExecutionPlan with topology and edge indexes.
+            context: ExecutionContext for data passing.
+
+        Raises:
+            ExecutionCancelledError: If the executor was cancelled.
+            ExecutionError: If any node failed.
+
+        """
+        import asyncio
+        import heapq
+
+        from app.models.enums import NodeType
+
+        node_map = plan.nodes
+        graph = plan.graph
+
+        # Ready heap ordered by critical-path priority, then topological order
+        topo_index = {nid: i for i, nid in enumerate(plan.ordered_node_ids)}
+        remaining = {nid: plan.in_degree[nid] for nid in plan.ordered_node_ids}
+        ready: list[tuple[float, int, UUID]] = []
+
+        def make_ready(node_id: UUID) -> None:
+            heapq.heappush(
+                ready,
+                (-self._priorities.get(node_id, 0.0), topo_index[node_id], node_id),
+            )
+
+        for nid in plan.ordered_node_ids:
+            if remaining[nid] == 0:
+                make_ready(nid)
+
+        failed_node_ids: set[UUID] = set()
+        skipped_node_ids: set[UUID] = set(self._carried_skips)
+        running: dict[asyncio.Task[_NodeOutcome], UUID] = {}
+        execution_counter = 0
+        # Slots of each resource class taken by this execution's running nodes
+        class_load: dict[str, int] = {}
+        node_slots: dict[UUID, tuple[str, int]] = {}
+
+        try:
+            while ready or running:
+                if self._cancelled:
+                    raise ExecutionCancelledError(execution_id=execution.id)
+
+                # Fill free slots with the highest-priority ready nodes
+                deferred: list[tuple[float, int, UUID]] = []
+                while ready and len(running) < self.max_parallel_nodes:
+                    entry = heapq.heappop(ready)
+                    node_id = entry[2]
+                    if node_id in skipped_node_ids:
+                        continue
+
+                    node = node_map[node_id]
+                    resource_class = self._resources.resource_class(node)
+                    pool, weight = self._resources.for_node(node)
+                    load = class_load.get(resource_class, 0)
+                    if load and load + weight > pool.capacity:
+                        # A running node of the same class releases it later
+                        deferred.append(entry)
+                        continue
+                    if (
+                        node.node_type == NodeType.CONDITION
+                        and node_id not in self._reused_outputs
+                    ):
+                        evaluation_result = await self._evaluate_condition_node(
+                            node=node,
+                            context=context,
+                        )
+                        condition_skipped = await self._apply_condition_routing(
+                            condition_node_id=node_id,
+                            matched_edges=evaluation_result.get("matched_edges", []),
+                            graph=graph,
+                            node_map=node_map,
+                            edge_map=plan.edge_endpoints,
+                        )
+                        # Descendants of skipped nodes are skipped as well, so
+                        # they never need to release their successors
+                        condition_skipped -= skipped_node_ids
+                        if condition_skipped:
+                            skipped_node_ids.update(condition_skipped)
+                            for nid in condition_skipped:
+                                await context.release_inputs(
+                                    plan.incoming_edges.get(nid, ())
+                                )
+                            await self._create_skipped_executions(
+                                skipped_nodes=condition_skipped,
+                                node_map=node_map,
+                                execution_id=execution.id,
+                                reason="Condition node excluded this path",
+                            )
+
+                    execution_counter += 1
+                    task = asyncio.create_task(
+                        self._run_node(
+                            node,
+                            plan.incoming_edges.get(node_id, ()),
+                            context,
+                            execution_counter,
+                        )
+                    )
+                    running[task] = node_id
+                    class_load[resource_class] = load + weight
+                    node_slots[node_id] = (resource_class, weight)
+
+                for entry in deferred:
+                    heapq.heappush(ready, entry)
+
+                if not running:
+                    break
+
+                done = await self._wait_for_nodes(execution.id, running)
+
+                outcomes: list[_NodeOutcome] = []
+                for task in done:
+                    resource_class, weight = node_slots.pop(running.pop(task))
+                    class_load[resource_class] -= weight
+                    outcome = task.result()
+                    outcomes.append(outcome)
+
+                    if not outcome.succeeded:
+                        # Failed nodes keep their successors blocked
+                        failed_node_ids.add(outcome.node_id)
+                        continue
+
+                    for successor_id in graph.get_successors(outcome.node_id):
+                        if successor_id not in remaining:
+                            continue
+                        remaining[successor_id] -= 1
+                        if remaining[successor_id] == 0:
+                            make_ready(successor_id)
+
+                await self._record_node_outcomes(execution.id, outcomes, node_map)
+        finally:
+            # Only reached with running tasks on cancellation or error;
+            # interrupted nodes are recorded by the cancellation handler
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        # Mark all downstream nodes of failed nodes as SKIPPED
+        if failed_node_ids:
+            await self._mark_downstream_blocked(
+                failed_node_ids=failed_node_ids,
+                graph=graph,
+                node_map=node_map,
+                execution_id=execution.id,
+                exclude_node_ids=skipped_node_ids,
+            )
+
+            if self._deadline_missed:
+                raise DeadlineExceededError(execution.id, self._deadline_seconds)
+
+            # Raise exception to mark workflow as failed
+            failed_node_names = [
+                node_map[nid].name for nid in failed_node_ids if nid in node_map
+            ]
+            raise ExecutionError(
+                f"Workflow execution failed: {len(failed_node_ids)} node(s) failed: "
+                f"{', '.join(failed_node_names)}"
+            )
+
+    async def _run_node(
+        self,
+        node: _ExecNode,
+        incoming_edges: Sequence[_ExecEdge],
+        context: ExecutionContext,
+        execution_order: int,
+    ) -> _NodeOutcome:
+        """Run a single node under the concurrency semaphore.
+
+        TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [SCHEDULER]
+        REQ: REQ-011-012 - Concurrency control
 
-        TAG: [SPEC-011] [EXECUTION] [EXECUTOR]
-        REQ: REQ-011-008 - Node timeout handling with asyncio.timeout()
+        Never touches the database session and never raises for node
+        failures; errors are captured in the returned outcome. If the task is
+        cancelled while the node runs, a cancelled outcome is kept in
+        _cancelled_outcomes for the cancellation handler.
+
+        Nodes that opt into the output cache are served from it when an
+        identical node ran with identical input within the TTL. Nodes reused
+        by a partial re-run restore their stored output without running.
+        Of a group of structurally identical nodes (see ExecutionPlan), the
+        first to start runs and the others share its outcome. PARALLEL nodes
+        fan out the list in their input and map body nodes run once per item.
 
         Args:
             node: Node to execute.
-            input_data: Input data for the node.
+            incoming_edges: Edges whose target is this node.
+            context: ExecutionContext for data passing.
             execution_order: Execution order counter.
 
         Returns:
-            Output data from node execution.
-
-        Raises:
-            NodeTimeoutError: If node execution exceeds timeout.
+            _NodeOutcome describing the run.
 
         """
         import asyncio
 
-        # Get timeout from node config (default to 30 seconds)
-        timeout_seconds = node.config.get("timeout_seconds", 30) if node.config else 30
+        reused = self._reused_outputs.get(node.id)
+        if reused is not None:
+            input_data, output_data = reused
+            await context.release_inputs(incoming_edges)
+            if node.id not in self._unread_outputs:
+                await context.set_output(node.id, output_data)
+            now = datetime.now(UTC)
+            return _NodeOutcome(
+                node_id=node.id,
+                input_data=input_data,
+                execution_order=execution_order,
+                started_at=now,
+                ended_at=now,
+                output_data=output_data,
+                cache_hit=True,
+                reused=True,
+                resumed=node.id in self._resumed_nodes,
+            )
 
-        # Get simulated execution time from node config (for testing, default 0.01s)
-        sleep_seconds = node.config.get("sleep_seconds", 0.01) if node.config else 0.01
+        from app.models.enums import NodeType
 
-        async def execute_node_logic() -> dict[str, Any]:
-            """Execute the actual node logic."""
-            # Placeholder implementation - in real scenario, this would execute
-            # the node's configured operation (API call, transformation, etc.)
-            await asyncio.sleep(sleep_seconds)  # Simulate work
-            return {"executed": True, "input": input_data}
+        if node.node_type == NodeType.PARALLEL:
+            return await self._run_fan_out(
+                node, incoming_edges, context, execution_order
+            )
+        fan_out_id = (
+            self._plan.map_bodies.get(node.id) if self._plan is not None else None
+        )
+        if fan_out_id is not None and self._plan is not None:
+            return await self._run_map(
+                node,
+                self._plan.nodes[fan_out_id],
+                incoming_edges,
+                context,
+                execution_order,
+            )
+
+        canonical_id = (
+            self._plan.equivalent_nodes.get(node.id) if self._plan is not None else None
+        )
+        if canonical_id is None:
+            outcome = await self._run_node_in_slots(
+                node, incoming_edges, context, execution_order
+            )
+            if node.id in self._unread_outputs:
+                await context.discard_output(node.id)
+            return outcome
+
+        shared = self._shared_runs.get(canonical_id)
+        if shared is not None:
+            return await self._join_shared_run(
+                node, incoming_edges, context, execution_order, shared
+            )
 
+        shared = asyncio.get_running_loop().create_future()
+        self._shared_runs[canonical_id] = shared
         try:
-            async with asyncio.timeout(timeout_seconds):
-                return await execute_node_logic()
-        except TimeoutError:
-            raise NodeTimeoutError(node_id=node.id, timeout_seconds=timeout_seconds)
+            outcome = await self._run_node_in_slots(
+                node, incoming_edges, context, execution_order
+            )
+        except BaseException:
+            shared.cancel()
+            raise
+        shared.set_result(outcome)
+        return outcome
 
-    async def _execute_node_with_retry(
+    async def _run_node_in_slots(
         self,
-        node: Node,
-        input_data: dict[str, Any],
+        node: _ExecNode,
+        incoming_edges: Sequence[_ExecEdge],
+        context: ExecutionContext,
         execution_order: int,
-    ) -> tuple[dict[str, Any], int]:
-        """Execute a node with exponential backoff retry.
+        input_data: Mapping[str, Any] | None = None,
+    ) -> _NodeOutcome:
+        """Run a node while holding its resource, execution and admission slots.
 
-        TAG: [SPEC-011] [EXECUTION] [EXECUTOR]
-        REQ: REQ-011-004 - Exponential backoff retry
+        TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [SCHEDULER]
+
+        Nodes that opt into single-flight await an identical call already
+        made by another execution instead of making their own.
 
         Args:
             node: Node to execute.
-            input_data: Input data for the node.
+            incoming_edges: Edges whose target is this node.
+            context: ExecutionContext for data passing.
             execution_order: Execution order counter.
+            input_data: Input read ahead of the run (default: read from the
+                incoming edges once the slots are taken).
 
         Returns:
-            Tuple of (output_data, retry_count).
-
-        Raises:
-            ExecutionError: If all retries are exhausted.
+            _NodeOutcome describing the run.
 
         """
         import asyncio
 
-        # Get retry config from node
-        retry_config = node.config.get("retry_config", {}) if node.config else {}
-        max_retries = retry_config.get("max_retries", 0)
-        delay = retry_config.get("delay", 1)
-
-        last_error: Exception | None = None
+        # Wait for the resource class first, so nodes queued on a busy class
+        # hold no execution or admission slot
+        pool, weight = self._resources.for_node(node)
+        async with (
+            pool.slot(weight),
+            self._semaphore,
+            self._admission.slot(*self._flow),
+        ):
+            if input_data is None:
+                input_data = await context.get_input(node, incoming_edges)
+            started_at = datetime.now(UTC)
+
+            cache_ttl = get_cache_ttl(node)
+            cache_key = None
+            if cache_ttl is not None:
+                cache_key = make_cache_key(node, input_data)
+                cached_output = await self._output_cache.get(cache_key)
+                if cached_output is not None:
+                    await context.set_output(node.id, cached_output)
+                    return _NodeOutcome(
+                        node_id=node.id,
+                        input_data=input_data,
+                        execution_order=execution_order,
+                        started_at=started_at,
+                        ended_at=datetime.now(UTC),
+                        output_data=cached_output,
+                        cache_hit=True,
+                    )
 
-        for attempt in range(max_retries + 1):  # +1 for initial attempt
+            flight_window = get_single_flight_window(node)
+            shared_flight = False
             try:
-                # Execute with timeout
-                output_data = await self._execute_node_with_timeout(
-                    node,
-                    input_data,
-                    execution_order,
+                if flight_window is None:
+                    output_data, retry_count = await self._execute_node_with_retry(
+                        node,
+                        input_data,
+                        execution_order,
+                    )
+                else:
+                    # Concurrent identical calls of other executions share one
+                    (
+                        (output_data, retry_count),
+                        shared_flight,
+                    ) = await self._single_flight.run(
+                        cache_key or make_cache_key(node, input_data),
+                        flight_window,
+                        lambda: self._execute_node_with_retry(
+                            node, input_data, execution_order
+                        ),
+                    )
+                    if shared_flight:
+                        retry_count = 0
+            except asyncio.CancelledError:
+                self._cancelled_outcomes.append(
+                    _NodeOutcome(
+                        node_id=node.id,
+                        input_data=input_data,
+                        execution_order=execution_order,
+                        started_at=started_at,
+                        ended_at=datetime.now(UTC),
+                        cancelled=True,
+                    )
                 )
-                # Success - return output and retry count
-                return output_data, attempt
-
+                raise
             except Exception as e:
-                last_error = e
-
-                # If this was not the last attempt, wait before retry
-                if attempt < max_retries:
-                    # Exponential backoff: delay * (2 ** attempt)
-                    backoff_delay = delay * (2**attempt)
-                    await asyncio.sleep(backoff_delay)
+                return _NodeOutcome(
+                    node_id=node.id,
+                    input_data=input_data,
+                    execution_order=execution_order,
+                    started_at=started_at,
+                    ended_at=datetime.now(UTC),
+                    error=e,
+                )
 
-        # All retries exhausted
-        raise ExecutionError(
-            f"Node {str(node.id)[:8]} failed after {max_retries} retries: {last_error}",
-        ) from last_error
+            await context.set_output(node.id, output_data)
+            if cache_key is not None and cache_ttl is not None:
+                await self._output_cache.set(cache_key, output_data, cache_ttl)
+            return _NodeOutcome(
+                node_id=node.id,
+                input_data=input_data,
+                execution_order=execution_order,
+                started_at=started_at,
+                ended_at=datetime.now(UTC),
+                output_data=output_data,
+                retry_count=retry_count,
+                cache_hit=shared_flight,
+                shared_flight=shared_flight,
+            )
 
-    async def _execute_by_levels(
+    async def _run_fan_out(
         self,
-        execution: WorkflowExecution,
-        workflow: Workflow,
-        topology: Any,  # TopologyResult
+        node: _ExecNode,
+        incoming_edges: Sequence[_ExecEdge],
         context: ExecutionContext,
-    ) -> None:
-        """Execute nodes by topological levels.
+        execution_order: int,
+    ) -> _NodeOutcome:
+        """Fan out the list in the input of a PARALLEL node.
 
-        TAG: [SPEC-011] [EXECUTION] [EXECUTOR]
-        REQ: REQ-011-002 - asyncio.TaskGroup parallel execution
-        REQ: REQ-011-005 - Failure isolation policy
-        REQ: REQ-011-006 - Condition node branching
+        TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [MAP]
 
-        Executes all nodes in each level in parallel using asyncio.TaskGroup.
-        Tracks failed nodes and marks downstream nodes as SKIPPED.
-        Processes condition nodes and excludes non-matching paths from execution.
+        Reads the list under the "items_key" config key (default "items")
+        and outputs {"items": [...]}, split into lists of "chunk_size"
+        elements if configured. Takes no slots: no dependency is called.
 
         Args:
-            execution: WorkflowExecution record.
-            workflow: Workflow being executed.
-            topology: TopologyResult with execution levels.
+            node: PARALLEL node.
+            incoming_edges: Edges whose target is this node.
             context: ExecutionContext for data passing.
+            execution_order: Execution order counter.
+
+        Returns:
+            _NodeOutcome describing the fan-out.
 
         """
-        from app.models.workflow import NodeType
-        from app.services.workflow.graph import Graph
+        input_data = await context.get_input(node, incoming_edges)
+        started_at = datetime.now(UTC)
+        config = node.config or {}
+        items_key = config.get(MAP_ITEMS_CONFIG_KEY, "items")
+        items = input_data.get(items_key)
+        chunk_size = int(config.get(MAP_CHUNK_SIZE_CONFIG_KEY, 1))
+
+        error: Exception | None = None
+        output_data: dict[str, Any] | None = None
+        if not isinstance(items, list):
+            error = NodeExecutionError(node.id, f"input '{items_key}' is not a list")
+        elif len(items) > settings.MAP_MAX_ITEMS:
+            error = NodeExecutionError(
+                node.id,
+                f"{len(items)} items exceed the limit of {settings.MAP_MAX_ITEMS}",
+            )
+        elif chunk_size < 1:
+            error = NodeExecutionError(node.id, f"invalid chunk_size {chunk_size}")
+        else:
+            output_data = {
+                "items": (
+                    items
+                    if chunk_size == 1
+                    else [
+                        items[i : i + chunk_size]
+                        for i in range(0, len(items), chunk_size)
+                    ]
+                )
+            }
+            await context.set_output(node.id, output_data)
 
-        # Fetch all nodes and edges
-        nodes, edges = await self._get_workflow_graph_data(workflow.id)
-        node_map = {node.id: node for node in nodes}
+        return _NodeOutcome(
+            node_id=node.id,
+            input_data=input_data,
+            execution_order=execution_order,
+            started_at=started_at,
+            ended_at=datetime.now(UTC),
+            output_data=output_data,
+            error=error,
+        )
 
-        # Create edge maps for lookups
-        edge_map_by_pair = {(e.source_node_id, e.target_node_id): e for e in edges}
-        edge_map_by_id = {e.id: (e.source_node_id, e.target_node_id) for e in edges}
+    async def _run_map(
+        self,
+        node: _ExecNode,
+        fan_out: _ExecNode,
+        incoming_edges: Sequence[_ExecEdge],
+        context: ExecutionContext,
+        execution_order: int,
+    ) -> _NodeOutcome:
+        """Run a map body node once per item of its PARALLEL node.
 
-        # Build graph for downstream traversal
-        graph = Graph[UUID]()
-        for edge in edges:
-            graph.add_edge(edge.source_node_id, edge.target_node_id)
+        TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [MAP]
 
-        # Track failed and skipped node IDs
-        failed_node_ids: set[UUID] = set()
-        skipped_node_ids: set[UUID] = set()
-
-        # Execute each level
-        for level_data in topology.execution_order:
-            if self._cancelled:
-                raise ExecutionCancelledError(execution_id=execution.id)
-
-            # Check for CONDITION nodes in this level
-            condition_nodes_in_level = [
-                node_map[nid]
-                for nid in level_data.node_ids
-                if nid in node_map and node_map[nid].node_type == NodeType.CONDITION
-            ]
+        Each item (or chunk) runs as {item_key: item}, at most
+        "max_concurrency" at a time (PARALLEL node config), through the
+        usual slots, output cache and single-flight. The item position is
+        kept off the input (it is recorded as item_index), so equal items
+        share cache entries and flights. The outputs are gathered in item
+        order as {"results": [...]}; if any item fails the node fails.
+        Per-item outcomes are kept for bulk persistence.
 
-            # Process condition nodes and apply routing
-            for condition_node in condition_nodes_in_level:
-                # Evaluate condition (placeholder - SPEC-012 will implement)
-                evaluation_result = await self._evaluate_condition_node(
-                    node=condition_node,
-                    context=context,
-                )
+        Args:
+            node: Map body node.
+            fan_out: PARALLEL node fanning out to it.
+            incoming_edges: Edges whose target is this node.
+            context: ExecutionContext for data passing.
+            execution_order: Execution order counter.
 
-                # Apply condition routing to get skipped nodes
-                matched_edges = evaluation_result.get("matched_edges", [])
-                condition_skipped = await self._apply_condition_routing(
-                    condition_node_id=condition_node.id,
-                    matched_edges=matched_edges,
-                    graph=graph,
-                    node_map=node_map,
-                    edge_map=edge_map_by_id,
-                )
+        Returns:
+            _NodeOutcome of the node with its per-item outcomes.
+
+        """
+        import asyncio
 
-                # Add to global skipped set
-                skipped_node_ids.update(condition_skipped)
+        input_data = await context.get_input(node, incoming_edges)
+        started_at = datetime.now(UTC)
+        config = fan_out.config or {}
+        item_key = config.get(MAP_ITEM_CONFIG_KEY, "item")
+        limit = int(
+            config.get(MAP_CONCURRENCY_CONFIG_KEY, settings.MAP_DEFAULT_CONCURRENCY)
+        )
+        items = input_data.get("items")
+        if not isinstance(items, list):
+            items = []
+
+        semaphore = asyncio.Semaphore(max(1, limit))
+        # Item outputs stay out of the shared context; only the gathered
+        # list is passed on
+        item_context = ExecutionContext(
+            workflow_execution_id=context.workflow_execution_id, input_data={}
+        )
 
-                # Create SKIPPED NodeExecution records for skipped nodes
-                await self._create_skipped_executions(
-                    skipped_nodes=condition_skipped,
-                    node_map=node_map,
-                    execution_id=execution.id,
-                    reason="Condition node excluded this path",
+        async def run_item(index: int, item: Any) -> _NodeOutcome:
+            async with semaphore:
+                outcome = await self._run_node_in_slots(
+                    node,
+                    (),
+                    item_context,
+                    execution_order,
+                    input_data={item_key: item},
                 )
+            outcome.item_index = index
+            return outcome
 
-            # Filter out skipped nodes from this level
-            nodes_to_execute = [
-                nid for nid in level_data.node_ids if nid not in skipped_node_ids
-            ]
-
-            # Execute non-skipped nodes in this level in parallel
-            level_failed_nodes = await self._execute_level(
-                execution,
-                nodes_to_execute,
-                node_map,
-                edge_map_by_pair,
-                context,
+        item_outcomes = list(
+            await asyncio.gather(
+                *(run_item(index, item) for index, item in enumerate(items))
             )
+        )
 
-            # Add failed nodes to tracking set
-            failed_node_ids.update(level_failed_nodes)
-
-        # Mark all downstream nodes of failed nodes as SKIPPED
-        if failed_node_ids:
-            await self._mark_downstream_blocked(
-                failed_node_ids=failed_node_ids,
-                graph=graph,
-                node_map=node_map,
-                execution_id=execution.id,
+        error: Exception | None = None
+        output_data: dict[str, Any] | None = None
+        failed = [o for o in item_outcomes if not o.succeeded]
+        if failed:
+            error = NodeExecutionError(
+                node.id,
+                f"{len(failed)} of {len(items)} item(s) failed, first "
+                f"(item {failed[0].item_index}): {failed[0].error}",
             )
+        else:
+            output_data = {"results": [o.output_data for o in item_outcomes]}
+            await context.set_output(node.id, output_data)
 
-            # Raise exception to mark workflow as failed
-            failed_node_names = [
-                node_map[nid].name for nid in failed_node_ids if nid in node_map
-            ]
-            raise ExecutionError(
-                f"Workflow execution failed: {len(failed_node_ids)} node(s) failed: "
-                f"{', '.join(failed_node_names)}"
-            )
+        return _NodeOutcome(
+            node_id=node.id,
+            input_data=input_data,
+            execution_order=execution_order,
+            started_at=started_at,
+            ended_at=datetime.now(UTC),
+            output_data=output_data,
+            error=error,
+            item_outcomes=item_outcomes,
+        )
 
-    async def _execute_level(
+    async def _join_shared_run(
         self,
-        execution: WorkflowExecution,
-        node_ids: list[UUID],
-        node_map: dict[UUID, Node],
-        edge_map: dict[tuple[UUID, UUID], Edge],
+        node: _ExecNode,
+        incoming_edges: Sequence[_ExecEdge],
         context: ExecutionContext,
-    ) -> list[UUID]:
-        """Execute all nodes in a level in parallel.
+        execution_order: int,
+        shared: asyncio.Future[_NodeOutcome],
+    ) -> _NodeOutcome:
+        """Take the outcome of a structurally identical node's run.
 
-        TAG: [SPEC-011] [EXECUTION] [EXECUTOR]
-        REQ: REQ-011-005 - Failure isolation policy
+        TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [SCHEDULER]
 
-        Uses asyncio.TaskGroup to execute nodes in parallel.
-        Returns list of failed node IDs for downstream blocking.
+        Holds no slots while waiting. A failed run fails this node with the
+        same error.
 
         Args:
-            execution: WorkflowExecution record.
-            node_ids: List of node IDs to execute.
-            node_map: Map of node ID to Node object.
-            edge_map: Map of (source, target) to Edge object.
+            node: Node sharing the run.
+            incoming_edges: Edges whose target is this node.
             context: ExecutionContext for data passing.
+            execution_order: Execution order counter.
+            shared: Future of the running node's outcome.
 
         Returns:
-            List of node IDs that failed during execution.
+            _NodeOutcome describing the shared run.
 
         """
         import asyncio
 
-        # Track execution order and failed nodes
-        execution_counter = 0
-        failed_node_ids: list[UUID] = []
-
-        async def execute_single_node(node_id: UUID) -> NodeExecution | None:
-            """Execute a single node.
-
-            Returns:
-                NodeExecution record if successful, None if failed.
-            """
-            nonlocal execution_counter
-            execution_counter += 1
-
-            node = node_map[node_id]
-
-            # Get incoming edges
-            incoming_edges = [
-                edge_map[(s, t)]
-                for (s, t) in edge_map
-                if t == node_id and (s, t) in edge_map
-            ]
-
-            # Get input data
-            input_data = await context.get_input(node, incoming_edges)
-
-            try:
-                # Execute node with retry and timeout
-                output_data, retry_count = await self._execute_node_with_retry(
-                    node,
-                    input_data,
-                    execution_counter,
-                )
-                await context.set_output(node_id, output_data)
-
-                # Create COMPLETED node execution record (don't flush yet)
-                node_execution = NodeExecution(
-                    workflow_execution_id=execution.id,
-                    node_id=node_id,
-                    status=ExecutionStatus.COMPLETED,
-                    started_at=datetime.now(UTC),
-                    ended_at=datetime.now(UTC),
+        input_data = await context.get_input(node, incoming_edges)
+        started_at = datetime.now(UTC)
+        try:
+            # Shielded: cancelling this node must not cancel the shared run
+            owner = await asyncio.shield(shared)
+        except asyncio.CancelledError:
+            self._cancelled_outcomes.append(
+                _NodeOutcome(
+                    node_id=node.id,
                     input_data=input_data,
-                    output_data=output_data,
-                    execution_order=execution_counter,
-                    retry_count=retry_count,
+                    execution_order=execution_order,
+                    started_at=started_at,
+                    ended_at=datetime.now(UTC),
+                    cancelled=True,
                 )
-                self.db.add(node_execution)
-                return node_execution
+            )
+            raise
 
-            except Exception as e:
-                # Track failed node
-                failed_node_ids.append(node_id)
+        if owner.succeeded and owner.output_data is not None:
+            await context.set_output(node.id, owner.output_data)
+        return _NodeOutcome(
+            node_id=node.id,
+            input_data=input_data,
+            execution_order=execution_order,
+            started_at=started_at,
+            ended_at=datetime.now(UTC),
+            output_data=owner.output_data,
+            error=owner.error,
+            deduplicated_from=owner.node_id,
+        )
 
-                # Create FAILED node execution record (don't flush yet)
-                node_execution = NodeExecution(
-                    workflow_execution_id=execution.id,
-                    node_id=node_id,
-                    status=ExecutionStatus.FAILED,
-                    started_at=datetime.now(UTC),
-                    ended_at=datetime.now(UTC),
-                    input_data=input_data,
-                    error_message=str(e),
-                    execution_order=execution_counter,
-                    retry_count=0,
-                )
-                self.db.add(node_execution)
-                # Return None to indicate failure
-                return None
+    async def _add_outcome_row(self, execution_id: UUID, outcome: _NodeOutcome) -> UUID:
+        """Buffer the NodeExecution record of a node outcome."""
+        return await self._writes.add_node_execution(
+            workflow_execution_id=execution_id,
+            node_id=outcome.node_id,
+            status=(
+                ExecutionStatus.COMPLETED
+                if outcome.succeeded
+                else ExecutionStatus.CANCELLED
+                if outcome.cancelled
+                else ExecutionStatus.FAILED
+            ),
+            started_at=outcome.started_at,
+            ended_at=outcome.ended_at,
+            input_data=outcome.input_data,
+            output_data=outcome.output_data,
+            error_message=(
+                None
+                if outcome.succeeded
+                else "Cancelled while running"
+                if outcome.cancelled
+                else str(outcome.error)
+            ),
+            execution_order=outcome.execution_order,
+            retry_count=outcome.retry_count,
+            cache_hit=outcome.cache_hit,
+            item_index=outcome.item_index,
+        )
 
-        # Execute all nodes in parallel using TaskGroup
-        # Collect node execution records for logging after flush
-        node_executions: list[NodeExecution] = []
+    async def _record_node_outcomes(
+        self,
+        execution_id: UUID,
+        outcomes: list[_NodeOutcome],
+        node_map: Mapping[UUID, _ExecNode],
+    ) -> None:
+        """Persist node outcomes as NodeExecution records and log them.
 
-        async def execute_and_collect(node_id: UUID) -> NodeExecution | None:
-            """Execute node and collect result."""
-            result = await execute_single_node(node_id)
-            if result is not None:
-                node_executions.append(result)
-            return result
+        TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [SCHEDULER]
+        REQ: REQ-011-010 - ExecutionLog integration
 
-        try:
-            async with asyncio.TaskGroup() as tg:
-                for node_id in node_ids:
-                    tg.create_task(execute_and_collect(node_id))
-        except ExceptionGroup:
-            # TaskGroup failed - some nodes may have succeeded, some failed
-            # All records have been added to session but not flushed yet
-            pass
-
-        # Flush all node executions (successful and failed) to database
-        # Note: We don't commit here - let the caller handle commit/rollback
-        # This ensures proper test isolation and session state management
-        await self.db.flush()
+        Args:
+            execution_id: Workflow execution ID.
+            outcomes: Outcomes of finished node runs.
+            node_map: Map of node ID to node.
+
+        """
+        for outcome in outcomes:
+            if outcome.resumed:
+                continue
+            # Per-item runs of map bodies are only persisted (bulk insert)
+            for item in outcome.item_outcomes:
+                await self._add_outcome_row(execution_id, item)
+            node_execution_id = await self._add_outcome_row(execution_id, outcome)
 
-        # Now that flush succeeded, log all node executions (safe to do now)
-        for node_exec in node_executions:
-            node = node_map.get(node_exec.node_id)
+            node = node_map.get(outcome.node_id)
             if not node:
                 continue
 
-            # Log node execution start
             await self._log_execution_event(
-                execution_id=execution.id,
-                node_execution_id=node_exec.id,
+                execution_id=execution_id,
+                node_execution_id=node_execution_id,
                 level=LogLevel.INFO,
                 message=f"Node '{node.name}' execution started",
             )
 
-            # Log retry warnings if retries occurred
-            if node_exec.retry_count > 0:
+            if outcome.item_outcomes:
+                failed_items = sum(1 for o in outcome.item_outcomes if not o.succeeded)
+                await self._log_execution_event(
+                    execution_id=execution_id,
+                    node_execution_id=node_execution_id,
+                    level=LogLevel.ERROR if failed_items else LogLevel.INFO,
+                    message=(
+                        f"Node '{node.name}' mapped over "
+                        f"{len(outcome.item_outcomes)} item(s), {failed_items} failed"
+                    ),
+                )
+
+            if outcome.retry_count > 0:
                 await self._log_execution_event(
-                    execution_id=execution.id,
-                    node_execution_id=node_exec.id,
+                    execution_id=execution_id,
+                    node_execution_id=node_execution_id,
                     level=LogLevel.WARNING,
-                    message=f"Node '{node.name}' required {node_exec.retry_count} retry(ies)",
+                    message=f"Node '{node.name}' required {outcome.retry_count} retry(ies)",
                 )
 
-            # Log node execution completion
-            if node_exec.status == ExecutionStatus.COMPLETED:
+            if outcome.reused:
+                await self._log_execution_event(
+                    execution_id=execution_id,
+                    node_execution_id=node_execution_id,
+                    level=LogLevel.INFO,
+                    message=f"Node '{node.name}' output reused from previous execution",
+                )
+            elif outcome.deduplicated_from is not None and outcome.succeeded:
+                source = node_map.get(outcome.deduplicated_from)
                 await self._log_execution_event(
-                    execution_id=execution.id,
-                    node_execution_id=node_exec.id,
+                    execution_id=execution_id,
+                    node_execution_id=node_execution_id,
+                    level=LogLevel.INFO,
+                    message=(
+                        f"Node '{node.name}' reused the output of identical node "
+                        f"'{source.name if source else outcome.deduplicated_from}'"
+                    ),
+                )
+            elif outcome.shared_flight:
+                await self._log_execution_event(
+                    execution_id=execution_id,
+                    node_execution_id=node_execution_id,
+                    level=LogLevel.INFO,
+                    message=(
+                        f"Node '{node.name}' output shared with an identical "
+                        "call of another execution"
+                    ),
+                )
+            elif outcome.cache_hit:
+                await self._log_execution_event(
+                    execution_id=execution_id,
+                    node_execution_id=node_execution_id,
+                    level=LogLevel.INFO,
+                    message=f"Node '{node.name}' output served from cache",
+                )
+            elif outcome.succeeded:
+                await self._log_execution_event(
+                    execution_id=execution_id,
+                    node_execution_id=node_execution_id,
                     level=LogLevel.INFO,
                     message=f"Node '{node.name}' execution completed",
                 )
-
-        # Log failures
-        if failed_node_ids:
-            for node_id in failed_node_ids:
-                node = node_map.get(node_id)
-                if node:
-                    await self._log_execution_event(
-                        execution_id=execution.id,
-                        level=LogLevel.ERROR,
-                        message=f"Node '{node.name}' execution failed",
-                    )
-
-        return failed_node_ids
+            elif outcome.cancelled:
+                await self._log_execution_event(
+                    execution_id=execution_id,
+                    node_execution_id=node_execution_id,
+                    level=LogLevel.WARNING,
+                    message=f"Node '{node.name}' execution cancelled",
+                )
+            else:
+                await self._log_execution_event(
+                    execution_id=execution_id,
+                    node_execution_id=node_execution_id,
+                    level=LogLevel.ERROR,
+                    message=f"Node '{node.name}' execution failed",
+                )
 
     async def _mark_downstream_blocked(
         self,
         failed_node_ids: set[UUID] | list[UUID],
         graph: Graph[UUID],
-        node_map: dict[UUID, Node],
+        node_map: Mapping[UUID, _ExecNode],
         execution_id: UUID,
+        exclude_node_ids: set[UUID] | None = None,
     ) -> None:
         """Mark all downstream nodes of failed nodes as SKIPPED.
 
@@ -668,12 +2516,16 @@ class WorkflowExecutor:
         Args:
             failed_node_ids: Set/list of failed node IDs.
             graph: Graph[UUID] with get_successors method.
-            node_map: Map of node ID to Node object.
+            node_map: Map of node ID to node.
             execution_id: Workflow execution ID.
+            exclude_node_ids: Node IDs that already have a terminal record
+                (e.g. skipped by condition routing) and must not be marked.
 
         """
         from collections import deque
 
+        excluded = exclude_node_ids or set()
+
         # Find all downstream nodes using BFS
         visited: set[UUID] = set()
         queue: deque[UUID] = deque()
@@ -697,40 +2549,28 @@ class WorkflowExecutor:
                     queue.append(successor_id)
                     downstream_nodes.append(successor_id)
 
-        # Create SKIPPED NodeExecution records for downstream nodes
-        # First add all records, then flush, then log (to avoid session state issues)
+        # Buffer SKIPPED NodeExecution records and their logs
         execution_order = 9999  # High number to indicate skipped
-        skipped_executions: list[tuple[Node, NodeExecution]] = []
 
         for node_id in downstream_nodes:
             node = node_map.get(node_id)
-            if not node:
+            if not node or node_id in excluded:
                 continue
 
-            # Create SKIPPED node execution record
-            node_execution = NodeExecution(
+            now = datetime.now(UTC)
+            node_execution_id = await self._writes.add_node_execution(
                 workflow_execution_id=execution_id,
                 node_id=node_id,
                 status=ExecutionStatus.SKIPPED,
-                started_at=datetime.now(UTC),
-                ended_at=datetime.now(UTC),
+                started_at=now,
+                ended_at=now,
                 input_data={},
-                output_data=None,
                 execution_order=execution_order,
-                retry_count=0,
                 error_message="Blocked by upstream node failure",
             )
-            self.db.add(node_execution)
-            skipped_executions.append((node, node_execution))
-
-        # Flush all SKIPPED node executions
-        await self.db.flush()
-
-        # Now log blocked nodes (safe after flush)
-        for node, node_execution in skipped_executions:
             await self._log_execution_event(
                 execution_id=execution_id,
-                node_execution_id=node_execution.id,
+                node_execution_id=node_execution_id,
                 level=LogLevel.WARNING,
                 message=f"Node '{node.name}' skipped due to upstream failure",
             )
@@ -738,7 +2578,7 @@ class WorkflowExecutor:
     async def _create_skipped_executions(
         self,
         skipped_nodes: set[UUID] | list[UUID],
-        node_map: dict[UUID, Node],
+        node_map: Mapping[UUID, _ExecNode],
         execution_id: UUID,
         reason: str,
     ) -> None:
@@ -749,7 +2589,7 @@ class WorkflowExecutor:
 
         Args:
             skipped_nodes: Set/list of node IDs to skip.
-            node_map: Map of node ID to Node object.
+            node_map: Map of node ID to node.
             execution_id: Workflow execution ID.
             reason: Reason for skipping.
 
@@ -761,33 +2601,23 @@ class WorkflowExecutor:
             if not node:
                 continue
 
-            # Create SKIPPED node execution record
-            node_execution = NodeExecution(
+            now = datetime.now(UTC)
+            node_execution_id = await self._writes.add_node_execution(
                 workflow_execution_id=execution_id,
                 node_id=node_id,
                 status=ExecutionStatus.SKIPPED,
-                started_at=datetime.now(UTC),
-                ended_at=datetime.now(UTC),
+                started_at=now,
+                ended_at=now,
                 input_data={},
-                output_data=None,
                 execution_order=execution_order,
-                retry_count=0,
                 error_message=reason,
             )
-            self.db.add(node_execution)
-
-        # Flush all SKIPPED node executions
-        await self.db.flush()
-
-        # Log skipped nodes
-        for node_id in skipped_nodes:
-            node = node_map.get(node_id)
-            if node:
-                await self._log_execution_event(
-                    execution_id=execution_id,
-                    level=LogLevel.WARNING,
-                    message=f"Node '{node.name}' skipped: {reason}",
-                )
+            await self._log_execution_event(
+                execution_id=execution_id,
+                node_execution_id=node_execution_id,
+                level=LogLevel.WARNING,
+                message=f"Node '{node.name}' skipped: {reason}",
+            )
 
     async def _get_workflow_graph_data(
         self,
@@ -831,7 +2661,7 @@ class WorkflowExecutor:
 
     async def _evaluate_condition_node(
         self,
-        node: Node,
+        node: _ExecNode,
         context: ExecutionContext,  # noqa: ARG002
     ) -> dict[str, Any]:
         """Evaluate condition node and return evaluation result.
@@ -857,11 +2687,15 @@ class WorkflowExecutor:
         if node.node_type != NodeType.CONDITION:
             return {"matched_edges": [], "result": False}
 
-        # Get outgoing edges for this node
-        edges_result = await self.db.execute(
-            select(Edge).where(Edge.source_node_id == node.id)
-        )
-        outgoing_edges = list(edges_result.scalars().all())
+        # Get outgoing edges for this node (from the compiled plan if available)
+        outgoing_edges: Sequence[_ExecEdge]
+        if self._plan is not None and node.id in self._plan.nodes:
+            outgoing_edges = self._plan.outgoing_edges.get(node.id, ())
+        else:
+            edges_result = await self.db.execute(
+                select(Edge).where(Edge.source_node_id == node.id)
+            )
+            outgoing_edges = list(edges_result.scalars().all())
 
         # SPEC-011: Return all edges as matched (placeholder)
         # SPEC-012: Will evaluate conditions and return only matching edges
@@ -875,8 +2709,8 @@ class WorkflowExecutor:
         condition_node_id: UUID,
         matched_edges: list[UUID],
         graph: _Graph,
-        node_map: dict[UUID, Node],  # noqa: ARG002
-        edge_map: dict[UUID, tuple[UUID, UUID]] | None = None,
+        node_map: Mapping[UUID, _ExecNode],  # noqa: ARG002
+        edge_map: Mapping[UUID, tuple[UUID, UUID]] | None = None,
     ) -> set[UUID]:
         """Mark non-matching paths as SKIPPED.
 
@@ -887,7 +2721,7 @@ class WorkflowExecutor:
             condition_node_id: ID of the condition node.
             matched_edges: List of edge IDs that matched the condition.
             graph: Graph[UUID] for traversal.
-            node_map: Map of node ID to Node object.
+            node_map: Map of node ID to node.
             edge_map: Optional map of edge_id to (source_id, target_id).
 
         Returns:
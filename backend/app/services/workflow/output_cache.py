@@ -0,0 +1,285 @@
+"""Content-addressed cache of node outputs.
+
+TAG: [SPEC-011] [EXECUTION] [CACHING]
+
+Deterministic nodes (adapters, aggregators, tool calls with fixed parameters)
+produce the same output for the same configuration and input. Nodes opt in
+with a ``cache`` key in their config:
+
+    {"cache": true}                 # default TTL
+    {"cache": {"ttl_seconds": 60}}  # per-node TTL
+
+Cache key format: "node_output:{sha256}" where the hash covers node type,
+node config, tool/agent ID and the merged node input. Node IDs are not part
+of the key, so identical nodes share entries across workflows.
+
+Two tiers:
+- In-process LRU with per-entry TTL, bounded by NODE_OUTPUT_CACHE_SIZE.
+- Optional Redis tier (NODE_OUTPUT_CACHE_REDIS) shared by all processes,
+  using the same connection pattern as ValidationCache.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Protocol
+from uuid import UUID
+
+from redis.asyncio import ConnectionPool, Redis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Cache key prefix
+NODE_OUTPUT_CACHE_PREFIX = "node_output"
+
+# Node config key enabling the cache (excluded from the cache key)
+CACHE_CONFIG_KEY = "cache"
+
+
+class _CacheableNode(Protocol):
+    @property
+    def node_type(self) -> Any: ...
+    @property
+    def config(self) -> Mapping[str, Any] | None: ...
+    @property
+    def tool_id(self) -> UUID | None: ...
+    @property
+    def agent_id(self) -> UUID | None: ...
+
+
+def to_plain(value: Any) -> Any:
+    """Convert read-only mappings (plan snapshots) into JSON-encodable dicts."""
+    if isinstance(value, Mapping):
+        return {str(k): to_plain(v) for k, v in value.items()}
+    if isinstance(value, list | tuple):
+        return [to_plain(v) for v in value]
+    return value
+
+
+def get_cache_ttl(node: _CacheableNode) -> int | None:
+    """Get the cache TTL of a node, or None if it did not opt in.
+
+    Args:
+        node: Node or PlanNode
+
+    Returns:
+        TTL in seconds, or None if caching is disabled for the node
+    """
+    option = (node.config or {}).get(CACHE_CONFIG_KEY)
+    if option is True:
+        return settings.NODE_OUTPUT_CACHE_TTL
+    if isinstance(option, Mapping):
+        return int(option.get("ttl_seconds", settings.NODE_OUTPUT_CACHE_TTL))
+    return None
+
+
+def make_cache_key(node: _CacheableNode, input_data: Mapping[str, Any]) -> str:
+    """Build the content-addressed cache key of a node run.
+
+    TAG: [SPEC-011] [EXECUTION] [CACHING]
+
+    Args:
+        node: Node or PlanNode
+        input_data: Merged node input from ExecutionContext.get_input
+
+    Returns:
+        Cache key string
+    """
+    node_type = getattr(node.node_type, "value", node.node_type)
+    config = {k: v for k, v in (node.config or {}).items() if k != CACHE_CONFIG_KEY}
+    payload = json.dumps(
+        {
+            "node_type": node_type,
+            "config": to_plain(config),
+            "tool_id": str(node.tool_id) if node.tool_id else None,
+            "agent_id": str(node.agent_id) if node.agent_id else None,
+            "input": to_plain(input_data),
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    digest = hashlib.sha256(payload.encode()).hexdigest()
+    return f"{NODE_OUTPUT_CACHE_PREFIX}:{digest}"
+
+
+class NodeOutputCache:
+    """Two-tier (in-process LRU + optional Redis) node output cache.
+
+    TAG: [SPEC-011] [EXECUTION] [CACHING]
+
+    Features:
+    - Per-entry TTL in both tiers
+    - LRU eviction of the in-process tier
+    - Graceful degradation when Redis is unavailable
+    """
+
+    def __init__(
+        self,
+        redis_url: str | None = None,
+        max_size: int | None = None,
+    ):
+        """Initialize the node output cache.
+
+        Args:
+            redis_url: Redis connection URL (in-process tier only if None)
+            max_size: Maximum in-process entries (default from settings)
+        """
+        self.max_size = max_size or settings.NODE_OUTPUT_CACHE_SIZE
+        self._entries: OrderedDict[str, tuple[dict[str, Any], float]] = OrderedDict()
+        self._pool: ConnectionPool | None = None
+        self._redis: Redis | None = None
+
+        if redis_url:
+            self._initialize_redis(redis_url)
+
+    def _initialize_redis(self, redis_url: str) -> None:
+        """Initialize Redis connection pool.
+
+        Args:
+            redis_url: Redis connection URL
+        """
+        try:
+            self._pool = ConnectionPool.from_url(
+                redis_url,
+                decode_responses=True,
+            )
+            self._redis = Redis(connection_pool=self._pool)
+            logger.info("Node output cache initialized with Redis")
+        except Exception as e:
+            logger.warning(f"Failed to initialize Redis node output cache: {e}")
+            self._pool = None
+            self._redis = None
+
+    def __len__(self) -> int:
+        """Return the number of in-process entries."""
+        return len(self._entries)
+
+    def _get_local(self, key: str) -> dict[str, Any] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        output, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        # Callers own the returned output; the cached copy stays pristine
+        return copy.deepcopy(output)
+
+    def _set_local(self, key: str, output: dict[str, Any], ttl: int) -> None:
+        self._entries[key] = (copy.deepcopy(output), time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Get a cached node output.
+
+        Args:
+            key: Cache key from make_cache_key
+
+        Returns:
+            Cached output dict, or None if not found/expired
+        """
+        output = self._get_local(key)
+        if output is not None:
+            logger.debug(f"In-memory node output cache HIT: {key}")
+            return output
+
+        if self._redis is None:
+            return None
+
+        try:
+            cached_data = await self._redis.get(key)
+            if not cached_data:
+                return None
+            ttl = await self._redis.ttl(key)
+            loaded: dict[str, Any] = json.loads(str(cached_data))
+        except RedisError as e:
+            logger.warning(f"Redis get failed: {e}")
+            return None
+        except ValueError as e:
+            logger.warning(f"Node output deserialization failed: {e}")
+            return None
+
+        logger.debug(f"Redis node output cache HIT: {key}")
+        if ttl > 0:
+            self._set_local(key, loaded, ttl)
+        return loaded
+
+    async def set(self, key: str, output: dict[str, Any], ttl: int) -> bool:
+        """Cache a node output with TTL.
+
+        Args:
+            key: Cache key from make_cache_key
+            output: Node output dict (must be JSON-serializable for Redis)
+            ttl: TTL in seconds
+
+        Returns:
+            True if cached, False if the TTL is not positive
+        """
+        if ttl <= 0:
+            return False
+
+        self._set_local(key, output, ttl)
+
+        if self._redis is not None:
+            try:
+                await self._redis.setex(key, ttl, json.dumps(output, default=str))
+            except RedisError as e:
+                logger.warning(f"Redis set failed: {e}")
+            except (TypeError, ValueError) as e:
+                logger.warning(f"Node output serialization failed: {e}")
+        return True
+
+    def clear(self) -> None:
+        """Drop all in-process entries."""
+        self._entries.clear()
+
+    async def close(self) -> None:
+        """Close Redis connection pool."""
+        if self._pool:
+            await self._pool.aclose()
+            logger.info("Node output cache connection closed")
+
+
+# Global cache instance (initialized from settings)
+_global_cache: NodeOutputCache | None = None
+
+
+def get_node_output_cache() -> NodeOutputCache:
+    """Get or create global node output cache instance.
+
+    TAG: [SPEC-011] [EXECUTION] [CACHING]
+
+    Returns:
+        NodeOutputCache instance (Redis tier only if enabled and configured)
+    """
+    global _global_cache
+
+    if _global_cache is None:
+        redis_url = (
+            str(settings.REDIS_URL)
+            if settings.NODE_OUTPUT_CACHE_REDIS and settings.REDIS_URL
+            else None
+        )
+        _global_cache = NodeOutputCache(redis_url=redis_url)
+
+    return _global_cache
+
+
+__all__ = [
+    "NodeOutputCache",
+    "get_cache_ttl",
+    "get_node_output_cache",
+    "make_cache_key",
+    "to_plain",
+]
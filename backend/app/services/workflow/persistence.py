@@ -0,0 +1,224 @@
+"""Write-behind persistence buffer for workflow execution records.
+
+TAG: [SPEC-011] [EXECUTION] [PERSISTENCE]
+REQ: REQ-011-010 - ExecutionLog integration
+
+This module batches NodeExecution and ExecutionLog inserts so that a
+workflow run issues a handful of multi-row statements instead of one flush
+per record.
+
+Primary keys are generated client-side, so callers can reference a buffered
+NodeExecution (e.g. from an ExecutionLog) before it reaches the database.
+Buffered rows are written when the batch size or flush interval is exceeded
+and when the caller flushes explicitly at workflow end.
+
+Node inputs and outputs above BLOB_OFFLOAD_THRESHOLD_BYTES are written to
+the blob store when buffered; the row holds only a blob reference.
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import insert
+
+from app.core.config import settings
+from app.models.execution import ExecutionLog, NodeExecution
+from app.services.workflow.blob_store import offload_payload
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from datetime import datetime
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.models.enums import ExecutionStatus, LogLevel
+    from app.services.workflow.blob_store import BlobStore
+
+
+class ExecutionWriteBuffer:
+    """Collects execution writes and sends them as batched statements.
+
+    TAG: [SPEC-011] [EXECUTION] [PERSISTENCE]
+
+    The buffer is not safe for concurrent use: like the AsyncSession it
+    wraps, it must only be driven by one coroutine at a time.
+
+    Rows are written in dependency order (node executions, then logs) so
+    foreign keys are always satisfied within a flush.
+
+    Attributes:
+        db: Async database session.
+        max_pending: Number of buffered rows that triggers a flush.
+        flush_interval: Seconds after which buffered rows trigger a flush.
+        blob_store: Store for offloaded payloads (None: global store).
+
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        max_pending: int | None = None,
+        flush_interval: float | None = None,
+        blob_store: BlobStore | None = None,
+    ) -> None:
+        """Initialize the buffer.
+
+        Args:
+            db: Async database session.
+            max_pending: Row count threshold (default from settings).
+            flush_interval: Age threshold in seconds (default from settings).
+            blob_store: Store for offloaded payloads (default: global store).
+
+        """
+        self.db = db
+        self.blob_store = blob_store
+        self.max_pending = (
+            max_pending
+            if max_pending is not None
+            else settings.EXECUTION_WRITE_BATCH_SIZE
+        )
+        self.flush_interval = (
+            flush_interval
+            if flush_interval is not None
+            else settings.EXECUTION_WRITE_FLUSH_INTERVAL
+        )
+        self._node_inserts: list[dict[str, Any]] = []
+        self._log_inserts: list[dict[str, Any]] = []
+        self._oldest_pending_at: float | None = None
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered rows not yet written."""
+        return len(self._node_inserts) + len(self._log_inserts)
+
+    async def add_node_execution(
+        self,
+        workflow_execution_id: uuid.UUID,
+        node_id: uuid.UUID,
+        status: ExecutionStatus,
+        execution_order: int,
+        started_at: datetime | None = None,
+        ended_at: datetime | None = None,
+        input_data: Mapping[str, Any] | None = None,
+        output_data: dict[str, Any] | None = None,
+        error_message: str | None = None,
+        retry_count: int = 0,
+        cache_hit: bool = False,
+        item_index: int | None = None,
+    ) -> uuid.UUID:
+        """Buffer a NodeExecution insert.
+
+        Large input and output payloads are offloaded to the blob store.
+
+        Args:
+            workflow_execution_id: Parent workflow execution ID.
+            node_id: Executed node ID.
+            status: Node execution status.
+            execution_order: Execution order counter.
+            started_at: When the node started.
+            ended_at: When the node finished.
+            input_data: Input data for the node.
+            output_data: Output data from the node.
+            error_message: Error message if the node failed or was skipped.
+            retry_count: Number of retries performed.
+            cache_hit: Whether the output was served from the output cache.
+            item_index: Mapped item position (per-item runs of map bodies).
+
+        Returns:
+            Client-generated ID of the NodeExecution row.
+
+        """
+        node_execution_id = uuid.uuid4()
+        self._node_inserts.append(
+            {
+                "id": node_execution_id,
+                "workflow_execution_id": workflow_execution_id,
+                "node_id": node_id,
+                "status": status,
+                "started_at": started_at,
+                "ended_at": ended_at,
+                "input_data": await offload_payload(input_data or {}, self.blob_store),
+                "output_data": await offload_payload(output_data, self.blob_store),
+                "error_message": error_message,
+                "retry_count": retry_count,
+                "execution_order": execution_order,
+                "cache_hit": cache_hit,
+                "item_index": item_index,
+            }
+        )
+        await self._maybe_flush()
+        return node_execution_id
+
+    async def add_log(
+        self,
+        workflow_execution_id: uuid.UUID,
+        level: LogLevel,
+        message: str,
+        node_execution_id: uuid.UUID | None = None,
+        data: dict[str, Any] | None = None,
+    ) -> uuid.UUID:
+        """Buffer an ExecutionLog insert.
+
+        Args:
+            workflow_execution_id: Parent workflow execution ID.
+            level: Log level.
+            message: Log message.
+            node_execution_id: Optional node execution ID.
+            data: Optional structured log data.
+
+        Returns:
+            Client-generated ID of the ExecutionLog row.
+
+        """
+        log_id = uuid.uuid4()
+        self._log_inserts.append(
+            {
+                "id": log_id,
+                "workflow_execution_id": workflow_execution_id,
+                "node_execution_id": node_execution_id,
+                "level": level,
+                "message": message,
+                "data": data,
+            }
+        )
+        await self._maybe_flush()
+        return log_id
+
+    async def flush(self) -> None:
+        """Write all buffered rows using multi-row statements.
+
+        Buffered rows are detached before writing, so a failed flush is not
+        retried with the same rows.
+        """
+        node_inserts, self._node_inserts = self._node_inserts, []
+        log_inserts, self._log_inserts = self._log_inserts, []
+        self._oldest_pending_at = None
+
+        if node_inserts:
+            await self.db.execute(insert(NodeExecution), node_inserts)
+        if log_inserts:
+            await self.db.execute(insert(ExecutionLog), log_inserts)
+
+    def clear(self) -> None:
+        """Discard all buffered rows without writing them."""
+        self._node_inserts.clear()
+        self._log_inserts.clear()
+        self._oldest_pending_at = None
+
+    async def _maybe_flush(self) -> None:
+        """Flush if the size or age threshold has been reached."""
+        now = time.monotonic()
+        if self._oldest_pending_at is None:
+            self._oldest_pending_at = now
+
+        if (
+            self.pending >= self.max_pending
+            or now - self._oldest_pending_at >= self.flush_interval
+        ):
+            await self.flush()
+
+
+__all__ = ["ExecutionWriteBuffer"]
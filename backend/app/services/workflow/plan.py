@@ -0,0 +1,547 @@
+"""Compiled execution plans for workflow execution.
+
+TAG: [SPEC-011] [EXECUTION] [PLAN]
+REQ: REQ-011-001 - DAG topological sort based execution
+
+An ExecutionPlan is an immutable snapshot of everything the executor needs
+to run a workflow version: topology, adjacency, per-node incoming edges,
+the outgoing (condition) edge index and node configuration.
+
+Compilation also groups structurally identical nodes that opt in with
+{"dedupe": true}: same type, config, tool, agent, timeout and retry
+settings, reading the same outputs through the same handles. The executor
+runs each group once and fans the output out to every member. Only mark
+nodes without side effects; condition and trigger nodes are never grouped.
+
+A node whose only predecessor is a condition node can be marked as a cheap,
+side-effect-free branch with {"speculative": true}. It reads the data the
+condition node routes (the condition node's inputs) instead of the routing
+decision, so level scheduling can start it before the condition is
+evaluated and discard it if its path is excluded.
+
+The only successor of a PARALLEL node is its map body when the PARALLEL
+node is the body's only predecessor: the executor runs the body once per
+item of the list the PARALLEL node fans out and gathers the outputs.
+
+Plans are cached in process by (workflow_id, version) with LRU eviction, so
+repeated runs of an unchanged workflow skip reloading and rebuilding the
+graph. Graph edits invalidate the cached plans of the affected workflow.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import logging
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.models.enums import NodeType
+from app.services.workflow.graph import Graph
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Mapping
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import Session
+
+    from app.models.workflow import Edge, Node
+    from app.schemas.validation import TopologyResult
+
+logger = logging.getLogger(__name__)
+
+# Default number of compiled plans kept in process
+DEFAULT_PLAN_CACHE_SIZE = 256
+
+# Node config key opting a node into deduplication
+DEDUPE_CONFIG_KEY = "dedupe"
+
+# Node config key marking a condition branch as safe to run speculatively
+SPECULATIVE_CONFIG_KEY = "speculative"
+
+# Node types whose runs are never shared: conditions route per node and
+# triggers start the workflow
+_NEVER_DEDUPED = frozenset({NodeType.CONDITION, NodeType.TRIGGER})
+
+# Node types that are never run as a map body
+_NOT_MAPPED = frozenset({NodeType.CONDITION, NodeType.TRIGGER, NodeType.PARALLEL})
+
+
+@dataclass(frozen=True, slots=True)
+class PlanNode:
+    """Immutable snapshot of a Node used during execution.
+
+    TAG: [SPEC-011] [EXECUTION] [PLAN]
+
+    Exposes the Node attributes read by the executor and processors, so it
+    can be passed wherever a Node is expected during execution.
+    """
+
+    id: UUID
+    workflow_id: UUID
+    name: str
+    node_type: NodeType
+    config: Mapping[str, Any]
+    tool_id: UUID | None
+    agent_id: UUID | None
+    timeout_seconds: int
+    retry_config: Mapping[str, Any]
+
+    @classmethod
+    def from_node(cls, node: Node) -> PlanNode:
+        """Snapshot a Node, copying its mutable configuration."""
+        return cls(
+            id=node.id,
+            workflow_id=node.workflow_id,
+            name=node.name,
+            node_type=node.node_type,
+            config=MappingProxyType(copy.deepcopy(node.config or {})),
+            tool_id=node.tool_id,
+            agent_id=node.agent_id,
+            timeout_seconds=node.timeout_seconds,
+            retry_config=MappingProxyType(copy.deepcopy(node.retry_config or {})),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class PlanEdge:
+    """Immutable snapshot of an Edge used during execution.
+
+    TAG: [SPEC-011] [EXECUTION] [PLAN]
+    """
+
+    id: UUID
+    source_node_id: UUID
+    target_node_id: UUID
+    source_handle: str | None
+    target_handle: str | None
+    condition: Mapping[str, Any] | None
+    priority: int
+    label: str | None
+
+    @classmethod
+    def from_edge(cls, edge: Edge) -> PlanEdge:
+        """Snapshot an Edge, copying its condition."""
+        return cls(
+            id=edge.id,
+            source_node_id=edge.source_node_id,
+            target_node_id=edge.target_node_id,
+            source_handle=edge.source_handle,
+            target_handle=edge.target_handle,
+            condition=(
+                MappingProxyType(copy.deepcopy(edge.condition))
+                if edge.condition is not None
+                else None
+            ),
+            priority=edge.priority,
+            label=edge.label,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ExecutionPlan:
+    """Compiled, immutable execution plan for one workflow version.
+
+    TAG: [SPEC-011] [EXECUTION] [PLAN]
+
+    The graph is shared by every run of the plan and must not be mutated;
+    callers that need a modified graph should use ``graph.copy()``.
+
+    Attributes:
+        workflow_id: ID of the compiled workflow.
+        version: Workflow version the plan was compiled from.
+        topology: Topological analysis (execution levels, critical path).
+        graph: Adjacency of the workflow DAG.
+        nodes: Node snapshots by node ID.
+        ordered_node_ids: Node IDs in topological order.
+        in_degree: Number of predecessors per node.
+        edge_endpoints: (source, target) per edge ID.
+        edges_by_pair: Edge per (source, target) pair.
+        incoming_edges: Edges whose source outputs each node reads: the
+            edges ending at it, or for a speculative branch the edges ending
+            at its condition node.
+        outgoing_edges: Edges leaving each node (condition routing index).
+        equivalent_nodes: Canonical node of each group of structurally
+            identical nodes, keyed by every member of the group (including
+            the canonical node, the first in topological order).
+        speculative_branches: Successors of each condition node that may run
+            before the condition is evaluated.
+        map_bodies: PARALLEL node fanning out to each map body node.
+
+    """
+
+    workflow_id: UUID
+    version: int
+    topology: TopologyResult
+    graph: Graph[UUID]
+    nodes: Mapping[UUID, PlanNode]
+    ordered_node_ids: tuple[UUID, ...]
+    in_degree: Mapping[UUID, int]
+    edge_endpoints: Mapping[UUID, tuple[UUID, UUID]]
+    edges_by_pair: Mapping[tuple[UUID, UUID], PlanEdge]
+    incoming_edges: Mapping[UUID, tuple[PlanEdge, ...]]
+    outgoing_edges: Mapping[UUID, tuple[PlanEdge, ...]]
+    equivalent_nodes: Mapping[UUID, UUID]
+    speculative_branches: Mapping[UUID, tuple[UUID, ...]]
+    map_bodies: Mapping[UUID, UUID]
+
+    @classmethod
+    def compile(
+        cls,
+        workflow_id: UUID,
+        version: int,
+        topology: TopologyResult,
+        nodes: list[Node],
+        edges: list[Edge],
+    ) -> ExecutionPlan:
+        """Compile an execution plan from loaded nodes and edges.
+
+        Args:
+            workflow_id: ID of the workflow.
+            version: Workflow version.
+            topology: TopologyResult for the workflow.
+            nodes: Workflow nodes.
+            edges: Workflow edges.
+
+        Returns:
+            Compiled ExecutionPlan.
+
+        """
+        plan_nodes = {node.id: PlanNode.from_node(node) for node in nodes}
+        plan_edges = [PlanEdge.from_edge(edge) for edge in edges]
+
+        graph = Graph[UUID]()
+        incoming: dict[UUID, list[PlanEdge]] = defaultdict(list)
+        outgoing: dict[UUID, list[PlanEdge]] = defaultdict(list)
+        for node_id in plan_nodes:
+            graph.add_node(node_id)
+        for edge in plan_edges:
+            graph.add_edge(edge.source_node_id, edge.target_node_id)
+            incoming[edge.target_node_id].append(edge)
+            outgoing[edge.source_node_id].append(edge)
+
+        ordered_node_ids = tuple(
+            node_id
+            for level_data in topology.execution_order
+            for node_id in level_data.node_ids
+            if node_id in plan_nodes
+        )
+
+        # Speculative branches read what their condition node reads
+        speculative: dict[UUID, list[UUID]] = defaultdict(list)
+        for node_id in ordered_node_ids:
+            node = plan_nodes[node_id]
+            branch_edges = incoming.get(node_id, [])
+            if (
+                (node.config or {}).get(SPECULATIVE_CONFIG_KEY) is True
+                and node.node_type not in _NEVER_DEDUPED
+                and len(branch_edges) == 1
+                and plan_nodes[branch_edges[0].source_node_id].node_type
+                == NodeType.CONDITION
+            ):
+                condition_id = branch_edges[0].source_node_id
+                speculative[condition_id].append(node_id)
+                incoming[node_id] = list(incoming.get(condition_id, []))
+
+        map_bodies = {
+            edges[0].target_node_id: node_id
+            for node_id, edges in outgoing.items()
+            if plan_nodes[node_id].node_type == NodeType.PARALLEL
+            and len(edges) == 1
+            and len(incoming.get(edges[0].target_node_id, [])) == 1
+            and plan_nodes[edges[0].target_node_id].node_type not in _NOT_MAPPED
+        }
+
+        return cls(
+            workflow_id=workflow_id,
+            version=version,
+            topology=topology,
+            graph=graph,
+            nodes=MappingProxyType(plan_nodes),
+            ordered_node_ids=ordered_node_ids,
+            in_degree=MappingProxyType(
+                {node_id: graph.get_in_degree(node_id) for node_id in plan_nodes}
+            ),
+            edge_endpoints=MappingProxyType(
+                {e.id: (e.source_node_id, e.target_node_id) for e in plan_edges}
+            ),
+            edges_by_pair=MappingProxyType(
+                {(e.source_node_id, e.target_node_id): e for e in plan_edges}
+            ),
+            incoming_edges=MappingProxyType(
+                {node_id: tuple(es) for node_id, es in incoming.items()}
+            ),
+            outgoing_edges=MappingProxyType(
+                {node_id: tuple(es) for node_id, es in outgoing.items()}
+            ),
+            equivalent_nodes=MappingProxyType(
+                _equivalent_nodes(
+                    plan_nodes,
+                    ordered_node_ids,
+                    incoming,
+                    {nid for nids in speculative.values() for nid in nids}
+                    | map_bodies.keys(),
+                )
+            ),
+            speculative_branches=MappingProxyType(
+                {node_id: tuple(ids) for node_id, ids in speculative.items()}
+            ),
+            map_bodies=MappingProxyType(map_bodies),
+        )
+
+    def priorities(
+        self,
+        weights: Mapping[UUID, float] | None = None,
+        nodes: Collection[UUID] | None = None,
+    ) -> dict[UUID, float]:
+        """Rank nodes by the length of the longest path they start.
+
+        A node's priority is its own weight plus the highest priority among
+        its successors, so nodes on the critical path rank highest. Nodes
+        without a weight get the mean of the known weights; without any
+        weights every node weighs 1 (longest path in hops).
+
+        Args:
+            weights: Expected duration per node ID (e.g. historical medians).
+            nodes: Rank only these nodes, ignoring paths through the others
+                (default: all nodes).
+
+        Returns:
+            Priority per node ID (higher runs first).
+
+        """
+        default_weight = sum(weights.values()) / len(weights) if weights else 1.0
+        ranks: dict[UUID, float] = {}
+        for node_id in reversed(self.ordered_node_ids):
+            if nodes is not None and node_id not in nodes:
+                continue
+            weight = weights.get(node_id, default_weight) if weights else 1.0
+            ranks[node_id] = weight + max(
+                (
+                    ranks[successor_id]
+                    for successor_id in self.graph.get_successors(node_id)
+                    if successor_id in ranks
+                ),
+                default=0.0,
+            )
+        return ranks
+
+
+def _equivalent_nodes(
+    nodes: Mapping[UUID, PlanNode],
+    ordered_node_ids: tuple[UUID, ...],
+    incoming: Mapping[UUID, list[PlanEdge]],
+    excluded: Collection[UUID],
+) -> dict[UUID, UUID]:
+    """Group structurally identical opted-in nodes under a canonical node.
+
+    Nodes are visited in topological order, so predecessors are replaced by
+    their canonical node before a node's own signature is built; duplicate
+    chains (B1 -> C1 and B2 -> C2 below identical B1, B2) collapse as well.
+
+    Args:
+        nodes: Node snapshots by node ID.
+        ordered_node_ids: Node IDs in topological order.
+        incoming: Edges read by each node.
+        excluded: Speculative branches and map bodies, which are never
+            grouped (a discarded run must not take its copies along, and a
+            map body runs once per item).
+
+    Returns:
+        Canonical node ID per member of each group with two or more members.
+
+    """
+    canonical: dict[UUID, UUID] = {}
+    by_signature: dict[tuple[Any, ...], UUID] = {}
+    groups: dict[UUID, int] = defaultdict(int)
+
+    for node_id in ordered_node_ids:
+        node = nodes[node_id]
+        config = dict(node.config or {})
+        if (
+            node.node_type in _NEVER_DEDUPED
+            or node_id in excluded
+            or config.pop(DEDUPE_CONFIG_KEY, False) is not True
+        ):
+            canonical[node_id] = node_id
+            continue
+
+        signature = (
+            node.node_type,
+            json.dumps(config, sort_keys=True, default=str),
+            node.tool_id,
+            node.agent_id,
+            node.timeout_seconds,
+            json.dumps(dict(node.retry_config or {}), sort_keys=True, default=str),
+            frozenset(
+                (
+                    canonical.get(edge.source_node_id, edge.source_node_id),
+                    edge.source_handle,
+                    edge.target_handle,
+                )
+                for edge in incoming.get(node_id, ())
+            ),
+        )
+        first = by_signature.setdefault(signature, node_id)
+        canonical[node_id] = first
+        groups[first] += 1
+
+    equivalent = {
+        node_id: first
+        for node_id, first in canonical.items()
+        if groups.get(first, 0) > 1
+    }
+    if equivalent:
+        logger.debug(
+            f"Plan groups {len(equivalent)} identical nodes into "
+            f"{len(set(equivalent.values()))} run(s)"
+        )
+    return equivalent
+
+
+class ExecutionPlanCache:
+    """In-process LRU cache of compiled execution plans.
+
+    TAG: [SPEC-011] [EXECUTION] [PLAN] [CACHING]
+
+    Cache key: (workflow_id, version). Every workflow, node and edge edit
+    bumps the workflow version, so plans cached by any process (API replicas,
+    queue workers) are never served for a newer graph. Edits also drop the
+    workflow's plans from this process once they are committed, which only
+    frees memory early.
+    """
+
+    # Session.info keys of the workflows whose plans are dropped on commit
+    # and of the flag marking the session's commit/rollback listeners
+    _PENDING_KEY = "plan_cache_invalidations"
+    _LISTENING_KEY = "plan_cache_listening"
+
+    def __init__(self, max_size: int = DEFAULT_PLAN_CACHE_SIZE) -> None:
+        """Initialize the plan cache.
+
+        Args:
+            max_size: Maximum number of cached plans (default: 256).
+
+        """
+        self.max_size = max_size
+        self._plans: OrderedDict[tuple[UUID, int], ExecutionPlan] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached plans."""
+        return len(self._plans)
+
+    def get(self, workflow_id: UUID, version: int) -> ExecutionPlan | None:
+        """Get a cached plan and mark it as recently used.
+
+        Args:
+            workflow_id: Workflow UUID.
+            version: Workflow version.
+
+        Returns:
+            Cached ExecutionPlan, or None if not cached.
+
+        """
+        key = (workflow_id, version)
+        plan = self._plans.get(key)
+        if plan is None:
+            logger.debug(f"Plan cache MISS: {workflow_id}:{version}")
+            return None
+        self._plans.move_to_end(key)
+        logger.debug(f"Plan cache HIT: {workflow_id}:{version}")
+        return plan
+
+    def set(self, plan: ExecutionPlan) -> None:
+        """Cache a plan, evicting the least recently used one if full.
+
+        Args:
+            plan: Compiled ExecutionPlan.
+
+        """
+        key = (plan.workflow_id, plan.version)
+        self._plans[key] = plan
+        self._plans.move_to_end(key)
+        while len(self._plans) > self.max_size:
+            evicted, _ = self._plans.popitem(last=False)
+            logger.debug(f"Plan cache evicted: {evicted[0]}:{evicted[1]}")
+
+    def invalidate(self, workflow_id: UUID, version: int | None = None) -> None:
+        """Remove cached plans for a workflow.
+
+        Args:
+            workflow_id: Workflow UUID.
+            version: Workflow version (None for all versions).
+
+        """
+        if version is not None:
+            self._plans.pop((workflow_id, version), None)
+            return
+
+        for key in [k for k in self._plans if k[0] == workflow_id]:
+            del self._plans[key]
+
+    def invalidate_after_commit(self, db: AsyncSession, workflow_id: UUID) -> None:
+        """Remove cached plans for a workflow once the session commits.
+
+        Invalidating before the commit would let a run in this process cache
+        the old graph again until the edit is committed.
+
+        Args:
+            db: Session holding the uncommitted graph edit.
+            workflow_id: Workflow UUID.
+
+        """
+        session = db.sync_session
+        if not session.info.get(self._LISTENING_KEY):
+            event.listen(session, "after_commit", self._invalidate_pending)
+            event.listen(session, "after_rollback", self._discard_pending)
+            session.info[self._LISTENING_KEY] = True
+        session.info.setdefault(self._PENDING_KEY, set()).add(workflow_id)
+
+    def _invalidate_pending(self, session: Session) -> None:
+        for workflow_id in session.info.pop(self._PENDING_KEY, ()):
+            self.invalidate(workflow_id)
+
+    def _discard_pending(self, session: Session) -> None:
+        session.info.pop(self._PENDING_KEY, None)
+
+    def clear(self) -> None:
+        """Remove all cached plans."""
+        self._plans.clear()
+
+
+# Global plan cache instance (initialized from settings)
+_global_plan_cache: ExecutionPlanCache | None = None
+
+
+def get_plan_cache() -> ExecutionPlanCache:
+    """Get or create the global execution plan cache.
+
+    TAG: [SPEC-011] [EXECUTION] [PLAN] [CACHING]
+
+    Returns:
+        ExecutionPlanCache instance.
+
+    """
+    global _global_plan_cache
+
+    if _global_plan_cache is None:
+        _global_plan_cache = ExecutionPlanCache(
+            max_size=settings.EXECUTION_PLAN_CACHE_SIZE
+        )
+
+    return _global_plan_cache
+
+
+__all__ = [
+    "ExecutionPlan",
+    "ExecutionPlanCache",
+    "PlanEdge",
+    "PlanNode",
+    "get_plan_cache",
+]
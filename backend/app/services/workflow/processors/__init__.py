@@ -6,10 +6,16 @@ This module provides the processor registry and exports for all node processors.
 """
 
 from app.services.workflow.processors.base import BaseProcessor, ProcessorConfig
+from app.services.workflow.processors.offload import (
+    ProcessPoolOffloader,
+    get_offloader,
+)
 from app.services.workflow.processors.registry import ProcessorRegistry
 
 __all__ = [
     "BaseProcessor",
+    "ProcessPoolOffloader",
     "ProcessorConfig",
     "ProcessorRegistry",
+    "get_offloader",
 ]
@@ -4,6 +4,7 @@ TAG: [SPEC-012] [PROCESSOR] [ADAPTER]
 REQ: REQ-012-013 - Data transformation with adapters
 """
 
+from collections.abc import AsyncIterator
 from typing import Any
 
 from pydantic import ValidationError
@@ -12,7 +13,135 @@ from app.models.workflow import Node
 from app.schemas.processors import AdapterProcessorInput, AdapterProcessorOutput
 from app.services.workflow.context import ExecutionContext
 from app.services.workflow.processors.base import BaseProcessor, ProcessorConfig
-from app.services.workflow.processors.errors import ProcessorValidationError
+from app.services.workflow.processors.errors import (
+    ProcessorConfigurationError,
+    ProcessorValidationError,
+)
+from app.services.workflow.streaming import chunk_records, is_stream
+
+# Transformations that apply record by record and can therefore be streamed
+STREAMABLE_TRANSFORMATIONS = frozenset(
+    {"field_mapping", "type_conversion", "filtering", "custom"}
+)
+
+
+def apply_transformation(
+    transformation_type: str, source_data: Any, config: dict[str, Any]
+) -> tuple[Any, int]:
+    """Apply an adapter transformation to source data.
+
+    TAG: [SPEC-012] [PROCESSOR] [ADAPTER] [TRANSFORM]
+
+    Pure module-level function so it can run in the offload process pool.
+
+    Args:
+        transformation_type: Transformation strategy name
+        source_data: Data to transform
+        config: Transformation configuration
+
+    Returns:
+        Tuple of (transformed_data, records_processed)
+    """
+    transformed_data = source_data
+    records_processed = 0
+
+    if transformation_type == "field_mapping":
+        # Apply field mapping
+        mapping = config.get("mapping", {})
+        if isinstance(source_data, dict):
+            transformed_data = {}
+            for old_key, new_key in mapping.items():
+                if old_key in source_data:
+                    transformed_data[new_key] = source_data[old_key]
+            records_processed = len(source_data)
+
+    elif transformation_type == "type_conversion":
+        # Apply type conversions
+        conversions = config.get("conversions", {})
+        if isinstance(source_data, dict):
+            transformed_data = source_data.copy()
+            for field, target_type in conversions.items():
+                if field in transformed_data:
+                    if target_type == "integer":
+                        transformed_data[field] = int(transformed_data[field])
+                    elif target_type == "string":
+                        transformed_data[field] = str(transformed_data[field])
+                    elif target_type == "float":
+                        transformed_data[field] = float(transformed_data[field])
+            records_processed = len(source_data)
+
+    elif transformation_type == "filtering":
+        # Apply filtering
+        filter_expr = config.get("filter", "")
+        if isinstance(source_data, dict) and "items" in source_data:
+            items = source_data["items"]
+            # Simplified filtering - production would use proper parser
+            if ">" in filter_expr:
+                threshold = int(filter_expr.split(">")[-1].strip())
+                transformed_data = {"items": [x for x in items if x > threshold]}
+                records_processed = len(items)
+        else:
+            records_processed = 1
+
+    elif transformation_type == "aggregation":
+        # Apply aggregation
+        if isinstance(source_data, dict):
+            transformed_data = {"aggregated": len(source_data)}
+            records_processed = len(source_data)
+
+    else:  # custom
+        # Custom transformation - just pass through
+        records_processed = 1
+
+    return transformed_data, records_processed
+
+
+def transform_chunk(
+    transformation_type: str, chunk: list[Any], config: dict[str, Any]
+) -> list[Any]:
+    """Apply a record-wise adapter transformation to one stream chunk.
+
+    TAG: [SPEC-012] [PROCESSOR] [ADAPTER] [STREAMING]
+
+    Pure module-level function so it can run in the offload process pool.
+
+    Args:
+        transformation_type: One of STREAMABLE_TRANSFORMATIONS
+        chunk: List of records
+        config: Transformation configuration
+
+    Returns:
+        Transformed records
+    """
+    if transformation_type == "filtering":
+        transformed, _ = apply_transformation(
+            transformation_type, {"items": chunk}, config
+        )
+        kept: list[Any] = transformed["items"]
+        return kept
+    if transformation_type in ("field_mapping", "type_conversion"):
+        return [
+            apply_transformation(transformation_type, record, config)[0]
+            for record in chunk
+        ]
+    return chunk
+
+
+async def _source_chunks(source_data: Any) -> AsyncIterator[list[Any]]:
+    """Iterate the records of adapter source data in chunks."""
+    if is_stream(source_data):
+        async for chunk in source_data:
+            yield chunk
+        return
+
+    if isinstance(source_data, dict) and isinstance(source_data.get("items"), list):
+        records = source_data["items"]
+    elif isinstance(source_data, list):
+        records = source_data
+    else:
+        records = [source_data]
+    for chunk in chunk_records(records):
+        yield chunk
 
 
 class AdapterNodeProcessor(
@@ -29,6 +158,10 @@ class AdapterNodeProcessor(
     2. Apply transformation to source data
     3. Return transformed data with metadata
 
+    Record-wise transformations also stream: source data given as a chunk
+    stream is transformed chunk by chunk as it arrives, and stream() yields
+    the transformed chunks to downstream nodes.
+
     Attributes:
         input_schema: AdapterProcessorInput schema
         output_schema: AdapterProcessorOutput schema
@@ -92,58 +225,30 @@ class AdapterNodeProcessor(
         """
         transformation_type = validated_input.transformation_type
         source_data = validated_input.source_data
-        config = validated_input.transformation_config
-
-        transformed_data = source_data
-        records_processed = 0
-
-        if transformation_type == "field_mapping":
-            # Apply field mapping
-            mapping = config.get("mapping", {})
-            if isinstance(source_data, dict):
-                transformed_data = {}
-                for old_key, new_key in mapping.items():
-                    if old_key in source_data:
-                        transformed_data[new_key] = source_data[old_key]
-                records_processed = len(source_data)
-
-        elif transformation_type == "type_conversion":
-            # Apply type conversions
-            conversions = config.get("conversions", {})
-            if isinstance(source_data, dict):
-                transformed_data = source_data.copy()
-                for field, target_type in conversions.items():
-                    if field in transformed_data:
-                        if target_type == "integer":
-                            transformed_data[field] = int(transformed_data[field])
-                        elif target_type == "string":
-                            transformed_data[field] = str(transformed_data[field])
-                        elif target_type == "float":
-                            transformed_data[field] = float(transformed_data[field])
-                records_processed = len(source_data)
-
-        elif transformation_type == "filtering":
-            # Apply filtering
-            filter_expr = config.get("filter", "")
-            if isinstance(source_data, dict) and "items" in source_data:
-                items = source_data["items"]
-                # Simplified filtering - production would use proper parser
-                if ">" in filter_expr:
-                    threshold = int(filter_expr.split(">")[-1].strip())
-                    transformed_data = {"items": [x for x in items if x > threshold]}
-                    records_processed = len(items)
-            else:
-                records_processed = 1
-
-        elif transformation_type == "aggregation":
-            # Apply aggregation
-            if isinstance(source_data, dict):
-                transformed_data = {"aggregated": len(source_data)}
-                records_processed = len(source_data)
-
-        else:  # custom
-            # Custom transformation - just pass through
-            records_processed = 1
+
+        if is_stream(source_data):
+            records: list[Any] = []
+            records_processed = 0
+            async for records_in, chunk in self._transform_chunks(validated_input):
+                records_processed += records_in
+                records.extend(chunk)
+            return AdapterProcessorOutput(
+                transformed_data=(
+                    {"items": records}
+                    if transformation_type == "filtering"
+                    else records
+                ),
+                transformation_applied=transformation_type,
+                records_processed=records_processed,
+            )
+
+        transformed_data, records_processed = await self.run_cpu_bound(
+            apply_transformation,
+            transformation_type,
+            source_data,
+            validated_input.transformation_config,
+            payload=source_data,
+        )
 
         return AdapterProcessorOutput(
             transformed_data=transformed_data,
@@ -151,6 +256,44 @@ class AdapterNodeProcessor(
             records_processed=records_processed,
         )
 
+    async def stream(
+        self, validated_input: AdapterProcessorInput
+    ) -> AsyncIterator[list[Any]]:
+        """Yield transformed records chunk by chunk.
+
+        TAG: [SPEC-012] [PROCESSOR] [ADAPTER] [STREAMING]
+
+        Args:
+            validated_input: Validated adapter processor input whose source
+                data is a chunk stream, a record list or {"items": [...]}
+
+        Yields:
+            Lists of transformed records
+        """
+        async for _, chunk in self._transform_chunks(validated_input):
+            yield chunk
+
+    async def _transform_chunks(
+        self, validated_input: AdapterProcessorInput
+    ) -> AsyncIterator[tuple[int, list[Any]]]:
+        """Transform source chunks, yielding (input records, output chunk)."""
+        transformation_type = validated_input.transformation_type
+        if transformation_type not in STREAMABLE_TRANSFORMATIONS:
+            raise ProcessorConfigurationError(
+                processor=self.__class__.__name__,
+                message=f"Transformation '{transformation_type}' cannot be streamed",
+            )
+
+        async for chunk in _source_chunks(validated_input.source_data):
+            transformed = await self.run_cpu_bound(
+                transform_chunk,
+                transformation_type,
+                chunk,
+                validated_input.transformation_config,
+                payload=chunk,
+            )
+            yield len(chunk), transformed
+
     async def post_process(self, output: AdapterProcessorOutput) -> dict[str, Any]:
         """Transform AdapterProcessorOutput into serializable dictionary.
 
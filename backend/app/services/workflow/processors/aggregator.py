@@ -4,6 +4,8 @@ TAG: [SPEC-012] [PROCESSOR] [AGGREGATOR]
 REQ: REQ-012-015 - Data aggregation from multiple sources
 """
 
+import asyncio
+from collections.abc import AsyncIterator
 from typing import Any
 
 from pydantic import ValidationError
@@ -12,6 +14,155 @@ from app.schemas.processors import AggregatorProcessorInput, AggregatorProcessor
 from app.services.workflow.context import ExecutionContext
 from app.services.workflow.processors.base import BaseProcessor, ProcessorConfig
 from app.services.workflow.processors.errors import ProcessorValidationError
+from app.services.workflow.streaming import is_stream
+
+
+def aggregate_sources(
+    strategy: str, input_sources: dict[str, Any], config: dict[str, Any]
+) -> Any:
+    """Apply an aggregation strategy to input sources.
+
+    TAG: [SPEC-012] [PROCESSOR] [AGGREGATOR] [TRANSFORM]
+
+    Pure module-level function so it can run in the offload process pool.
+
+    Args:
+        strategy: Aggregation strategy name
+        input_sources: Source data keyed by source name
+        config: Aggregation configuration
+
+    Returns:
+        Aggregated result
+    """
+    aggregated_result: Any = None
+
+    if strategy == "merge":
+        # Merge all sources into single dict
+        aggregated_result = {}
+        for source_data in input_sources.values():
+            if isinstance(source_data, dict):
+                aggregated_result.update(source_data)
+
+    elif strategy == "list":
+        # Collect all sources into list
+        aggregated_result = []
+        for source_data in input_sources.values():
+            if isinstance(source_data, list):
+                aggregated_result.extend(source_data)
+            else:
+                aggregated_result.append(source_data)
+
+    elif strategy == "reduce":
+        # Reduce sources using operation
+        operation = config.get("operation", "sum")
+        values = list(input_sources.values())
+
+        if operation == "sum":
+            aggregated_result = sum(values)
+        elif operation == "concatenate":
+            aggregated_result = "".join(str(v) for v in values)
+        elif operation == "average":
+            aggregated_result = sum(values) / len(values) if values else 0
+        else:
+            aggregated_result = values
+
+    else:  # custom
+        # Custom aggregation - pass through
+        aggregated_result = {"sources": input_sources}
+
+    return aggregated_result
+
+
+async def _source_chunks(source: Any) -> AsyncIterator[list[Any]]:
+    """Iterate a source as chunks; a plain value is a single record."""
+    if is_stream(source):
+        async for chunk in source:
+            yield chunk
+    else:
+        yield [source]
+
+
+async def _fold_source(strategy: str, operation: str, source: Any) -> Any:
+    """Fold one source into a partial aggregate as its chunks arrive."""
+    if strategy == "merge":
+        merged: dict[str, Any] = {}
+        async for chunk in _source_chunks(source):
+            for record in chunk:
+                if isinstance(record, dict):
+                    merged.update(record)
+        return merged
+
+    if strategy == "reduce" and operation in ("sum", "average"):
+        total: Any = 0
+        count = 0
+        async for chunk in _source_chunks(source):
+            total += sum(chunk)
+            count += len(chunk)
+        return total, count
+
+    if strategy == "custom" and not is_stream(source):
+        return source
+
+    if strategy == "list" and isinstance(source, list):
+        return list(source)
+
+    records: list[Any] = []
+    async for chunk in _source_chunks(source):
+        records.extend(chunk)
+    return records
+
+
+async def aggregate_streams(
+    strategy: str, input_sources: dict[str, Any], config: dict[str, Any]
+) -> Any:
+    """Apply an aggregation strategy to sources that may be chunk streams.
+
+    TAG: [SPEC-012] [PROCESSOR] [AGGREGATOR] [STREAMING]
+
+    All sources are consumed concurrently, so no producer is held up by
+    back-pressure while another source is read. Streamed records are folded
+    as they arrive; sum and average never hold the records in memory.
+    Non-stream sources keep the semantics of aggregate_sources.
+
+    Args:
+        strategy: Aggregation strategy name
+        input_sources: Source data or chunk streams keyed by source name
+        config: Aggregation configuration
+
+    Returns:
+        Aggregated result
+    """
+    operation = config.get("operation", "sum")
+
+    async with asyncio.TaskGroup() as tg:
+        tasks = {
+            name: tg.create_task(_fold_source(strategy, operation, source))
+            for name, source in input_sources.items()
+        }
+    partials = [task.result() for task in tasks.values()]
+
+    if strategy == "merge":
+        merged: dict[str, Any] = {}
+        for partial in partials:
+            merged.update(partial)
+        return merged
+
+    if strategy == "list":
+        return [record for partial in partials for record in partial]
+
+    if strategy == "reduce":
+        if operation == "sum":
+            return sum(total for total, _ in partials)
+        if operation == "average":
+            count = sum(count for _, count in partials)
+            return sum(total for total, _ in partials) / count if count else 0
+        values = [value for partial in partials for value in partial]
+        if operation == "concatenate":
+            return "".join(str(v) for v in values)
+        return values
+
+    # custom - pass through with streams materialized
+    return {"sources": dict(zip(tasks, partials, strict=True))}
 
 
 class AggregatorNodeProcessor(
@@ -28,6 +179,9 @@ class AggregatorNodeProcessor(
     2. Apply aggregation strategy to input sources
     3. Return aggregated result with source count
 
+    Sources given as chunk streams are aggregated incrementally as their
+    chunks arrive (see aggregate_streams).
+
     Attributes:
         input_schema: AggregatorProcessorInput schema
         output_schema: AggregatorProcessorOutput schema
@@ -91,48 +245,23 @@ class AggregatorNodeProcessor(
         """
         strategy = validated_input.strategy
         input_sources = validated_input.input_sources
-        config = validated_input.aggregation_config
-
-        source_count = len(input_sources)
-        aggregated_result: Any = None
-
-        if strategy == "merge":
-            # Merge all sources into single dict
-            aggregated_result = {}
-            for source_data in input_sources.values():
-                if isinstance(source_data, dict):
-                    aggregated_result.update(source_data)
-
-        elif strategy == "list":
-            # Collect all sources into list
-            aggregated_result = []
-            for source_data in input_sources.values():
-                if isinstance(source_data, list):
-                    aggregated_result.extend(source_data)
-                else:
-                    aggregated_result.append(source_data)
-
-        elif strategy == "reduce":
-            # Reduce sources using operation
-            operation = config.get("operation", "sum")
-            values = list(input_sources.values())
-
-            if operation == "sum":
-                aggregated_result = sum(values)
-            elif operation == "concatenate":
-                aggregated_result = "".join(str(v) for v in values)
-            elif operation == "average":
-                aggregated_result = sum(values) / len(values) if values else 0
-            else:
-                aggregated_result = values
 
-        else:  # custom
-            # Custom aggregation - pass through
-            aggregated_result = {"sources": input_sources}
+        if any(is_stream(source) for source in input_sources.values()):
+            aggregated_result = await aggregate_streams(
+                strategy, input_sources, validated_input.aggregation_config
+            )
+        else:
+            aggregated_result = await self.run_cpu_bound(
+                aggregate_sources,
+                strategy,
+                input_sources,
+                validated_input.aggregation_config,
+                payload=input_sources,
+            )
 
         return AggregatorProcessorOutput(
             aggregated_result=aggregated_result,
-            source_count=source_count,
+            source_count=len(input_sources),
             strategy_used=strategy,
         )
 
@@ -7,23 +7,30 @@ REQ: REQ-012-001, REQ-012-002, REQ-012-003, REQ-012-004, REQ-012-005
 import asyncio
 import time
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any, Generic, TypeVar
 
 from pydantic import BaseModel
 
+from app.core.config import settings
 from app.models.workflow import Node
+from app.services.workflow.circuit_breaker import CircuitBreaker, get_circuit_breakers
 from app.services.workflow.context import ExecutionContext
+from app.services.workflow.exceptions import CircuitOpenError
 
 from .errors import (
+    ProcessorConfigurationError,
     ProcessorExecutionError,
     ProcessorTimeoutError,
 )
 from .metrics import MetricsCollector, ProcessorMetrics
+from .offload import get_offloader
 
 InputT = TypeVar("InputT", bound=BaseModel)
 OutputT = TypeVar("OutputT", bound=BaseModel)
+T = TypeVar("T")
 
 
 @dataclass
@@ -62,6 +69,7 @@ class BaseProcessor(ABC, Generic[InputT, OutputT]):
 
     Provides:
     - Lifecycle hooks (pre_process, process, post_process)
+    - Optional streaming output (stream, publish)
     - Input/output validation
     - Error handling with retry logic
     - Metrics collection
@@ -215,12 +223,57 @@ class BaseProcessor(ABC, Generic[InputT, OutputT]):
             Serializable dictionary for downstream consumption
         """
 
+    def stream(self, validated_input: InputT) -> AsyncIterator[list[Any]]:  # noqa: ARG002
+        """Yield the output as record chunks instead of one complete result.
+
+        TAG: [SPEC-012] [PROCESSOR] [STREAMING]
+
+        Streaming processors override this with an async generator.
+
+        Args:
+            validated_input: Validated input model from pre_process
+
+        Returns:
+            Async iterator over lists of output records
+
+        Raises:
+            ProcessorConfigurationError: If the processor cannot stream
+        """
+        raise ProcessorConfigurationError(
+            processor=self.__class__.__name__,
+            message="Streaming output is not supported",
+        )
+
+    async def publish(self, raw_inputs: dict[str, Any]) -> dict[str, Any]:
+        """Stream the output to downstream nodes through the context.
+
+        TAG: [SPEC-012] [PROCESSOR] [STREAMING]
+
+        Chunks go to the node's context stream as they are produced; the
+        stored node output only summarizes the stream. Consumers must have
+        subscribed to the stream before this is called.
+
+        Args:
+            raw_inputs: Raw input data from previous node or trigger
+
+        Returns:
+            Stream summary with chunk and record counts
+        """
+        validated_input = await self.pre_process(raw_inputs)
+        stream = await self.context.get_stream(self.node.id)
+        records = await stream.pump(self.stream(validated_input))
+        output = {"streamed": True, "chunks": stream.chunks_sent, "records": records}
+        await self.context.set_output(self.node.id, output)
+        return output
+
     async def _execute_with_retry(self, validated_input: InputT) -> OutputT:
         """Execute process() with retry logic.
 
         TAG: [SPEC-012] [PROCESSOR] [RETRY]
 
         Implements exponential backoff retry for configured exception types.
+        Nodes calling a tool or LLM provider fail fast while its circuit is
+        open and retry only within the shared retry budget.
 
         Args:
             validated_input: Validated input to pass to process()
@@ -229,19 +282,29 @@ class BaseProcessor(ABC, Generic[InputT, OutputT]):
             Output from process()
 
         Raises:
-            ProcessorExecutionError: If all retries exhausted
+            ProcessorExecutionError: If all retries exhausted, the retry
+                budget is spent or the circuit is open
             ProcessorTimeoutError: If execution exceeds timeout
         """
         last_exception = None
         retry_count = 0
+        circuits = get_circuit_breakers()
+        breaker = circuits.for_node(self.node)
+        if breaker is not None:
+            await circuits.retry_budget.deposit(breaker.name)
 
         for attempt in range(self.config.max_retries + 1):
+            if breaker is not None and not breaker.allow():
+                error = CircuitOpenError(breaker.name, breaker.retry_after)
+                raise ProcessorExecutionError(
+                    processor=self.__class__.__name__,
+                    node_id=str(self.node.id),
+                    message=str(error),
+                    retry_count=retry_count,
+                ) from error
             try:
                 # Execute with timeout
-                return await asyncio.wait_for(
-                    self.process(validated_input),
-                    timeout=self.config.timeout_seconds,
-                )
+                return await self._process_with_circuit(validated_input, breaker)
             except TimeoutError:
                 # Timeout is NOT retriable - raise immediately
                 raise ProcessorTimeoutError(
@@ -264,6 +327,16 @@ class BaseProcessor(ABC, Generic[InputT, OutputT]):
 
                 # Don't delay after last attempt
                 if attempt < self.config.max_retries:
+                    if (
+                        breaker is not None
+                        and not await circuits.retry_budget.try_withdraw(breaker.name)
+                    ):
+                        raise ProcessorExecutionError(
+                            processor=self.__class__.__name__,
+                            node_id=str(self.node.id),
+                            message=f"retry budget of {breaker.name} exhausted: {e}",
+                            retry_count=retry_count,
+                        ) from e
                     # Calculate exponential backoff delay
                     delay = min(
                         self.config.initial_delay_seconds
@@ -288,6 +361,80 @@ class BaseProcessor(ABC, Generic[InputT, OutputT]):
             retry_count=retry_count,
         ) from last_exception
 
+    async def _process_with_circuit(
+        self, validated_input: InputT, breaker: CircuitBreaker | None
+    ) -> OutputT:
+        """Run one process() attempt and report its outcome to the circuit.
+
+        Args:
+            validated_input: Validated input to pass to process()
+            breaker: Circuit of the node's dependency, if any
+
+        Returns:
+            Output from process()
+        """
+        try:
+            output = await asyncio.wait_for(
+                self.process(validated_input),
+                timeout=self.config.timeout_seconds,
+            )
+        except asyncio.CancelledError:
+            if breaker is not None:
+                breaker.abandon()
+            raise
+        except Exception as e:
+            if breaker is not None:
+                breaker.record_failure(e)
+            raise
+        if breaker is not None:
+            breaker.record_success()
+        return output
+
+    def offload_enabled(self) -> bool:
+        """Check whether CPU-bound work of this node may use the process pool.
+
+        TAG: [SPEC-012] [PROCESSOR] [OFFLOAD]
+
+        A boolean ``offload`` key in the node config takes precedence;
+        otherwise the node type must be listed in PROCESS_POOL_NODE_TYPES.
+
+        Returns:
+            True if offloading is allowed for this node
+        """
+        if not settings.PROCESS_POOL_ENABLED:
+            return False
+        node_config = getattr(self.node, "config", None) or {}
+        flag = node_config.get("offload")
+        if isinstance(flag, bool):
+            return flag
+        node_type = getattr(self.node.node_type, "value", self.node.node_type)
+        return node_type in settings.PROCESS_POOL_NODE_TYPES
+
+    async def run_cpu_bound(
+        self, fn: Callable[..., T], *args: Any, payload: Any = None
+    ) -> T:
+        """Run a pure CPU-bound transform, in the process pool when worthwhile.
+
+        TAG: [SPEC-012] [PROCESSOR] [OFFLOAD]
+
+        The transform runs in a worker process when offloading is enabled for
+        the node and ``payload`` meets the size threshold; otherwise it runs
+        inline. Timeouts from _execute_with_retry cancel queued pool work.
+
+        Args:
+            fn: Module-level (picklable) transform function
+            *args: Picklable positional arguments for fn
+            payload: Data used to decide whether offloading pays off
+
+        Returns:
+            Result of fn(*args)
+        """
+        if self.offload_enabled():
+            offloader = get_offloader()
+            if offloader.should_offload(payload):
+                return await offloader.run(fn, *args)
+        return fn(*args)
+
     # Context helper methods
     def get_variable(self, path: str, default: Any = None) -> Any:
         """Get variable from execution context.
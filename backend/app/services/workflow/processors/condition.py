@@ -4,14 +4,20 @@ TAG: [SPEC-012] [PROCESSOR] [CONDITION]
 REQ: REQ-012-012 - Condition evaluation and branching
 """
 
+from contextlib import aclosing
 from typing import Any
 
 from pydantic import ValidationError
 
-from app.schemas.processors import ConditionProcessorInput, ConditionProcessorOutput
+from app.schemas.processors import (
+    ConditionExpression,
+    ConditionProcessorInput,
+    ConditionProcessorOutput,
+)
 from app.services.workflow.context import ExecutionContext
 from app.services.workflow.processors.base import BaseProcessor, ProcessorConfig
 from app.services.workflow.processors.errors import ProcessorValidationError
+from app.services.workflow.streaming import is_stream
 
 
 class ConditionNodeProcessor(
@@ -29,6 +35,11 @@ class ConditionNodeProcessor(
     3. Select first matching condition
     4. Return target node and evaluation results
 
+    When ``data`` in the evaluation context is a chunk stream, conditions are
+    evaluated per record as chunks arrive; a condition matches if any record
+    matches. Consumption stops as soon as the first condition has matched,
+    since no later record can change the selected branch.
+
     Attributes:
         input_schema: ConditionProcessorInput schema
         output_schema: ConditionProcessorOutput schema
@@ -92,6 +103,9 @@ class ConditionNodeProcessor(
         conditions = validated_input.conditions
         context = validated_input.evaluation_context
 
+        if is_stream(context.get("data")):
+            return await self._evaluate_stream(conditions, context)
+
         evaluated_results = []
         selected_branch = None
         target_node = None
@@ -143,6 +157,71 @@ class ConditionNodeProcessor(
             evaluated_conditions=evaluated_results,
         )
 
+    async def _evaluate_stream(
+        self,
+        conditions: list[ConditionExpression],
+        context: dict[str, Any],
+    ) -> ConditionProcessorOutput:
+        """Evaluate conditions against streamed records.
+
+        TAG: [SPEC-012] [PROCESSOR] [CONDITION] [STREAMING]
+
+        Args:
+            conditions: Conditions in priority order
+            context: Evaluation context whose ``data`` is a chunk stream
+
+        Returns:
+            ConditionProcessorOutput with selected branch and evaluation results
+        """
+        matched = [False] * len(conditions)
+        records_evaluated = 0
+
+        async with aclosing(context["data"]) as chunks:
+            async for chunk in chunks:
+                for record in chunk:
+                    records_evaluated += 1
+                    eval_context = {**context, "data": record}
+                    for index, condition in enumerate(conditions):
+                        if matched[index]:
+                            continue
+                        try:
+                            result = eval(
+                                condition.expression,
+                                {"__builtins__": {}},
+                                eval_context,
+                            )
+                        except Exception:
+                            # If evaluation fails, treat as False
+                            result = False
+                        matched[index] = bool(result)
+                    if matched and matched[0]:
+                        break
+                if matched and matched[0]:
+                    break
+
+        evaluated_results = [
+            {
+                "name": condition.name,
+                "expression": condition.expression,
+                "result": matched[index],
+                "target_node": condition.target_node,
+                "records_evaluated": records_evaluated,
+            }
+            for index, condition in enumerate(conditions)
+        ]
+
+        # First matching condition wins; the last condition is the default
+        selected = next(
+            (c for c, hit in zip(conditions, matched, strict=True) if hit),
+            conditions[-1] if conditions else None,
+        )
+
+        return ConditionProcessorOutput(
+            selected_branch=selected.name if selected else "default",
+            target_node=selected.target_node if selected else "default",
+            evaluated_conditions=evaluated_results,
+        )
+
     async def post_process(self, output: ConditionProcessorOutput) -> dict[str, Any]:
         """Transform ConditionProcessorOutput into serializable dictionary.
 
@@ -0,0 +1,211 @@
+"""Process Pool Offload for CPU-bound Processors.
+
+TAG: [SPEC-012] [PROCESSOR] [OFFLOAD]
+
+Pure-Python transforms (adapter and aggregator processors) hold the GIL and
+block the event loop while they run, stalling every other execution in the
+process. ProcessPoolOffloader runs such transforms in a managed
+ProcessPoolExecutor so the loop stays responsive to I/O-bound nodes.
+
+Offloaded callables must be module-level functions with picklable arguments
+and results. Small payloads are run inline because pickling them costs more
+than the transform itself.
+
+Cancellation:
+    Cancelling the awaiting task (e.g. a processor timeout) cancels work that
+    has not started in a worker yet. Work already running in a worker cannot
+    be interrupted; it runs to completion and its result is discarded.
+"""
+
+import asyncio
+import importlib
+import multiprocessing
+import os
+from collections.abc import Callable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, TypeVar
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+def _warm_up() -> int:
+    """Import transform modules in a worker process.
+
+    Returns:
+        Worker process ID
+    """
+    importlib.import_module("app.services.workflow.processors.adapter")
+    importlib.import_module("app.services.workflow.processors.aggregator")
+    return os.getpid()
+
+
+def estimate_payload_items(payload: Any, limit: int) -> int:
+    """Count container items in a payload, stopping once limit is reached.
+
+    TAG: [SPEC-012] [PROCESSOR] [OFFLOAD] [PAYLOAD]
+
+    Serves as a cheap proxy for transform cost without serializing the
+    payload.
+
+    Args:
+        payload: Nested dict/list/tuple/set structure
+        limit: Count at which to stop walking
+
+    Returns:
+        Number of items visited, capped at limit
+    """
+    count = 0
+    stack = [payload]
+    while stack and count < limit:
+        value = stack.pop()
+        if isinstance(value, Mapping):
+            count += len(value)
+            stack.extend(value.values())
+        elif isinstance(value, list | tuple | set | frozenset):
+            count += len(value)
+            stack.extend(value)
+    return min(count, limit)
+
+
+class ProcessPoolOffloader:
+    """Managed process pool for CPU-bound processor transforms.
+
+    TAG: [SPEC-012] [PROCESSOR] [OFFLOAD]
+
+    Workers are spawned (not forked) so they never inherit the parent's event
+    loop, sockets or database connections.
+
+    Example:
+        offloader = get_offloader()
+        await offloader.start()
+        result = await offloader.run(apply_transformation, "filtering", data, cfg)
+
+    Attributes:
+        max_workers: Number of worker processes
+        min_payload_items: Payload size below which work runs inline
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        min_payload_items: int | None = None,
+    ) -> None:
+        """Initialize the offloader without starting workers.
+
+        Args:
+            max_workers: Worker processes (default from settings, then CPU count)
+            min_payload_items: Inline threshold (default from settings)
+        """
+        self.max_workers = (
+            max_workers or settings.PROCESS_POOL_MAX_WORKERS or os.cpu_count() or 1
+        )
+        self.min_payload_items = (
+            settings.PROCESS_POOL_MIN_PAYLOAD_ITEMS
+            if min_payload_items is None
+            else min_payload_items
+        )
+        self._pool: ProcessPoolExecutor | None = None
+
+    @property
+    def started(self) -> bool:
+        """Whether the worker pool exists."""
+        return self._pool is not None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._pool
+
+    async def start(self) -> None:
+        """Create the pool and warm every worker.
+
+        Spawning a worker and importing the application takes far longer than
+        a typical transform, so this should run at process startup rather
+        than on the first large payload.
+        """
+        pool = self._get_pool()
+        loop = asyncio.get_running_loop()
+        pids = await asyncio.gather(
+            *(loop.run_in_executor(pool, _warm_up) for _ in range(self.max_workers))
+        )
+        logger.info(f"Processor offload pool started with {len(set(pids))} worker(s)")
+
+    def should_offload(self, payload: Any) -> bool:
+        """Check whether a payload is large enough to be worth offloading.
+
+        Args:
+            payload: Transform input
+
+        Returns:
+            True if the payload meets the size threshold
+        """
+        if self.min_payload_items <= 0:
+            return True
+        return (
+            estimate_payload_items(payload, self.min_payload_items)
+            >= self.min_payload_items
+        )
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run a function in a worker process.
+
+        Args:
+            fn: Module-level (picklable) function
+            *args: Picklable positional arguments
+
+        Returns:
+            Result of fn(*args)
+
+        Raises:
+            Any exception raised by fn, re-raised in the caller
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_pool(), fn, *args)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down workers and cancel queued work.
+
+        Args:
+            wait: Whether to wait for running work to finish
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
+
+
+# Module-level singleton for convenience
+_offloader: ProcessPoolOffloader | None = None
+
+
+def get_offloader() -> ProcessPoolOffloader:
+    """Get the global process pool offloader singleton.
+
+    TAG: [SPEC-012] [PROCESSOR] [OFFLOAD] [SINGLETON]
+
+    Returns:
+        The global ProcessPoolOffloader instance (creates on first call)
+    """
+    global _offloader
+    if _offloader is None:
+        _offloader = ProcessPoolOffloader()
+    return _offloader
+
+
+def shutdown_offloader(wait: bool = True) -> None:
+    """Shut down the global offloader if it was created.
+
+    Args:
+        wait: Whether to wait for running work to finish
+    """
+    global _offloader
+    if _offloader is not None:
+        _offloader.shutdown(wait=wait)
+        _offloader = None
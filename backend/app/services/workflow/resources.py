@@ -0,0 +1,391 @@
+"""Resource classes with separate node slot pools.
+
+TAG: [SPEC-011] [EXECUTION] [RESOURCES]
+
+Nodes differ widely in cost: an LLM agent call takes seconds and is rate
+limited upstream, an HTTP tool call mostly waits on the network, and an
+adapter transform finishes in microseconds. Each node runs in a resource
+class with its own process-wide pool, so cheap nodes never queue behind
+expensive ones:
+
+- RESOURCE_CLASS_SLOTS: capacity per class.
+- RESOURCE_CLASS_BY_NODE_TYPE: default class per node type; other types use
+  RESOURCE_CLASS_DEFAULT.
+- Node config overrides both:
+
+    {"resource_class": "http"}                       # pool to run in
+    {"resource_class": "llm", "resource_weight": 2}  # slots taken in it
+
+A node waits for its resource slots before it takes an execution slot
+(max_parallel_nodes) and an admission slot, so nodes waiting on a busy
+class hold no other slot.
+
+Classes listed in RESOURCE_CLASS_MAX_SLOTS adapt their limit (AIMD): every
+node attempt within the class latency target adds 1/limit (about one slot
+per round of completions) up to the maximum, while a timeout, a failed
+connection, a 429/5xx response, a slow attempt or an error rate above AIMD_ERROR_RATE_TARGET
+multiplies the limit by AIMD_DECREASE_FACTOR, at most once per
+AIMD_DECREASE_COOLDOWN seconds.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from typing import Any, Protocol
+
+from app.core.config import settings
+from app.services.workflow.exceptions import NodeTimeoutError
+
+logger = logging.getLogger(__name__)
+
+# Node config keys selecting the resource class and slot weight
+RESOURCE_CLASS_CONFIG_KEY = "resource_class"
+RESOURCE_WEIGHT_CONFIG_KEY = "resource_weight"
+
+# Smoothing factor of the error rate moving average
+_ERROR_RATE_ALPHA = 0.1
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """Check whether a node failure signals an overloaded upstream.
+
+    Timeouts, refused or dropped connections and HTTP 429/5xx responses
+    count, including when wrapped by another exception.
+
+    Args:
+        error: Exception raised by a node attempt
+
+    Returns:
+        True if the resource class should back off
+    """
+    seen: set[int] = set()
+    current: BaseException | None = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, NodeTimeoutError | TimeoutError | ConnectionError):
+            return True
+        response = getattr(current, "response", None)
+        status_code = getattr(current, "status_code", None) or getattr(
+            response, "status_code", None
+        )
+        if isinstance(status_code, int) and (status_code == 429 or status_code >= 500):
+            return True
+        current = current.__cause__ or current.__context__
+    return False
+
+
+class _ResourceNode(Protocol):
+    @property
+    def node_type(self) -> Any: ...
+    @property
+    def config(self) -> Mapping[str, Any] | None: ...
+
+
+class ResourcePool:
+    """Weighted FIFO slot pool of one resource class.
+
+    TAG: [SPEC-011] [EXECUTION] [RESOURCES]
+
+    Waiters are admitted in arrival order, so a heavy node is not starved by
+    a stream of light ones. With max_capacity above the initial capacity,
+    the limit adapts to observed latency and errors (AIMD).
+
+    Attributes:
+        name: Resource class name
+        max_capacity: Upper bound of the limit
+        latency_target: Attempt latency in seconds above which it shrinks
+    """
+
+    def __init__(
+        self,
+        name: str,
+        capacity: int,
+        max_capacity: int | None = None,
+        latency_target: float | None = None,
+    ) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            name: Resource class name
+            capacity: Initial number of slots (at least 1)
+            max_capacity: Upper bound of an adaptive limit (fixed if None)
+            latency_target: Latency target in seconds (None: errors only)
+        """
+        self.name = name
+        self.max_capacity = max(1, capacity, max_capacity or 0)
+        self.latency_target = latency_target
+        self._adaptive = max_capacity is not None
+        self._limit = float(max(1, capacity))
+        self._error_rate = 0.0
+        self._last_decrease = float("-inf")
+        self._in_use = 0
+        self._waiters: deque[tuple[int, asyncio.Future[None]]] = deque()
+
+    @property
+    def capacity(self) -> int:
+        """Current number of slots."""
+        return int(self._limit)
+
+    @property
+    def in_use(self) -> int:
+        """Number of slots currently held."""
+        return self._in_use
+
+    def clamp(self, weight: int) -> int:
+        """Limit a slot weight to the pool size.
+
+        Args:
+            weight: Requested slots
+
+        Returns:
+            Slots actually taken (1..max_capacity)
+        """
+        return min(max(1, weight), self.max_capacity)
+
+    def _fits(self, weight: int) -> bool:
+        # An empty pool admits a node heavier than a shrunken limit
+        return self._in_use == 0 or self._in_use + weight <= self.capacity
+
+    async def acquire(self, weight: int = 1) -> None:
+        """Wait until weight slots are free and take them.
+
+        Args:
+            weight: Slots to take (clamped to 1..max_capacity)
+        """
+        weight = self.clamp(weight)
+        if not self._waiters and self._fits(weight):
+            self._in_use += weight
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append((weight, future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Admitted just before the cancellation landed
+                self.release(weight)
+            else:
+                self._waiters.remove((weight, future))
+                self._wake()
+            raise
+
+    def release(self, weight: int = 1) -> None:
+        """Return weight slots and admit waiters that now fit.
+
+        Args:
+            weight: Slots to return (clamped like in acquire)
+        """
+        self._in_use -= self.clamp(weight)
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters:
+            weight, future = self._waiters[0]
+            if not self._fits(weight):
+                return
+            self._waiters.popleft()
+            self._in_use += weight
+            future.set_result(None)
+
+    def record(self, latency: float, error: BaseException | None = None) -> None:
+        """Adapt the limit to the result of one node attempt.
+
+        Args:
+            latency: Attempt duration in seconds
+            error: Exception raised by the attempt, if any
+        """
+        if not self._adaptive:
+            return
+
+        self._error_rate += _ERROR_RATE_ALPHA * ((error is not None) - self._error_rate)
+        overloaded = (
+            (error is not None and is_overload_error(error))
+            or (self.latency_target is not None and latency > self.latency_target)
+            or self._error_rate > settings.AIMD_ERROR_RATE_TARGET
+        )
+
+        if overloaded:
+            now = time.monotonic()
+            if now - self._last_decrease < settings.AIMD_DECREASE_COOLDOWN:
+                return
+            self._last_decrease = now
+            limit = max(1.0, self._limit * settings.AIMD_DECREASE_FACTOR)
+            if int(limit) != self.capacity:
+                logger.info(
+                    f"Resource class {self.name!r} limit decreased to {int(limit)}"
+                )
+            self._limit = limit
+        elif error is None:
+            self._limit = min(float(self.max_capacity), self._limit + 1.0 / self._limit)
+            self._wake()
+
+    def metrics(self) -> dict[str, Any]:
+        """Snapshot of the pool state.
+
+        Returns:
+            Dictionary with limit, usage and error rate
+        """
+        return {
+            "limit": self.capacity,
+            "max_limit": self.max_capacity,
+            "adaptive": self._adaptive,
+            "in_use": self._in_use,
+            "waiting": len(self._waiters),
+            "error_rate": round(self._error_rate, 4),
+        }
+
+    @asynccontextmanager
+    async def slot(self, weight: int = 1) -> AsyncIterator[None]:
+        """Hold weight slots for the duration of the block.
+
+        Args:
+            weight: Slots to take
+        """
+        await self.acquire(weight)
+        try:
+            yield
+        finally:
+            self.release(weight)
+
+
+class ResourcePools:
+    """Process-wide resource pools, one per configured class.
+
+    TAG: [SPEC-011] [EXECUTION] [RESOURCES]
+    """
+
+    def __init__(
+        self,
+        capacities: Mapping[str, int] | None = None,
+        class_by_node_type: Mapping[str, str] | None = None,
+        default_class: str | None = None,
+        max_capacities: Mapping[str, int] | None = None,
+        latency_targets: Mapping[str, float] | None = None,
+    ) -> None:
+        """Initialize the pools.
+
+        Args:
+            capacities: Initial slots per class (default from settings)
+            class_by_node_type: Default class per node type (default from
+                settings)
+            default_class: Class of node types without a mapping (default
+                from settings)
+            max_capacities: Upper limit of adaptive classes (default from
+                settings)
+            latency_targets: Latency target per adaptive class in seconds
+                (default from settings)
+        """
+        capacities = (
+            capacities if capacities is not None else settings.RESOURCE_CLASS_SLOTS
+        )
+        max_capacities = (
+            max_capacities
+            if max_capacities is not None
+            else settings.RESOURCE_CLASS_MAX_SLOTS
+        )
+        latency_targets = (
+            latency_targets
+            if latency_targets is not None
+            else settings.RESOURCE_CLASS_LATENCY_TARGETS
+        )
+        self._pools = {
+            name: ResourcePool(
+                name,
+                capacity,
+                max_capacity=max_capacities.get(name),
+                latency_target=latency_targets.get(name),
+            )
+            for name, capacity in capacities.items()
+        }
+        self._class_by_node_type = dict(
+            class_by_node_type
+            if class_by_node_type is not None
+            else settings.RESOURCE_CLASS_BY_NODE_TYPE
+        )
+        self.default_class = default_class or settings.RESOURCE_CLASS_DEFAULT
+        if self.default_class not in self._pools:
+            self._pools[self.default_class] = ResourcePool(self.default_class, 1)
+
+    def pool(self, name: str) -> ResourcePool:
+        """Get the pool of a resource class.
+
+        Args:
+            name: Resource class name
+
+        Returns:
+            ResourcePool of the class (the default class if unknown)
+        """
+        return self._pools.get(name) or self._pools[self.default_class]
+
+    def resource_class(self, node: _ResourceNode) -> str:
+        """Resolve the resource class of a node.
+
+        Args:
+            node: Node or PlanNode
+
+        Returns:
+            Configured class name
+        """
+        node_type = str(getattr(node.node_type, "value", node.node_type))
+        default = self._class_by_node_type.get(node_type, self.default_class)
+        name = str((node.config or {}).get(RESOURCE_CLASS_CONFIG_KEY, default))
+        if name not in self._pools:
+            logger.warning(
+                f"Unknown resource class {name!r}, using {default!r} instead"
+            )
+            name = default if default in self._pools else self.default_class
+        return name
+
+    def for_node(self, node: _ResourceNode) -> tuple[ResourcePool, int]:
+        """Get the pool and slot weight a node runs with.
+
+        Args:
+            node: Node or PlanNode
+
+        Returns:
+            Tuple of (pool, slots taken in it)
+        """
+        pool = self.pool(self.resource_class(node))
+        try:
+            weight = int((node.config or {}).get(RESOURCE_WEIGHT_CONFIG_KEY, 1))
+        except (TypeError, ValueError):
+            weight = 1
+        return pool, pool.clamp(weight)
+
+    def metrics(self) -> dict[str, dict[str, Any]]:
+        """Snapshot of every pool, keyed by resource class.
+
+        Returns:
+            Dictionary of pool metrics
+        """
+        return {name: pool.metrics() for name, pool in self._pools.items()}
+
+
+# Module-level singleton shared by all executors of the process
+_pools: ResourcePools | None = None
+
+
+def get_resource_pools() -> ResourcePools:
+    """Get the global resource pools singleton.
+
+    TAG: [SPEC-011] [EXECUTION] [RESOURCES]
+
+    Returns:
+        The global ResourcePools instance (creates on first call)
+    """
+    global _pools
+    if _pools is None:
+        _pools = ResourcePools()
+    return _pools
+
+
+__all__ = [
+    "ResourcePool",
+    "ResourcePools",
+    "get_resource_pools",
+    "is_overload_error",
+]
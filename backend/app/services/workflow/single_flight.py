@@ -0,0 +1,199 @@
+"""Process-wide single-flight registry for identical node calls.
+
+TAG: [SPEC-011] [EXECUTION] [SINGLE-FLIGHT]
+
+When many executions run the same tool or agent call at once (e.g. every
+scheduled workflow fetching the same quote at market open), only the first
+one calls the dependency; the others await its result. Nodes opt in with a
+``single_flight`` key in their config:
+
+    {"single_flight": true}                     # default freshness window
+    {"single_flight": {"window_seconds": 2.0}}  # per-node window
+
+Calls are keyed by the content hash of the node run (see make_cache_key), so
+identical nodes of different workflows share flights. A completed result is
+still handed out for the freshness window after the call ends, which also
+catches executions arriving just too late to join the call. Failed calls
+are passed to the callers waiting at that moment and never kept; if the
+calling execution is cancelled, a waiting caller makes the call itself.
+"""
+
+import asyncio
+import copy
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any, Protocol
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Node config key enabling single-flight
+SINGLE_FLIGHT_CONFIG_KEY = "single_flight"
+
+
+class _FlightNode(Protocol):
+    @property
+    def config(self) -> Mapping[str, Any] | None: ...
+
+
+def get_single_flight_window(node: _FlightNode) -> float | None:
+    """Get the freshness window of a node, or None if it did not opt in.
+
+    Args:
+        node: Node or PlanNode
+
+    Returns:
+        Window in seconds, or None if single-flight is disabled for the node
+    """
+    option = (node.config or {}).get(SINGLE_FLIGHT_CONFIG_KEY)
+    if option is True:
+        return settings.SINGLE_FLIGHT_WINDOW
+    if isinstance(option, Mapping):
+        return float(option.get("window_seconds", settings.SINGLE_FLIGHT_WINDOW))
+    return None
+
+
+class SingleFlight:
+    """Registry of in-flight and recently completed node calls.
+
+    TAG: [SPEC-011] [EXECUTION] [SINGLE-FLIGHT]
+
+    Attributes:
+        max_entries: Completed results kept before the oldest are dropped
+    """
+
+    def __init__(self, max_entries: int | None = None) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            max_entries: Completed results kept (default from settings)
+        """
+        self.max_entries = max_entries or settings.SINGLE_FLIGHT_MAX_ENTRIES
+        self._flights: dict[str, asyncio.Future[Any]] = {}
+        self._results: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._shared = 0
+
+    def __len__(self) -> int:
+        """Return the number of in-flight calls."""
+        return len(self._flights)
+
+    def _get_fresh(self, key: str) -> tuple[bool, Any]:
+        entry = self._results.get(key)
+        if entry is None:
+            return False, None
+        result, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._results[key]
+            return False, None
+        # Callers own the returned result; the kept copy stays pristine
+        return True, copy.deepcopy(result)
+
+    def _keep(self, key: str, result: Any, window: float) -> None:
+        if window <= 0:
+            return
+        self._results[key] = (copy.deepcopy(result), time.monotonic() + window)
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+
+    async def run(
+        self,
+        key: str,
+        window: float,
+        call: Callable[[], Awaitable[Any]],
+    ) -> tuple[Any, bool]:
+        """Run a call unless an identical one is in flight or fresh.
+
+        Args:
+            key: Content hash of the call (see make_cache_key)
+            window: Seconds a completed result is handed out
+            call: Coroutine factory making the call
+
+        Returns:
+            Tuple of (result, shared), where shared is True if the result
+            came from another caller's call
+
+        Raises:
+            Exception: Whatever the call (or the call being awaited) raised
+        """
+        while True:
+            fresh, result = self._get_fresh(key)
+            if fresh:
+                self._shared += 1
+                return result, True
+
+            flight = self._flights.get(key)
+            if flight is None:
+                break
+
+            # asyncio.wait never cancels the flight when this caller is
+            # cancelled, and returns instead of raising when it ends
+            await asyncio.wait({flight})
+            if flight.cancelled():
+                # The calling execution was cancelled; try again
+                continue
+            self._shared += 1
+            return copy.deepcopy(flight.result()), True
+
+        flight = asyncio.get_running_loop().create_future()
+        self._flights[key] = flight
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except Exception as e:
+            flight.set_exception(e)
+            # Mark retrieved: nobody may be waiting for it
+            flight.exception()
+            raise
+        finally:
+            del self._flights[key]
+
+        self._keep(key, result, window)
+        flight.set_result(result)
+        return result, False
+
+    def metrics(self) -> dict[str, int]:
+        """Snapshot of the registry.
+
+        Returns:
+            Dictionary with in-flight calls, kept results and shared results
+        """
+        return {
+            "in_flight": len(self._flights),
+            "fresh_results": len(self._results),
+            "shared": self._shared,
+        }
+
+    def clear(self) -> None:
+        """Drop all kept results."""
+        self._results.clear()
+
+
+# Module-level singleton shared by all executors of the process
+_single_flight: SingleFlight | None = None
+
+
+def get_single_flight() -> SingleFlight:
+    """Get the global single-flight registry singleton.
+
+    TAG: [SPEC-011] [EXECUTION] [SINGLE-FLIGHT]
+
+    Returns:
+        The global SingleFlight instance (creates on first call)
+    """
+    global _single_flight
+    if _single_flight is None:
+        _single_flight = SingleFlight()
+    return _single_flight
+
+
+__all__ = [
+    "SingleFlight",
+    "get_single_flight",
+    "get_single_flight_window",
+]
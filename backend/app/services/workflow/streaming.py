@@ -0,0 +1,210 @@
+"""Streaming node outputs.
+
+TAG: [SPEC-011] [EXECUTION] [STREAMING]
+
+A streaming node publishes its output as record chunks (lists of records)
+instead of one complete dict, so downstream nodes start on the first chunk
+and no node holds the whole record set in memory.
+
+Each consumer reads from its own bounded queue. A producer sending to a full
+queue waits until that consumer catches up (back-pressure), so producers and
+consumers must run concurrently. Consumers subscribe before the producer
+sends its first chunk; a consumer that stops early releases the producer.
+
+Example:
+    stream = await context.get_stream(source_node.id)
+    chunks = stream.subscribe()           # before the producer starts
+    await stream.pump(producer_chunks)    # in the producer task
+    async for chunk in chunks: ...        # in the consumer task
+"""
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from app.core.config import settings
+from app.services.workflow.exceptions import StreamError
+
+
+@dataclass(frozen=True)
+class _StreamEnd:
+    """End-of-stream marker, carrying the producer error if it failed."""
+
+    error: BaseException | None = None
+
+
+def chunk_records(
+    records: Iterable[Any], size: int | None = None
+) -> Iterator[list[Any]]:
+    """Split records into chunks.
+
+    Args:
+        records: Records to split
+        size: Records per chunk (default from settings)
+
+    Yields:
+        Lists of at most size records
+    """
+    size = size or settings.STREAM_CHUNK_SIZE
+    chunk: list[Any] = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def is_stream(value: Any) -> bool:
+    """Check whether a node input value is a chunk stream.
+
+    Args:
+        value: Node input value
+
+    Returns:
+        True if value is an async iterable of record chunks
+    """
+    return isinstance(value, AsyncIterable)
+
+
+class RecordStream:
+    """Bounded single-producer, multi-consumer stream of record chunks.
+
+    TAG: [SPEC-011] [EXECUTION] [STREAMING]
+
+    Attributes:
+        maxsize: Chunks buffered per consumer
+        chunks_sent: Number of chunks sent so far
+        records_sent: Number of records sent so far
+    """
+
+    def __init__(self, maxsize: int | None = None) -> None:
+        """Initialize an open stream without consumers.
+
+        Args:
+            maxsize: Chunks buffered per consumer (default from settings)
+        """
+        self.maxsize = maxsize or settings.STREAM_QUEUE_SIZE
+        self.chunks_sent = 0
+        self.records_sent = 0
+        self._queues: list[asyncio.Queue[list[Any] | _StreamEnd]] = []
+        self._started = False
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        """Whether the producer has finished."""
+        return self._closed
+
+    def subscribe(self) -> AsyncIterator[list[Any]]:
+        """Register a consumer.
+
+        Returns:
+            Async iterator over the chunks sent from now on; it raises
+            StreamError if the producer fails
+
+        Raises:
+            StreamError: If the producer already started sending
+        """
+        if self._started:
+            raise StreamError("Cannot subscribe to a stream after it has started")
+        queue: asyncio.Queue[list[Any] | _StreamEnd] = asyncio.Queue(self.maxsize)
+        self._queues.append(queue)
+        return self._consume(queue)
+
+    async def _consume(
+        self, queue: asyncio.Queue[list[Any] | _StreamEnd]
+    ) -> AsyncIterator[list[Any]]:
+        try:
+            while True:
+                item = await queue.get()
+                if isinstance(item, _StreamEnd):
+                    if isinstance(item.error, StreamError):
+                        raise item.error
+                    if item.error is not None:
+                        # Chunks cannot be replayed, so consumers must not
+                        # retry on the producer's (possibly retriable) error
+                        raise StreamError(
+                            f"Stream producer failed: {item.error}"
+                        ) from item.error
+                    return
+                yield item
+        finally:
+            # Consumer finished or stopped early: stop feeding it and wake a
+            # producer blocked on its full queue
+            if queue in self._queues:
+                self._queues.remove(queue)
+            while not queue.empty():
+                queue.get_nowait()
+
+    async def send(self, chunk: list[Any]) -> None:
+        """Send a chunk to every consumer, waiting while any queue is full.
+
+        Args:
+            chunk: List of records
+
+        Raises:
+            StreamError: If the stream is closed
+        """
+        if self._closed:
+            raise StreamError("Cannot send to a closed stream")
+        self._started = True
+        for queue in list(self._queues):
+            await queue.put(chunk)
+        self.chunks_sent += 1
+        self.records_sent += len(chunk)
+
+    async def close(self, error: BaseException | None = None) -> None:
+        """Finish the stream.
+
+        On error, chunks still buffered are dropped so the error reaches
+        consumers without waiting for them to drain.
+
+        Args:
+            error: Producer failure to raise in consumers
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._started = True
+        end = _StreamEnd(error)
+        for queue in list(self._queues):
+            if error is None:
+                await queue.put(end)
+            else:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(end)
+
+    async def pump(self, chunks: AsyncIterable[list[Any]]) -> int:
+        """Send every chunk of a producer and close the stream.
+
+        Args:
+            chunks: Producer chunk iterator
+
+        Returns:
+            Number of records sent
+
+        Raises:
+            Any exception raised by the producer, after failing the stream
+        """
+        try:
+            async for chunk in chunks:
+                await self.send(chunk)
+        except asyncio.CancelledError:
+            await self.close(StreamError("Stream producer was cancelled"))
+            raise
+        except Exception as e:
+            await self.close(e)
+            raise
+        await self.close()
+        return self.records_sent
+
+
+__all__ = [
+    "RecordStream",
+    "chunk_records",
+    "is_stream",
+]
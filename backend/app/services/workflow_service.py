@@ -16,11 +16,12 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
 
 from app.models.workflow import Edge, Node, Workflow
+from app.services.workflow.plan import get_plan_cache
 
 if TYPE_CHECKING:
     from uuid import UUID
@@ -60,6 +61,20 @@ class VersionConflictError(WorkflowServiceError):
     """Raised when version conflict occurs during optimistic locking."""
 
 
+async def _bump_graph_version(db: AsyncSession, workflow_id: UUID) -> None:
+    """Bump the workflow version after a node or edge edit.
+
+    Execution plans are cached by (workflow_id, version) in every process,
+    so the new version makes all of them compile the edited graph.
+    """
+    await db.execute(
+        update(Workflow)
+        .where(Workflow.id == workflow_id)
+        .values(version=Workflow.version + 1, updated_at=datetime.now(UTC))
+    )
+    get_plan_cache().invalidate_after_commit(db, workflow_id)
+
+
 # =============================================================================
 # WorkflowService
 # =============================================================================
@@ -222,6 +237,7 @@ class WorkflowService:
 
         workflow.version += 1
         workflow.updated_at = datetime.now(UTC)
+        get_plan_cache().invalidate_after_commit(self.db, workflow_id)
 
         await self.db.flush()
         await self.db.refresh(workflow)
@@ -234,6 +250,7 @@ class WorkflowService:
             raise WorkflowNotFoundError(f"Workflow {workflow_id} not found")
 
         workflow.soft_delete()
+        get_plan_cache().invalidate_after_commit(self.db, workflow_id)
         await self.db.flush()
         await self.db.refresh(workflow)
         return workflow
@@ -350,6 +367,7 @@ class NodeService:
             self.db.add(node)
             await self.db.flush()
             await self.db.refresh(node)
+            await _bump_graph_version(self.db, workflow_id)
             return node
         except IntegrityError as e:
             raise InvalidNodeReferenceError(f"Invalid node reference: {e}") from e
@@ -382,6 +400,7 @@ class NodeService:
         node.updated_at = datetime.now(UTC)
         await self.db.flush()
         await self.db.refresh(node)
+        await _bump_graph_version(self.db, node.workflow_id)
         return node
 
     async def delete(self, node_id: UUID) -> Node:
@@ -392,6 +411,7 @@ class NodeService:
 
         await self.db.delete(node)
         await self.db.flush()
+        await _bump_graph_version(self.db, node.workflow_id)
         return node
 
     async def batch_create(self, workflow_id: UUID, nodes_data: Any) -> list[Node]:
@@ -434,6 +454,7 @@ class NodeService:
         for node in created_nodes:
             await self.db.refresh(node)
 
+        await _bump_graph_version(self.db, workflow_id)
         return created_nodes
 
 
@@ -470,6 +491,7 @@ class EdgeService:
             self.db.add(edge)
             await self.db.flush()
             await self.db.refresh(edge)
+            await _bump_graph_version(self.db, workflow_id)
             return edge
         except IntegrityError as e:
             raise InvalidNodeReferenceError(f"Invalid edge reference: {e}") from e
@@ -496,6 +518,7 @@ class EdgeService:
 
         await self.db.delete(edge)
         await self.db.flush()
+        await _bump_graph_version(self.db, edge.workflow_id)
         return edge
 
     async def batch_create(self, workflow_id: UUID, edges_data: Any) -> list[Edge]:
@@ -534,6 +557,7 @@ class EdgeService:
             for edge in created_edges:
                 await self.db.refresh(edge)
 
+            await _bump_graph_version(self.db, workflow_id)
             return created_edges
         except IntegrityError as e:
             raise InvalidNodeReferenceError(f"Invalid edge reference: {e}") from e
@@ -0,0 +1,241 @@
+"""Standalone workflow execution worker.
+
+TAG: [SPEC-011] [EXECUTION] [WORKER]
+
+Drains the execution queue (see app.services.execution_queue): the API only
+inserts PENDING WorkflowExecution rows, and any number of worker processes
+on any number of hosts claim and run them.
+
+Usage:
+    python -m app.worker --concurrency 8
+
+Each claimed execution runs in its own database session while a heartbeat
+task renews its lease in a separate session. If the lease cannot be renewed
+(execution cancelled or reclaimed), the executor is stopped.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import os
+import signal
+import socket
+import uuid
+from typing import TYPE_CHECKING
+
+from app.core.config import settings
+from app.core.logging import get_logger, setup_logging
+from app.db.session import async_session, engine
+from app.services.execution_queue import ExecutionQueueService
+from app.services.workflow.cancellation import CancellationListener
+from app.services.workflow.executor import WorkflowExecutor
+from app.services.workflow.processors.offload import get_offloader, shutdown_offloader
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = get_logger(__name__)
+
+
+def default_worker_id() -> str:
+    """Build a worker ID unique across hosts and processes."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class ExecutionWorker:
+    """Polls the execution queue and runs claimed executions.
+
+    TAG: [SPEC-011] [EXECUTION] [WORKER]
+
+    Attributes:
+        worker_id: Unique ID recorded on leased executions.
+        concurrency: Maximum executions run at the same time.
+        poll_interval: Seconds to wait between polls when idle or full.
+        lease_seconds: Lease duration of claimed executions.
+        heartbeat_interval: Seconds between lease renewals.
+
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = async_session,
+        worker_id: str | None = None,
+        concurrency: int | None = None,
+        poll_interval: float | None = None,
+        lease_seconds: int | None = None,
+        heartbeat_interval: float | None = None,
+    ) -> None:
+        """Initialize the worker.
+
+        Args:
+            session_factory: Factory returning new AsyncSession instances.
+            worker_id: Worker ID (default: host, pid and random suffix).
+            concurrency: Concurrent executions (default from settings).
+            poll_interval: Idle poll interval (default from settings).
+            lease_seconds: Lease duration (default from settings).
+            heartbeat_interval: Heartbeat interval (default from settings).
+
+        """
+        self._session_factory = session_factory
+        self.worker_id = worker_id or default_worker_id()
+        self.concurrency = concurrency or settings.WORKER_CONCURRENCY
+        self.poll_interval = poll_interval or settings.WORKER_POLL_INTERVAL
+        self.lease_seconds = lease_seconds or settings.WORKER_LEASE_SECONDS
+        self.heartbeat_interval = (
+            heartbeat_interval or settings.WORKER_HEARTBEAT_INTERVAL
+        )
+        self._running: set[asyncio.Task[None]] = set()
+        self._stopping = asyncio.Event()
+
+    def stop(self) -> None:
+        """Stop claiming new executions; running ones are allowed to finish."""
+        self._stopping.set()
+
+    async def run(self) -> None:
+        """Poll the queue until stopped, then wait for running executions."""
+        logger.info(
+            f"Execution worker {self.worker_id} started "
+            f"(concurrency={self.concurrency})"
+        )
+        while not self._stopping.is_set():
+            try:
+                claimed = await self.run_once()
+            except Exception:
+                logger.exception("Execution queue poll failed")
+                claimed = 0
+
+            if claimed == 0 or len(self._running) >= self.concurrency:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        self._stopping.wait(), timeout=self.poll_interval
+                    )
+
+        if self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+        logger.info(f"Execution worker {self.worker_id} stopped")
+
+    async def run_once(self) -> int:
+        """Claim executions for free slots and start running them.
+
+        Returns:
+            Number of executions claimed.
+
+        """
+        free_slots = self.concurrency - len(self._running)
+        if free_slots <= 0:
+            return 0
+
+        async with self._session_factory() as db:
+            await ExecutionQueueService.fail_exhausted(db)
+            executions = await ExecutionQueueService.claim(
+                db,
+                worker_id=self.worker_id,
+                limit=free_slots,
+                lease_seconds=self.lease_seconds,
+            )
+            execution_ids = [execution.id for execution in executions]
+
+        for execution_id in execution_ids:
+            task = asyncio.create_task(self._process(execution_id))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+        return len(execution_ids)
+
+    async def _process(self, execution_id: uuid.UUID) -> None:
+        """Run one claimed execution and release its lease."""
+        error_message: str | None = None
+
+        async with self._session_factory() as db:
+            executor = WorkflowExecutor(db)
+            heartbeat = asyncio.create_task(self._heartbeat(execution_id, executor))
+            try:
+                result = await executor.run_execution(execution_id)
+                error_message = result.error_message
+            except Exception as e:
+                logger.exception(f"Execution {execution_id} crashed")
+                error_message = str(e)
+                await db.rollback()
+            finally:
+                heartbeat.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await heartbeat
+
+        async with self._session_factory() as db:
+            await ExecutionQueueService.release(
+                db,
+                execution_id=execution_id,
+                worker_id=self.worker_id,
+                error_message=error_message,
+            )
+
+    async def _heartbeat(
+        self, execution_id: uuid.UUID, executor: WorkflowExecutor
+    ) -> None:
+        """Renew the lease until cancelled; stop the executor if it is lost."""
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                async with self._session_factory() as db:
+                    renewed = await ExecutionQueueService.heartbeat(
+                        db,
+                        execution_id=execution_id,
+                        worker_id=self.worker_id,
+                        lease_seconds=self.lease_seconds,
+                    )
+            except Exception:
+                logger.exception(f"Heartbeat failed for execution {execution_id}")
+                continue
+
+            if not renewed:
+                logger.warning(
+                    f"Lease lost for execution {execution_id}; stopping executor"
+                )
+                executor.stop()
+                return
+
+
+def main() -> None:
+    """Run an execution worker until SIGINT/SIGTERM."""
+    parser = argparse.ArgumentParser(description="Paste Trader execution worker")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=settings.WORKER_CONCURRENCY,
+        help="Maximum executions run at the same time",
+    )
+    parser.add_argument("--worker-id", default=None, help="Override the worker ID")
+    args = parser.parse_args()
+
+    setup_logging(
+        log_level=settings.LOG_LEVEL,
+        log_file=settings.LOG_FILE,
+        service_name=f"{settings.PROJECT_NAME} Worker",
+        enable_json=settings.LOG_JSON_FORMAT,
+    )
+
+    async def _run() -> None:
+        worker = ExecutionWorker(worker_id=args.worker_id, concurrency=args.concurrency)
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            with contextlib.suppress(NotImplementedError):
+                loop.add_signal_handler(sig, worker.stop)
+        if settings.PROCESS_POOL_ENABLED:
+            await get_offloader().start()
+        cancel_listener = CancellationListener(engine)
+        await cancel_listener.start()
+        try:
+            await worker.run()
+        finally:
+            await cancel_listener.stop()
+            shutdown_offloader()
+
+    asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    main()
@@ -14,10 +14,13 @@ including async database sessions with transaction rollback, sample data fixture
 and factory patterns for creating test models.
 """
 
+import asyncio
+import inspect
 import os
 from collections.abc import AsyncGenerator
 from datetime import UTC, datetime
 from typing import cast
+from unittest.mock import patch
 from uuid import UUID, uuid4
 
 import pytest
@@ -1007,6 +1010,121 @@ def agent_factory(sample_user_id: str):
     return _create
 
 
+# =============================================================================
+# NODE RUN FIXTURES (stand-in for WorkflowExecutor node calls)
+# =============================================================================
+
+
+class NodeRuns:
+    """Records node runs in place of WorkflowExecutor._execute_node_with_timeout.
+
+    Each run returns {"executed": True} unless an output, a respond
+    callback or a failure is configured for it. Runs can be held until
+    another node run starts or ends, so tests order runs with events
+    instead of sleeps. Patch an executor instance, or the WorkflowExecutor
+    class for executors created by the code under test.
+
+    Attributes:
+        events: "start:<name>" and "end:<name>" in the order they happened.
+        started: Node names in start order.
+        inputs: Input data of the last run of each node, by name.
+        orders: Execution order of the last run of each node, by name.
+        outputs: Output returned for a node, by name.
+        failures: Exception raised for a node, by name.
+        respond: Called (or awaited) with (node, input_data) at the start of
+            each run; a non-None result is the output.
+        delay: Seconds each run takes after respond, to let runs overlap.
+        active: Runs in progress.
+        peak: Most runs in progress at once.
+    """
+
+    # Seconds a held run waits at most before failing the test, so a
+    # scheduling bug fails fast instead of hanging it
+    HOLD_TIMEOUT = 30.0
+
+    def __init__(self) -> None:
+        self.events: list[str] = []
+        self.started: list[str] = []
+        self.inputs: dict[str, dict] = {}
+        self.orders: dict[str, int] = {}
+        self.outputs: dict[str, dict] = {}
+        self.failures: dict[str, BaseException] = {}
+        self.respond = None
+        self.delay = 0.0
+        self.active = 0
+        self.peak = 0
+        self._holds: dict[str, list[str]] = {}
+        self._seen: dict[str, asyncio.Event] = {}
+
+    def hold(self, name: str, *until: str) -> None:
+        """Hold runs of a node until the given events happened.
+
+        Args:
+            name: Name of the held node.
+            until: Events such as "start:Fast" or "end:Fast".
+        """
+        self._holds.setdefault(name, []).extend(until)
+
+    async def wait_for(self, event: str) -> None:
+        """Wait until an event such as "start:Fetch" happened."""
+        await self._seen.setdefault(event, asyncio.Event()).wait()
+
+    def _record(self, event: str) -> None:
+        self.events.append(event)
+        self._seen.setdefault(event, asyncio.Event()).set()
+
+    def patch(self, executor):
+        """Patch the node calls of an executor (or executor class)."""
+        return patch.object(
+            executor, "_execute_node_with_timeout", side_effect=self.run
+        )
+
+    async def run(self, node, input_data, execution_order):
+        """Record one node run and return its output."""
+        self._record(f"start:{node.name}")
+        self.started.append(node.name)
+        self.inputs[node.name] = dict(input_data)
+        self.orders[node.name] = execution_order
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            for event in self._holds.get(node.name, ()):
+                waiter = self._seen.setdefault(event, asyncio.Event())
+                try:
+                    await asyncio.wait_for(waiter.wait(), self.HOLD_TIMEOUT)
+                except TimeoutError:
+                    pytest.fail(f"{event} never happened while {node.name} was held")
+            output = None
+            if self.respond is not None:
+                output = self.respond(node, input_data)
+                if inspect.isawaitable(output):
+                    output = await output
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            if node.name in self.failures:
+                raise self.failures[node.name]
+            if node.name in self.outputs:
+                return self.outputs[node.name]
+            return {"executed": True} if output is None else output
+        finally:
+            self.active -= 1
+            self._record(f"end:{node.name}")
+
+
+@pytest.fixture
+def node_runs() -> NodeRuns:
+    """Recorder standing in for the node calls of a WorkflowExecutor.
+
+    Example:
+        async def test_order(db_session, node_runs):
+            executor = WorkflowExecutor(db=db_session)
+            with node_runs.patch(executor):
+                await executor.execute(workflow_id=workflow.id, input_data={})
+            assert node_runs.started == ["A", "B"]
+    """
+    return NodeRuns()
+
+
 # =============================================================================
 # LEGACY FIXTURES (for backward compatibility)
 # =============================================================================
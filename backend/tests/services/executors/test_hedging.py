@@ -0,0 +1,137 @@
+"""Tests for hedged requests of idempotent tools.
+
+TAG: [SPEC-011] [EXECUTION] [HEDGING] [TEST]
+"""
+
+import asyncio
+
+import pytest
+
+from app.services.executors import ToolExecutorFactory
+from app.services.executors.base import ToolExecutionResult, ToolExecutor
+from app.services.executors.hedging import (
+    HedgeController,
+    HedgingToolExecutor,
+    hedge_percentile,
+)
+
+HEDGED_CONFIG = {
+    "url": "https://api.example.com/quotes",
+    "method": "GET",
+    "idempotent": True,
+    "hedge": True,
+}
+
+
+class ScriptedExecutor(ToolExecutor):
+    """Executor answering each call after the next scripted delay."""
+
+    def __init__(self, delays, results=None) -> None:
+        self.delays = list(delays)
+        self.results = list(results or [])
+        self.calls = 0
+
+    async def execute(self, _config, _input_data, _auth_config=None):
+        index = self.calls
+        self.calls += 1
+        await asyncio.sleep(self.delays[index])
+        if index < len(self.results):
+            return self.results[index]
+        return ToolExecutionResult(success=True, output={"call": index})
+
+    def validate_config(self, _config):
+        return True
+
+
+def _warm_controller(**kwargs) -> HedgeController:
+    controller = HedgeController(min_samples=5, **kwargs)
+    for _ in range(50):
+        controller.record_latency("GET https://api.example.com/quotes", 0.01)
+    return controller
+
+
+class TestHedgePolicy:
+    """Tests for opting tools into hedging.
+
+    TAG: [SPEC-011] [EXECUTION] [HEDGING] [TEST]
+    """
+
+    def test_only_idempotent_tools_are_hedged(self) -> None:
+        """Test that hedging needs both the idempotent flag and a policy."""
+        assert hedge_percentile(HEDGED_CONFIG) == 95.0
+        assert hedge_percentile({**HEDGED_CONFIG, "hedge": {"percentile": 90}}) == 90
+        assert hedge_percentile({**HEDGED_CONFIG, "idempotent": False}) is None
+        assert hedge_percentile({"url": "https://x", "hedge": True}) is None
+
+    def test_factory_wraps_executors(self) -> None:
+        """Test that factory-created executors go through the hedging path."""
+        executor = ToolExecutorFactory.create("http")
+
+        assert isinstance(executor, HedgingToolExecutor)
+
+
+class TestHedgingToolExecutor:
+    """Tests for issuing and budgeting hedged requests.
+
+    TAG: [SPEC-011] [EXECUTION] [HEDGING] [TEST]
+    """
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_answered_by_hedge(self) -> None:
+        """Test that the first response wins once the percentile has passed."""
+        controller = _warm_controller()
+        inner = ScriptedExecutor([1.0, 0.01])
+        executor = HedgingToolExecutor(inner, controller)
+
+        result = await asyncio.wait_for(
+            executor.execute(HEDGED_CONFIG, {}), timeout=0.5
+        )
+
+        assert result.output == {"call": 1}
+        assert result.metadata["hedged"] is True
+        counters = controller.metrics()["tools"]["GET https://api.example.com/quotes"]
+        assert counters == {
+            "calls": 1,
+            "hedged": 1,
+            "hedge_wins": 1,
+            "budget_exhausted": 0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_without_history_or_opt_in(self) -> None:
+        """Test that unknown latencies and plain tools issue one request."""
+        inner = ScriptedExecutor([0.05, 0.05])
+        executor = HedgingToolExecutor(inner, HedgeController(min_samples=5))
+
+        await executor.execute(HEDGED_CONFIG, {})
+        await executor.execute({"url": "https://api.example.com/quotes"}, {})
+
+        assert inner.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_budget_caps_hedges(self) -> None:
+        """Test that hedges stop once the budget is spent."""
+        controller = _warm_controller(budget_ratio=0.0, budget_burst=1.0)
+        inner = ScriptedExecutor([0.05, 0.05, 0.05])
+        executor = HedgingToolExecutor(inner, controller)
+
+        await executor.execute(HEDGED_CONFIG, {})
+        await executor.execute(HEDGED_CONFIG, {})
+
+        assert inner.calls == 3
+        counters = controller.metrics()["tools"]["GET https://api.example.com/quotes"]
+        assert (counters["hedged"], counters["budget_exhausted"]) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_failed_attempt_waits_for_the_other(self) -> None:
+        """Test that a fast failure does not beat a slower success."""
+        controller = _warm_controller()
+        failure = ToolExecutionResult(success=False, error="HTTP 503")
+        success = ToolExecutionResult(success=True, output={"call": 0})
+        inner = ScriptedExecutor([0.05, 0.02], results=[success, failure])
+        executor = HedgingToolExecutor(inner, controller)
+
+        result = await executor.execute(HEDGED_CONFIG, {})
+
+        assert result.success is True
+        assert result.output == {"call": 0}
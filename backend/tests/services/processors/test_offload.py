@@ -0,0 +1,148 @@
+"""Tests for process pool offload of CPU-bound processors.
+
+TAG: [SPEC-012] [PROCESSOR] [TEST] [OFFLOAD]
+"""
+
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from app.models.enums import NodeType
+from app.services.workflow.context import ExecutionContext
+from app.services.workflow.processors.adapter import (
+    AdapterNodeProcessor,
+    apply_transformation,
+)
+from app.services.workflow.processors.aggregator import aggregate_sources
+from app.services.workflow.processors.offload import (
+    ProcessPoolOffloader,
+    estimate_payload_items,
+)
+from app.services.workflow.processors.tool import ToolNodeProcessor
+
+POOL_ENABLED = "app.services.workflow.processors.base.settings.PROCESS_POOL_ENABLED"
+
+
+class MockNode:
+    """Mock node for testing."""
+
+    def __init__(self, node_type: str = "adapter", config: dict | None = None):
+        self.id = uuid4()
+        self.node_type = node_type
+        self.config = config or {}
+
+
+@pytest.fixture
+def offloader():
+    """Single-worker offloader that offloads every payload."""
+    offloader = ProcessPoolOffloader(max_workers=1, min_payload_items=0)
+    yield offloader
+    offloader.shutdown()
+
+
+class TestEstimatePayloadItems:
+    """Test payload size estimation."""
+
+    def test_counts_nested_items(self):
+        """Test that nested container items are counted."""
+        payload = {"items": [1, 2, 3], "meta": {"a": 1}}
+
+        assert estimate_payload_items(payload, limit=100) == 6
+
+    def test_stops_at_limit(self):
+        """Test that counting is capped at the limit."""
+        assert estimate_payload_items({"items": list(range(1000))}, limit=10) == 10
+
+
+class TestOffloadSelection:
+    """Test which nodes and payloads are offloaded."""
+
+    def test_disabled_without_process_pool(self):
+        """Test that nothing is offloaded unless the process pool is enabled."""
+        context = ExecutionContext(workflow_execution_id=uuid4(), input_data={})
+
+        assert not AdapterNodeProcessor(
+            MockNode(NodeType.ADAPTER), context
+        ).offload_enabled()
+
+    @patch(POOL_ENABLED, True)
+    def test_enabled_by_node_type(self):
+        """Test that configured node types are offloaded by default."""
+        context = ExecutionContext(workflow_execution_id=uuid4(), input_data={})
+
+        assert AdapterNodeProcessor(
+            MockNode(NodeType.ADAPTER), context
+        ).offload_enabled()
+        assert not ToolNodeProcessor(MockNode(NodeType.TOOL), context).offload_enabled()
+
+    @patch(POOL_ENABLED, True)
+    def test_node_config_flag_overrides_type(self):
+        """Test that the per-node offload flag takes precedence."""
+        context = ExecutionContext(workflow_execution_id=uuid4(), input_data={})
+        node = MockNode("adapter", config={"offload": False})
+
+        assert not AdapterNodeProcessor(node, context).offload_enabled()
+        assert ToolNodeProcessor(
+            MockNode("tool", config={"offload": True}), context
+        ).offload_enabled()
+
+    def test_small_payload_runs_inline(self):
+        """Test that payloads below the threshold are not offloaded."""
+        offloader = ProcessPoolOffloader(max_workers=1, min_payload_items=100)
+
+        assert not offloader.should_offload({"items": [1, 2, 3]})
+        assert offloader.should_offload({"items": list(range(100))})
+        assert not offloader.started
+
+
+class TestProcessPoolOffloader:
+    """Test running transforms in worker processes."""
+
+    @pytest.mark.asyncio
+    async def test_runs_transform_in_worker(self, offloader):
+        """Test that a transform result is returned from the pool."""
+        await offloader.start()
+
+        result = await offloader.run(
+            apply_transformation,
+            "filtering",
+            {"items": [1, 5, 10]},
+            {"filter": "value > 4"},
+        )
+
+        assert result == ({"items": [5, 10]}, 3)
+
+    @pytest.mark.asyncio
+    async def test_worker_exceptions_propagate(self, offloader):
+        """Test that transform errors are re-raised in the caller."""
+        with pytest.raises(TypeError):
+            await offloader.run(
+                aggregate_sources, "reduce", {"a": "x", "b": 1}, {"operation": "sum"}
+            )
+
+    @pytest.mark.asyncio
+    @patch(POOL_ENABLED, True)
+    async def test_processor_uses_offloader(self, offloader):
+        """Test that an adapter processor routes large payloads to the pool."""
+        context = ExecutionContext(workflow_execution_id=uuid4(), input_data={})
+        processor = AdapterNodeProcessor(MockNode(), context)
+
+        with (
+            patch(
+                "app.services.workflow.processors.base.get_offloader",
+                return_value=offloader,
+            ),
+            patch.object(offloader, "run", wraps=offloader.run) as run,
+        ):
+            validated = await processor.pre_process(
+                {
+                    "transformation_type": "field_mapping",
+                    "source_data": {"old": 1},
+                    "transformation_config": {"mapping": {"old": "new"}},
+                }
+            )
+            output = await processor.process(validated)
+
+        assert run.call_count == 1
+        assert output.transformed_data == {"new": 1}
@@ -0,0 +1,177 @@
+"""Tests for streaming processors.
+
+TAG: [SPEC-012] [PROCESSOR] [TEST] [STREAMING]
+"""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from app.services.workflow.context import ExecutionContext
+from app.services.workflow.processors.adapter import AdapterNodeProcessor
+from app.services.workflow.processors.aggregator import AggregatorNodeProcessor
+from app.services.workflow.processors.condition import ConditionNodeProcessor
+from app.services.workflow.processors.errors import ProcessorConfigurationError
+
+
+class MockNode:
+    """Mock node for testing."""
+
+    def __init__(self, node_type: str = "adapter"):
+        self.id = uuid4()
+        self.node_type = node_type
+        self.config = {"offload": False}
+
+
+async def _chunks(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.fixture
+def context():
+    """Execution context shared by the processors of a test."""
+    return ExecutionContext(workflow_execution_id=uuid4(), input_data={})
+
+
+class TestAdapterStreaming:
+    """Test record-wise adapter transforms over chunk streams."""
+
+    @pytest.mark.asyncio
+    async def test_stream_transforms_chunk_by_chunk(self, context):
+        """Test that each incoming chunk yields one transformed chunk."""
+        processor = AdapterNodeProcessor(MockNode(), context)
+        validated = await processor.pre_process(
+            {
+                "transformation_type": "filtering",
+                "source_data": _chunks([1, 5], [10, 2]),
+                "transformation_config": {"filter": "value > 4"},
+            }
+        )
+
+        assert [chunk async for chunk in processor.stream(validated)] == [[5], [10]]
+
+    @pytest.mark.asyncio
+    async def test_process_consumes_stream(self, context):
+        """Test that process() accepts a streamed source."""
+        processor = AdapterNodeProcessor(MockNode(), context)
+        validated = await processor.pre_process(
+            {
+                "transformation_type": "field_mapping",
+                "source_data": _chunks([{"px": 1}], [{"px": 2}]),
+                "transformation_config": {"mapping": {"px": "price"}},
+            }
+        )
+
+        output = await processor.process(validated)
+
+        assert output.transformed_data == [{"price": 1}, {"price": 2}]
+        assert output.records_processed == 2
+
+    @pytest.mark.asyncio
+    async def test_whole_payload_transformations_do_not_stream(self, context):
+        """Test that aggregation transforms are rejected for streaming."""
+        processor = AdapterNodeProcessor(MockNode(), context)
+        validated = await processor.pre_process(
+            {"transformation_type": "aggregation", "source_data": [1]}
+        )
+
+        with pytest.raises(ProcessorConfigurationError):
+            await anext(processor.stream(validated))
+
+
+class TestAggregatorStreaming:
+    """Test incremental aggregation of streamed sources."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("strategy", "config", "expected"),
+        [
+            ("list", {}, [1, 2, 3, 4, 5]),
+            ("reduce", {"operation": "sum"}, 15),
+            ("reduce", {"operation": "average"}, 3.0),
+        ],
+    )
+    async def test_streams_and_values_are_aggregated(
+        self, context, strategy, config, expected
+    ):
+        """Test mixing streamed and plain sources."""
+        processor = AggregatorNodeProcessor(MockNode("aggregator"), context)
+        plain = [5] if strategy == "list" else 5
+        validated = await processor.pre_process(
+            {
+                "strategy": strategy,
+                "input_sources": {"feed": _chunks([1, 2], [3, 4]), "extra": plain},
+                "aggregation_config": config,
+            }
+        )
+
+        output = await processor.process(validated)
+
+        assert output.aggregated_result == expected
+
+
+class TestConditionStreaming:
+    """Test condition evaluation over streamed records."""
+
+    @pytest.mark.asyncio
+    async def test_stops_consuming_once_first_condition_matches(self, context):
+        """Test early exit and producer release on the first match."""
+        stream = await context.get_stream(uuid4())
+        stream.maxsize = 1
+        processor = ConditionNodeProcessor(MockNode("condition"), context)
+        validated = await processor.pre_process(
+            {
+                "conditions": [
+                    {"name": "spike", "expression": "data > 100", "target_node": "a"},
+                    {"name": "any", "expression": "data > 0", "target_node": "b"},
+                ],
+                "evaluation_context": {"data": stream.subscribe()},
+            }
+        )
+
+        async def ticks():
+            for price in (5, 250, 7, 8, 9):
+                yield [price]
+
+        produced, output = await asyncio.gather(
+            stream.pump(ticks()), processor.process(validated)
+        )
+
+        assert produced == 5
+        assert output.selected_branch == "spike"
+        assert output.evaluated_conditions[0]["records_evaluated"] == 2
+
+
+class TestPublish:
+    """Test publishing a processor's stream through the context."""
+
+    @pytest.mark.asyncio
+    async def test_pipeline_adapter_to_aggregator(self, context):
+        """Test adapter -> aggregator pipelining with a summary output."""
+        source = AdapterNodeProcessor(MockNode(), context)
+        sink = AggregatorNodeProcessor(MockNode("aggregator"), context)
+        stream = await context.get_stream(source.node.id)
+        validated = await sink.pre_process(
+            {
+                "strategy": "reduce",
+                "input_sources": {"prices": stream.subscribe()},
+                "aggregation_config": {"operation": "sum"},
+            }
+        )
+
+        summary, output = await asyncio.gather(
+            source.publish(
+                {
+                    "transformation_type": "filtering",
+                    "source_data": {"items": list(range(2500))},
+                    "transformation_config": {"filter": "value > 1999"},
+                }
+            ),
+            sink.process(validated),
+        )
+
+        assert summary == {"streamed": True, "chunks": 3, "records": 500}
+        assert output.aggregated_result == sum(range(2000, 2500))
+        assert (await context.get_all_outputs())[source.node.id] == summary
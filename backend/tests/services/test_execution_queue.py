@@ -0,0 +1,345 @@
+"""Tests for the database-backed execution queue and worker.
+
+TAG: [SPEC-011] [SERVICES] [EXECUTION] [QUEUE] [TEST]
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+
+from app.models.enums import ExecutionStatus, NodeType, TriggerType
+from app.models.execution import NodeExecution, WorkflowExecution
+from app.services.execution_queue import ExecutionQueueService
+from app.services.workflow.executor import WorkflowExecutor
+from app.worker import ExecutionWorker
+
+
+@pytest.fixture
+async def workflow(db_session, workflow_factory, node_factory):
+    """Persist a single-node workflow."""
+    workflow = workflow_factory()
+    node = node_factory(workflow_id=workflow.id, node_type=NodeType.TOOL)
+    db_session.add_all([workflow, node])
+    await db_session.commit()
+    return workflow
+
+
+@pytest.fixture
+def enqueue(db_session, workflow):
+    """Insert a PENDING execution like the execute endpoint does."""
+
+    async def _enqueue(**kwargs) -> WorkflowExecution:
+        kwargs.setdefault("status", ExecutionStatus.PENDING)
+        execution = WorkflowExecution(
+            workflow_id=workflow.id,
+            trigger_type=TriggerType.MANUAL,
+            input_data={"n": 1},
+            **kwargs,
+        )
+        db_session.add(execution)
+        await db_session.commit()
+        return execution
+
+    return _enqueue
+
+
+async def _reload(db_session, execution_id) -> WorkflowExecution:
+    result = await db_session.execute(
+        select(WorkflowExecution)
+        .where(WorkflowExecution.id == execution_id)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one()
+
+
+class TestExecutionQueueClaim:
+    """Tests for claiming executions.
+
+    TAG: [SPEC-011] [SERVICES] [EXECUTION] [QUEUE] [TEST]
+    """
+
+    @pytest.mark.asyncio
+    async def test_claim_leases_pending_execution_once(
+        self, db_session, enqueue
+    ) -> None:
+        """Test that a PENDING execution is claimed by exactly one worker."""
+        execution = await enqueue()
+        execution_id = execution.id
+
+        claimed = await ExecutionQueueService.claim(db_session, "worker-a")
+        claimed_again = await ExecutionQueueService.claim(db_session, "worker-b")
+
+        assert [e.id for e in claimed] == [execution_id]
+        assert claimed_again == []
+        reloaded = await _reload(db_session, execution_id)
+        assert reloaded.status == ExecutionStatus.RUNNING
+        assert reloaded.worker_id == "worker-a"
+        assert reloaded.attempts == 1
+        assert reloaded.lease_expires_at is not None
+        assert reloaded.started_at is not None
+
+    @pytest.mark.asyncio
+    async def test_claim_respects_limit_and_age(self, db_session, enqueue) -> None:
+        """Test that the oldest executions are claimed first, up to limit."""
+        now = datetime.now(UTC)
+        oldest = await enqueue(created_at=now - timedelta(minutes=2))
+        older = await enqueue(created_at=now - timedelta(minutes=1))
+        await enqueue(created_at=now)
+        expected = [oldest.id, older.id]
+
+        claimed = await ExecutionQueueService.claim(db_session, "worker-a", limit=2)
+
+        assert [e.id for e in claimed] == expected
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_is_reclaimed(self, db_session, enqueue) -> None:
+        """Test that a dead worker's execution is picked up by another."""
+        execution = await enqueue(
+            status=ExecutionStatus.RUNNING,
+            worker_id="dead-worker",
+            lease_expires_at=datetime.now(UTC) - timedelta(seconds=1),
+            attempts=1,
+        )
+        execution_id = execution.id
+
+        claimed = await ExecutionQueueService.claim(db_session, "worker-b")
+
+        assert [e.id for e in claimed] == [execution_id]
+        reloaded = await _reload(db_session, execution_id)
+        assert reloaded.worker_id == "worker-b"
+        assert reloaded.attempts == 2
+
+    @pytest.mark.asyncio
+    async def test_exhausted_execution_is_failed_not_claimed(
+        self, db_session, enqueue
+    ) -> None:
+        """Test that executions out of attempts are failed instead of retried."""
+        execution = await enqueue(
+            status=ExecutionStatus.RUNNING,
+            worker_id="dead-worker",
+            lease_expires_at=datetime.now(UTC) - timedelta(seconds=1),
+            attempts=3,
+        )
+        execution_id = execution.id
+
+        claimed = await ExecutionQueueService.claim(
+            db_session, "worker-b", max_attempts=3
+        )
+        failed = await ExecutionQueueService.fail_exhausted(db_session, max_attempts=3)
+
+        assert claimed == []
+        assert failed == 1
+        reloaded = await _reload(db_session, execution_id)
+        assert reloaded.status == ExecutionStatus.FAILED
+        assert "lease expired" in reloaded.error_message
+
+    @pytest.mark.asyncio
+    async def test_claim_respects_batch_concurrency(self, db_session, enqueue) -> None:
+        """Test that a batch never runs more executions than its limit."""
+        now = datetime.now(UTC)
+        batch_id = uuid4()
+        batch = [
+            await enqueue(
+                batch_id=batch_id,
+                batch_max_concurrency=2,
+                created_at=now - timedelta(minutes=3 - i),
+            )
+            for i in range(3)
+        ]
+        batch_ids = [execution.id for execution in batch]
+        single = await enqueue(created_at=now)
+        single_id = single.id
+
+        first = await ExecutionQueueService.claim(db_session, "worker-a", limit=1)
+        second = await ExecutionQueueService.claim(db_session, "worker-b", limit=3)
+
+        assert [e.id for e in first] == batch_ids[:1]
+        assert [e.id for e in second] == [batch_ids[1], single_id]
+
+        await ExecutionQueueService.release(
+            db_session, execution_id=batch_ids[0], worker_id="worker-a"
+        )
+        third = await ExecutionQueueService.claim(db_session, "worker-a", limit=3)
+        assert [e.id for e in third] == batch_ids[2:]
+
+
+class TestExecutionQueueLease:
+    """Tests for heartbeats and lease release.
+
+    TAG: [SPEC-011] [SERVICES] [EXECUTION] [QUEUE] [TEST]
+    """
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_only_renews_own_running_lease(
+        self, db_session, enqueue
+    ) -> None:
+        """Test that heartbeats fail for other workers and finished runs."""
+        execution = await enqueue()
+        execution_id = execution.id
+        await ExecutionQueueService.claim(db_session, "worker-a", lease_seconds=5)
+
+        assert await ExecutionQueueService.heartbeat(
+            db_session, execution_id, "worker-a", lease_seconds=60
+        )
+        assert not await ExecutionQueueService.heartbeat(
+            db_session, execution_id, "worker-b"
+        )
+        reloaded = await _reload(db_session, execution_id)
+        lease = reloaded.lease_expires_at - reloaded.heartbeat_at
+        assert lease == timedelta(seconds=60)
+
+        reloaded.status = ExecutionStatus.CANCELLED
+        await db_session.commit()
+        assert not await ExecutionQueueService.heartbeat(
+            db_session, execution_id, "worker-a"
+        )
+
+    @pytest.mark.asyncio
+    async def test_release_fails_unfinished_execution(
+        self, db_session, enqueue
+    ) -> None:
+        """Test that releasing a still-RUNNING execution marks it FAILED."""
+        execution = await enqueue()
+        execution_id = execution.id
+        await ExecutionQueueService.claim(db_session, "worker-a")
+
+        await ExecutionQueueService.release(
+            db_session, execution_id, "worker-a", error_message="boom"
+        )
+
+        reloaded = await _reload(db_session, execution_id)
+        assert reloaded.status == ExecutionStatus.FAILED
+        assert reloaded.error_message == "boom"
+        assert reloaded.lease_expires_at is None
+
+
+class TestExecutionWorker:
+    """Tests for ExecutionWorker draining the queue.
+
+    TAG: [SPEC-011] [EXECUTION] [WORKER] [TEST]
+    """
+
+    @staticmethod
+    def _worker(db_session) -> ExecutionWorker:
+        @asynccontextmanager
+        async def session_factory():
+            yield db_session
+
+        return ExecutionWorker(
+            session_factory=session_factory,
+            worker_id="test-worker",
+            concurrency=1,
+            heartbeat_interval=60,
+        )
+
+    @pytest.mark.asyncio
+    async def test_worker_runs_claimed_execution(self, db_session, enqueue) -> None:
+        """Test that a worker executes a queued execution to completion."""
+        execution = await enqueue()
+        execution_id = execution.id
+        worker = self._worker(db_session)
+
+        claimed = await worker.run_once()
+        await asyncio.gather(*worker._running)
+
+        assert claimed == 1
+        reloaded = await _reload(db_session, execution_id)
+        assert reloaded.status == ExecutionStatus.COMPLETED
+        assert reloaded.worker_id == "test-worker"
+        assert reloaded.lease_expires_at is None
+        node_executions = await db_session.execute(
+            select(NodeExecution).where(
+                NodeExecution.workflow_execution_id == execution_id
+            )
+        )
+        assert len(node_executions.scalars().all()) == 1
+
+    @pytest.mark.asyncio
+    async def test_worker_respects_concurrency(self, db_session, enqueue) -> None:
+        """Test that a worker never claims more than its free slots."""
+        await enqueue()
+        await enqueue()
+        worker = self._worker(db_session)
+
+        assert await worker.run_once() == 1
+        assert await worker.run_once() == 0
+        await asyncio.gather(*worker._running)
+
+    @pytest.mark.asyncio
+    async def test_reclaimed_execution_resumes_finished_nodes(
+        self,
+        db_session,
+        workflow_factory,
+        node_factory,
+        edge_factory,
+        node_runs,
+    ) -> None:
+        """Test that a reclaimed run neither repeats nor duplicates nodes."""
+        workflow = workflow_factory()
+        a, b, c = (node_factory(workflow_id=workflow.id, name=name) for name in "ABC")
+        edges = [
+            edge_factory(
+                workflow_id=workflow.id, source_node_id=s.id, target_node_id=t.id
+            )
+            for s, t in ((a, b), (b, c))
+        ]
+        now = datetime.now(UTC)
+        execution = WorkflowExecution(
+            workflow_id=workflow.id,
+            trigger_type=TriggerType.MANUAL,
+            input_data={},
+            status=ExecutionStatus.RUNNING,
+            worker_id="dead-worker",
+            lease_expires_at=now - timedelta(seconds=1),
+            attempts=1,
+        )
+        db_session.add_all([workflow, a, b, c, *edges, execution])
+        await db_session.flush()
+        # The dead worker finished A and was running B
+        db_session.add_all(
+            [
+                NodeExecution(
+                    workflow_execution_id=execution.id,
+                    node_id=a.id,
+                    status=ExecutionStatus.COMPLETED,
+                    started_at=now,
+                    ended_at=now,
+                    output_data={"a": 1},
+                    execution_order=0,
+                ),
+                NodeExecution(
+                    workflow_execution_id=execution.id,
+                    node_id=b.id,
+                    status=ExecutionStatus.RUNNING,
+                    started_at=now,
+                    execution_order=1,
+                ),
+            ]
+        )
+        await db_session.commit()
+        execution_id = execution.id
+        names = {a.id: "A", b.id: "B", c.id: "C"}
+        worker = self._worker(db_session)
+
+        with node_runs.patch(WorkflowExecutor):
+            assert await worker.run_once() == 1
+            await asyncio.gather(*worker._running)
+
+        reloaded = await _reload(db_session, execution_id)
+        assert reloaded.status == ExecutionStatus.COMPLETED
+        assert node_runs.started == ["B", "C"]
+        assert node_runs.inputs["B"] == {"a": 1}
+        result = await db_session.execute(
+            select(NodeExecution.node_id, NodeExecution.status).where(
+                NodeExecution.workflow_execution_id == execution_id
+            )
+        )
+        assert sorted((names[row.node_id], row.status) for row in result) == [
+            ("A", ExecutionStatus.COMPLETED),
+            ("B", ExecutionStatus.COMPLETED),
+            ("C", ExecutionStatus.COMPLETED),
+        ]
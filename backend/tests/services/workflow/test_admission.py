@@ -0,0 +1,121 @@
+"""Tests for process-wide weighted fair admission of node runs.
+
+TAG: [SPEC-011] [EXECUTION] [ADMISSION] [TEST]
+"""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from app.models.enums import ExecutionStatus
+from app.services.workflow.admission import AdmissionController, priority_weight
+from app.services.workflow.executor import SchedulingMode, WorkflowExecutor
+
+
+async def _grant_order(controller, requests):
+    """Queue requests behind a held slot and return the admission order."""
+    order: list[str] = []
+
+    async def request(name, owner_id, priority):
+        async with controller.slot(owner_id, priority):
+            order.append(name)
+
+    await controller.acquire(uuid4())
+    tasks = []
+    for name, owner_id, priority in requests:
+        tasks.append(asyncio.create_task(request(name, owner_id, priority)))
+        await asyncio.sleep(0)
+    controller.release()
+    await asyncio.gather(*tasks)
+    return order
+
+
+class TestAdmissionController:
+    """Tests for the weighted fair slot pool.
+
+    TAG: [SPEC-011] [EXECUTION] [ADMISSION] [TEST]
+    """
+
+    def test_priority_weight_doubles_per_scale(self) -> None:
+        """Test that weight grows exponentially with priority."""
+        assert priority_weight(0) == 1.0
+        assert priority_weight(25) == pytest.approx(2.0)
+        assert priority_weight(-25) == pytest.approx(0.5)
+
+    @pytest.mark.asyncio
+    async def test_owners_share_slots_fairly(self) -> None:
+        """Test that a late owner is not starved by a long backlog."""
+        controller = AdmissionController(capacity=1)
+        bulk, interactive = uuid4(), uuid4()
+        requests = [(f"bulk-{i}", bulk, 0) for i in range(10)]
+        requests.append(("interactive", interactive, 0))
+
+        order = await _grant_order(controller, requests)
+
+        assert order.index("interactive") <= 1
+        assert controller.in_use == 0
+
+    @pytest.mark.asyncio
+    async def test_higher_priority_gets_larger_share(self) -> None:
+        """Test that slots are shared in proportion to priority weights."""
+        controller = AdmissionController(capacity=1)
+        low, high = uuid4(), uuid4()
+        requests = [(f"low-{i}", low, 0) for i in range(4)]
+        requests += [(f"high-{i}", high, 25) for i in range(4)]
+
+        order = await _grant_order(controller, requests)
+
+        first_six = order[:6]
+        assert sum(name.startswith("high") for name in first_six) == 4
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self) -> None:
+        """Test that a waiter cancelled in the queue gives up its place."""
+        controller = AdmissionController(capacity=1)
+        await controller.acquire(uuid4())
+        waiter = asyncio.create_task(controller.acquire(uuid4()))
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        controller.release()
+
+        assert controller.in_use == 0
+        await asyncio.wait_for(controller.acquire(uuid4()), timeout=1)
+        assert controller.in_use == 1
+
+
+class TestExecutorAdmission:
+    """Tests for executors sharing one admission controller.
+
+    TAG: [SPEC-011] [EXECUTION] [ADMISSION] [TEST]
+    """
+
+    @pytest.mark.asyncio
+    async def test_execution_waits_for_shared_slots(
+        self, db_session, workflow_factory, node_factory, node_runs
+    ) -> None:
+        """Test that node runs are bounded by slots held by other executions."""
+        workflow = workflow_factory()
+        nodes = [node_factory(workflow_id=workflow.id) for _ in range(3)]
+        db_session.add_all([workflow, *nodes])
+        await db_session.commit()
+
+        controller = AdmissionController(capacity=2)
+        # Another execution holds one of the two slots
+        await controller.acquire(uuid4())
+        node_runs.delay = 0.02
+
+        executor = WorkflowExecutor(
+            db=db_session,
+            scheduling_mode=SchedulingMode.DEPENDENCY,
+            admission=controller,
+        )
+        with node_runs.patch(executor):
+            result = await executor.execute(workflow_id=workflow.id, input_data={})
+
+        assert result.status == ExecutionStatus.COMPLETED
+        assert node_runs.peak == 1
+        assert controller.in_use == 1
@@ -345,6 +345,47 @@ class TestTopologicalSortLevels:
 # =============================================================================
 
 
+class TestFindReachableFrom:
+    """Tests for find_reachable_from method."""
+
+    def test_includes_start_nodes_and_descendants(
+        self, diamond_dag: tuple[Graph[UUID], dict[str, UUID]]
+    ):
+        """Start nodes and everything downstream should be returned."""
+        graph, nodes = diamond_dag
+        result = GraphAlgorithms.find_reachable_from(graph, {nodes["b"]})
+        assert result == {nodes["b"], nodes["d"]}
+
+    def test_no_start_nodes_reaches_nothing(
+        self, simple_dag: tuple[Graph[UUID], dict[str, UUID]]
+    ):
+        """Empty start set should reach no nodes."""
+        graph, _ = simple_dag
+        assert GraphAlgorithms.find_reachable_from(graph, set()) == set()
+
+
+class TestFindAncestorsOf:
+    """Tests for find_ancestors_of method."""
+
+    def test_includes_targets_and_upstream_nodes(
+        self, diamond_dag: tuple[Graph[UUID], dict[str, UUID]]
+    ):
+        """Targets and everything they depend on should be returned."""
+        graph, nodes = diamond_dag
+        result = GraphAlgorithms.find_ancestors_of(graph, {nodes["b"]})
+        assert result == {nodes["a"], nodes["b"]}
+        assert GraphAlgorithms.find_ancestors_of(graph, {nodes["d"]}) == set(
+            nodes.values()
+        )
+
+    def test_no_targets_needs_nothing(
+        self, simple_dag: tuple[Graph[UUID], dict[str, UUID]]
+    ):
+        """Empty target set should need no nodes."""
+        graph, _ = simple_dag
+        assert GraphAlgorithms.find_ancestors_of(graph, set()) == set()
+
+
 class TestFindUnreachableFrom:
     """Tests for find_unreachable_from method."""
 
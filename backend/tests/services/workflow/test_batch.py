@@ -0,0 +1,100 @@
+"""Tests for batch execution of one workflow over many inputs.
+
+TAG: [SPEC-011] [EXECUTION] [BATCH] [TEST]
+"""
+
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import select
+
+from app.models.enums import ExecutionStatus, NodeType
+from app.models.execution import WorkflowExecution
+from app.services.execution_service import WorkflowExecutionService
+from app.services.workflow.batch import BatchExecutor
+from app.services.workflow.executor import WorkflowExecutor
+from app.services.workflow.plan import ExecutionPlan
+
+
+def _batch_executor(db_session, **kwargs) -> BatchExecutor:
+    @asynccontextmanager
+    async def session_factory():
+        yield db_session
+
+    # One shared test session: executions must not use it concurrently
+    return BatchExecutor(session_factory=session_factory, max_concurrency=1, **kwargs)
+
+
+class TestBatchExecutor:
+    """Tests for running a workflow over a list of inputs.
+
+    TAG: [SPEC-011] [EXECUTION] [BATCH] [TEST]
+    """
+
+    @pytest.mark.asyncio
+    async def test_runs_every_input_with_one_plan(
+        self, db_session, workflow_factory, node_factory
+    ) -> None:
+        """Test that the plan is compiled once and each input gets a run."""
+        workflow = workflow_factory()
+        node = node_factory(workflow_id=workflow.id, node_type=NodeType.TOOL)
+        db_session.add_all([workflow, node])
+        await db_session.commit()
+        inputs = [{"symbol": "AAPL"}, {"symbol": "MSFT"}, {"symbol": "NVDA"}]
+
+        with patch.object(
+            ExecutionPlan, "compile", wraps=ExecutionPlan.compile
+        ) as compile_spy:
+            batch = await _batch_executor(db_session).execute(workflow.id, inputs)
+
+        assert compile_spy.call_count == 1
+        assert batch.counts == {"completed": 3}
+        executions = (
+            (
+                await db_session.execute(
+                    select(WorkflowExecution)
+                    .where(WorkflowExecution.batch_id == batch.batch_id)
+                    .execution_options(populate_existing=True)
+                )
+            )
+            .scalars()
+            .all()
+        )
+        by_id = {execution.id: execution for execution in executions}
+        assert [by_id[r.execution_id].input_data for r in batch.results] == inputs
+
+        progress = await WorkflowExecutionService.get_batch(db_session, batch.batch_id)
+        assert (progress.total, progress.completed) == (3, 3)
+        assert progress.progress == 1.0
+        assert progress.is_terminal is True
+
+    @pytest.mark.asyncio
+    async def test_failed_run_is_recorded_and_batch_continues(
+        self, db_session, workflow_factory, node_factory, node_runs
+    ) -> None:
+        """Test that one failing input does not stop the rest of the batch."""
+        workflow = workflow_factory()
+        node = node_factory(
+            workflow_id=workflow.id, config={"retry_config": {"max_retries": 0}}
+        )
+        db_session.add_all([workflow, node])
+        await db_session.commit()
+
+        def fail_first_run(*_):
+            if len(node_runs.started) == 1:
+                raise ValueError("bad input")
+
+        node_runs.respond = fail_first_run
+        # Executors are created by the batch executor
+        with node_runs.patch(WorkflowExecutor):
+            batch = await _batch_executor(db_session).execute(
+                workflow.id, [{"symbol": "????"}, {"symbol": "AAPL"}]
+            )
+
+        assert [r.status for r in batch.results] == [
+            ExecutionStatus.FAILED,
+            ExecutionStatus.COMPLETED,
+        ]
+        progress = await WorkflowExecutionService.get_batch(db_session, batch.batch_id)
+        assert (progress.failed, progress.completed) == (1, 1)
@@ -0,0 +1,162 @@
+"""Tests for offloading large node payloads to the blob store.
+
+TAG: [SPEC-011] [EXECUTION] [BLOB-STORE] [TEST]
+"""
+
+import threading
+from collections import ChainMap
+from datetime import UTC, datetime
+from types import MappingProxyType
+from unittest.mock import patch
+
+import pytest
+
+from app.models.enums import ExecutionStatus, NodeType, TriggerType
+from app.models.execution import NodeExecution, WorkflowExecution
+from app.services.workflow import blob_store
+from app.services.workflow.blob_store import (
+    BLOB_REF_KEY,
+    FileSystemBlobStore,
+    is_blob_ref,
+    offload_payload,
+    resolve_payload,
+)
+from app.services.workflow.exceptions import BlobNotFoundError
+from app.services.workflow.persistence import ExecutionWriteBuffer
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Filesystem blob store in a temporary directory."""
+    return FileSystemBlobStore(tmp_path / "blobs")
+
+
+class TestFileSystemBlobStore:
+    """Tests for the content-addressed filesystem backend.
+
+    TAG: [SPEC-011] [EXECUTION] [BLOB-STORE] [TEST]
+    """
+
+    @pytest.mark.asyncio
+    async def test_put_and_get_round_trip(self, store) -> None:
+        """Test that a blob is addressed by its content digest."""
+        digest = await store.put(b"ohlcv")
+
+        assert digest == store.digest_of(b"ohlcv")
+        assert digest.startswith("sha256:")
+        assert await store.get(digest) == b"ohlcv"
+
+    @pytest.mark.asyncio
+    async def test_identical_content_stored_once(self, store) -> None:
+        """Test that identical payloads share one file."""
+        first = await store.put(b"same")
+        second = await store.put(b"same")
+
+        assert first == second
+        assert len([p for p in store.root.rglob("*") if p.is_file()]) == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("digest", ["sha256:" + "0" * 64, "sha256:../../etc"])
+    async def test_unknown_or_malformed_digest_raises(self, store, digest) -> None:
+        """Test that missing and malformed digests raise BlobNotFoundError."""
+        with pytest.raises(BlobNotFoundError):
+            await store.get(digest)
+
+
+class TestPayloadOffload:
+    """Tests for replacing large payloads by blob references.
+
+    TAG: [SPEC-011] [EXECUTION] [BLOB-STORE] [TEST]
+    """
+
+    @pytest.mark.asyncio
+    async def test_small_payload_stays_inline(self, store) -> None:
+        """Test that payloads under the threshold are kept as is."""
+        payload = {"close": [1, 2, 3]}
+
+        assert await offload_payload(payload, store, threshold=1024) == payload
+        assert await offload_payload(None, store, threshold=0) is None
+
+    @pytest.mark.asyncio
+    async def test_large_payload_round_trip(self, store) -> None:
+        """Test that a large payload is offloaded and resolved back."""
+        payload = {"close": list(range(1000))}
+
+        ref = await offload_payload(payload, store, threshold=100)
+
+        assert is_blob_ref(ref)
+        assert ref["size_bytes"] > 100
+        assert await resolve_payload(ref, store) == payload
+        # Offloading a reference again keeps it unchanged
+        assert await offload_payload(ref, store, threshold=0) == ref
+
+    @pytest.mark.asyncio
+    async def test_payloads_with_many_items_encode_off_the_loop(self, store) -> None:
+        """Test that only payloads with many items are encoded in a thread."""
+        encoded_in: list[bool] = []
+        original = blob_store._encode
+
+        def encode(payload):
+            encoded_in.append(threading.current_thread() is threading.main_thread())
+            return original(payload)
+
+        with patch.object(blob_store, "_encode", side_effect=encode):
+            await offload_payload({"close": [1, 2, 3]}, store, threshold=100)
+            ref = await offload_payload(
+                {"close": list(range(blob_store.INLINE_ENCODE_MAX_ITEMS))},
+                store,
+                threshold=100,
+            )
+
+        assert encoded_in == [True, False]
+        assert ref["size_bytes"] == len(await store.get(ref[BLOB_REF_KEY]))
+
+    @pytest.mark.asyncio
+    async def test_node_input_view_round_trip(self, store) -> None:
+        """Test that a read-only node input view is stored as plain JSON."""
+        payload = MappingProxyType(
+            ChainMap({"close": list(range(1000))}, {"symbol": "AAPL"})
+        )
+
+        ref = await offload_payload(payload, store, threshold=100)
+
+        assert is_blob_ref(ref)
+        assert await resolve_payload(ref, store) == {
+            "close": list(range(1000)),
+            "symbol": "AAPL",
+        }
+        assert await offload_payload(payload, store, threshold=10**6) == dict(payload)
+
+    @pytest.mark.asyncio
+    async def test_write_buffer_stores_references(
+        self, db_session, workflow_factory, node_factory, store
+    ) -> None:
+        """Test that node_executions rows hold references to large payloads."""
+        workflow = workflow_factory()
+        node = node_factory(workflow_id=workflow.id, node_type=NodeType.TOOL)
+        execution = WorkflowExecution(
+            workflow_id=workflow.id,
+            trigger_type=TriggerType.MANUAL,
+            status=ExecutionStatus.RUNNING,
+            started_at=datetime.now(UTC),
+            input_data={},
+        )
+        db_session.add_all([workflow, node, execution])
+        await db_session.flush()
+        buffer = ExecutionWriteBuffer(db_session, blob_store=store)
+        output = {"candles": [[i, i + 1.5] for i in range(50_000)]}
+
+        node_execution_id = await buffer.add_node_execution(
+            workflow_execution_id=execution.id,
+            node_id=node.id,
+            status=ExecutionStatus.COMPLETED,
+            execution_order=1,
+            input_data={"symbol": "BTC"},
+            output_data=output,
+        )
+        await buffer.flush()
+
+        row = await db_session.get(NodeExecution, node_execution_id)
+        assert row.input_data == {"symbol": "BTC"}
+        assert set(row.output_data) == {BLOB_REF_KEY, "size_bytes"}
+        assert await resolve_payload(row.output_data, store) == output
@@ -0,0 +1,163 @@
+"""Tests for cooperative cancellation of running executions.
+
+TAG: [SPEC-011] [EXECUTION] [CANCELLATION] [TEST]
+REQ: REQ-011-009 - Workflow cancellation support
+"""
+
+import asyncio
+import time
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select, update
+
+from app.models.enums import ExecutionStatus
+from app.models.execution import NodeExecution, WorkflowExecution
+from app.services.execution_service import WorkflowExecutionService
+from app.services.workflow.cancellation import (
+    CancellationListener,
+    CancellationRegistry,
+    get_cancellation_registry,
+)
+from app.services.workflow.executor import SchedulingMode, WorkflowExecutor
+
+
+@pytest.fixture
+async def workflow(db_session, workflow_factory, node_factory):
+    """Persist a single-node workflow."""
+    workflow = workflow_factory()
+    node = node_factory(workflow_id=workflow.id, name="Slow")
+    db_session.add_all([workflow, node])
+    await db_session.commit()
+    return workflow
+
+
+async def _node_statuses(db_session, execution_id):
+    result = await db_session.execute(
+        select(NodeExecution.status).where(
+            NodeExecution.workflow_execution_id == execution_id
+        )
+    )
+    return list(result.scalars().all())
+
+
+class TestCancellationRegistry:
+    """Tests for the process-local cancellation registry.
+
+    TAG: [SPEC-011] [EXECUTION] [CANCELLATION] [TEST]
+    """
+
+    def test_signal_sets_registered_event(self) -> None:
+        """Test that only registered executions are signalled."""
+        registry = CancellationRegistry()
+        execution_id = uuid4()
+        event = asyncio.Event()
+        registry.register(execution_id, event)
+
+        assert registry.signal(execution_id)
+        assert event.is_set()
+        registry.unregister(execution_id)
+        assert not registry.signal(execution_id)
+
+    def test_listener_relays_notifications(self) -> None:
+        """Test that NOTIFY payloads are forwarded to the registry."""
+        registry = CancellationRegistry()
+        execution_id = uuid4()
+        event = asyncio.Event()
+        registry.register(execution_id, event)
+        listener = CancellationListener(engine=None, registry=registry)
+
+        listener._on_notify(None, 1, "channel", "not-a-uuid")
+        listener._on_notify(None, 1, "channel", str(execution_id))
+
+        assert event.is_set()
+
+
+class TestInFlightCancellation:
+    """Tests for interrupting nodes that are already running.
+
+    TAG: [SPEC-011] [EXECUTION] [CANCELLATION] [TEST]
+    """
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode", list(SchedulingMode))
+    async def test_service_cancel_interrupts_running_node(
+        self, db_session, workflow, node_runs, mode
+    ) -> None:
+        """Test that cancelling through the service stops a node mid-run."""
+        executor = WorkflowExecutor(db=db_session, scheduling_mode=mode)
+        node_runs.delay = 30
+
+        async def cancel_when_started():
+            await node_runs.wait_for("start:Slow")
+            (execution_id,) = get_cancellation_registry()._events
+            await WorkflowExecutionService.cancel(db_session, execution_id)
+            return execution_id
+
+        begin = time.monotonic()
+        with node_runs.patch(executor):
+            result, execution_id = await asyncio.gather(
+                executor.execute(workflow_id=workflow.id, input_data={}),
+                cancel_when_started(),
+            )
+
+        assert time.monotonic() - begin < 5
+        assert result.status == ExecutionStatus.CANCELLED
+        assert await _node_statuses(db_session, execution_id) == [
+            ExecutionStatus.CANCELLED
+        ]
+        execution = await db_session.get(WorkflowExecution, execution_id)
+        assert execution.status == ExecutionStatus.CANCELLED
+
+    @pytest.mark.asyncio
+    async def test_status_polling_detects_external_cancel(
+        self, db_session, workflow, node_runs
+    ) -> None:
+        """Test the polling fallback when no signal reaches the process."""
+        executor = WorkflowExecutor(db=db_session)
+
+        async def cancel_externally(*_):
+            # Another process cancels without reaching this registry
+            await db_session.execute(
+                update(WorkflowExecution)
+                .where(WorkflowExecution.workflow_id == workflow.id)
+                .values(status=ExecutionStatus.CANCELLED)
+            )
+
+        node_runs.respond = cancel_externally
+        node_runs.delay = 30
+
+        with (
+            patch(
+                "app.services.workflow.executor.settings.EXECUTION_CANCEL_POLL_INTERVAL",
+                0.05,
+            ),
+            node_runs.patch(executor),
+        ):
+            result = await asyncio.wait_for(
+                executor.execute(workflow_id=workflow.id, input_data={}), timeout=5
+            )
+
+        assert result.status == ExecutionStatus.CANCELLED
+        assert await _node_statuses(db_session, result.execution_id) == [
+            ExecutionStatus.CANCELLED
+        ]
+
+    @pytest.mark.asyncio
+    async def test_stop_does_not_overwrite_execution_status(
+        self, db_session, workflow, node_runs
+    ) -> None:
+        """Test that a lease-loss stop leaves the execution row alone."""
+        executor = WorkflowExecutor(db=db_session)
+        node_runs.respond = lambda *_: executor.stop()
+        node_runs.delay = 30
+
+        with node_runs.patch(executor):
+            result = await asyncio.wait_for(
+                executor.execute(workflow_id=workflow.id, input_data={}), timeout=5
+            )
+
+        assert result.status == ExecutionStatus.CANCELLED
+        execution = await db_session.get(WorkflowExecution, result.execution_id)
+        assert execution.status == ExecutionStatus.RUNNING
@@ -0,0 +1,209 @@
+"""Tests for circuit breakers and the shared retry budget.
+
+TAG: [SPEC-011] [EXECUTION] [CIRCUIT-BREAKER] [TEST]
+"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from app.models.enums import ExecutionStatus, NodeType
+from app.schemas.processors import ToolProcessorInput, ToolProcessorOutput
+from app.services.workflow.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakers,
+    CircuitState,
+    RetryBudget,
+)
+from app.services.workflow.executor import WorkflowExecutor
+from app.services.workflow.processors.base import BaseProcessor, ProcessorConfig
+from app.services.workflow.processors.errors import ProcessorExecutionError
+
+
+class FailingToolProcessor(BaseProcessor):
+    """Tool processor whose upstream refuses connections."""
+
+    input_schema = ToolProcessorInput
+    output_schema = ToolProcessorOutput
+
+    def __init__(self, node, context, config=None):
+        super().__init__(node, context, config)
+        self.calls = 0
+
+    async def pre_process(self, inputs):
+        return ToolProcessorInput.model_validate(inputs)
+
+    async def process(self, _validated_input):
+        self.calls += 1
+        raise ConnectionError("connection refused")
+
+    async def post_process(self, output):
+        return output.model_dump()
+
+
+class TestCircuitBreaker:
+    """Tests for circuit state transitions.
+
+    TAG: [SPEC-011] [EXECUTION] [CIRCUIT-BREAKER] [TEST]
+    """
+
+    def test_opens_after_consecutive_outage_errors(self) -> None:
+        """Test that only outage errors count towards opening."""
+        breaker = CircuitBreaker("tool:quotes", failure_threshold=2)
+
+        breaker.record_failure(ConnectionError())
+        breaker.record_failure(ValueError("bad request"))
+        breaker.record_failure(TimeoutError())
+        assert breaker.state == CircuitState.CLOSED
+
+        breaker.record_failure(TimeoutError())
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow()
+        assert breaker.retry_after > 0
+        assert breaker.metrics()["rejected"] == 1
+
+    def test_half_open_probe_closes_or_reopens(self) -> None:
+        """Test that one probe is let through after the reset timeout."""
+        breaker = CircuitBreaker(
+            "llm:anthropic", failure_threshold=1, reset_timeout=0.0
+        )
+        breaker.record_failure(ConnectionError())
+
+        assert breaker.allow()
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert not breaker.allow()
+        breaker.record_failure(TimeoutError())
+        assert breaker._state == CircuitState.OPEN
+
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_abandoned_probe_is_returned(self) -> None:
+        """Test that a cancelled probe lets the next attempt through."""
+        breaker = CircuitBreaker("tool:quotes", failure_threshold=1, reset_timeout=0.0)
+        breaker.record_failure(ConnectionError())
+
+        assert breaker.allow()
+        breaker.abandon()
+
+        assert breaker.allow()
+
+
+class TestRetryBudget:
+    """Tests for the retry token buckets.
+
+    TAG: [SPEC-011] [EXECUTION] [CIRCUIT-BREAKER] [TEST]
+    """
+
+    @pytest.mark.asyncio
+    async def test_retries_limited_to_earned_tokens(self) -> None:
+        """Test that retries spend tokens earned by first attempts."""
+        budget = RetryBudget(ratio=0.5, burst=1.0)
+
+        assert await budget.try_withdraw("tool:quotes")
+        assert not await budget.try_withdraw("tool:quotes")
+        await budget.deposit("tool:quotes")
+        await budget.deposit("tool:quotes")
+        assert await budget.try_withdraw("tool:quotes")
+        # Buckets are kept per circuit
+        assert await budget.try_withdraw("llm:openai")
+
+
+class TestCircuitBreakers:
+    """Tests for resolving the circuit of a node.
+
+    TAG: [SPEC-011] [EXECUTION] [CIRCUIT-BREAKER] [TEST]
+    """
+
+    def test_circuit_per_tool_and_provider(self) -> None:
+        """Test circuit names of tool, agent and local nodes."""
+        tool_id, agent_id = uuid4(), uuid4()
+
+        def node(node_type, config=None, **ids):
+            return SimpleNamespace(
+                node_type=node_type,
+                config=config,
+                tool_id=ids.get("tool_id"),
+                agent_id=ids.get("agent_id"),
+            )
+
+        name = CircuitBreakers.circuit_name
+        assert name(node(NodeType.TOOL, tool_id=tool_id)) == f"tool:{tool_id}"
+        assert name(node(NodeType.AGENT, {"provider": "openai"})) == "llm:openai"
+        assert (
+            name(node(NodeType.AGENT, {"llm_config": {"provider": "anthropic"}}))
+            == "llm:anthropic"
+        )
+        assert name(node(NodeType.AGENT, agent_id=agent_id)) == f"agent:{agent_id}"
+        assert name(node(NodeType.ADAPTER, {"circuit": "market-data"})) == "market-data"
+        assert name(node(NodeType.ADAPTER)) is None
+
+
+class TestFailFast:
+    """Tests for nodes failing fast on an open circuit.
+
+    TAG: [SPEC-011] [EXECUTION] [CIRCUIT-BREAKER] [TEST]
+    """
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_node_calls(
+        self, db_session, workflow_factory, node_factory, node_runs
+    ) -> None:
+        """Test that executions stop calling a dependency that is down."""
+        workflow = workflow_factory()
+        node = node_factory(
+            workflow_id=workflow.id,
+            config={"circuit": "quotes-api", "retry_config": {"max_retries": 0}},
+        )
+        db_session.add_all([workflow, node])
+        await db_session.commit()
+        node_runs.failures[node.name] = ConnectionError("connection refused")
+
+        circuits = CircuitBreakers(retry_budget=RetryBudget())
+        with patch(
+            "app.services.workflow.circuit_breaker.settings.CIRCUIT_FAILURE_THRESHOLD",
+            2,
+        ):
+            for _ in range(3):
+                executor = WorkflowExecutor(db=db_session, circuits=circuits)
+                with node_runs.patch(executor):
+                    result = await executor.execute(
+                        workflow_id=workflow.id, input_data={}
+                    )
+                assert result.status == ExecutionStatus.FAILED
+
+        assert len(node_runs.started) == 2
+        assert circuits.metrics()["quotes-api"]["state"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_processor_retries_stop_at_budget(self) -> None:
+        """Test that processor retries are paid from the shared budget."""
+        node = SimpleNamespace(
+            id=uuid4(),
+            node_type=NodeType.TOOL,
+            config={"circuit": "quotes-api"},
+            tool_id=None,
+            agent_id=None,
+        )
+        circuits = CircuitBreakers(retry_budget=RetryBudget(ratio=0.0, burst=1.0))
+        processor = FailingToolProcessor(
+            node,
+            SimpleNamespace(execution_id=uuid4()),
+            ProcessorConfig(max_retries=3, initial_delay_seconds=0.0),
+        )
+
+        with (
+            patch(
+                "app.services.workflow.processors.base.get_circuit_breakers",
+                return_value=circuits,
+            ),
+            pytest.raises(ProcessorExecutionError, match="retry budget"),
+        ):
+            await processor._execute_with_retry(
+                ToolProcessorInput(tool_id="quotes", parameters={})
+            )
+
+        assert processor.calls == 2
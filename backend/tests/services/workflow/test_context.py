@@ -196,6 +196,119 @@ class TestNodeInputOutput:
         assert "value" in input_data
         assert input_data["value"] == 42
 
+    @pytest.mark.asyncio
+    async def test_get_input_is_read_only_view(self) -> None:
+        """Test that input is a layered view sharing predecessor outputs.
+
+        TAG: [SPEC-011] [EXECUTION] [CONTEXT] [TEST]
+        """
+        from uuid import uuid4
+
+        context = ExecutionContext(workflow_execution_id=uuid4(), input_data={})
+        first_id, second_id, target_id = uuid4(), uuid4(), uuid4()
+        rows = [{"id": 1}]
+        await context.set_output(first_id, {"rows": rows, "key": "first"})
+        await context.set_output(second_id, {"key": "second"})
+        edges = [
+            Edge(
+                id=uuid4(),
+                workflow_id=uuid4(),
+                source_node_id=source_id,
+                target_node_id=target_id,
+            )
+            for source_id in (first_id, second_id)
+        ]
+
+        input_data = await context.get_input(Node(id=target_id), edges)
+
+        # Last edge wins, values are shared rather than copied
+        assert input_data == {"rows": rows, "key": "second"}
+        assert input_data["rows"] is rows
+        with pytest.raises(TypeError):
+            input_data["key"] = "changed"  # type: ignore[index]
+        assert dict(input_data) == {"rows": rows, "key": "second"}
+
+
+class TestOutputRelease:
+    """Tests for releasing node outputs after their last consumer.
+
+    TAG: [SPEC-011] [EXECUTION] [CONTEXT] [MEMORY] [TEST]
+    """
+
+    @staticmethod
+    def _edge(source_id, target_id) -> Edge:
+        from uuid import uuid4
+
+        return Edge(
+            id=uuid4(),
+            workflow_id=uuid4(),
+            source_node_id=source_id,
+            target_node_id=target_id,
+        )
+
+    @pytest.mark.asyncio
+    async def test_output_released_after_last_consumer(self) -> None:
+        """Test that an output is dropped once every consumer has read it."""
+        from uuid import uuid4
+
+        context = ExecutionContext(workflow_execution_id=uuid4(), input_data={})
+        source_id, first_id, second_id = uuid4(), uuid4(), uuid4()
+        context.track_consumers({source_id: 2})
+        await context.set_output(source_id, {"rows": [1, 2, 3]})
+
+        first = await context.get_input(
+            Node(id=first_id), [self._edge(source_id, first_id)]
+        )
+        assert source_id in await context.get_all_outputs()
+
+        second = await context.get_input(
+            Node(id=second_id), [self._edge(source_id, second_id)]
+        )
+        assert first == second == {"rows": [1, 2, 3]}
+        assert source_id not in await context.get_all_outputs()
+
+    @pytest.mark.asyncio
+    async def test_sink_and_retained_outputs_kept(self) -> None:
+        """Test that outputs without consumers or marked retained are kept."""
+        from uuid import uuid4
+
+        context = ExecutionContext(workflow_execution_id=uuid4(), input_data={})
+        retained_id, sink_id = uuid4(), uuid4()
+        context.track_consumers({retained_id: 1, sink_id: 0}, retain={retained_id})
+        await context.set_output(retained_id, {"kept": True})
+        await context.set_output(sink_id, {"final": True})
+
+        await context.get_input(Node(id=sink_id), [self._edge(retained_id, sink_id)])
+
+        assert set(await context.get_all_outputs()) == {retained_id, sink_id}
+
+    @pytest.mark.asyncio
+    async def test_release_inputs_of_skipped_node(self) -> None:
+        """Test that a skipped consumer no longer holds its inputs."""
+        from uuid import uuid4
+
+        context = ExecutionContext(workflow_execution_id=uuid4(), input_data={})
+        source_id, skipped_id = uuid4(), uuid4()
+        context.track_consumers({source_id: 1})
+        await context.set_output(source_id, {"data": "x"})
+
+        await context.release_inputs([self._edge(source_id, skipped_id)])
+
+        assert await context.get_all_outputs() == {}
+
+    @pytest.mark.asyncio
+    async def test_untracked_outputs_never_released(self) -> None:
+        """Test that outputs are kept when consumer tracking is not enabled."""
+        from uuid import uuid4
+
+        context = ExecutionContext(workflow_execution_id=uuid4(), input_data={})
+        source_id, target_id = uuid4(), uuid4()
+        await context.set_output(source_id, {"data": "x"})
+
+        await context.get_input(Node(id=target_id), [self._edge(source_id, target_id)])
+
+        assert source_id in await context.get_all_outputs()
+
 
 class TestErrorHandling:
     """Tests for error recording and checking.
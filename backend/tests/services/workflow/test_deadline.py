@@ -0,0 +1,100 @@
+"""Tests for execution deadlines propagated into node timeouts.
+
+TAG: [SPEC-011] [EXECUTION] [DEADLINE] [TEST]
+"""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from app.models.enums import ExecutionStatus
+from app.services.workflow.executor import (
+    SchedulingMode,
+    WorkflowExecutor,
+    _execution_deadline,
+)
+
+
+class TestExecutionDeadline:
+    """Tests for executions bounded by a time budget.
+
+    TAG: [SPEC-011] [EXECUTION] [DEADLINE] [TEST]
+    """
+
+    def test_request_deadline_overrides_workflow(self) -> None:
+        """Test where the time budget of an execution comes from."""
+        workflow = SimpleNamespace(config={"deadline_seconds": 60})
+
+        request = SimpleNamespace(metadata_={"deadline_seconds": 5})
+        unset = SimpleNamespace(metadata_={"deadline_seconds": None})
+
+        assert _execution_deadline(request, workflow) == 5.0
+        assert _execution_deadline(unset, workflow) == 60.0
+        assert _execution_deadline(unset, SimpleNamespace(config={})) is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode", list(SchedulingMode))
+    async def test_node_timeout_shortened_to_deadline(
+        self, db_session, workflow_factory, node_factory, mode
+    ) -> None:
+        """Test that a slow node is cut off when the workflow budget ends."""
+        workflow = workflow_factory(config={"deadline_seconds": 0.2})
+        node = node_factory(
+            workflow_id=workflow.id,
+            config={"sleep_seconds": 5, "timeout_seconds": 30},
+        )
+        db_session.add_all([workflow, node])
+        await db_session.commit()
+
+        executor = WorkflowExecutor(db=db_session, scheduling_mode=mode)
+        started = time.monotonic()
+        result = await executor.execute(workflow_id=workflow.id, input_data={})
+
+        assert result.status == ExecutionStatus.FAILED
+        assert time.monotonic() - started < 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode", list(SchedulingMode))
+    async def test_unreachable_deadline_aborts_early(
+        self, db_session, workflow_factory, node_factory, edge_factory, node_runs, mode
+    ) -> None:
+        """Test that no node runs when its critical path cannot fit."""
+        workflow = workflow_factory(config={"deadline_seconds": 1})
+        first = node_factory(workflow_id=workflow.id, name="Fetch")
+        second = node_factory(workflow_id=workflow.id, name="Signal")
+        edge = edge_factory(
+            workflow_id=workflow.id,
+            source_node_id=first.id,
+            target_node_id=second.id,
+        )
+        db_session.add_all([workflow, first, second, edge])
+        await db_session.commit()
+        executor = WorkflowExecutor(db=db_session, scheduling_mode=mode)
+        # Signal usually takes 5s, which Fetch would have to leave it
+        medians = {first.id: 0.1, second.id: 5.0}
+        with (
+            patch.object(executor, "_get_node_duration_medians", return_value=medians),
+            node_runs.patch(executor),
+        ):
+            result = await executor.execute(workflow_id=workflow.id, input_data={})
+
+        assert result.status == ExecutionStatus.FAILED
+        assert "deadline" in result.error_message
+        assert node_runs.started == []
+
+    @pytest.mark.asyncio
+    async def test_deadline_leaves_fast_workflows_alone(
+        self, db_session, workflow_factory, node_factory
+    ) -> None:
+        """Test that executions within their budget complete normally."""
+        workflow = workflow_factory(config={"deadline_seconds": 30})
+        node = node_factory(workflow_id=workflow.id)
+        db_session.add_all([workflow, node])
+        await db_session.commit()
+
+        executor = WorkflowExecutor(db=db_session)
+        result = await executor.execute(workflow_id=workflow.id, input_data={})
+
+        assert result.status == ExecutionStatus.COMPLETED
@@ -0,0 +1,116 @@
+"""Tests for sharing one run between structurally identical nodes.
+
+TAG: [SPEC-011] [EXECUTION] [PLAN] [TEST]
+"""
+
+import pytest
+from sqlalchemy import select
+
+from app.models.enums import ExecutionStatus
+from app.models.execution import ExecutionLog, NodeExecution
+from app.services.workflow.executor import SchedulingMode, WorkflowExecutor
+
+
+@pytest.fixture
+async def workflow(db_session, workflow_factory, node_factory, edge_factory):
+    """Persist Quotes -> (RSI, RSI copy) with Signal and Report consumers."""
+    workflow = workflow_factory()
+    nodes = {
+        name: node_factory(workflow_id=workflow.id, name=name, config=config)
+        for name, config in [
+            ("Quotes", {"url": "https://api.example.com/quotes"}),
+            ("RSI", {"url": "https://api.example.com/rsi", "dedupe": True}),
+            ("RSI copy", {"url": "https://api.example.com/rsi", "dedupe": True}),
+            ("Signal", {"url": "https://api.example.com/signal"}),
+            ("Report", {"url": "https://api.example.com/report"}),
+        ]
+    }
+    edges = [
+        edge_factory(
+            workflow_id=workflow.id,
+            source_node_id=nodes[source].id,
+            target_node_id=nodes[target].id,
+        )
+        for source, target in (
+            ("Quotes", "RSI"),
+            ("Quotes", "RSI copy"),
+            ("RSI", "Signal"),
+            ("RSI copy", "Report"),
+        )
+    ]
+    db_session.add_all([workflow, *nodes.values(), *edges])
+    await db_session.commit()
+    return workflow.id, {name: node.id for name, node in nodes.items()}
+
+
+class TestNodeDeduplication:
+    """Tests for running identical nodes once per execution.
+
+    TAG: [SPEC-011] [EXECUTION] [PLAN] [TEST]
+    """
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode", list(SchedulingMode))
+    async def test_identical_nodes_run_once(
+        self, db_session, workflow, node_runs, mode
+    ) -> None:
+        """Test that both consumers read the output of a single run."""
+        workflow_id, node_ids = workflow
+        names = {node_id: name for name, node_id in node_ids.items()}
+        node_runs.outputs = {"RSI": {"rsi": 71.5}, "RSI copy": {"rsi": 71.5}}
+        node_runs.delay = 0.01
+
+        executor = WorkflowExecutor(db=db_session, scheduling_mode=mode)
+        with node_runs.patch(executor):
+            result = await executor.execute(workflow_id=workflow_id, input_data={})
+
+        assert result.status == ExecutionStatus.COMPLETED
+        assert sorted(node_runs.started) == ["Quotes", "RSI", "Report", "Signal"]
+        assert node_runs.inputs["Signal"] == node_runs.inputs["Report"]
+        assert node_runs.inputs["Report"] == {"rsi": 71.5}
+
+        records = await db_session.execute(
+            select(NodeExecution).where(
+                NodeExecution.workflow_execution_id == result.execution_id
+            )
+        )
+        by_name = {names[ne.node_id]: ne for ne in records.scalars().all()}
+        assert by_name["RSI copy"].status == ExecutionStatus.COMPLETED
+        assert by_name["RSI copy"].output_data == {"rsi": 71.5}
+        # Copies are not output cache hits
+        assert by_name["RSI copy"].cache_hit is False
+
+        logs = await db_session.execute(
+            select(ExecutionLog.message).where(
+                ExecutionLog.workflow_execution_id == result.execution_id
+            )
+        )
+        assert "Node 'RSI copy' reused the output of identical node 'RSI'" in set(
+            logs.scalars().all()
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_run_fails_every_copy(
+        self, db_session, workflow, node_runs
+    ) -> None:
+        """Test that the copies of a failed node fail with the same error."""
+        workflow_id, node_ids = workflow
+        names = {node_id: name for name, node_id in node_ids.items()}
+        error = ValueError("not enough quotes")
+        node_runs.failures = {"RSI": error, "RSI copy": error}
+
+        executor = WorkflowExecutor(db=db_session)
+        with node_runs.patch(executor):
+            result = await executor.execute(workflow_id=workflow_id, input_data={})
+
+        assert result.status == ExecutionStatus.FAILED
+        records = await db_session.execute(
+            select(NodeExecution).where(
+                NodeExecution.workflow_execution_id == result.execution_id
+            )
+        )
+        by_name = {names[ne.node_id]: ne for ne in records.scalars().all()}
+        assert by_name["RSI"].status == ExecutionStatus.FAILED
+        assert by_name["RSI copy"].status == ExecutionStatus.FAILED
+        assert by_name["RSI copy"].error_message == by_name["RSI"].error_message
+        assert by_name["Report"].status == ExecutionStatus.SKIPPED
@@ -412,7 +412,7 @@ class TestWorkflowExecutorCancellationDuringExecution:
             )
 
         # Verify execution was cancelled
-        assert result.status == ExecutionStatus.FAILED
+        assert result.status == ExecutionStatus.CANCELLED
         assert result.error_message is not None
         assert "cancelled" in result.error_message.lower()
 
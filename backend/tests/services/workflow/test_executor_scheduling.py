@@ -0,0 +1,431 @@
+"""Tests for WorkflowExecutor dependency-driven scheduling.
+
+TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [SCHEDULER] [TEST]
+REQ: REQ-011-005 - Failure isolation policy
+REQ: REQ-011-006 - Condition node branching
+REQ: REQ-011-012 - Concurrency control
+"""
+
+import itertools
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import select
+
+from app.models.enums import ExecutionStatus, NodeType, TriggerType
+from app.models.execution import NodeExecution
+from app.services.workflow.executor import SchedulingMode, WorkflowExecutor
+
+
+async def _node_executions_by_name(db_session, execution_id, nodes):
+    """Return NodeExecution status keyed by node name."""
+    names = {node.id: node.name for node in nodes}
+    result = await db_session.execute(
+        select(NodeExecution).where(NodeExecution.workflow_execution_id == execution_id)
+    )
+    return {names[ne.node_id]: ne.status for ne in result.scalars().all()}
+
+
+class TestSchedulingModeInitialization:
+    """Tests for scheduling mode selection.
+
+    TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [SCHEDULER] [TEST]
+    """
+
+    def test_default_scheduling_mode_is_levels(self, db_session) -> None:
+        """Test that level-by-level scheduling remains the default."""
+        executor = WorkflowExecutor(db=db_session)
+
+        assert executor.scheduling_mode == SchedulingMode.LEVELS
+
+    def test_scheduling_mode_accepts_string_value(self, db_session) -> None:
+        """Test that the scheduling mode can be given by value."""
+        executor = WorkflowExecutor(db=db_session, scheduling_mode="dependency")
+
+        assert executor.scheduling_mode == SchedulingMode.DEPENDENCY
+
+
+class TestDependencyScheduling:
+    """Tests for ready-queue execution driven by remaining in-degree.
+
+    TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [SCHEDULER] [TEST]
+    """
+
+    async def _build_uneven_workflow(
+        self, db_session, workflow_factory, node_factory, edge_factory
+    ):
+        """Create Slow and Fast -> After Fast (two independent branches)."""
+        workflow = workflow_factory()
+        slow = node_factory(workflow_id=workflow.id, name="Slow")
+        fast = node_factory(workflow_id=workflow.id, name="Fast")
+        after_fast = node_factory(workflow_id=workflow.id, name="After Fast")
+        edge = edge_factory(
+            workflow_id=workflow.id,
+            source_node_id=fast.id,
+            target_node_id=after_fast.id,
+        )
+        db_session.add_all([workflow, slow, fast, after_fast, edge])
+        await db_session.commit()
+        return workflow, [slow, fast, after_fast]
+
+    @pytest.mark.asyncio
+    async def test_successor_starts_before_slow_sibling_finishes(
+        self, db_session, workflow_factory, node_factory, edge_factory, node_runs
+    ) -> None:
+        """Test that a node does not wait for unrelated nodes of its level."""
+        workflow, _ = await self._build_uneven_workflow(
+            db_session, workflow_factory, node_factory, edge_factory
+        )
+        # Slow only finishes once After Fast has started
+        node_runs.hold("Slow", "start:After Fast")
+
+        executor = WorkflowExecutor(
+            db=db_session, scheduling_mode=SchedulingMode.DEPENDENCY
+        )
+        with node_runs.patch(executor):
+            result = await executor.execute(
+                workflow_id=workflow.id,
+                input_data={},
+                trigger_type=TriggerType.MANUAL,
+            )
+
+        assert result.status == ExecutionStatus.COMPLETED
+        events = node_runs.events
+        assert events.index("start:After Fast") < events.index("end:Slow")
+
+    @pytest.mark.asyncio
+    async def test_levels_mode_waits_for_whole_level(
+        self, db_session, workflow_factory, node_factory, edge_factory, node_runs
+    ) -> None:
+        """Test the level barrier that dependency scheduling removes."""
+        workflow, _ = await self._build_uneven_workflow(
+            db_session, workflow_factory, node_factory, edge_factory
+        )
+        # Slow finishes after Fast, while After Fast could already start
+        node_runs.hold("Slow", "end:Fast")
+
+        executor = WorkflowExecutor(db=db_session)
+        with node_runs.patch(executor):
+            await executor.execute(
+                workflow_id=workflow.id,
+                input_data={},
+                trigger_type=TriggerType.MANUAL,
+            )
+
+        events = node_runs.events
+        assert events.index("start:After Fast") > events.index("end:Slow")
+
+    @pytest.mark.asyncio
+    async def test_outputs_flow_to_successors(
+        self, db_session, workflow_factory, node_factory, edge_factory, node_runs
+    ) -> None:
+        """Test that successors receive predecessor outputs as input."""
+        workflow, nodes = await self._build_uneven_workflow(
+            db_session, workflow_factory, node_factory, edge_factory
+        )
+        node_runs.outputs = {node.name: {"from": node.name} for node in nodes}
+
+        executor = WorkflowExecutor(
+            db=db_session, scheduling_mode=SchedulingMode.DEPENDENCY
+        )
+        with node_runs.patch(executor):
+            result = await executor.execute(
+                workflow_id=workflow.id,
+                input_data={"seed": 1},
+                trigger_type=TriggerType.MANUAL,
+            )
+
+        assert result.status == ExecutionStatus.COMPLETED
+        assert node_runs.inputs["After Fast"]["from"] == "Fast"
+        # Only sink outputs are kept; Fast was released after its successor
+        assert set(result.node_results) == {
+            node.id for node in nodes if node.name != "Fast"
+        }
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode", list(SchedulingMode))
+    async def test_retain_output_keeps_intermediate_result(
+        self, db_session, workflow_factory, node_factory, edge_factory, node_runs, mode
+    ) -> None:
+        """Test that retain_output keeps a consumed output in the results."""
+        workflow, nodes = await self._build_uneven_workflow(
+            db_session, workflow_factory, node_factory, edge_factory
+        )
+        fast = next(node for node in nodes if node.name == "Fast")
+        fast.config = {**fast.config, "retain_output": True}
+        await db_session.commit()
+        node_runs.outputs = {node.name: {"from": node.name} for node in nodes}
+
+        executor = WorkflowExecutor(db=db_session, scheduling_mode=mode)
+        with node_runs.patch(executor):
+            result = await executor.execute(workflow_id=workflow.id, input_data={})
+
+        assert result.status == ExecutionStatus.COMPLETED
+        assert set(result.node_results) == {node.id for node in nodes}
+        assert result.node_results[fast.id] == {"from": "Fast"}
+
+    @pytest.mark.asyncio
+    async def test_max_parallel_nodes_is_respected(
+        self, db_session, workflow_factory, node_factory, node_runs
+    ) -> None:
+        """Test that the semaphore bounds concurrently running nodes."""
+        workflow = workflow_factory()
+        nodes = [
+            node_factory(workflow_id=workflow.id, name=f"Node {i}") for i in range(6)
+        ]
+        db_session.add_all([workflow, *nodes])
+        await db_session.commit()
+        node_runs.delay = 0.02
+
+        executor = WorkflowExecutor(
+            db=db_session,
+            max_parallel_nodes=2,
+            scheduling_mode=SchedulingMode.DEPENDENCY,
+        )
+        with node_runs.patch(executor):
+            result = await executor.execute(
+                workflow_id=workflow.id,
+                input_data={},
+                trigger_type=TriggerType.MANUAL,
+            )
+
+        assert result.status == ExecutionStatus.COMPLETED
+        assert node_runs.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_blocks_only_downstream(
+        self, db_session, workflow_factory, node_factory, edge_factory, node_runs
+    ) -> None:
+        """Test failure isolation: A -> B(fails) -> C, independent D."""
+        workflow = workflow_factory()
+        node_a = node_factory(workflow_id=workflow.id, name="A")
+        node_b = node_factory(workflow_id=workflow.id, name="B")
+        node_c = node_factory(workflow_id=workflow.id, name="C")
+        node_d = node_factory(workflow_id=workflow.id, name="D")
+        nodes = [node_a, node_b, node_c, node_d]
+        edges = [
+            edge_factory(
+                workflow_id=workflow.id,
+                source_node_id=node_a.id,
+                target_node_id=node_b.id,
+            ),
+            edge_factory(
+                workflow_id=workflow.id,
+                source_node_id=node_b.id,
+                target_node_id=node_c.id,
+            ),
+        ]
+        db_session.add_all([workflow, *nodes, *edges])
+        await db_session.commit()
+        node_runs.failures["B"] = Exception("Simulated failure")
+
+        executor = WorkflowExecutor(
+            db=db_session, scheduling_mode=SchedulingMode.DEPENDENCY
+        )
+        with node_runs.patch(executor):
+            result = await executor.execute(
+                workflow_id=workflow.id,
+                input_data={},
+                trigger_type=TriggerType.MANUAL,
+            )
+
+        assert result.status == ExecutionStatus.FAILED
+        assert "C" not in node_runs.started
+        statuses = await _node_executions_by_name(
+            db_session, result.execution_id, nodes
+        )
+        assert statuses == {
+            "A": ExecutionStatus.COMPLETED,
+            "B": ExecutionStatus.FAILED,
+            "C": ExecutionStatus.SKIPPED,
+            "D": ExecutionStatus.COMPLETED,
+        }
+
+    @pytest.mark.asyncio
+    async def test_condition_skips_non_matching_path(
+        self, db_session, workflow_factory, node_factory, edge_factory
+    ) -> None:
+        """Test that condition routing excludes non-matching successors."""
+        workflow = workflow_factory()
+        condition = node_factory(
+            workflow_id=workflow.id, name="Condition", node_type=NodeType.CONDITION
+        )
+        node_a = node_factory(workflow_id=workflow.id, name="A")
+        node_b = node_factory(workflow_id=workflow.id, name="B")
+        node_b_child = node_factory(workflow_id=workflow.id, name="B Child")
+        nodes = [condition, node_a, node_b, node_b_child]
+        edge_a = edge_factory(
+            workflow_id=workflow.id,
+            source_node_id=condition.id,
+            target_node_id=node_a.id,
+        )
+        edge_b = edge_factory(
+            workflow_id=workflow.id,
+            source_node_id=condition.id,
+            target_node_id=node_b.id,
+        )
+        edge_b_child = edge_factory(
+            workflow_id=workflow.id,
+            source_node_id=node_b.id,
+            target_node_id=node_b_child.id,
+        )
+        db_session.add_all([workflow, *nodes, edge_a, edge_b, edge_b_child])
+        await db_session.commit()
+
+        executor = WorkflowExecutor(
+            db=db_session, scheduling_mode=SchedulingMode.DEPENDENCY
+        )
+        with patch.object(
+            executor,
+            "_evaluate_condition_node",
+            return_value={"matched_edges": [edge_a.id], "result": True},
+        ):
+            result = await executor.execute(
+                workflow_id=workflow.id,
+                input_data={},
+                trigger_type=TriggerType.MANUAL,
+            )
+
+        assert result.status == ExecutionStatus.COMPLETED
+        statuses = await _node_executions_by_name(
+            db_session, result.execution_id, nodes
+        )
+        assert statuses == {
+            "Condition": ExecutionStatus.COMPLETED,
+            "A": ExecutionStatus.COMPLETED,
+            "B": ExecutionStatus.SKIPPED,
+            "B Child": ExecutionStatus.SKIPPED,
+        }
+
+    @pytest.mark.asyncio
+    async def test_cancellation_stops_dispatch(
+        self, db_session, workflow_factory, node_factory, edge_factory, node_runs
+    ) -> None:
+        """Test that cancelling mid-run prevents successors from starting."""
+        workflow = workflow_factory()
+        first = node_factory(workflow_id=workflow.id, name="First")
+        second = node_factory(workflow_id=workflow.id, name="Second")
+        edge = edge_factory(
+            workflow_id=workflow.id,
+            source_node_id=first.id,
+            target_node_id=second.id,
+        )
+        db_session.add_all([workflow, first, second, edge])
+        await db_session.commit()
+
+        executor = WorkflowExecutor(
+            db=db_session, scheduling_mode=SchedulingMode.DEPENDENCY
+        )
+
+        def cancel_during_run(*_):
+            executor._cancelled = True
+            return {"executed": True}
+
+        node_runs.respond = cancel_during_run
+        with node_runs.patch(executor):
+            result = await executor.execute(
+                workflow_id=workflow.id,
+                input_data={},
+                trigger_type=TriggerType.MANUAL,
+            )
+
+        assert result.status == ExecutionStatus.CANCELLED
+        assert "cancelled" in result.error_message.lower()
+        assert node_runs.started == ["First"]
+
+
+class TestCriticalPathPriority:
+    """Tests for critical-path-first dispatch of ready nodes.
+
+    TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [SCHEDULER] [TEST]
+    """
+
+    async def _build_workflow(
+        self, db_session, workflow_factory, node_factory, edge_factory
+    ):
+        """Create Short alongside a Chain 1 -> Chain 2 -> Chain 3 branch."""
+        workflow = workflow_factory()
+        short = node_factory(workflow_id=workflow.id, name="Short")
+        chain = [
+            node_factory(workflow_id=workflow.id, name=f"Chain {i}")
+            for i in range(1, 4)
+        ]
+        edges = [
+            edge_factory(
+                workflow_id=workflow.id, source_node_id=s.id, target_node_id=t.id
+            )
+            for s, t in itertools.pairwise(chain)
+        ]
+        db_session.add_all([workflow, short, *chain, *edges])
+        await db_session.commit()
+        return workflow, short, chain
+
+    async def _run_single_slot(self, db_session, workflow, scheduling_mode, node_runs):
+        executor = WorkflowExecutor(
+            db=db_session, max_parallel_nodes=1, scheduling_mode=scheduling_mode
+        )
+        with node_runs.patch(executor):
+            result = await executor.execute(workflow_id=workflow.id, input_data={})
+
+        assert result.status == ExecutionStatus.COMPLETED
+        return node_runs.started
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode", list(SchedulingMode))
+    async def test_longest_path_starts_first(
+        self, db_session, workflow_factory, node_factory, edge_factory, node_runs, mode
+    ) -> None:
+        """Test that the head of the longest chain gets the only slot first."""
+        workflow, _, _ = await self._build_workflow(
+            db_session, workflow_factory, node_factory, edge_factory
+        )
+
+        started = await self._run_single_slot(db_session, workflow, mode, node_runs)
+
+        assert started[0] == "Chain 1"
+
+    @pytest.mark.asyncio
+    async def test_historical_durations_weight_priorities(
+        self, db_session, workflow_factory, node_factory, edge_factory, node_runs
+    ) -> None:
+        """Test that a slow node outranks a longer chain of fast nodes."""
+        from datetime import UTC, datetime, timedelta
+
+        from app.models.execution import WorkflowExecution
+
+        workflow, short, chain = await self._build_workflow(
+            db_session, workflow_factory, node_factory, edge_factory
+        )
+        past = WorkflowExecution(
+            workflow_id=workflow.id,
+            trigger_type=TriggerType.MANUAL,
+            status=ExecutionStatus.COMPLETED,
+        )
+        db_session.add(past)
+        await db_session.flush()
+        start = datetime.now(UTC) - timedelta(hours=1)
+        for order, (node, seconds) in enumerate(
+            [(short, 60), (short, 30), *((n, 1) for n in chain)], start=1
+        ):
+            db_session.add(
+                NodeExecution(
+                    workflow_execution_id=past.id,
+                    node_id=node.id,
+                    status=ExecutionStatus.COMPLETED,
+                    started_at=start,
+                    ended_at=start + timedelta(seconds=seconds),
+                    execution_order=order,
+                )
+            )
+        await db_session.commit()
+
+        executor = WorkflowExecutor(db=db_session)
+        medians = await executor._get_node_duration_medians(
+            await executor._get_execution_plan(workflow)
+        )
+        started = await self._run_single_slot(
+            db_session, workflow, SchedulingMode.DEPENDENCY, node_runs
+        )
+
+        assert medians[short.id] == 45
+        assert started[0] == "Short"
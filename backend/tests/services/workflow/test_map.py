@@ -0,0 +1,223 @@
+"""Tests for PARALLEL map nodes fanning a body node out over a list.
+
+TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [MAP] [TEST]
+"""
+
+import pytest
+from sqlalchemy import select
+
+from app.models.enums import ExecutionStatus, NodeType
+from app.models.execution import ExecutionLog, NodeExecution
+from app.services.workflow.executor import WorkflowExecutor
+
+TICKERS = ["AAPL", "MSFT", "NVDA", "AMZN", "GOOG"]
+
+
+@pytest.fixture
+def build_workflow(db_session, workflow_factory, node_factory, edge_factory):
+    """Persist Source -> Fan (PARALLEL) -> Quote -> Collect (AGGREGATOR)."""
+
+    async def build(fan_config, quote_config=None):
+        workflow = workflow_factory()
+        nodes = {
+            "Source": node_factory(
+                workflow_id=workflow.id, name="Source", config={"list": True}
+            ),
+            "Fan": node_factory(
+                workflow_id=workflow.id,
+                name="Fan",
+                node_type=NodeType.PARALLEL,
+                config=fan_config,
+            ),
+            "Quote": node_factory(
+                workflow_id=workflow.id,
+                name="Quote",
+                config=quote_config or {"quote": True},
+            ),
+            "Collect": node_factory(
+                workflow_id=workflow.id,
+                name="Collect",
+                node_type=NodeType.AGGREGATOR,
+                config={},
+            ),
+        }
+        edges = [
+            edge_factory(
+                workflow_id=workflow.id,
+                source_node_id=nodes[source].id,
+                target_node_id=nodes[target].id,
+            )
+            for source, target in (
+                ("Source", "Fan"),
+                ("Fan", "Quote"),
+                ("Quote", "Collect"),
+            )
+        ]
+        db_session.add_all([workflow, *nodes.values(), *edges])
+        await db_session.commit()
+        return workflow.id, {node.id: name for name, node in nodes.items()}
+
+    return build
+
+
+@pytest.fixture
+def quote_runs(node_runs):
+    """Node runs where Source lists TICKERS and each Quote item echoes its ticker."""
+
+    def quote(node, input_data):
+        if node.name == "Quote":
+            return {"quote": input_data["ticker"]}
+        return dict(input_data)
+
+    node_runs.outputs["Source"] = {"tickers": TICKERS}
+    node_runs.respond = quote
+    return node_runs
+
+
+class TestMapNodes:
+    """Tests for dynamic fan-out over a list in the node input.
+
+    TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [MAP] [TEST]
+    """
+
+    @pytest.mark.asyncio
+    async def test_body_runs_per_item_with_bounded_concurrency(
+        self, db_session, build_workflow, quote_runs
+    ) -> None:
+        """Test that items run at most max_concurrency at once, in order."""
+        workflow_id, names = await build_workflow(
+            {"items_key": "tickers", "item_key": "ticker", "max_concurrency": 2}
+        )
+        quote_runs.delay = 0.01
+
+        executor = WorkflowExecutor(db=db_session)
+        with quote_runs.patch(executor):
+            result = await executor.execute(workflow_id=workflow_id, input_data={})
+
+        assert result.status == ExecutionStatus.COMPLETED
+        assert quote_runs.peak == 2
+        node_ids = {name: node_id for node_id, name in names.items()}
+        assert result.output_data[str(node_ids["Collect"])] == {
+            "results": [{"quote": ticker} for ticker in TICKERS]
+        }
+
+        records = await db_session.execute(
+            select(NodeExecution).where(
+                NodeExecution.workflow_execution_id == result.execution_id,
+                NodeExecution.node_id == node_ids["Quote"],
+            )
+        )
+        rows = records.scalars().all()
+        assert sorted(r.item_index for r in rows if r.item_index is not None) == [
+            0,
+            1,
+            2,
+            3,
+            4,
+        ]
+        assert len([r for r in rows if r.item_index is None]) == 1
+        assert all(r.status == ExecutionStatus.COMPLETED for r in rows)
+        logs = await db_session.execute(
+            select(ExecutionLog.message).where(
+                ExecutionLog.workflow_execution_id == result.execution_id
+            )
+        )
+        assert "Node 'Quote' mapped over 5 item(s), 0 failed" in set(
+            logs.scalars().all()
+        )
+
+    @pytest.mark.asyncio
+    async def test_equal_items_share_cached_output(
+        self, db_session, build_workflow, quote_runs
+    ) -> None:
+        """Test that the item position is not part of the output cache key."""
+        workflow_id, _ = await build_workflow(
+            {"items_key": "tickers", "item_key": "ticker", "max_concurrency": 1},
+            {"quote": True, "cache": True},
+        )
+        quote_runs.outputs["Source"] = {"tickers": ["AAPL", "MSFT", "AAPL"]}
+
+        executor = WorkflowExecutor(db=db_session)
+        with quote_runs.patch(executor):
+            result = await executor.execute(workflow_id=workflow_id, input_data={})
+
+        assert result.status == ExecutionStatus.COMPLETED
+        assert quote_runs.started.count("Quote") == 2
+        collected = next(iter(result.output_data.values()))
+        assert collected == {
+            "results": [{"quote": "AAPL"}, {"quote": "MSFT"}, {"quote": "AAPL"}]
+        }
+
+    @pytest.mark.asyncio
+    async def test_items_are_chunked(
+        self, db_session, build_workflow, quote_runs
+    ) -> None:
+        """Test that chunk_size hands lists of items to each body run."""
+        workflow_id, _ = await build_workflow(
+            {"items_key": "tickers", "item_key": "ticker", "chunk_size": 2}
+        )
+
+        executor = WorkflowExecutor(db=db_session)
+        with quote_runs.patch(executor):
+            result = await executor.execute(workflow_id=workflow_id, input_data={})
+
+        assert result.status == ExecutionStatus.COMPLETED
+        collected = next(iter(result.output_data.values()))
+        assert [r["quote"] for r in collected["results"]] == [
+            ["AAPL", "MSFT"],
+            ["NVDA", "AMZN"],
+            ["GOOG"],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_item_fails_body(
+        self, db_session, build_workflow, node_runs
+    ) -> None:
+        """Test that one failed item fails the body and its row is kept."""
+        workflow_id, _ = await build_workflow(
+            {"items_key": "tickers", "item_key": "ticker"}
+        )
+
+        def reject_nvda(_node, input_data):
+            if input_data.get("ticker") == "NVDA":
+                raise ValueError("unknown ticker")
+
+        node_runs.outputs["Source"] = {"tickers": TICKERS}
+        node_runs.respond = reject_nvda
+
+        executor = WorkflowExecutor(db=db_session)
+        with node_runs.patch(executor):
+            result = await executor.execute(workflow_id=workflow_id, input_data={})
+
+        assert result.status == ExecutionStatus.FAILED
+        records = await db_session.execute(
+            select(NodeExecution).where(
+                NodeExecution.workflow_execution_id == result.execution_id,
+                NodeExecution.status == ExecutionStatus.FAILED,
+            )
+        )
+        failed = {r.item_index: r.error_message for r in records.scalars().all()}
+        assert set(failed) == {None, 2}
+        assert "1 of 5 item(s) failed" in failed[None]
+
+    @pytest.mark.asyncio
+    async def test_non_list_input_fails_fan_out(
+        self, db_session, build_workflow, quote_runs
+    ) -> None:
+        """Test that the PARALLEL node fails if its input has no list."""
+        workflow_id, _ = await build_workflow({"items_key": "tickers"})
+        quote_runs.outputs["Source"] = {"tickers": "AAPL"}
+
+        executor = WorkflowExecutor(db=db_session)
+        with quote_runs.patch(executor):
+            result = await executor.execute(workflow_id=workflow_id, input_data={})
+
+        assert result.status == ExecutionStatus.FAILED
+        assert "Fan" in result.error_message
+        failed = await db_session.scalar(
+            select(NodeExecution).where(
+                NodeExecution.workflow_execution_id == result.execution_id,
+                NodeExecution.status == ExecutionStatus.FAILED,
+            )
+        )
+        assert "input 'tickers' is not a list" in failed.error_message
@@ -0,0 +1,164 @@
+"""Tests for content-addressed node output memoization.
+
+TAG: [SPEC-011] [EXECUTION] [CACHING] [TEST]
+"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import select
+
+from app.models.enums import NodeType
+from app.models.execution import NodeExecution
+from app.services.workflow.executor import WorkflowExecutor
+from app.services.workflow.output_cache import (
+    NodeOutputCache,
+    get_cache_ttl,
+    make_cache_key,
+)
+
+
+def _node(config=None, node_type=NodeType.ADAPTER, tool_id=None):
+    return SimpleNamespace(
+        node_type=node_type, config=config or {}, tool_id=tool_id, agent_id=None
+    )
+
+
+class TestCacheKey:
+    """Tests for cache key derivation.
+
+    TAG: [SPEC-011] [EXECUTION] [CACHING] [TEST]
+    """
+
+    def test_key_is_stable_and_ignores_cache_option(self) -> None:
+        """Test that equal content yields equal keys regardless of ordering."""
+        first = _node({"a": 1, "b": [1, 2], "cache": True})
+        second = _node({"b": [1, 2], "a": 1, "cache": {"ttl_seconds": 5}})
+
+        assert make_cache_key(first, {"x": 1, "y": 2}) == make_cache_key(
+            second, {"y": 2, "x": 1}
+        )
+
+    def test_key_changes_with_content(self) -> None:
+        """Test that node type, config and input all affect the key."""
+        base = make_cache_key(_node({"a": 1}), {"x": 1})
+
+        assert make_cache_key(_node({"a": 2}), {"x": 1}) != base
+        assert make_cache_key(_node({"a": 1}), {"x": 2}) != base
+        assert (
+            make_cache_key(_node({"a": 1}, node_type=NodeType.AGGREGATOR), {"x": 1})
+            != base
+        )
+
+    def test_ttl_requires_opt_in(self) -> None:
+        """Test that only nodes with a cache option are cached."""
+        assert get_cache_ttl(_node()) is None
+        assert get_cache_ttl(_node({"cache": False})) is None
+        assert get_cache_ttl(_node({"cache": {"ttl_seconds": 7}})) == 7
+
+
+class TestNodeOutputCache:
+    """Tests for the in-process cache tier.
+
+    TAG: [SPEC-011] [EXECUTION] [CACHING] [TEST]
+    """
+
+    @pytest.mark.asyncio
+    async def test_entries_expire(self) -> None:
+        """Test that entries are dropped after their TTL."""
+        cache = NodeOutputCache(max_size=4)
+        await cache.set("k", {"v": 1}, ttl=10)
+
+        with patch(
+            "app.services.workflow.output_cache.time.monotonic", return_value=1e12
+        ):
+            assert await cache.get("k") is None
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(self) -> None:
+        """Test LRU eviction once the size bound is reached."""
+        cache = NodeOutputCache(max_size=2)
+        await cache.set("a", {"v": "a"}, ttl=60)
+        await cache.set("b", {"v": "b"}, ttl=60)
+        assert await cache.get("a") == {"v": "a"}
+
+        await cache.set("c", {"v": "c"}, ttl=60)
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") == {"v": "a"}
+        assert await cache.get("c") == {"v": "c"}
+
+    @pytest.mark.asyncio
+    async def test_returned_outputs_are_copies(self) -> None:
+        """Test that mutating a returned output leaves the entry intact."""
+        cache = NodeOutputCache()
+        await cache.set("k", {"items": [1]}, ttl=60)
+
+        (await cache.get("k"))["items"].append(2)
+
+        assert await cache.get("k") == {"items": [1]}
+
+
+class TestExecutorMemoization:
+    """Tests for serving opted-in nodes from the cache.
+
+    TAG: [SPEC-011] [EXECUTION] [CACHING] [TEST]
+    """
+
+    async def _run_twice(
+        self, db_session, workflow_factory, node_factory, node_runs, config
+    ):
+        workflow = workflow_factory()
+        node = node_factory(workflow_id=workflow.id, name="Cached", config=config)
+        db_session.add_all([workflow, node])
+        await db_session.commit()
+        workflow_id = workflow.id
+
+        cache = NodeOutputCache()
+        node_runs.respond = lambda *_: {"value": len(node_runs.started)}
+
+        results = []
+        for _ in range(2):
+            executor = WorkflowExecutor(db=db_session, output_cache=cache)
+            with node_runs.patch(executor):
+                results.append(
+                    await executor.execute(workflow_id=workflow_id, input_data={})
+                )
+
+        rows = []
+        for result in results:
+            row = await db_session.execute(
+                select(NodeExecution).where(
+                    NodeExecution.workflow_execution_id == result.execution_id
+                )
+            )
+            rows.append(row.scalar_one())
+        return node_runs.started, rows
+
+    @pytest.mark.asyncio
+    async def test_second_run_is_served_from_cache(
+        self, db_session, workflow_factory, node_factory, node_runs
+    ) -> None:
+        """Test that identical input skips node logic and flags the row."""
+        calls, (first, second) = await self._run_twice(
+            db_session, workflow_factory, node_factory, node_runs, {"cache": True}
+        )
+
+        assert len(calls) == 1
+        assert first.cache_hit is False
+        assert second.cache_hit is True
+        assert second.output_data == first.output_data == {"value": 1}
+
+    @pytest.mark.asyncio
+    async def test_nodes_without_opt_in_always_run(
+        self, db_session, workflow_factory, node_factory, node_runs
+    ) -> None:
+        """Test that nodes are not cached by default."""
+        calls, rows = await self._run_twice(
+            db_session, workflow_factory, node_factory, node_runs, {}
+        )
+
+        assert len(calls) == 2
+        assert [row.cache_hit for row in rows] == [False, False]
@@ -0,0 +1,129 @@
+"""Tests for the write-behind execution persistence buffer.
+
+TAG: [SPEC-011] [EXECUTION] [PERSISTENCE] [TEST]
+REQ: REQ-011-010 - ExecutionLog integration
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models.enums import ExecutionStatus, LogLevel, NodeType, TriggerType
+from app.models.execution import ExecutionLog, NodeExecution, WorkflowExecution
+from app.services.workflow.persistence import ExecutionWriteBuffer
+
+
+@pytest.fixture
+async def running_execution(db_session, workflow_factory, node_factory):
+    """Create a workflow with one node and a RUNNING execution."""
+    workflow = workflow_factory()
+    node = node_factory(workflow_id=workflow.id, node_type=NodeType.TOOL)
+    execution = WorkflowExecution(
+        workflow_id=workflow.id,
+        trigger_type=TriggerType.MANUAL,
+        status=ExecutionStatus.RUNNING,
+        started_at=datetime.now(UTC),
+        input_data={},
+    )
+    db_session.add_all([workflow, node, execution])
+    await db_session.flush()
+    return execution, node
+
+
+async def _count(db_session, model) -> int:
+    result = await db_session.execute(select(func.count()).select_from(model))
+    return result.scalar_one()
+
+
+class TestExecutionWriteBuffer:
+    """Tests for ExecutionWriteBuffer batching.
+
+    TAG: [SPEC-011] [EXECUTION] [PERSISTENCE] [TEST]
+    """
+
+    @pytest.mark.asyncio
+    async def test_rows_are_buffered_until_flush(
+        self, db_session, running_execution
+    ) -> None:
+        """Test that buffered rows are only written on flush."""
+        execution, node = running_execution
+        buffer = ExecutionWriteBuffer(db_session, max_pending=100, flush_interval=60)
+
+        node_execution_id = await buffer.add_node_execution(
+            workflow_execution_id=execution.id,
+            node_id=node.id,
+            status=ExecutionStatus.COMPLETED,
+            execution_order=1,
+            output_data={"ok": True},
+        )
+        await buffer.add_log(
+            workflow_execution_id=execution.id,
+            node_execution_id=node_execution_id,
+            level=LogLevel.INFO,
+            message="done",
+        )
+
+        assert buffer.pending == 2
+        assert await _count(db_session, NodeExecution) == 0
+        assert await _count(db_session, ExecutionLog) == 0
+
+        await buffer.flush()
+
+        assert buffer.pending == 0
+        node_execution = await db_session.get(NodeExecution, node_execution_id)
+        assert node_execution is not None
+        assert node_execution.output_data == {"ok": True}
+        logs = (await db_session.execute(select(ExecutionLog))).scalars().all()
+        assert [log.node_execution_id for log in logs] == [node_execution_id]
+
+    @pytest.mark.asyncio
+    async def test_size_threshold_triggers_flush(
+        self, db_session, running_execution
+    ) -> None:
+        """Test that reaching max_pending writes the batch."""
+        execution, _ = running_execution
+        buffer = ExecutionWriteBuffer(db_session, max_pending=3, flush_interval=60)
+
+        for i in range(3):
+            await buffer.add_log(
+                workflow_execution_id=execution.id,
+                level=LogLevel.INFO,
+                message=f"log {i}",
+            )
+
+        assert buffer.pending == 0
+        assert await _count(db_session, ExecutionLog) == 3
+
+    @pytest.mark.asyncio
+    async def test_interval_threshold_triggers_flush(
+        self, db_session, running_execution
+    ) -> None:
+        """Test that rows older than flush_interval are written."""
+        execution, _ = running_execution
+        buffer = ExecutionWriteBuffer(db_session, max_pending=100, flush_interval=0)
+
+        await buffer.add_log(
+            workflow_execution_id=execution.id,
+            level=LogLevel.INFO,
+            message="immediate",
+        )
+
+        assert buffer.pending == 0
+        assert await _count(db_session, ExecutionLog) == 1
+
+    @pytest.mark.asyncio
+    async def test_clear_discards_rows(self, db_session, running_execution) -> None:
+        """Test that clear drops buffered rows without writing them."""
+        execution, _ = running_execution
+        buffer = ExecutionWriteBuffer(db_session, max_pending=100, flush_interval=60)
+
+        await buffer.add_log(
+            workflow_execution_id=execution.id,
+            level=LogLevel.INFO,
+            message="dropped",
+        )
+        buffer.clear()
+        await buffer.flush()
+
+        assert await _count(db_session, ExecutionLog) == 0
@@ -0,0 +1,411 @@
+"""Tests for compiled execution plans and the plan cache.
+
+TAG: [SPEC-011] [EXECUTION] [PLAN] [TEST]
+REQ: REQ-011-001 - DAG topological sort based execution
+"""
+
+from dataclasses import FrozenInstanceError
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from app.models.enums import ExecutionStatus, NodeType, TriggerType
+from app.schemas.validation import TopologyLevel, TopologyResult
+from app.services.workflow.executor import WorkflowExecutor
+from app.services.workflow.plan import ExecutionPlan, ExecutionPlanCache
+from app.services.workflow_service import EdgeService, NodeService
+
+
+def _topology(*levels):
+    return TopologyResult(
+        execution_order=[
+            TopologyLevel(level=i, node_ids=list(ids), can_parallel=len(ids) > 1)
+            for i, ids in enumerate(levels)
+        ],
+        total_levels=len(levels),
+        max_parallel_nodes=max((len(ids) for ids in levels), default=0),
+        critical_path_length=len(levels),
+        critical_path=[ids[0] for ids in levels],
+    )
+
+
+@pytest.fixture
+def diamond(workflow_factory, node_factory, edge_factory):
+    """Build an A -> (B, C) -> D diamond without persisting it."""
+    workflow = workflow_factory()
+    a, b, c, d = (
+        node_factory(workflow_id=workflow.id, name=name, config={"k": [name]})
+        for name in "ABCD"
+    )
+    edges = [
+        edge_factory(workflow_id=workflow.id, source_node_id=s.id, target_node_id=t.id)
+        for s, t in [(a, b), (a, c), (b, d), (c, d)]
+    ]
+    return workflow, [a, b, c, d], edges
+
+
+class TestExecutionPlanCompile:
+    """Tests for ExecutionPlan.compile.
+
+    TAG: [SPEC-011] [EXECUTION] [PLAN] [TEST]
+    """
+
+    def test_compile_builds_indexes(self, diamond) -> None:
+        """Test that adjacency and edge indexes are precomputed."""
+        workflow, (a, b, c, d), edges = diamond
+        plan = ExecutionPlan.compile(
+            workflow.id, 1, _topology([a.id], [b.id, c.id], [d.id]), [a, b, c, d], edges
+        )
+
+        assert plan.ordered_node_ids == (a.id, b.id, c.id, d.id)
+        assert dict(plan.in_degree) == {a.id: 0, b.id: 1, c.id: 1, d.id: 2}
+        assert {e.source_node_id for e in plan.incoming_edges[d.id]} == {b.id, c.id}
+        assert {e.target_node_id for e in plan.outgoing_edges[a.id]} == {b.id, c.id}
+        assert plan.edge_endpoints[edges[0].id] == (a.id, b.id)
+        assert set(plan.graph.get_successors(a.id)) == {b.id, c.id}
+
+    def test_plan_is_immutable_snapshot(self, diamond) -> None:
+        """Test that the plan is frozen and detached from ORM objects."""
+        workflow, nodes, edges = diamond
+        plan = ExecutionPlan.compile(
+            workflow.id, 1, _topology([n.id for n in nodes]), nodes, edges
+        )
+        nodes[0].config["k"].append("mutated")
+
+        assert plan.nodes[nodes[0].id].config["k"] == ["A"]
+        with pytest.raises(FrozenInstanceError):
+            plan.version = 2  # type: ignore[misc]
+        with pytest.raises(TypeError):
+            plan.nodes[nodes[0].id].config["new"] = 1  # type: ignore[index]
+
+    def test_identical_nodes_are_grouped(
+        self, workflow_factory, node_factory, edge_factory
+    ) -> None:
+        """Test grouping of opted-in identical nodes and of their successors."""
+        workflow = workflow_factory()
+        a, b1, b2, c1, c2, d = (
+            node_factory(workflow_id=workflow.id, name=name, config=config)
+            for name, config in [
+                ("A", {"k": "a"}),
+                ("B1", {"k": "b", "dedupe": True}),
+                ("B2", {"k": "b", "dedupe": True}),
+                ("C1", {"k": "c", "dedupe": True}),
+                ("C2", {"k": "c", "dedupe": True}),
+                ("D", {"k": "b"}),
+            ]
+        )
+        edges = [
+            edge_factory(
+                workflow_id=workflow.id, source_node_id=s.id, target_node_id=t.id
+            )
+            for s, t in [(a, b1), (a, b2), (a, d), (b1, c1), (b2, c2)]
+        ]
+        nodes = [a, b1, b2, c1, c2, d]
+        plan = ExecutionPlan.compile(
+            workflow.id,
+            1,
+            _topology([a.id], [b1.id, b2.id, d.id], [c1.id, c2.id]),
+            nodes,
+            edges,
+        )
+
+        assert dict(plan.equivalent_nodes) == {
+            b1.id: b1.id,
+            b2.id: b1.id,
+            c1.id: c1.id,
+            c2.id: c1.id,
+        }
+
+    def test_condition_nodes_are_not_grouped(
+        self, workflow_factory, node_factory
+    ) -> None:
+        """Test that condition nodes keep their own routing."""
+        workflow = workflow_factory()
+        nodes = [
+            node_factory(
+                workflow_id=workflow.id,
+                node_type=NodeType.CONDITION,
+                config={"dedupe": True},
+            )
+            for _ in range(2)
+        ]
+        plan = ExecutionPlan.compile(
+            workflow.id, 1, _topology([n.id for n in nodes]), nodes, []
+        )
+
+        assert dict(plan.equivalent_nodes) == {}
+
+    def test_speculative_branch_reads_condition_inputs(
+        self, workflow_factory, node_factory, edge_factory
+    ) -> None:
+        """Test that only a sole condition successor becomes speculative."""
+        workflow = workflow_factory()
+        source = node_factory(workflow_id=workflow.id, name="Source")
+        condition = node_factory(
+            workflow_id=workflow.id, name="Condition", node_type=NodeType.CONDITION
+        )
+        branch, joined = (
+            node_factory(
+                workflow_id=workflow.id, name=name, config={"speculative": True}
+            )
+            for name in ("Branch", "Joined")
+        )
+        pairs = [
+            (source, condition),
+            (condition, branch),
+            (condition, joined),
+            (source, joined),
+        ]
+        edges = [
+            edge_factory(
+                workflow_id=workflow.id, source_node_id=s.id, target_node_id=t.id
+            )
+            for s, t in pairs
+        ]
+        nodes = [source, condition, branch, joined]
+        plan = ExecutionPlan.compile(
+            workflow.id,
+            1,
+            _topology([source.id], [condition.id], [branch.id, joined.id]),
+            nodes,
+            edges,
+        )
+
+        assert dict(plan.speculative_branches) == {condition.id: (branch.id,)}
+        assert plan.incoming_edges[branch.id] == plan.incoming_edges[condition.id]
+        assert len(plan.incoming_edges[joined.id]) == 2
+
+    def test_map_body_is_sole_successor_of_parallel_node(
+        self, workflow_factory, node_factory, edge_factory
+    ) -> None:
+        """Test that identical map bodies are mapped, not deduplicated."""
+        workflow = workflow_factory()
+        fan_out = node_factory(
+            workflow_id=workflow.id, name="Fan", node_type=NodeType.PARALLEL
+        )
+        other = node_factory(
+            workflow_id=workflow.id, name="Other", node_type=NodeType.PARALLEL
+        )
+        body, branch_a, branch_b = (
+            node_factory(workflow_id=workflow.id, name=name, config={"dedupe": True})
+            for name in ("Body", "BranchA", "BranchB")
+        )
+        pairs = [(fan_out, body), (other, branch_a), (other, branch_b)]
+        edges = [
+            edge_factory(
+                workflow_id=workflow.id, source_node_id=s.id, target_node_id=t.id
+            )
+            for s, t in pairs
+        ]
+        nodes = [fan_out, other, body, branch_a, branch_b]
+        plan = ExecutionPlan.compile(
+            workflow.id,
+            1,
+            _topology([fan_out.id, other.id], [body.id, branch_a.id, branch_b.id]),
+            nodes,
+            edges,
+        )
+
+        assert dict(plan.map_bodies) == {body.id: fan_out.id}
+        assert body.id not in plan.equivalent_nodes
+        assert plan.equivalent_nodes[branch_b.id] == branch_a.id
+
+
+class TestExecutionPlanCache:
+    """Tests for ExecutionPlanCache LRU behavior.
+
+    TAG: [SPEC-011] [EXECUTION] [PLAN] [CACHING] [TEST]
+    """
+
+    @staticmethod
+    def _plan(workflow_id, version=1):
+        return ExecutionPlan.compile(workflow_id, version, _topology(), [], [])
+
+    def test_get_returns_cached_plan_by_version(self) -> None:
+        """Test that plans are keyed by workflow ID and version."""
+        cache = ExecutionPlanCache()
+        workflow_id = uuid4()
+        plan = self._plan(workflow_id)
+        cache.set(plan)
+
+        assert cache.get(workflow_id, 1) is plan
+        assert cache.get(workflow_id, 2) is None
+
+    def test_least_recently_used_plan_is_evicted(self) -> None:
+        """Test that the cache is bounded with LRU eviction."""
+        cache = ExecutionPlanCache(max_size=2)
+        first, second, third = uuid4(), uuid4(), uuid4()
+        cache.set(self._plan(first))
+        cache.set(self._plan(second))
+        cache.get(first, 1)
+        cache.set(self._plan(third))
+
+        assert len(cache) == 2
+        assert cache.get(second, 1) is None
+        assert cache.get(first, 1) is not None
+
+    def test_invalidate_removes_all_versions(self) -> None:
+        """Test invalidation of every cached version of a workflow."""
+        cache = ExecutionPlanCache()
+        workflow_id, other_id = uuid4(), uuid4()
+        cache.set(self._plan(workflow_id, 1))
+        cache.set(self._plan(workflow_id, 2))
+        cache.set(self._plan(other_id))
+
+        cache.invalidate(workflow_id)
+
+        assert cache.get(workflow_id, 1) is None
+        assert cache.get(workflow_id, 2) is None
+        assert cache.get(other_id, 1) is not None
+
+
+class TestExecutorPlanReuse:
+    """Tests for plan reuse across executions.
+
+    TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [PLAN] [TEST]
+    """
+
+    @pytest.mark.asyncio
+    async def test_prepare_caches_plan(
+        self, db_session, workflow_factory, node_factory
+    ) -> None:
+        """Test that prepare compiles the plan into the executor's cache."""
+        workflow = workflow_factory()
+        node = node_factory(workflow_id=workflow.id, node_type=NodeType.TOOL)
+        db_session.add_all([workflow, node])
+        await db_session.commit()
+        cache = ExecutionPlanCache()
+
+        prepared, plan = await WorkflowExecutor(
+            db=db_session, plan_cache=cache
+        ).prepare(workflow.id)
+
+        assert prepared.id == workflow.id
+        assert plan.ordered_node_ids == (node.id,)
+        assert cache.get(workflow.id, workflow.version) is plan
+
+    @pytest.mark.asyncio
+    async def test_repeated_runs_compile_once(
+        self, db_session, workflow_factory, node_factory
+    ) -> None:
+        """Test that an unchanged workflow version is compiled only once."""
+        workflow = workflow_factory()
+        node = node_factory(workflow_id=workflow.id, node_type=NodeType.TOOL)
+        db_session.add_all([workflow, node])
+        await db_session.commit()
+
+        cache = ExecutionPlanCache()
+        executor = WorkflowExecutor(db=db_session, plan_cache=cache)
+        original_get_topology = executor._validator.get_topology
+
+        with patch.object(
+            executor._validator, "get_topology", side_effect=original_get_topology
+        ) as get_topology:
+            for _ in range(3):
+                result = await executor.execute(
+                    workflow_id=workflow.id,
+                    input_data={},
+                    trigger_type=TriggerType.MANUAL,
+                )
+                assert result.status == ExecutionStatus.COMPLETED
+
+        assert get_topology.call_count == 1
+        assert cache.get(workflow.id, workflow.version) is not None
+
+    @pytest.mark.asyncio
+    async def test_graph_edit_invalidates_plan(
+        self, db_session, workflow_factory, node_factory
+    ) -> None:
+        """Test that node and edge edits bump the version and drop plans on commit."""
+        from app.schemas.workflow import EdgeCreate, NodeCreate
+        from app.services.workflow.plan import get_plan_cache
+
+        workflow = workflow_factory()
+        node = node_factory(workflow_id=workflow.id, node_type=NodeType.TOOL)
+        db_session.add_all([workflow, node])
+        await db_session.commit()
+
+        cache = get_plan_cache()
+        executor = WorkflowExecutor(db=db_session)
+        await executor.execute(workflow_id=workflow.id, input_data={})
+        old_version = workflow.version
+        assert cache.get(workflow.id, old_version) is not None
+
+        new_node = await NodeService(db_session).create(
+            workflow.id, NodeCreate(name="Added", node_type=NodeType.TRIGGER)
+        )
+        assert cache.get(workflow.id, old_version) is not None
+        await db_session.commit()
+        await db_session.refresh(workflow)
+        assert workflow.version == old_version + 1
+        assert cache.get(workflow.id, old_version) is None
+
+        await WorkflowExecutor(db=db_session).execute(
+            workflow_id=workflow.id, input_data={}
+        )
+        assert cache.get(workflow.id, workflow.version) is not None
+
+        await EdgeService(db_session).create(
+            workflow.id,
+            EdgeCreate(source_node_id=node.id, target_node_id=new_node.id),
+        )
+        await db_session.commit()
+        await db_session.refresh(workflow)
+        assert workflow.version == old_version + 2
+        assert cache.get(workflow.id, old_version + 1) is None
+
+    @pytest.mark.asyncio
+    async def test_rolled_back_edit_keeps_plan(
+        self, db_session, workflow_factory, node_factory
+    ) -> None:
+        """Test that a rolled back edit does not drop plans on a later commit."""
+        from app.schemas.workflow import NodeCreate
+        from app.services.workflow.plan import get_plan_cache
+
+        workflow = workflow_factory()
+        node = node_factory(workflow_id=workflow.id, node_type=NodeType.TOOL)
+        db_session.add_all([workflow, node])
+        await db_session.commit()
+
+        cache = get_plan_cache()
+        await WorkflowExecutor(db=db_session).execute(
+            workflow_id=workflow.id, input_data={}
+        )
+        workflow_id, version = workflow.id, workflow.version
+
+        await NodeService(db_session).create(
+            workflow_id, NodeCreate(name="Added", node_type=NodeType.TRIGGER)
+        )
+        await db_session.rollback()
+        await db_session.commit()
+
+        assert cache.get(workflow_id, version) is not None
+
+
+class TestExecutionPlanPriorities:
+    """Tests for critical-path priorities.
+
+    TAG: [SPEC-011] [EXECUTION] [PLAN] [SCHEDULER] [TEST]
+    """
+
+    def test_unit_priorities_are_longest_path_in_hops(self, diamond) -> None:
+        """Test that without weights priority counts remaining nodes."""
+        workflow, (a, b, c, d), edges = diamond
+        plan = ExecutionPlan.compile(
+            workflow.id, 1, _topology([a.id], [b.id, c.id], [d.id]), [a, b, c, d], edges
+        )
+
+        assert plan.priorities() == {a.id: 3, b.id: 2, c.id: 2, d.id: 1}
+
+    def test_weighted_priorities_follow_slowest_branch(self, diamond) -> None:
+        """Test that weights pick the critical branch; missing ones use the mean."""
+        workflow, (a, b, c, d), edges = diamond
+        plan = ExecutionPlan.compile(
+            workflow.id, 1, _topology([a.id], [b.id, c.id], [d.id]), [a, b, c, d], edges
+        )
+
+        priorities = plan.priorities({b.id: 1.0, c.id: 9.0, d.id: 2.0})
+
+        assert priorities[c.id] > priorities[b.id]
+        assert priorities[a.id] == 4.0 + 9.0 + 2.0
@@ -0,0 +1,109 @@
+"""Tests for executing only the nodes needed for requested targets.
+
+TAG: [SPEC-011] [EXECUTION] [PRUNING] [TEST]
+"""
+
+import pytest
+from sqlalchemy import select
+
+from app.models.enums import ExecutionStatus
+from app.models.execution import NodeExecution
+from app.schemas.execution import WorkflowExecutionCreate
+from app.services.execution_service import WorkflowExecutionService
+from app.services.workflow.executor import SchedulingMode, WorkflowExecutor
+
+
+@pytest.fixture
+async def workflow(db_session, workflow_factory, node_factory, edge_factory):
+    """Persist A -> B -> Signal with a reporting branch B -> Report -> Mail."""
+    workflow = workflow_factory()
+    nodes = {
+        name: node_factory(workflow_id=workflow.id, name=name)
+        for name in ("A", "B", "Signal", "Report", "Mail")
+    }
+    edges = [
+        edge_factory(
+            workflow_id=workflow.id,
+            source_node_id=nodes[source].id,
+            target_node_id=nodes[target].id,
+        )
+        for source, target in (
+            ("A", "B"),
+            ("B", "Signal"),
+            ("B", "Report"),
+            ("Report", "Mail"),
+        )
+    ]
+    db_session.add_all([workflow, *nodes.values(), *edges])
+    await db_session.commit()
+    return workflow.id, {name: node.id for name, node in nodes.items()}
+
+
+class TestTargetPruning:
+    """Tests for pruning executions to the ancestors of target nodes.
+
+    TAG: [SPEC-011] [EXECUTION] [PRUNING] [TEST]
+    """
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode", list(SchedulingMode))
+    async def test_only_target_ancestors_run(
+        self, db_session, workflow, node_runs, mode
+    ) -> None:
+        """Test that the reporting branch is skipped when only Signal is needed."""
+        workflow_id, node_ids = workflow
+        names = {node_id: name for name, node_id in node_ids.items()}
+        node_runs.outputs = {name: {name: True} for name in node_ids}
+
+        executor = WorkflowExecutor(db=db_session, scheduling_mode=mode)
+        with node_runs.patch(executor):
+            result = await executor.execute(
+                workflow_id=workflow_id,
+                input_data={},
+                target_node_ids=[node_ids["Signal"]],
+            )
+
+        assert result.status == ExecutionStatus.COMPLETED
+        assert node_runs.started == ["A", "B", "Signal"]
+        assert result.output_data == {str(node_ids["Signal"]): {"Signal": True}}
+        records = await db_session.execute(
+            select(NodeExecution).where(
+                NodeExecution.workflow_execution_id == result.execution_id
+            )
+        )
+        statuses = {names[ne.node_id]: ne.status for ne in records.scalars().all()}
+        assert statuses == {
+            "A": ExecutionStatus.COMPLETED,
+            "B": ExecutionStatus.COMPLETED,
+            "Signal": ExecutionStatus.COMPLETED,
+            "Report": ExecutionStatus.SKIPPED,
+            "Mail": ExecutionStatus.SKIPPED,
+        }
+
+    @pytest.mark.asyncio
+    async def test_intermediate_target_keeps_its_output(
+        self, db_session, workflow
+    ) -> None:
+        """Test that a target with pruned successors is part of the output."""
+        workflow_id, node_ids = workflow
+        executor = WorkflowExecutor(db=db_session)
+
+        result = await executor.execute(
+            workflow_id=workflow_id, input_data={}, target_node_ids=[node_ids["B"]]
+        )
+
+        assert result.status == ExecutionStatus.COMPLETED
+        assert set(result.output_data) == {str(node_ids["B"])}
+
+    @pytest.mark.asyncio
+    async def test_unknown_target_is_rejected(self, db_session, workflow) -> None:
+        """Test that target nodes must belong to the executed workflow."""
+        workflow_id, _ = workflow
+        data = WorkflowExecutionCreate(
+            workflow_id=workflow_id,
+            trigger_type="manual",
+            target_node_ids=[workflow_id],
+        )
+
+        with pytest.raises(ValueError, match="Target nodes not in workflow"):
+            await WorkflowExecutionService.create(db_session, workflow_id, data)
@@ -0,0 +1,129 @@
+"""Tests for partial re-execution of finished executions.
+
+TAG: [SPEC-011] [EXECUTION] [RERUN] [TEST]
+"""
+
+import pytest
+from sqlalchemy import select
+
+from app.models.enums import ExecutionStatus
+from app.models.execution import NodeExecution
+from app.services.workflow.exceptions import ExecutionCancelledError
+from app.services.workflow.executor import SchedulingMode, WorkflowExecutor
+
+
+@pytest.fixture
+async def workflow(db_session, workflow_factory, node_factory, edge_factory):
+    """Persist A -> B -> C with an independent branch A -> D."""
+    workflow = workflow_factory()
+    nodes = {
+        name: node_factory(workflow_id=workflow.id, name=name)
+        for name in ("A", "B", "C", "D")
+    }
+    edges = [
+        edge_factory(
+            workflow_id=workflow.id,
+            source_node_id=nodes[source].id,
+            target_node_id=nodes[target].id,
+        )
+        for source, target in (("A", "B"), ("B", "C"), ("A", "D"))
+    ]
+    db_session.add_all([workflow, *nodes.values(), *edges])
+    await db_session.commit()
+    return workflow.id, {name: node.id for name, node in nodes.items()}
+
+
+async def _records(db_session, execution_id, node_ids):
+    names = {node_id: name for name, node_id in node_ids.items()}
+    result = await db_session.execute(
+        select(NodeExecution).where(NodeExecution.workflow_execution_id == execution_id)
+    )
+    return {names[ne.node_id]: ne for ne in result.scalars().all()}
+
+
+@pytest.fixture
+def numbered_runs(node_runs):
+    """Node runs outputting {name: run number}."""
+    node_runs.respond = lambda node, _input_data: {node.name: len(node_runs.started)}
+    return node_runs
+
+
+class TestPartialRerun:
+    """Tests for re-running only the sub-DAG affected by dirty nodes.
+
+    TAG: [SPEC-011] [EXECUTION] [RERUN] [TEST]
+    """
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode", list(SchedulingMode))
+    async def test_only_dirty_node_and_descendants_run(
+        self, db_session, workflow, numbered_runs, mode
+    ) -> None:
+        """Test that upstream and sibling outputs are restored, not recomputed."""
+        workflow_id, node_ids = workflow
+        executor = WorkflowExecutor(db=db_session, scheduling_mode=mode)
+        with numbered_runs.patch(executor):
+            source = await executor.execute(workflow_id=workflow_id, input_data={})
+        before = await _records(db_session, source.execution_id, node_ids)
+        stored = {name: record.output_data for name, record in before.items()}
+
+        numbered_runs.started.clear()
+        executor = WorkflowExecutor(db=db_session, scheduling_mode=mode)
+        with numbered_runs.patch(executor):
+            result = await executor.rerun(source.execution_id, [node_ids["B"]])
+
+        assert result.status == ExecutionStatus.COMPLETED
+        assert sorted(numbered_runs.started) == ["B", "C"]
+        after = await _records(db_session, result.execution_id, node_ids)
+        assert {name: r.cache_hit for name, r in after.items()} == {
+            "A": True,
+            "B": False,
+            "C": False,
+            "D": True,
+        }
+        assert after["A"].output_data == stored["A"]
+        assert after["D"].output_data == stored["D"]
+        # Re-executed nodes see the restored upstream output as input
+        assert after["B"].input_data == stored["A"]
+
+    @pytest.mark.asyncio
+    async def test_failed_nodes_are_rerun_without_being_dirty(
+        self, db_session, workflow, numbered_runs
+    ) -> None:
+        """Test that failed and blocked nodes of the source always re-run."""
+        workflow_id, node_ids = workflow
+        numbered_runs.failures["B"] = RuntimeError("B failed")
+        executor = WorkflowExecutor(db=db_session)
+        with numbered_runs.patch(executor):
+            source = await executor.execute(workflow_id=workflow_id, input_data={})
+        assert source.status == ExecutionStatus.FAILED
+
+        numbered_runs.failures.clear()
+        numbered_runs.started.clear()
+        executor = WorkflowExecutor(db=db_session)
+        with numbered_runs.patch(executor):
+            result = await executor.rerun(source.execution_id, [])
+
+        assert result.status == ExecutionStatus.COMPLETED
+        assert sorted(numbered_runs.started) == ["B", "C"]
+        after = await _records(db_session, result.execution_id, node_ids)
+        assert {name: r.status for name, r in after.items()} == dict.fromkeys(
+            "ABCD", ExecutionStatus.COMPLETED
+        )
+
+    @pytest.mark.asyncio
+    async def test_stopped_executor_refuses_rerun(
+        self, db_session, workflow, numbered_runs
+    ) -> None:
+        """Test that a stopped executor names the source execution it refused."""
+        workflow_id, _ = workflow
+        executor = WorkflowExecutor(db=db_session)
+        with numbered_runs.patch(executor):
+            source = await executor.execute(workflow_id=workflow_id, input_data={})
+
+        executor = WorkflowExecutor(db=db_session)
+        executor.stop()
+        with pytest.raises(ExecutionCancelledError) as exc_info:
+            await executor.rerun(source.execution_id, [])
+
+        assert exc_info.value.execution_id == source.execution_id
@@ -0,0 +1,231 @@
+"""Tests for per-class node resource pools.
+
+TAG: [SPEC-011] [EXECUTION] [RESOURCES] [TEST]
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from app.models.enums import ExecutionStatus, NodeType
+from app.services.workflow.exceptions import ExecutionError, NodeTimeoutError
+from app.services.workflow.executor import SchedulingMode, WorkflowExecutor
+from app.services.workflow.resources import (
+    ResourcePool,
+    ResourcePools,
+    is_overload_error,
+)
+
+
+def _pools(**capacities):
+    return ResourcePools(
+        capacities=capacities,
+        class_by_node_type={"agent": "llm", "adapter": "cpu"},
+        default_class="light",
+        max_capacities={},
+    )
+
+
+class TestResourcePool:
+    """Tests for the weighted FIFO slot pool.
+
+    TAG: [SPEC-011] [EXECUTION] [RESOURCES] [TEST]
+    """
+
+    @pytest.mark.asyncio
+    async def test_waiters_admitted_in_arrival_order(self) -> None:
+        """Test that a heavy waiter is not overtaken by lighter ones."""
+        pool = ResourcePool("llm", capacity=2)
+        order: list[str] = []
+
+        async def run(name, weight):
+            async with pool.slot(weight):
+                order.append(name)
+                await asyncio.sleep(0)
+
+        await pool.acquire(2)
+        tasks = [
+            asyncio.create_task(run("heavy", 2)),
+            asyncio.create_task(run("light", 1)),
+        ]
+        await asyncio.sleep(0)
+        pool.release(2)
+        await asyncio.gather(*tasks)
+
+        assert order == ["heavy", "light"]
+        assert pool.in_use == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_wakes_next(self) -> None:
+        """Test that cancelling a queued waiter admits the ones behind it."""
+        pool = ResourcePool("cpu", capacity=2)
+        await pool.acquire(1)
+        heavy = asyncio.create_task(pool.acquire(2))
+        light = asyncio.create_task(pool.acquire(1))
+        await asyncio.sleep(0)
+
+        heavy.cancel()
+        await asyncio.wait_for(light, timeout=1)
+
+        assert heavy.cancelled()
+        assert pool.in_use == 2
+
+
+class TestAdaptiveLimit:
+    """Tests for AIMD adaptation of resource class limits.
+
+    TAG: [SPEC-011] [EXECUTION] [RESOURCES] [TEST]
+    """
+
+    def test_fast_attempts_raise_limit_up_to_max(self) -> None:
+        """Test the additive increase while latency stays on target."""
+        pool = ResourcePool("http", capacity=2, max_capacity=4, latency_target=1.0)
+
+        # +1/limit per attempt: 2 -> 2.5 -> 2.9 -> 3.24
+        for _ in range(3):
+            pool.record(0.1)
+        assert pool.capacity == 3
+
+        for _ in range(50):
+            pool.record(0.1)
+        assert pool.capacity == 4
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            NodeTimeoutError(node_id=uuid4(), timeout_seconds=1),
+            ExecutionError("HTTP 429"),
+        ],
+    )
+    def test_overload_cuts_limit_once_per_cooldown(self, error) -> None:
+        """Test the multiplicative decrease on timeouts and 429/5xx."""
+        if not isinstance(error, NodeTimeoutError):
+            error.status_code = 429
+        pool = ResourcePool("llm", capacity=8, max_capacity=16)
+
+        pool.record(0.1, error)
+        pool.record(0.1, error)
+
+        assert pool.capacity == 4
+
+    def test_slow_attempts_and_error_rate_back_off(self) -> None:
+        """Test that latency above target and frequent errors shrink the limit."""
+        slow = ResourcePool("llm", capacity=8, max_capacity=16, latency_target=1.0)
+        slow.record(5.0)
+        assert slow.capacity == 4
+
+        failing = ResourcePool("http", capacity=8, max_capacity=16)
+        with patch(
+            "app.services.workflow.resources.settings.AIMD_DECREASE_COOLDOWN", 0
+        ):
+            for _ in range(3):
+                failing.record(0.1, ValueError("bad request"))
+        assert failing.capacity < 8
+        assert failing.metrics()["error_rate"] > 0.2
+
+    def test_fixed_pool_does_not_adapt(self) -> None:
+        """Test that classes without a maximum keep their capacity."""
+        pool = ResourcePool("cpu", capacity=4)
+
+        pool.record(100.0, TimeoutError())
+
+        assert pool.capacity == 4
+        assert pool.metrics()["adaptive"] is False
+
+    def test_overload_detected_through_wrapping(self) -> None:
+        """Test that wrapped timeouts and response status codes are found."""
+        response_error = ValueError("upstream")
+        response_error.response = SimpleNamespace(status_code=503)
+        wrapped = ExecutionError("retries exhausted")
+        wrapped.__cause__ = TimeoutError()
+
+        assert is_overload_error(wrapped)
+        assert is_overload_error(response_error)
+        assert not is_overload_error(ValueError("bad request"))
+
+
+class TestResourcePools:
+    """Tests for resolving the resource class of a node.
+
+    TAG: [SPEC-011] [EXECUTION] [RESOURCES] [TEST]
+    """
+
+    def test_class_from_node_type_and_config(self) -> None:
+        """Test the node type default and the node config override."""
+        pools = _pools(llm=2, cpu=4, http=8, light=16)
+
+        agent = SimpleNamespace(node_type=NodeType.AGENT, config={})
+        tool = SimpleNamespace(node_type=NodeType.TOOL, config=None)
+        override = SimpleNamespace(
+            node_type=NodeType.TOOL,
+            config={"resource_class": "http", "resource_weight": 3},
+        )
+
+        assert pools.resource_class(agent) == "llm"
+        assert pools.resource_class(tool) == "light"
+        pool, weight = pools.for_node(override)
+        assert (pool.name, weight) == ("http", 3)
+
+    def test_unknown_class_and_oversized_weight(self) -> None:
+        """Test the fallback for unknown classes and weight clamping."""
+        pools = _pools(llm=2)
+        node = SimpleNamespace(
+            node_type=NodeType.AGENT,
+            config={"resource_class": "gpu", "resource_weight": 10},
+        )
+
+        pool, weight = pools.for_node(node)
+
+        assert (pool.name, weight) == ("llm", 2)
+
+
+class TestExecutorResourceClasses:
+    """Tests for executors scheduling by resource class.
+
+    TAG: [SPEC-011] [EXECUTION] [RESOURCES] [TEST]
+    """
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode", list(SchedulingMode))
+    async def test_cheap_nodes_do_not_queue_behind_expensive(
+        self, db_session, workflow_factory, node_factory, node_runs, mode
+    ) -> None:
+        """Test that adapters run while agents wait for their pool."""
+        workflow = workflow_factory()
+        agents = [
+            node_factory(
+                workflow_id=workflow.id, name=f"agent-{i}", node_type=NodeType.AGENT
+            )
+            for i in range(3)
+        ]
+        adapters = [
+            node_factory(
+                workflow_id=workflow.id, name=f"adapter-{i}", node_type=NodeType.ADAPTER
+            )
+            for i in range(3)
+        ]
+        db_session.add_all([workflow, *agents, *adapters])
+        await db_session.commit()
+        # An agent holds the only llm slot until every adapter ran
+        for agent in agents:
+            node_runs.hold(agent.name, *(f"end:{a.name}" for a in adapters))
+
+        executor = WorkflowExecutor(
+            db=db_session,
+            max_parallel_nodes=2,
+            scheduling_mode=mode,
+            resources=_pools(llm=1, cpu=4, light=4),
+        )
+        with node_runs.patch(executor):
+            result = await executor.execute(workflow_id=workflow.id, input_data={})
+
+        assert result.status == ExecutionStatus.COMPLETED
+        events = node_runs.events
+        second_agent = [e for e in events if e.startswith("start:agent")][1]
+        assert all(
+            events.index(f"end:{adapter.name}") < events.index(second_agent)
+            for adapter in adapters
+        )
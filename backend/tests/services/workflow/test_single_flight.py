@@ -0,0 +1,175 @@
+"""Tests for the single-flight registry of identical node calls.
+
+TAG: [SPEC-011] [EXECUTION] [SINGLE-FLIGHT] [TEST]
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import select
+
+from app.models.enums import ExecutionStatus
+from app.models.execution import NodeExecution
+from app.services.workflow.executor import WorkflowExecutor
+from app.services.workflow.single_flight import (
+    SingleFlight,
+    get_single_flight_window,
+)
+
+
+class TestSingleFlight:
+    """Tests for sharing in-flight and fresh call results.
+
+    TAG: [SPEC-011] [EXECUTION] [SINGLE-FLIGHT] [TEST]
+    """
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_call(self) -> None:
+        """Test that only the first of concurrent identical calls runs."""
+        flights = SingleFlight()
+        calls = 0
+
+        async def fetch_quote():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return {"price": 187.5}
+
+        results = await asyncio.gather(
+            *(flights.run("quote:AAPL", 0.0, fetch_quote) for _ in range(5))
+        )
+
+        assert calls == 1
+        assert [shared for _, shared in results] == [False, True, True, True, True]
+        assert all(result == {"price": 187.5} for result, _ in results)
+        assert flights.metrics() == {"in_flight": 0, "fresh_results": 0, "shared": 4}
+
+    @pytest.mark.asyncio
+    async def test_result_is_reused_within_window(self) -> None:
+        """Test that late callers get the result while it is fresh."""
+        flights = SingleFlight()
+
+        async def fetch_quote():
+            return {"price": 187.5}
+
+        assert await flights.run("quote:AAPL", 60.0, fetch_quote) == (
+            {"price": 187.5},
+            False,
+        )
+        result, shared = await flights.run("quote:AAPL", 60.0, fetch_quote)
+        assert shared is True
+        result["price"] = 0.0
+
+        assert await flights.run("quote:AAPL", 60.0, fetch_quote) == (
+            {"price": 187.5},
+            True,
+        )
+        assert (await flights.run("quote:MSFT", 60.0, fetch_quote))[1] is False
+
+    @pytest.mark.asyncio
+    async def test_failure_reaches_waiters_and_is_not_kept(self) -> None:
+        """Test that waiters get the error and the next caller retries."""
+        flights = SingleFlight()
+
+        async def refused():
+            await asyncio.sleep(0.01)
+            raise ConnectionError("connection refused")
+
+        results = await asyncio.gather(
+            flights.run("quote:AAPL", 60.0, refused),
+            flights.run("quote:AAPL", 60.0, refused),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, ConnectionError) for r in results)
+        assert len(flights) == 0
+        with pytest.raises(ConnectionError):
+            await flights.run("quote:AAPL", 60.0, refused)
+
+    @pytest.mark.asyncio
+    async def test_waiter_calls_itself_if_caller_is_cancelled(self) -> None:
+        """Test that cancelling one execution does not fail the others."""
+        flights = SingleFlight()
+        started = asyncio.Event()
+
+        async def slow_quote():
+            started.set()
+            await asyncio.sleep(1)
+            return {"price": 1.0}
+
+        async def fast_quote():
+            return {"price": 187.5}
+
+        leader = asyncio.create_task(flights.run("quote:AAPL", 0.0, slow_quote))
+        await started.wait()
+        waiter = asyncio.create_task(flights.run("quote:AAPL", 0.0, fast_quote))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await waiter == ({"price": 187.5}, False)
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+    def test_window_is_opt_in(self) -> None:
+        """Test reading the freshness window from the node config."""
+        with patch(
+            "app.services.workflow.single_flight.settings.SINGLE_FLIGHT_WINDOW", 1.5
+        ):
+            assert get_single_flight_window(SimpleNamespace(config={})) is None
+            assert (
+                get_single_flight_window(
+                    SimpleNamespace(config={"single_flight": True})
+                )
+                == 1.5
+            )
+            assert (
+                get_single_flight_window(
+                    SimpleNamespace(config={"single_flight": {"window_seconds": 5}})
+                )
+                == 5.0
+            )
+
+
+class TestExecutorSingleFlight:
+    """Tests for executions sharing identical node calls.
+
+    TAG: [SPEC-011] [EXECUTION] [SINGLE-FLIGHT] [TEST]
+    """
+
+    @pytest.mark.asyncio
+    async def test_fresh_call_is_shared_across_executions(
+        self, db_session, workflow_factory, node_factory, node_runs
+    ) -> None:
+        """Test that a second execution reuses the first one's fresh call."""
+        workflow = workflow_factory()
+        node = node_factory(
+            workflow_id=workflow.id,
+            config={
+                "url": "https://api.example.com/quotes",
+                "single_flight": {"window_seconds": 60},
+            },
+        )
+        db_session.add_all([workflow, node])
+        await db_session.commit()
+        flights = SingleFlight()
+        node_runs.outputs[node.name] = {"price": 187.5}
+
+        results = []
+        for _ in range(2):
+            executor = WorkflowExecutor(db=db_session, single_flight=flights)
+            with node_runs.patch(executor):
+                results.append(
+                    await executor.execute(workflow_id=workflow.id, input_data={})
+                )
+
+        assert len(node_runs.started) == 1
+        assert [r.status for r in results] == [ExecutionStatus.COMPLETED] * 2
+        assert results[1].output_data == {str(node.id): {"price": 187.5}}
+        record = await db_session.scalar(
+            select(NodeExecution).where(
+                NodeExecution.workflow_execution_id == results[1].execution_id
+            )
+        )
+        assert record.cache_hit is True
@@ -0,0 +1,120 @@
+"""Tests for speculative execution of condition branches.
+
+TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [TEST]
+REQ: REQ-011-006 - Condition node branching
+"""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import select
+
+from app.models.enums import ExecutionStatus, NodeType
+from app.models.execution import ExecutionLog, NodeExecution
+from app.services.workflow.executor import WorkflowExecutor
+
+
+@pytest.fixture
+async def workflow(db_session, workflow_factory, node_factory, edge_factory):
+    """Persist Quotes -> Signal (condition) -> speculative Buy and Sell."""
+    workflow = workflow_factory()
+    nodes = {
+        "Quotes": node_factory(workflow_id=workflow.id, name="Quotes"),
+        "Signal": node_factory(
+            workflow_id=workflow.id, name="Signal", node_type=NodeType.CONDITION
+        ),
+        "Buy": node_factory(
+            workflow_id=workflow.id,
+            name="Buy",
+            config={"side": "buy", "speculative": True},
+        ),
+        "Sell": node_factory(
+            workflow_id=workflow.id,
+            name="Sell",
+            config={"side": "sell", "speculative": True},
+        ),
+    }
+    edges = {
+        (source, target): edge_factory(
+            workflow_id=workflow.id,
+            source_node_id=nodes[source].id,
+            target_node_id=nodes[target].id,
+        )
+        for source, target in (
+            ("Quotes", "Signal"),
+            ("Signal", "Buy"),
+            ("Signal", "Sell"),
+        )
+    }
+    db_session.add_all([workflow, *nodes.values(), *edges.values()])
+    await db_session.commit()
+    return workflow.id, {name: node.id for name, node in nodes.items()}, edges
+
+
+class TestSpeculativeBranches:
+    """Tests for running condition branches before the routing decision.
+
+    TAG: [SPEC-011] [EXECUTION] [EXECUTOR] [TEST]
+    """
+
+    @pytest.mark.asyncio
+    async def test_branch_overlaps_condition_and_loser_is_discarded(
+        self, db_session, workflow, node_runs
+    ) -> None:
+        """Test that Buy runs alongside Signal and the Sell run is dropped."""
+        workflow_id, node_ids, edges = workflow
+        names = {node_id: name for name, node_id in node_ids.items()}
+        node_runs.outputs = {"Quotes": {"price": 187.5}, "Buy": {"Buy": True}}
+        # Signal only decides once the Buy branch has started
+        node_runs.hold("Signal", "start:Buy")
+
+        async def buy_only(**_):
+            return {"matched_edges": [edges[("Signal", "Buy")].id], "result": True}
+
+        executor = WorkflowExecutor(db=db_session)
+        with (
+            node_runs.patch(executor),
+            patch.object(executor, "_evaluate_condition_node", side_effect=buy_only),
+        ):
+            result = await executor.execute(workflow_id=workflow_id, input_data={})
+
+        assert result.status == ExecutionStatus.COMPLETED
+        events = node_runs.events
+        assert events.index("start:Buy") < events.index("end:Signal")
+        # Speculative branches read the data routed by the condition node
+        assert node_runs.inputs["Buy"] == {"price": 187.5}
+        assert set(result.output_data) == {str(node_ids["Buy"])}
+
+        records = await db_session.execute(
+            select(NodeExecution).where(
+                NodeExecution.workflow_execution_id == result.execution_id
+            )
+        )
+        statuses = {names[ne.node_id]: ne.status for ne in records.scalars().all()}
+        assert statuses == {
+            "Quotes": ExecutionStatus.COMPLETED,
+            "Signal": ExecutionStatus.COMPLETED,
+            "Buy": ExecutionStatus.COMPLETED,
+            "Sell": ExecutionStatus.SKIPPED,
+        }
+        logs = await db_session.execute(
+            select(ExecutionLog.message).where(
+                ExecutionLog.workflow_execution_id == result.execution_id
+            )
+        )
+        assert "Speculative run of node 'Sell' discarded" in set(logs.scalars().all())
+
+    @pytest.mark.asyncio
+    async def test_failed_speculative_branch_fails_execution(
+        self, db_session, workflow, node_runs
+    ) -> None:
+        """Test that a kept branch that failed is reported like any node."""
+        workflow_id, _, _ = workflow
+        node_runs.failures["Sell"] = ValueError("no position to sell")
+
+        executor = WorkflowExecutor(db=db_session)
+        with node_runs.patch(executor):
+            result = await executor.execute(workflow_id=workflow_id, input_data={})
+
+        assert result.status == ExecutionStatus.FAILED
+        assert "Sell" in result.error_message
@@ -0,0 +1,108 @@
+"""Tests for streamed node outputs.
+
+TAG: [SPEC-011] [EXECUTION] [STREAMING] [TEST]
+"""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from app.services.workflow.context import ExecutionContext
+from app.services.workflow.exceptions import StreamError
+from app.services.workflow.streaming import RecordStream, chunk_records
+
+
+async def _produce(count: int):
+    for i in range(count):
+        yield [i]
+
+
+async def _collect(chunks) -> list:
+    return [record async for chunk in chunks for record in chunk]
+
+
+class TestRecordStream:
+    """Tests for the bounded chunk stream.
+
+    TAG: [SPEC-011] [EXECUTION] [STREAMING] [TEST]
+    """
+
+    def test_chunk_records(self) -> None:
+        """Test splitting records into fixed-size chunks."""
+        assert list(chunk_records(range(5), size=2)) == [[0, 1], [2, 3], [4]]
+
+    @pytest.mark.asyncio
+    async def test_every_consumer_receives_every_chunk(self) -> None:
+        """Test fan-out to multiple consumers."""
+        stream = RecordStream(maxsize=2)
+        first, second = stream.subscribe(), stream.subscribe()
+
+        records, a, b = await asyncio.gather(
+            stream.pump(_produce(10)), _collect(first), _collect(second)
+        )
+
+        assert records == 10
+        assert a == b == list(range(10))
+
+    @pytest.mark.asyncio
+    async def test_producer_waits_for_slow_consumer(self) -> None:
+        """Test that at most maxsize chunks are buffered ahead of a consumer."""
+        stream = RecordStream(maxsize=2)
+        chunks = stream.subscribe()
+        producer = asyncio.create_task(stream.pump(_produce(10)))
+
+        await asyncio.sleep(0.05)
+        assert stream.chunks_sent == 2
+        assert not producer.done()
+
+        assert await _collect(chunks) == list(range(10))
+        assert await producer == 10
+
+    @pytest.mark.asyncio
+    async def test_consumer_stopping_early_releases_producer(self) -> None:
+        """Test that an abandoned consumer no longer blocks the producer."""
+        stream = RecordStream(maxsize=1)
+        chunks = stream.subscribe()
+        producer = asyncio.create_task(stream.pump(_produce(10)))
+
+        assert await anext(chunks) == [0]
+        await chunks.aclose()
+
+        assert await asyncio.wait_for(producer, timeout=1) == 10
+
+    @pytest.mark.asyncio
+    async def test_producer_error_reaches_consumers(self) -> None:
+        """Test that a failing producer fails its consumers with StreamError."""
+
+        async def failing():
+            yield [1]
+            raise ConnectionError("feed dropped")
+
+        stream = RecordStream()
+        chunks = stream.subscribe()
+
+        with pytest.raises(ConnectionError):
+            await stream.pump(failing())
+        with pytest.raises(StreamError, match="feed dropped"):
+            await _collect(chunks)
+
+    @pytest.mark.asyncio
+    async def test_subscribe_after_start_is_rejected(self) -> None:
+        """Test that late consumers cannot silently miss chunks."""
+        stream = RecordStream()
+        await stream.pump(_produce(1))
+
+        with pytest.raises(StreamError):
+            stream.subscribe()
+
+    @pytest.mark.asyncio
+    async def test_context_shares_stream_per_node(self) -> None:
+        """Test that producer and consumers get the same stream."""
+        context = ExecutionContext(workflow_execution_id=uuid4(), input_data={})
+        node_id = uuid4()
+
+        assert await context.get_stream(node_id) is await context.get_stream(node_id)
+        assert await context.get_stream(uuid4()) is not await context.get_stream(
+            node_id
+        )
@@ -151,6 +151,28 @@ class TestWorkflowExecutionEndpoints:
         data = response.json()
         assert data["status"] == "cancelled"
 
+    @pytest.mark.asyncio
+    async def test_rerun_execution_requires_finished_execution(
+        self, async_client: AsyncClient, execution_id: str
+    ):
+        """Test that only finished executions can be partially re-run."""
+        response = await async_client.post(
+            f"/api/v1/executions/{execution_id}/rerun",
+            json={"dirty_node_ids": [str(uuid4())]},
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    @pytest.mark.asyncio
+    async def test_rerun_execution_not_found(self, async_client: AsyncClient):
+        """Test re-running a non-existent execution."""
+        response = await async_client.post(
+            f"/api/v1/executions/{uuid4()}/rerun",
+            json={"dirty_node_ids": [str(uuid4())]},
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
     @pytest.mark.asyncio
     async def test_get_execution_statistics(
         self, async_client: AsyncClient, workflow_id: str, sample_execution_data
@@ -558,6 +580,60 @@ class TestNodeExecutionEndpoints:
         assert "logs" in data
         assert len(data["logs"]) == 2
 
+    @pytest.mark.asyncio
+    async def test_get_node_execution_payload_resolves_blobs(
+        self,
+        async_client: AsyncClient,
+        execution_id: str,
+        db_session,
+        tmp_path,
+    ):
+        """Test that the payload endpoint loads offloaded data lazily."""
+        from app.models.enums import ExecutionStatus
+        from app.models.execution import NodeExecution
+        from app.services.workflow.blob_store import (
+            FileSystemBlobStore,
+            offload_payload,
+        )
+
+        store = FileSystemBlobStore(tmp_path)
+        output = {"close": list(range(100))}
+        node_execution = NodeExecution(
+            id=uuid4(),
+            workflow_execution_id=execution_id,
+            node_id=uuid4(),
+            status=ExecutionStatus.COMPLETED,
+            input_data={"symbol": "BTC"},
+            output_data=await offload_payload(output, store, threshold=10),
+            retry_count=0,
+            execution_order=1,
+        )
+        db_session.add(node_execution)
+        await db_session.commit()
+        url = f"/api/v1/executions/{execution_id}/nodes/{node_execution.id}"
+
+        with patch(
+            "app.services.workflow.blob_store.get_blob_store", return_value=store
+        ):
+            detail = await async_client.get(url)
+            payload = await async_client.get(f"{url}/payload")
+
+        assert detail.status_code == status.HTTP_200_OK
+        assert "$blob" in detail.json()["output_data"]
+        assert payload.status_code == status.HTTP_200_OK
+        assert payload.json() == {
+            "input_data": {"symbol": "BTC"},
+            "output_data": output,
+        }
+
+        with patch(
+            "app.services.workflow.blob_store.get_blob_store",
+            return_value=FileSystemBlobStore(tmp_path / "empty"),
+        ):
+            missing = await async_client.get(f"{url}/payload")
+
+        assert missing.status_code == status.HTTP_404_NOT_FOUND
+
 
 # =============================================================================
 # ExecutionLog Endpoint Tests
@@ -218,6 +218,39 @@ class TestWorkflowEndpoints:
 
         assert response.status_code == status.HTTP_409_CONFLICT
 
+    @pytest.mark.asyncio
+    async def test_update_workflow_conflicts_after_node_edit(
+        self, async_client: AsyncClient, sample_workflow_data
+    ):
+        """Test that a node edit bumps the version the update must match."""
+        # Create workflow
+        create_response = await async_client.post(
+            "/api/v1/workflows/", json=sample_workflow_data
+        )
+        workflow_id = create_response.json()["id"]
+        version = create_response.json()["version"]
+
+        # Add a node, which bumps the workflow version
+        node_data = {"name": "Trigger", "node_type": "trigger"}
+        await async_client.post(
+            f"/api/v1/workflows/{workflow_id}/nodes", json=node_data
+        )
+
+        # Update with the version read before the node edit
+        update_data = {"name": "Updated", "version": version}
+        response = await async_client.put(
+            f"/api/v1/workflows/{workflow_id}", json=update_data
+        )
+        assert response.status_code == status.HTTP_409_CONFLICT
+
+        # Update with the bumped version
+        update_data["version"] = version + 1
+        response = await async_client.put(
+            f"/api/v1/workflows/{workflow_id}", json=update_data
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["version"] == version + 2
+
     @pytest.mark.asyncio
     async def test_delete_workflow_success(
         self, async_client: AsyncClient, sample_workflow_data
@@ -2067,6 +2100,63 @@ class TestWorkflowExecuteEndpoint:
             assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
             assert "Failed to execute workflow" in response.json()["detail"]
 
+    @pytest.mark.asyncio
+    async def test_execute_workflow_batch(
+        self, async_client: AsyncClient, active_workflow_id: str
+    ):
+        """Test that a batch queues one execution per input behind one handle."""
+        inputs = [{"symbol": "AAPL"}, {"symbol": "MSFT"}, {"symbol": "NVDA"}]
+
+        response = await async_client.post(
+            f"/api/v1/workflows/{active_workflow_id}/execute/batch",
+            json={"inputs": inputs, "max_concurrency": 2},
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        batch = response.json()
+        assert batch["workflow_id"] == active_workflow_id
+        assert (batch["total"], batch["pending"]) == (3, 3)
+        assert batch["progress"] == 0.0
+        assert batch["is_terminal"] is False
+
+        response = await async_client.get(
+            f"/api/v1/executions/batches/{batch['batch_id']}"
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["total"] == 3
+
+        response = await async_client.get(
+            f"/api/v1/executions/workflows/{active_workflow_id}/executions"
+        )
+        executions = response.json()["items"]
+        assert len(executions) == 3
+        response = await async_client.get(f"/api/v1/executions/{executions[0]['id']}")
+        execution = response.json()
+        assert execution["batch_id"] == batch["batch_id"]
+        assert execution["input_data"] in inputs
+
+    @pytest.mark.asyncio
+    async def test_execute_workflow_batch_validation(
+        self, async_client: AsyncClient, inactive_workflow_id: str
+    ):
+        """Test empty batches, inactive workflows and unknown batches."""
+        response = await async_client.post(
+            f"/api/v1/workflows/{inactive_workflow_id}/execute/batch",
+            json={"inputs": []},
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+        response = await async_client.post(
+            f"/api/v1/workflows/{inactive_workflow_id}/execute/batch",
+            json={"inputs": [{}]},
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        from uuid import uuid4
+
+        response = await async_client.get(f"/api/v1/executions/batches/{uuid4()}")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
 
 # =============================================================================
 # Additional Mock-Based Exception Handling Tests
@@ -31,3 +31,16 @@ async def test_api_v1_status(async_client: AsyncClient) -> None:
     data = response.json()
     assert data["status"] == "ok"
     assert data["version"] == "v1"
+
+
+@pytest.mark.asyncio
+async def test_api_v1_concurrency_status(async_client: AsyncClient) -> None:
+    """Test that node slot usage and adaptive limits are exposed."""
+    response = await async_client.get("/api/v1/status/concurrency")
+    assert response.status_code == 200
+    data = response.json()
+    assert {"capacity", "in_use", "waiting"} <= data["admission"].keys()
+    assert data["resource_classes"]["llm"]["adaptive"] is True
+    assert data["resource_classes"]["light"]["adaptive"] is False
+    assert {"budget_tokens", "tools"} <= data["hedging"].keys()
+    assert isinstance(data["circuits"], dict)
@@ -14,6 +14,7 @@ import pytest
 from app.models.enums import ExecutionStatus, LogLevel
 from app.models.execution import ExecutionLog, NodeExecution, WorkflowExecution
 from app.schemas.execution import (
+    ExecutionRerun,
     WorkflowExecutionCreate,
 )
 from app.services.execution_service import (
@@ -311,6 +312,37 @@ class TestWorkflowExecutionService:
         with pytest.raises(ValueError, match="not found"):
             await WorkflowExecutionService.cancel(db_session, uuid4())
 
+    @pytest.mark.asyncio
+    async def test_create_rerun(self, db_session, workflow_factory, node_factory):
+        """Test creating a partial re-run of a finished execution."""
+        workflow = workflow_factory()
+        node = node_factory(workflow_id=workflow.id)
+        source = WorkflowExecution(
+            id=uuid4(),
+            workflow_id=workflow.id,
+            status=ExecutionStatus.FAILED,
+            trigger_type="manual",
+            input_data={"x": 1},
+            context={},
+            metadata_={},
+        )
+        db_session.add_all([workflow, node, source])
+        await db_session.flush()
+
+        rerun = await WorkflowExecutionService.create_rerun(
+            db_session, source.id, ExecutionRerun(dirty_node_ids=[node.id])
+        )
+
+        assert rerun.status == ExecutionStatus.PENDING
+        assert rerun.rerun_of_id == source.id
+        assert rerun.dirty_node_ids == [str(node.id)]
+        assert rerun.input_data == {"x": 1}
+
+        with pytest.raises(ValueError, match="not in workflow"):
+            await WorkflowExecutionService.create_rerun(
+                db_session, source.id, ExecutionRerun(dirty_node_ids=[uuid4()])
+            )
+
     @pytest.mark.asyncio
     async def test_get_statistics(self, db_session):
         """Test getting execution statistics."""